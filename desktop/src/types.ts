@@ -26,11 +26,15 @@ export interface AgentStats {
   api_duration: number;
   input_tokens: number;
   output_tokens: number;
+  cache_read_tokens?: number;
+  cache_write_tokens?: number;
   lines_added: number;
   lines_removed: number;
   premium_requests: number;
   retries: number;
   tool_calls: number;
+  tool_duration?: number;
+  idle_wait_duration?: number;
 }
 
 /** Record of a single work item completion for model A/B testing */
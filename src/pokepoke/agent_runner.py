@@ -5,20 +5,24 @@ import json
 import re
 from datetime import datetime
 from pathlib import Path
-from typing import Optional
+from typing import Iterable, Optional, TYPE_CHECKING
 
 from pokepoke.config import get_config
 from pokepoke.copilot import invoke_copilot
 from pokepoke.types import BeadsWorkItem, AgentStats, CopilotResult
 from pokepoke.stats import parse_agent_stats
+from pokepoke.git_operations import sanitize_branch_name
 from pokepoke.worktrees import create_worktree, merge_worktree, cleanup_worktree
-from pokepoke.prompts import PromptService
+from pokepoke.prompts import PromptService, item_prompt_variables
 from pokepoke import terminal_ui
 from pokepoke.cleanup_agents import (
     invoke_cleanup_agent, invoke_merge_conflict_cleanup_agent, 
     get_pokepoke_prompts_dir, run_cleanup_loop, aggregate_cleanup_stats
 )
 
+if TYPE_CHECKING:
+    from pokepoke.logging_utils import ItemLogger
+
 # Re-export cleanup agent functions for backward compatibility
 __all__ = ['invoke_cleanup_agent', 'invoke_merge_conflict_cleanup_agent',
            'aggregate_cleanup_stats', 'run_cleanup_loop', 'run_maintenance_agent',
@@ -30,32 +34,35 @@ def _generate_unique_agent_id(agent_type: str) -> str:
     timestamp = datetime.now().strftime("%Y%m%d-%H%M%S")
     return f"{agent_type}-{timestamp}"
 
-def run_gate_agent(item: BeadsWorkItem, cwd: Optional[str] = None) -> tuple[bool, str, Optional[AgentStats]]:
-    """Run the Gate Agent to verify a fixed work item."""
+def _result_stats(result: CopilotResult) -> Optional[AgentStats]:
+    """Stats the SDK reported for a run, else whatever the output text yields."""
+    return result.stats or (parse_agent_stats(result.output) if result.output else None)
+
+def run_gate_agent(item: BeadsWorkItem, cwd: Optional[str] = None, item_logger: Optional['ItemLogger'] = None) -> tuple[bool, str, Optional[AgentStats]]:
+    """Run the Gate Agent to verify a fixed work item; its output goes to the item's log."""
     terminal_ui.ui.set_current_agent("Gate Agent")
     print(f"\n{'='*60}\n🕵️ Running Gate Agent on {item.id}\n{'='*60}")
     
     service = PromptService()
     try:
-        final_prompt = service.load_and_render("gate-agent", {
-            "item_id": item.id,
-            "title": item.title,
-            "description": item.description or ""
-        })
+        final_prompt = service.render_with_item("gate-agent", {}, item_prompt_variables(item))
     except Exception as e:
         return False, f"Failed to render prompt: {e}", None
 
     # Gate Agent runs in the specified directory (worktree)
     # deny_write=True ensures it only reads/runs tests but doesn't modify code
-    result = invoke_copilot(item, prompt=final_prompt, deny_write=True, cwd=cwd)
+    result = invoke_copilot(item, prompt=final_prompt, deny_write=True, cwd=cwd, item_logger=item_logger)
     
-    stats = parse_agent_stats(result.output) if result.output else None
+    stats = _result_stats(result)
     
     if not result.success:
         return False, f"Gate Agent execution failed: {result.error}", stats
         
-    # Parse output for decision
+    # Parse output for decision - the verdict is in the final message, which
+    # may have fallen out of the output tail if it was very long
     output = result.output or ""
+    if result.final_message and result.final_message not in output:
+        output = f"{result.final_message}\n{output}"
     
     # Try to find JSON block
     json_match = re.search(r'```json\s*(\{.*?\})\s*```', output, re.DOTALL)
@@ -80,7 +87,7 @@ def run_gate_agent(item: BeadsWorkItem, cwd: Optional[str] = None) -> tuple[bool
     return False, "Gate Agent did not explicitly approve the fix. Check logs.", stats
 
 
-def run_maintenance_agent(agent_name: str, prompt_file: str, repo_root: Optional[Path] = None, needs_worktree: bool = True, merge_changes: bool = True, model: Optional[str] = None) -> Optional[AgentStats]:
+def run_maintenance_agent(agent_name: str, prompt_file: str, repo_root: Optional[Path] = None, needs_worktree: bool = True, merge_changes: bool = True, model: Optional[str] = None, item_logger: Optional['ItemLogger'] = None) -> Optional[AgentStats]:
     """Run a maintenance agent with optional worktree isolation."""
     terminal_ui.ui.set_current_agent(f"{agent_name} Agent")
     print(f"\n{'='*60}\n🔧 Running {agent_name} Agent\n{'='*60}")
@@ -113,38 +120,45 @@ def run_maintenance_agent(agent_name: str, prompt_file: str, repo_root: Optional
     
     # Beads-only agents run in main repo without worktree
     if not needs_worktree:
-        return _run_beads_only_agent(agent_name, agent_item, agent_prompt, model=model)
+        return _run_beads_only_agent(agent_name, agent_item, agent_prompt, model=model, item_logger=item_logger)
     
     # Code-modifying agents need worktree isolation
     # Ensure repo_root has a value
     if repo_root is None:
         repo_root = Path.cwd()
     
-    return _run_worktree_agent(agent_name, agent_id, agent_item, agent_prompt, repo_root, merge_changes=merge_changes, model=model)
+    return _run_worktree_agent(agent_name, agent_id, agent_item, agent_prompt, repo_root, merge_changes=merge_changes, model=model, item_logger=item_logger)
 
 
-def _run_simple_agent(agent_name: str, agent_item: BeadsWorkItem, agent_prompt: str, deny_write: bool = True, model: Optional[str] = None, cwd: Optional[str] = None) -> Optional[AgentStats]:
+def _run_simple_agent(agent_name: str, agent_item: BeadsWorkItem, agent_prompt: str, deny_write: bool = True, model: Optional[str] = None, cwd: Optional[str] = None, item_logger: Optional['ItemLogger'] = None) -> Optional[AgentStats]:
     """Run a simple agent in the main repo with configurable write access."""
     print(f"\n📋 Running {agent_name} ({'no write' if deny_write else 'write enabled'}){f', model={model}' if model else ''}")
-    result = invoke_copilot(agent_item, prompt=agent_prompt, deny_write=deny_write, model=model, cwd=cwd)
+    result = invoke_copilot(agent_item, prompt=agent_prompt, deny_write=deny_write, model=model, cwd=cwd, item_logger=item_logger)
     if result.success:
         print(f"✅ {agent_name} completed")
-        return parse_agent_stats(result.output) if result.output else None
+        return _result_stats(result)
     print(f"❌ {agent_name} failed: {result.error}")
     return None
 
 # Backward-compatible aliases
-def _run_beads_only_agent(agent_name: str, agent_item: BeadsWorkItem, agent_prompt: str, model: Optional[str] = None, cwd: Optional[str] = None) -> Optional[AgentStats]:
+def _run_beads_only_agent(agent_name: str, agent_item: BeadsWorkItem, agent_prompt: str, model: Optional[str] = None, cwd: Optional[str] = None, item_logger: Optional['ItemLogger'] = None) -> Optional[AgentStats]:
     """Run a beads-only maintenance agent in the main repo."""
-    return _run_simple_agent(agent_name, agent_item, agent_prompt, deny_write=True, model=model, cwd=cwd)
+    return _run_simple_agent(agent_name, agent_item, agent_prompt, deny_write=True, model=model, cwd=cwd, item_logger=item_logger)
 
-def _run_main_repo_agent(agent_name: str, agent_item: BeadsWorkItem, agent_prompt: str, model: Optional[str] = None, cwd: Optional[str] = None) -> Optional[AgentStats]:
+def _run_main_repo_agent(agent_name: str, agent_item: BeadsWorkItem, agent_prompt: str, model: Optional[str] = None, cwd: Optional[str] = None, item_logger: Optional['ItemLogger'] = None) -> Optional[AgentStats]:
     """Run a maintenance agent in the main repo WITH write access."""
-    return _run_simple_agent(agent_name, agent_item, agent_prompt, deny_write=False, model=model, cwd=cwd)
+    return _run_simple_agent(agent_name, agent_item, agent_prompt, deny_write=False, model=model, cwd=cwd, item_logger=item_logger)
 
 
-def run_worktree_cleanup(repo_root: Optional[Path] = None) -> Optional[AgentStats]:
-    """Run worktree cleanup agent to merge/delete stale worktrees."""
+def run_worktree_cleanup(repo_root: Optional[Path] = None, keep_item_ids: Iterable[str] = (), item_logger: Optional['ItemLogger'] = None) -> Optional[AgentStats]:
+    """Run worktree cleanup agent to merge/delete stale worktrees.
+    
+    Args:
+        repo_root: Main repository the agent works in.
+        keep_item_ids: Items being worked on right now; the agent is told to
+            leave their worktrees alone.
+        item_logger: Log for the agent's full output.
+    """
     terminal_ui.ui.set_current_agent("Worktree Cleanup")
     print(f"\n{'='*60}\n🌳 Running Worktree Cleanup Agent\n{'='*60}")
     
@@ -159,7 +173,7 @@ def run_worktree_cleanup(repo_root: Optional[Path] = None) -> Optional[AgentStat
         print(f"❌ Prompt not found at {prompt_path}")
         return None
     
-    cleanup_prompt = prompt_path.read_text(encoding='utf-8')
+    cleanup_prompt = prompt_path.read_text(encoding='utf-8') + _worktrees_in_use_section(keep_item_ids)
     
     agent_id = "worktree-cleanup"
     cleanup_item = BeadsWorkItem(
@@ -174,10 +188,25 @@ def run_worktree_cleanup(repo_root: Optional[Path] = None) -> Optional[AgentStat
     
     # Pass repo_root as cwd to the agent instead of changing process directory
     cwd = str(repo_root) if repo_root is not None else None
-    return _run_main_repo_agent("Worktree Cleanup", cleanup_item, cleanup_prompt, cwd=cwd)
+    return _run_main_repo_agent("Worktree Cleanup", cleanup_item, cleanup_prompt, cwd=cwd, item_logger=item_logger)
+
+
+def _worktrees_in_use_section(item_ids: Iterable[str]) -> str:
+    """Prompt section listing the live worktrees the cleanup agent must skip."""
+    lines = [
+        f"- `worktrees/task-{sanitize_branch_name(item_id)}` (branch `task/{sanitize_branch_name(item_id)}`)"
+        for item_id in sorted(item_ids)
+    ]
+    if not lines:
+        return ""
+    return (
+        "\n\n## ⛔ Worktrees In Use - Do NOT Touch\n\n"
+        "Other agents are working in these worktrees right now. "
+        "Do not merge, delete or modify them:\n\n" + "\n".join(lines) + "\n"
+    )
 
 
-def _run_worktree_agent(agent_name: str, agent_id: str, agent_item: BeadsWorkItem, agent_prompt: str, repo_root: Path, merge_changes: bool = True, model: Optional[str] = None) -> Optional[AgentStats]:
+def _run_worktree_agent(agent_name: str, agent_id: str, agent_item: BeadsWorkItem, agent_prompt: str, repo_root: Path, merge_changes: bool = True, model: Optional[str] = None, item_logger: Optional['ItemLogger'] = None) -> Optional[AgentStats]:
     """Run a code-modifying maintenance agent in a worktree."""
     print(f"\n🌳 Creating worktree for {agent_id}...")
     try:
@@ -193,7 +222,7 @@ def _run_worktree_agent(agent_name: str, agent_id: str, agent_item: BeadsWorkIte
         print(f"   Model: {model}")
     
     try:
-        result = invoke_copilot(agent_item, prompt=agent_prompt, model=model, cwd=worktree_cwd)
+        result = invoke_copilot(agent_item, prompt=agent_prompt, model=model, cwd=worktree_cwd, item_logger=item_logger)
     except Exception as e:
         print(f"❌ Error invoking Copilot: {e}")
         from pokepoke.types import CopilotResult
@@ -205,7 +234,7 @@ def _run_worktree_agent(agent_name: str, agent_id: str, agent_item: BeadsWorkIte
             attempt_count=1
         )
     
-    cleanup_success, _ = run_cleanup_loop(agent_item, result, repo_root, cwd=worktree_cwd)
+    cleanup_success, _ = run_cleanup_loop(agent_item, result, repo_root, cwd=worktree_cwd, item_logger=item_logger)
     
     if not cleanup_success:
         result.success = False
@@ -216,11 +245,11 @@ def _run_worktree_agent(agent_name: str, agent_id: str, agent_item: BeadsWorkIte
         if not merge_changes:
             print("   Discarding worktree (merge_changes=False)")
             cleanup_worktree(agent_id, force=True)
-            return parse_agent_stats(result.output) if result.output else None
+            return _result_stats(result)
 
         print("   All changes committed and validated")
         
-        agent_stats = parse_agent_stats(result.output) if result.output else None
+        agent_stats = _result_stats(result)
         
         # Check if main repo is ready for merge
         from pokepoke.git_operations import check_main_repo_ready_for_merge
@@ -234,7 +263,7 @@ def _run_worktree_agent(agent_name: str, agent_id: str, agent_item: BeadsWorkIte
             
             print(f"   Invoking cleanup agent to resolve uncommitted changes before merge...")
             # We use agent_item as context
-            cleanup_success, _ = invoke_cleanup_agent(agent_item, repo_root)
+            cleanup_success, _ = invoke_cleanup_agent(agent_item, repo_root, item_logger=item_logger)
             
             if cleanup_success:
                  print("   Cleanup successful, retrying merge check...")
@@ -273,7 +302,8 @@ def _run_worktree_agent(agent_name: str, agent_id: str, agent_item: BeadsWorkIte
                 agent_item, 
                 repo_root, 
                 f"Merge conflict detected in {len(unmerged_files)} file(s)",
-                unmerged_files=unmerged_files
+                unmerged_files=unmerged_files,
+                item_logger=item_logger
             )
             
             if success:
@@ -314,7 +344,7 @@ def _run_worktree_agent(agent_name: str, agent_id: str, agent_item: BeadsWorkIte
         return None
 
 
-def run_beta_tester(repo_root: Optional[Path] = None) -> Optional[AgentStats]:
+def run_beta_tester(repo_root: Optional[Path] = None, item_logger: Optional['ItemLogger'] = None) -> Optional[AgentStats]:
     """Run beta tester agent to test all MCP tools. Restarts MCP server first."""
     config = get_config()
 
@@ -382,4 +412,4 @@ def run_beta_tester(repo_root: Optional[Path] = None) -> Optional[AgentStats]:
     print("\n🧪 Invoking beta tester agent in isolated worktree (will be discarded)...")
     if repo_root is None:
         repo_root = Path.cwd()
-    return _run_worktree_agent("Beta Tester", agent_id, beta_item, beta_prompt, repo_root, merge_changes=False)
+    return _run_worktree_agent("Beta Tester", agent_id, beta_item, beta_prompt, repo_root, merge_changes=False, item_logger=item_logger)
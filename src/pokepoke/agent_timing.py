@@ -0,0 +1,113 @@
+"""Latency histograms and timing roll-ups for agent runs.
+
+The session event collector times every exchange: time to first token,
+model time per turn, execution time per tool call and the idle wait spent
+confirming completion. Those land in ``AgentStats`` as fixed-bucket
+histograms. Unlike raw samples, histograms add up across exchanges, items
+and the whole session. ``item_latency_record`` condenses one item's stats
+into the breakdown written to stats.json.
+"""
+
+from typing import Dict, List
+
+from .types import LATENCY_BUCKETS, AgentStats, ItemLatencyRecord, LatencyHistogram
+
+# Tools listed in per-item breakdowns and the session summary
+_TOP_TOOLS = 5
+
+
+def record_latency(histogram: LatencyHistogram, seconds: float) -> None:
+    """Count one duration."""
+    bucket = next((i for i, bound in enumerate(LATENCY_BUCKETS) if seconds <= bound), len(LATENCY_BUCKETS))
+    histogram.counts[bucket] += 1
+    histogram.total_seconds += seconds
+    histogram.max_seconds = max(histogram.max_seconds, seconds)
+
+
+def merge_histogram(target: LatencyHistogram, source: LatencyHistogram) -> None:
+    """Add ``source``'s counts to ``target``."""
+    target.counts = [a + b for a, b in zip(target.counts, source.counts)]
+    target.total_seconds += source.total_seconds
+    target.max_seconds = max(target.max_seconds, source.max_seconds)
+
+
+def histogram_count(histogram: LatencyHistogram) -> int:
+    return sum(histogram.counts)
+
+
+def histogram_percentile(histogram: LatencyHistogram, pct: int) -> float:
+    """Upper bound of the bucket holding the ``pct``-th percentile (0 if empty)."""
+    total = histogram_count(histogram)
+    if not total:
+        return 0.0
+    rank = total * pct / 100
+    seen = 0
+    for bound, count in zip(LATENCY_BUCKETS, histogram.counts):
+        seen += count
+        if seen >= rank:
+            return min(bound, histogram.max_seconds)
+    return histogram.max_seconds
+
+
+def merge_agent_stats(target: AgentStats, source: AgentStats) -> None:
+    """Add every counter, duration and histogram of ``source`` to ``target``."""
+    target.wall_duration += source.wall_duration
+    target.api_duration += source.api_duration
+    target.input_tokens += source.input_tokens
+    target.output_tokens += source.output_tokens
+    target.cache_read_tokens += source.cache_read_tokens
+    target.cache_write_tokens += source.cache_write_tokens
+    target.lines_added += source.lines_added
+    target.lines_removed += source.lines_removed
+    target.premium_requests += source.premium_requests
+    target.tool_calls += source.tool_calls
+    target.retries += source.retries
+    target.tool_duration += source.tool_duration
+    target.idle_wait_duration += source.idle_wait_duration
+    merge_histogram(target.first_token_latency, source.first_token_latency)
+    merge_histogram(target.turn_latency, source.turn_latency)
+    for name, histogram in source.tool_latency.items():
+        merge_histogram(target.tool_latency.setdefault(name, LatencyHistogram()), histogram)
+
+
+def slowest_tools(stats: AgentStats) -> Dict[str, float]:
+    """Tools by total execution time, slowest first."""
+    ranked = sorted(stats.tool_latency.items(), key=lambda kv: kv[1].total_seconds, reverse=True)
+    return {name: round(h.total_seconds, 2) for name, h in ranked[:_TOP_TOOLS]}
+
+
+def item_latency_record(item_id: str, total_seconds: float, stats: AgentStats) -> ItemLatencyRecord:
+    """Where one item's time went."""
+    return ItemLatencyRecord(
+        item_id=item_id,
+        total=round(total_seconds, 2),
+        agent=round(stats.wall_duration, 2),
+        model=round(stats.api_duration, 2),
+        tools=round(stats.tool_duration, 2),
+        idle_wait=round(stats.idle_wait_duration, 2),
+        turns=histogram_count(stats.turn_latency),
+        turn_p50=histogram_percentile(stats.turn_latency, 50),
+        turn_p90=histogram_percentile(stats.turn_latency, 90),
+        first_token_p50=histogram_percentile(stats.first_token_latency, 50),
+        slowest_tools=slowest_tools(stats),
+    )
+
+
+def latency_summary(stats: AgentStats) -> List[str]:
+    """Lines describing where agent time went, for the session statistics."""
+    lines = []
+    if histogram_count(stats.first_token_latency):
+        first = stats.first_token_latency
+        lines.append(f"🕐 First token:        p50 {histogram_percentile(first, 50):.1f}s, "
+                     f"p90 {histogram_percentile(first, 90):.1f}s, max {first.max_seconds:.1f}s")
+    if histogram_count(stats.turn_latency):
+        turns = stats.turn_latency
+        lines.append(f"🧠 Model per turn:     p50 {histogram_percentile(turns, 50):.1f}s, "
+                     f"p90 {histogram_percentile(turns, 90):.1f}s, max {turns.max_seconds:.1f}s "
+                     f"({histogram_count(turns)} turns)")
+    if stats.tool_duration > 0:
+        top = ", ".join(f"{name} {seconds:.0f}s" for name, seconds in slowest_tools(stats).items())
+        lines.append(f"🔧 Tool time:          {stats.tool_duration:.1f}s ({top})")
+    if stats.idle_wait_duration > 0:
+        lines.append(f"💤 Idle wait:          {stats.idle_wait_duration:.1f}s")
+    return lines
@@ -0,0 +1,141 @@
+"""Long-lived asyncio event loop shared by all Copilot invocations.
+
+Every agent invocation (work, cleanup, gate, maintenance) used to call
+``asyncio.run``, building and tearing down an event loop each time. The
+runtime instead keeps one loop running on a daemon thread. Synchronous
+callers hand it a coroutine with ``run_coroutine`` and block until it
+finishes. Agents invoked from several threads at once (parallel workers,
+the maintenance lane) then run as coroutines on the same loop.
+"""
+
+import asyncio
+import atexit
+import concurrent.futures
+import threading
+import time
+from typing import Any, Coroutine, Optional, TypeVar
+
+T = TypeVar('T')
+
+# How often a blocked caller wakes up, so Ctrl+C reaches it promptly
+_RESULT_POLL_SECONDS = 0.5
+
+# Time allowed for cancelled coroutines to clean up when stopping
+_STOP_TIMEOUT_SECONDS = 5.0
+
+
+class AsyncRuntime:
+    """An event loop running on its own thread, with a sync facade."""
+
+    def __init__(self, name: str = "pokepoke-async") -> None:
+        self.name = name
+        self._lock = threading.Lock()
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def running(self) -> bool:
+        return self._thread is not None and self._thread.is_alive()
+
+    def loop(self) -> asyncio.AbstractEventLoop:
+        """Return the runtime's loop, starting its thread on first use."""
+        with self._lock:
+            if self._loop is None or not self.running:
+                loop = asyncio.new_event_loop()
+                started = threading.Event()
+                thread = threading.Thread(
+                    target=self._run_loop, args=(loop, started), name=self.name, daemon=True
+                )
+                thread.start()
+                started.wait()
+                self._loop, self._thread = loop, thread
+            return self._loop
+
+    def submit(self, coro: Coroutine[Any, Any, T]) -> 'concurrent.futures.Future[T]':
+        """Schedule a coroutine on the loop without waiting for it."""
+        return asyncio.run_coroutine_threadsafe(coro, self.loop())
+
+    def run(self, coro: Coroutine[Any, Any, T], timeout: Optional[float] = None) -> T:
+        """Run a coroutine on the loop and block until it returns.
+
+        Raises:
+            RuntimeError: If called from the loop's own thread, which would deadlock.
+            TimeoutError: If ``timeout`` passes first (the coroutine is cancelled).
+        """
+        if self._thread is not None and threading.current_thread() is self._thread:
+            coro.close()
+            raise RuntimeError("AsyncRuntime.run() called from the event loop thread; await the coroutine instead")
+        future = self.submit(coro)
+        deadline = None if timeout is None else time.monotonic() + timeout
+        try:
+            while True:
+                wait = _RESULT_POLL_SECONDS
+                if deadline is not None:
+                    wait = min(wait, max(0.0, deadline - time.monotonic()))
+                try:
+                    return future.result(timeout=wait)
+                except concurrent.futures.TimeoutError:
+                    if deadline is not None and time.monotonic() >= deadline:
+                        raise TimeoutError(f"Coroutine did not finish within {timeout}s")
+        except BaseException:
+            # Ctrl+C or timeout in the caller - don't leave the coroutine running
+            future.cancel()
+            raise
+
+    def stop(self) -> None:
+        """Cancel outstanding coroutines and stop the loop thread."""
+        with self._lock:
+            loop, thread = self._loop, self._thread
+            self._loop = self._thread = None
+        if loop is None or thread is None or not thread.is_alive():
+            return
+        try:
+            asyncio.run_coroutine_threadsafe(_cancel_pending(), loop).result(_STOP_TIMEOUT_SECONDS)
+        except Exception:
+            pass
+        loop.call_soon_threadsafe(loop.stop)
+        thread.join(_STOP_TIMEOUT_SECONDS)
+        if not thread.is_alive():
+            loop.close()
+
+    @staticmethod
+    def _run_loop(loop: asyncio.AbstractEventLoop, started: threading.Event) -> None:
+        asyncio.set_event_loop(loop)
+        loop.call_soon(started.set)
+        loop.run_forever()
+
+
+async def _cancel_pending() -> None:
+    current = asyncio.current_task()
+    tasks = [task for task in asyncio.all_tasks() if task is not current]
+    for task in tasks:
+        task.cancel()
+    await asyncio.gather(*tasks, return_exceptions=True)
+
+
+_runtime: Optional[AsyncRuntime] = None
+_runtime_lock = threading.Lock()
+
+
+def get_runtime() -> AsyncRuntime:
+    """Return the process-wide runtime (its loop starts on first use)."""
+    global _runtime
+    with _runtime_lock:
+        if _runtime is None:
+            _runtime = AsyncRuntime()
+            atexit.register(_runtime.stop)
+        return _runtime
+
+
+def run_coroutine(coro: Coroutine[Any, Any, T], timeout: Optional[float] = None) -> T:
+    """Run a coroutine on the shared loop and block until it returns."""
+    return get_runtime().run(coro, timeout=timeout)
+
+
+def stop_runtime() -> None:
+    """Stop the shared loop (a later call to ``get_runtime`` starts a new one)."""
+    global _runtime
+    with _runtime_lock:
+        runtime, _runtime = _runtime, None
+    if runtime is not None:
+        runtime.stop()
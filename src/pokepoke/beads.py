@@ -3,15 +3,25 @@
 This module provides a unified interface to beads operations.
 Implementation is split across:
 - beads_query: Query operations
+- beads_parsing: Shared parsing of bd --json output
 - beads_hierarchy: Parent-child relationships
 - beads_management: Item management and filtering
+- beads_create: Issue creation
+- beads_graph: In-memory snapshot of the whole issue graph
+- beads_index: Memoized hierarchy index for leaf selection
+- beads_sync: Coalescing background bd sync worker
+- beads_leases: Expiring claim leases and their heartbeat
+- beads_stats: Database statistics computed without spawning bd
 """
 
 # Re-export all public functions for backward compatibility
 from .beads_query import (
     get_ready_work_items,
     get_issue_dependencies,
-    get_beads_stats
+    get_issues_bulk,
+    get_beads_stats,
+    get_issue_cache_stats,
+    invalidate_issue_cache
 )
 
 from .beads_hierarchy import (
@@ -21,12 +31,33 @@ from .beads_hierarchy import (
     close_parent_if_complete,
     get_parent_id,
     has_feature_parent,
+    get_feature_parent_ids,
     resolve_to_leaf_task
 )
 
+from .beads_graph import (
+    BeadsGraph,
+    load_beads_graph
+)
+
+from .beads_index import HierarchyIndex
+
+from .beads_sync import (
+    SyncLockBusy,
+    request_sync,
+    await_sync,
+    sync_now
+)
+
+from .beads_leases import (
+    LeaseHeartbeat,
+    is_lease_expired
+)
+
+from .beads_create import create_issue
+
 from .beads_management import (
     close_item,
-    create_issue,
     filter_work_items,
     get_first_ready_work_item,
     select_next_hierarchical_item,
@@ -38,7 +69,10 @@ __all__ = [
     # Query operations
     'get_ready_work_items',
     'get_issue_dependencies',
+    'get_issues_bulk',
     'get_beads_stats',
+    'get_issue_cache_stats',
+    'invalidate_issue_cache',
     
     # Hierarchy operations
     'get_children',
@@ -47,8 +81,24 @@ __all__ = [
     'close_parent_if_complete',
     'get_parent_id',
     'has_feature_parent',
+    'get_feature_parent_ids',
     'resolve_to_leaf_task',
     
+    # Snapshot operations
+    'BeadsGraph',
+    'HierarchyIndex',
+    'load_beads_graph',
+    
+    # Sync operations
+    'SyncLockBusy',
+    'request_sync',
+    'await_sync',
+    'sync_now',
+    
+    # Lease operations
+    'LeaseHeartbeat',
+    'is_lease_expired',
+    
     # Management operations
     'close_item',
     'create_issue',
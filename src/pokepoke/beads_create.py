@@ -0,0 +1,124 @@
+"""Beads issue creation - new work items and cleanup delegation issues."""
+
+import json
+import subprocess
+from typing import List, Optional
+
+from .beads_parsing import parse_bd_json
+from .beads_query import invalidate_issue_cache
+from .beads_stats import record_status_change
+
+
+def create_issue(
+    title: str,
+    issue_type: str = "task",
+    priority: int = 1,
+    description: str = "",
+    labels: Optional[List[str]] = None,
+    parent_id: Optional[str] = None
+) -> Optional[str]:
+    """Create a new beads issue.
+    
+    Args:
+        title: Issue title
+        issue_type: Type of issue (task, bug, feature, epic, chore)
+        priority: Priority (0=critical, 1=high, 2=medium, 3=low, 4=backlog)
+        description: Issue description
+        labels: List of labels to add
+        parent_id: Parent issue ID for dependencies
+        
+    Returns:
+        Created issue ID, or None if creation failed
+    """
+    try:
+        cmd = ['bd', 'create', title, '-t', issue_type, '-p', str(priority)]
+        
+        if description:
+            cmd.extend(['-d', description])
+        
+        if parent_id:
+            cmd.extend(['--deps', f'parent:{parent_id}'])
+        
+        cmd.append('--json')
+        
+        result = subprocess.run(
+            cmd,
+            capture_output=True,
+            text=True,
+            encoding='utf-8',
+            check=True
+        )
+        
+        # Parse JSON output to get issue ID
+        data = parse_bd_json(result.stdout)
+        
+        if data is not None:
+            # Handle both array and single object responses
+            if isinstance(data, list):
+                issue_id = data[0].get('id') if data else None
+            else:
+                issue_id = data.get('id')
+            
+            if issue_id:
+                record_status_change(issue_id, None, 'open')
+            
+            # The parent's dependents list just changed
+            if parent_id:
+                invalidate_issue_cache(parent_id)
+            
+            # Add labels if provided
+            if labels and issue_id:
+                subprocess.run(
+                    ['bd', 'label', 'add', issue_id] + labels + ['--json'],
+                    capture_output=True,
+                    text=True,
+                    encoding='utf-8'
+                )
+            
+            return issue_id
+        
+        return None
+        
+    except (subprocess.CalledProcessError, json.JSONDecodeError, KeyError) as e:
+        print(f"⚠️  Failed to create issue: {e}")
+        return None
+
+
+def create_cleanup_delegation_issue(
+    title: str,
+    description: str,
+    labels: Optional[List[str]] = None,
+    parent_id: Optional[str] = None,
+    priority: int = 0
+) -> Optional[str]:
+    """Create a cleanup/delegation issue for agent to handle.
+    
+    Used when automated operations fail and require manual/agent intervention.
+    
+    Args:
+        title: Issue title
+        description: Detailed description of the cleanup needed
+        labels: Labels to add (defaults to ['cleanup', 'delegation'])
+        parent_id: Optional parent issue that this relates to
+        priority: Priority (default 0 = critical, needs immediate attention)
+        
+    Returns:
+        Created issue ID, or None if creation failed
+    """
+    default_labels = ['cleanup', 'delegation']
+    all_labels = list(set(default_labels + (labels or [])))
+    
+    issue_id = create_issue(
+        title=title,
+        issue_type='task',
+        priority=priority,
+        description=description,
+        labels=all_labels,
+        parent_id=parent_id
+    )
+    
+    if issue_id:
+        print(f"\n📋 Created delegation issue: {issue_id}")
+        print("   An agent will handle this cleanup automatically")
+    
+    return issue_id
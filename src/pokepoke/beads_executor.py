@@ -0,0 +1,229 @@
+"""Async executor for concurrent `bd` invocations.
+
+Independent beads lookups (chunks of a bulk `bd show`, per-issue fallbacks,
+stats collection) can overlap instead of running back to back. The executor
+runs them as asyncio subprocesses with a bounded number in flight, a
+per-call timeout, and cancellation as soon as shutdown is requested.
+
+``get_beads_executor`` returns one executor per process, so the limit on
+bd processes in flight holds across every worker thread, not just within
+one batch. The slots are an asyncio.Semaphore on the shared runtime loop;
+blocking calls from other threads take a slot through the runtime too.
+"""
+
+import asyncio
+import subprocess
+import threading
+import weakref
+from typing import Callable, List, Optional, Sequence, Tuple, Union
+
+from .async_runtime import run_coroutine
+from .config import get_config
+from .shutdown import is_shutting_down
+
+# How often running commands check for a shutdown request (seconds)
+_SHUTDOWN_POLL_SECONDS = 0.1
+
+BdOutcome = Union['subprocess.CompletedProcess[str]', BaseException]
+
+
+class BeadsCommandCancelled(Exception):
+    """A bd command was cancelled because PokePoke is shutting down."""
+
+
+class BeadsExecutor:
+    """Runs bd commands as asyncio subprocesses with bounded concurrency."""
+
+    def __init__(self, max_concurrency: int = 4, timeout: float = 30.0) -> None:
+        self.max_concurrency = max(1, max_concurrency)
+        self.timeout = timeout
+        # Slots per event loop; in practice all calls run on the shared runtime's
+        self._slots: 'weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, asyncio.Semaphore]' = (
+            weakref.WeakKeyDictionary()
+        )
+        self._slots_lock = threading.Lock()
+
+    def _loop_slots(self) -> asyncio.Semaphore:
+        loop = asyncio.get_running_loop()
+        with self._slots_lock:
+            slots = self._slots.get(loop)
+            if slots is None:
+                slots = self._slots[loop] = asyncio.Semaphore(self.max_concurrency)
+            return slots
+
+    async def _acquire_slot(self, args: Sequence[str]) -> asyncio.Semaphore:
+        """Wait for a free slot, giving up if shutdown is requested.
+
+        Returns:
+            The semaphore to release the slot on.
+        """
+        slots = self._loop_slots()
+        acquire = asyncio.ensure_future(slots.acquire())
+        try:
+            while not acquire.done():
+                if is_shutting_down():
+                    raise BeadsCommandCancelled(' '.join(args))
+                await asyncio.wait({acquire}, timeout=_SHUTDOWN_POLL_SECONDS)
+        except BaseException:
+            if not acquire.cancel():
+                slots.release()  # Acquired just as we gave up
+            raise
+        return slots
+
+    async def _acquire_slot_on_loop(
+        self, args: Sequence[str]
+    ) -> Tuple[asyncio.AbstractEventLoop, asyncio.Semaphore]:
+        return asyncio.get_running_loop(), await self._acquire_slot(args)
+
+    def _hold_slot(self, args: Sequence[str]) -> Callable[[], None]:
+        """Take a slot on the shared runtime for a command run in this thread.
+
+        Returns:
+            The function that gives the slot back.
+
+        Raises:
+            BeadsCommandCancelled: Shutdown was requested while waiting.
+        """
+        if _in_event_loop():
+            # A caller already blocking an event loop can't wait on the runtime
+            return lambda: None
+        loop, slots = run_coroutine(self._acquire_slot_on_loop(args))
+
+        def release() -> None:
+            try:
+                loop.call_soon_threadsafe(slots.release)
+            except RuntimeError:
+                pass  # The runtime stopped; its slots went with it
+        return release
+
+    async def run(
+        self,
+        args: Sequence[str],
+        cwd: Optional[str] = None,
+        check: bool = True,
+    ) -> 'subprocess.CompletedProcess[str]':
+        """Run one command, killing it on timeout or shutdown.
+
+        Raises:
+            subprocess.CalledProcessError: Non-zero exit with check=True.
+            subprocess.TimeoutExpired: The command exceeded the timeout.
+            BeadsCommandCancelled: Shutdown was requested.
+        """
+        slots = await self._acquire_slot(args)
+        try:
+            if is_shutting_down():
+                raise BeadsCommandCancelled(' '.join(args))
+            proc = await asyncio.create_subprocess_exec(
+                *args,
+                stdout=asyncio.subprocess.PIPE,
+                stderr=asyncio.subprocess.PIPE,
+                cwd=cwd,
+            )
+            communicate = asyncio.ensure_future(proc.communicate())
+            loop = asyncio.get_running_loop()
+            deadline = loop.time() + self.timeout
+            try:
+                while not communicate.done():
+                    if is_shutting_down():
+                        raise BeadsCommandCancelled(' '.join(args))
+                    remaining = deadline - loop.time()
+                    if remaining <= 0:
+                        raise subprocess.TimeoutExpired(list(args), self.timeout)
+                    await asyncio.wait(
+                        {communicate}, timeout=min(remaining, _SHUTDOWN_POLL_SECONDS)
+                    )
+            except BaseException:
+                if proc.returncode is None:
+                    proc.kill()
+                communicate.cancel()
+                await asyncio.gather(communicate, return_exceptions=True)
+                await proc.wait()
+                raise
+
+            stdout_bytes, stderr_bytes = communicate.result()
+        finally:
+            slots.release()
+
+        stdout = stdout_bytes.decode('utf-8', errors='replace')
+        stderr = stderr_bytes.decode('utf-8', errors='replace')
+        returncode = proc.returncode if proc.returncode is not None else -1
+        if check and returncode != 0:
+            raise subprocess.CalledProcessError(returncode, list(args), stdout, stderr)
+        return subprocess.CompletedProcess(list(args), returncode, stdout, stderr)
+
+    async def run_all(
+        self,
+        commands: Sequence[Sequence[str]],
+        cwd: Optional[str] = None,
+        check: bool = True,
+    ) -> List[BdOutcome]:
+        """Run commands concurrently; each result is a CompletedProcess or the error."""
+        return list(await asyncio.gather(
+            *(self.run(args, cwd=cwd, check=check) for args in commands),
+            return_exceptions=True,
+        ))
+
+    def run_many(
+        self,
+        commands: Sequence[Sequence[str]],
+        cwd: Optional[str] = None,
+        check: bool = True,
+    ) -> List[BdOutcome]:
+        """Blocking wrapper around run_all for synchronous callers.
+
+        A single command (or a caller already inside an event loop) runs
+        through plain subprocess.run, so there is no overhead when there is
+        nothing to overlap.
+        """
+        if not commands:
+            return []
+        if len(commands) == 1 or _in_event_loop():
+            return [self._run_blocking(args, cwd, check) for args in commands]
+        return run_coroutine(self.run_all(commands, cwd=cwd, check=check))
+
+    def _run_blocking(self, args: Sequence[str], cwd: Optional[str], check: bool) -> BdOutcome:
+        try:
+            release = self._hold_slot(args)
+        except BeadsCommandCancelled as e:
+            return e
+        try:
+            if is_shutting_down():
+                return BeadsCommandCancelled(' '.join(args))
+            return subprocess.run(
+                list(args),
+                capture_output=True,
+                text=True,
+                encoding='utf-8',
+                check=check,
+                cwd=cwd,
+                timeout=self.timeout,
+            )
+        except (subprocess.SubprocessError, OSError) as e:
+            return e
+        finally:
+            release()
+
+
+def _in_event_loop() -> bool:
+    try:
+        asyncio.get_running_loop()
+        return True
+    except RuntimeError:
+        return False
+
+
+_executor: Optional[BeadsExecutor] = None
+_executor_settings: Optional[Tuple[int, float]] = None
+_executor_lock = threading.Lock()
+
+
+def get_beads_executor() -> BeadsExecutor:
+    """The process-wide executor, using the project's beads settings."""
+    global _executor, _executor_settings
+    beads_config = get_config().beads
+    settings = (beads_config.max_concurrency, beads_config.command_timeout)
+    with _executor_lock:
+        if _executor is None or settings != _executor_settings:
+            _executor = BeadsExecutor(max_concurrency=settings[0], timeout=settings[1])
+            _executor_settings = settings
+        return _executor
@@ -0,0 +1,233 @@
+"""In-memory snapshot of the beads issue graph.
+
+Loads the whole issue set (status, priority, type, labels, assignee and
+parent/blocks edges) in a single bulk call so that hierarchy questions can
+be answered from memory instead of spawning ``bd show`` once per issue.
+"""
+
+import dataclasses
+import json
+import subprocess
+from typing import Any, Dict, Iterable, List, Optional
+
+from .types import BeadsWorkItem, BeadsStats
+from .beads_query import _direct_snapshot
+from .beads_parsing import work_item_from_dict
+
+# Dependency types linking a child to its parent epic/feature
+# (older bd versions export 'parent', newer ones 'parent-child')
+PARENT_DEPENDENCY_TYPES = ('parent', 'parent-child')
+
+# Dependency types where the target must close before the issue is ready
+BLOCKING_DEPENDENCY_TYPES = ('blocks',)
+
+COMPLETE_STATUSES = ('done', 'closed', 'resolved')
+
+# Statuses `bd ready` considers workable (when nothing blocks them)
+READY_STATUSES = ('open', 'in_progress')
+
+
+class BeadsGraph:
+    """Snapshot of all beads issues with their parent/child and blocks edges.
+
+    Built once per selection pass; every lookup afterwards is a dict access.
+    Call ``set_status`` after our own ``bd update``/``bd close`` calls to keep
+    the snapshot consistent with what we just wrote. Snapshots read from
+    issues.jsonl are shared between threads, so ``set_status`` swaps in an
+    updated item instead of changing the one other callers may hold.
+    """
+
+    def __init__(self) -> None:
+        self._items: Dict[str, BeadsWorkItem] = {}
+        self._parent: Dict[str, str] = {}
+        self._children: Dict[str, List[str]] = {}
+        self._blocked_by: Dict[str, List[str]] = {}
+
+    @classmethod
+    def from_records(cls, records: Iterable[Dict[str, Any]]) -> 'BeadsGraph':
+        """Build a graph from issue records (``bd export`` / issues.jsonl format).
+
+        Dependency entries are accepted in both the export shape
+        (``depends_on_id``/``type``) and the ``bd show`` shape
+        (``id``/``dependency_type``).
+        """
+        graph = cls()
+        for record in records:
+            graph.add_record(record)
+        return graph
+
+    def add_record(self, record: Dict[str, Any]) -> None:
+        """Add or replace a single issue record in the snapshot."""
+        issue_id = record['id']
+        if issue_id in self._items:
+            self._remove_edges(issue_id)
+        self._items[issue_id] = work_item_from_dict(record)
+
+        for dep in record.get('dependencies') or []:
+            target = dep.get('depends_on_id') or dep.get('id')
+            dep_type = dep.get('type') or dep.get('dependency_type')
+            if not target or target == issue_id:
+                continue
+            if dep_type in PARENT_DEPENDENCY_TYPES:
+                self._parent[issue_id] = target
+                self._children.setdefault(target, []).append(issue_id)
+            elif dep_type in BLOCKING_DEPENDENCY_TYPES:
+                self._blocked_by.setdefault(issue_id, []).append(target)
+
+    def _remove_edges(self, issue_id: str) -> None:
+        """Drop the outgoing edges of an issue before it is replaced."""
+        parent_id = self._parent.pop(issue_id, None)
+        if parent_id is not None:
+            siblings = self._children.get(parent_id, [])
+            if issue_id in siblings:
+                siblings.remove(issue_id)
+        self._blocked_by.pop(issue_id, None)
+
+    def __len__(self) -> int:
+        return len(self._items)
+
+    def __contains__(self, issue_id: object) -> bool:
+        return issue_id in self._items
+
+    def get(self, issue_id: str) -> Optional[BeadsWorkItem]:
+        """Return the snapshot of an issue, or None if unknown."""
+        return self._items.get(issue_id)
+
+    def items(self) -> List[BeadsWorkItem]:
+        """Return every issue in the snapshot."""
+        return list(self._items.values())
+
+    def set_status(self, issue_id: str, status: str) -> None:
+        """Record a status change we made so later lookups see it."""
+        item = self._items.get(issue_id)
+        if item is not None:
+            self._items[issue_id] = dataclasses.replace(item, status=status)
+
+    def get_children(self, parent_id: str) -> List[BeadsWorkItem]:
+        """Get all child items of a parent issue."""
+        return [
+            self._items[child_id]
+            for child_id in self._children.get(parent_id, [])
+            if child_id in self._items
+        ]
+
+    def get_parent_id(self, child_id: str) -> Optional[str]:
+        """Get the parent ID of a child item, or None."""
+        return self._parent.get(child_id)
+
+    def get_blocker_ids(self, issue_id: str) -> List[str]:
+        """Get the IDs of issues that block this one (open or not)."""
+        return list(self._blocked_by.get(issue_id, []))
+
+    def has_feature_parent(self, issue_id: str) -> bool:
+        """Check if an issue's parent is a feature."""
+        parent_id = self._parent.get(issue_id)
+        if parent_id is None:
+            return False
+        parent = self._items.get(parent_id)
+        return parent is not None and parent.issue_type == 'feature'
+
+    def all_children_complete(self, parent_id: str) -> bool:
+        """Check if all children are complete (False when there are none)."""
+        children = self.get_children(parent_id)
+        if not children:
+            return False
+        return all(child.status in COMPLETE_STATUSES for child in children)
+
+    def _is_blocked(self, issue_id: str, _seen: Optional[set[str]] = None) -> bool:
+        """Check for open blockers on the issue or any of its ancestors."""
+        seen = _seen if _seen is not None else set()
+        if issue_id in seen:
+            return False
+        seen.add(issue_id)
+        for blocker_id in self._blocked_by.get(issue_id, []):
+            blocker = self._items.get(blocker_id)
+            if blocker is not None and blocker.status not in COMPLETE_STATUSES:
+                return True
+        parent_id = self._parent.get(issue_id)
+        return parent_id is not None and self._is_blocked(parent_id, seen)
+
+    def ready_items(self) -> List[BeadsWorkItem]:
+        """Compute what ``bd ready`` would return from the snapshot.
+
+        Open or in-progress issues with no open blockers (blocking is
+        inherited from parents), ordered by priority then age.
+        """
+        ready = [
+            item for item in self._items.values()
+            if item.status in READY_STATUSES and not self._is_blocked(item.id)
+        ]
+        ready.sort(key=lambda x: (x.priority, x.created_at or ''))
+        return ready
+
+    def stats(self) -> BeadsStats:
+        """Compute database statistics equivalent to ``bd stats``."""
+        statuses = [item.status for item in self._items.values()]
+        return BeadsStats(
+            total_issues=len(statuses),
+            open_issues=statuses.count('open'),
+            in_progress_issues=statuses.count('in_progress'),
+            closed_issues=sum(1 for s in statuses if s in COMPLETE_STATUSES),
+            ready_issues=len(self.ready_items()),
+        )
+
+    def resolve_to_leaf_task(self, item: BeadsWorkItem) -> Optional[BeadsWorkItem]:
+        """Resolve an epic/feature to an assignable leaf task from memory.
+
+        Same rules as ``beads_hierarchy.resolve_to_leaf_task``: leaf items and
+        childless parents are returned directly, parents whose children are
+        all complete are auto-closed, and fully blocked parents are skipped.
+        Use one ``HierarchyIndex`` per selection pass to share the walk
+        between several items.
+        """
+        from .beads_index import HierarchyIndex
+        return HierarchyIndex(self).resolve(item)
+
+
+def load_beads_graph() -> Optional[BeadsGraph]:
+    """Load the whole beads issue set with one ``bd export`` call.
+
+    Uses the issues.jsonl snapshot instead (no process at all) when direct
+    reads are enabled.
+
+    Returns:
+        A BeadsGraph snapshot, or None if the export failed (callers should
+        fall back to per-issue lookups).
+    """
+    direct = _direct_snapshot()
+    if direct is not None:
+        return direct
+
+    try:
+        result = subprocess.run(
+            ['bd', 'export'],
+            capture_output=True,
+            text=True,
+            encoding='utf-8',
+            check=True
+        )
+    except (subprocess.CalledProcessError, OSError) as e:
+        print(f"⚠️  Could not load beads snapshot, using per-issue lookups: {e}")
+        return None
+
+    records = []
+    for line in (result.stdout or '').splitlines():
+        line = line.strip()
+        if not line.startswith('{'):
+            # Skip Note:/Warning:/Hint: lines and blank lines
+            continue
+        try:
+            record = json.loads(line)
+        except json.JSONDecodeError:
+            continue
+        if isinstance(record, dict) and 'id' in record:
+            records.append(record)
+
+    if not records:
+        return None
+
+    try:
+        return BeadsGraph.from_records(records)
+    except (KeyError, TypeError) as e:
+        print(f"⚠️  Unexpected beads export format, using per-issue lookups: {e}")
+        return None
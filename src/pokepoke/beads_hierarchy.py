@@ -2,10 +2,15 @@
 
 import os
 import subprocess
-from typing import List, Optional
+from typing import Iterable, List, Optional, Set, TYPE_CHECKING
 
-from .types import BeadsWorkItem
-from .beads_query import get_issue_dependencies
+from .types import BeadsWorkItem, IssueWithDependencies
+from .beads_query import get_issue_dependencies, get_issues_bulk, invalidate_issue_cache, _direct_snapshot, _issue_cache
+from .beads_leases import is_lease_expired
+from .beads_graph import PARENT_DEPENDENCY_TYPES
+
+if TYPE_CHECKING:
+    from .beads_graph import BeadsGraph
 
 # Label that marks items as requiring human intervention - agents will skip these
 HUMAN_REQUIRED_LABEL = 'human-required'
@@ -20,6 +25,10 @@ def get_children(parent_id: str) -> List[BeadsWorkItem]:
     Returns:
         List of child work items.
     """
+    graph = _direct_snapshot()
+    if graph is not None:
+        return graph.get_children(parent_id)
+    
     issue = get_issue_dependencies(parent_id)
     if not issue or not issue.dependents:
         return []
@@ -27,16 +36,17 @@ def get_children(parent_id: str) -> List[BeadsWorkItem]:
     # Get child items (those with parent dependency type pointing to this issue)
     child_ids = [
         dep.id for dep in issue.dependents 
-        if dep.dependency_type == 'parent'
+        if dep.dependency_type in PARENT_DEPENDENCY_TYPES
     ]
     
     if not child_ids:
         return []
     
-    # Fetch full details for each child
+    # Fetch full details for all children in one bd call
+    child_issues = get_issues_bulk(child_ids)
     children = []
     for child_id in child_ids:
-        child_issue = get_issue_dependencies(child_id)
+        child_issue = child_issues.get(child_id)
         if child_issue:
             children.append(BeadsWorkItem(
                 id=child_issue.id,
@@ -65,6 +75,7 @@ def _is_assigned_to_current_user(item: BeadsWorkItem) -> bool:
     
     Also checks status: if 'in_progress' with no assignee info, assumes
     another agent has claimed it (bd commands sometimes omit assignee).
+    Claims whose lease has expired are available to anyone.
     
     Args:
         item: Work item to check.
@@ -75,6 +86,9 @@ def _is_assigned_to_current_user(item: BeadsWorkItem) -> bool:
     assignee = getattr(item, 'assignee', None) or ''
     agent_name = os.environ.get('AGENT_NAME', '')
     
+    if is_lease_expired(item.labels):
+        return True  # The claiming agent stopped renewing its lease
+    
     if assignee:
         # Has an assignee - check if it's THIS agent
         if agent_name and agent_name.lower() == assignee.lower():
@@ -137,12 +151,20 @@ def get_next_child_task(parent_id: str) -> Optional[BeadsWorkItem]:
     return min(available_children, key=lambda x: x.priority)
 
 
-def _get_available_children(parent_id: str) -> tuple[list[BeadsWorkItem], list[BeadsWorkItem]]:
+def _get_available_children(
+    parent_id: str,
+    skip_ids: Optional[Set[str]] = None
+) -> tuple[list[BeadsWorkItem], list[BeadsWorkItem]]:
     """Get available children for a parent, separated from all children.
     
+    Args:
+        parent_id: The parent issue ID.
+        skip_ids: Child IDs to treat as unavailable (e.g. held by another worker).
+    
     Returns:
         Tuple of (available_children sorted by priority, all_children).
-        available_children excludes completed, blocked, and human-required items.
+        available_children excludes completed, blocked, skipped and
+        human-required items.
     """
     children = get_children(parent_id)
     
@@ -163,6 +185,7 @@ def _get_available_children(parent_id: str) -> tuple[list[BeadsWorkItem], list[B
         child for child in open_children
         if _is_assigned_to_current_user(child)
         and not (child.labels and HUMAN_REQUIRED_LABEL in child.labels)
+        and not (skip_ids and child.id in skip_ids)
     ]
     
     # Sort by priority (lowest number = highest priority)
@@ -171,7 +194,11 @@ def _get_available_children(parent_id: str) -> tuple[list[BeadsWorkItem], list[B
     return available, children
 
 
-def resolve_to_leaf_task(item: BeadsWorkItem, _depth: int = 0) -> Optional[BeadsWorkItem]:
+def resolve_to_leaf_task(
+    item: BeadsWorkItem,
+    _depth: int = 0,
+    skip_ids: Optional[Set[str]] = None
+) -> Optional[BeadsWorkItem]:
     """Recursively resolve an epic/feature to an assignable leaf task.
     
     Core rule: NEVER directly assign an epic/feature that has children.
@@ -183,12 +210,14 @@ def resolve_to_leaf_task(item: BeadsWorkItem, _depth: int = 0) -> Optional[Beads
     - Epics/features with children: iterate available children by priority.
       Leaf children are returned. Epic/feature children are recursively resolved.
     - If all children are complete, auto-closes the parent and returns None.
-    - If all children are blocked (assigned to others, human-required),
-      returns None (skip parent entirely).
+    - If all children are blocked (assigned to others, human-required,
+      in ``skip_ids``), returns None (skip parent entirely).
     
     Args:
         item: The work item to resolve.
         _depth: Internal recursion depth tracker (prevents infinite loops).
+        skip_ids: Item IDs never to resolve to. All workers share one agent
+            name, so an item another worker holds still looks assignable.
         
     Returns:
         An assignable leaf task, the item itself if childless, or None if
@@ -202,7 +231,7 @@ def resolve_to_leaf_task(item: BeadsWorkItem, _depth: int = 0) -> Optional[Beads
     if item.issue_type not in ('epic', 'feature'):
         return item
     
-    available, all_children = _get_available_children(item.id)
+    available, all_children = _get_available_children(item.id, skip_ids)
     
     if not all_children:
         # Childless epic/feature - return for direct work
@@ -216,11 +245,14 @@ def resolve_to_leaf_task(item: BeadsWorkItem, _depth: int = 0) -> Optional[Beads
         close_parent_if_complete(item.id)
         return None
     
+    # Look up the next level for every child epic/feature in one batch
+    _prefetch_children([child for child in available if child.issue_type in ('epic', 'feature')])
+    
     # Iterate through available children by priority
     for child in available:
         if child.issue_type in ('epic', 'feature'):
             # Child is itself an epic/feature - recursively resolve
-            resolved = resolve_to_leaf_task(child, _depth + 1)
+            resolved = resolve_to_leaf_task(child, _depth + 1, skip_ids)
             if resolved:
                 return resolved
             # This child resolved to nothing - try next sibling
@@ -235,6 +267,30 @@ def resolve_to_leaf_task(item: BeadsWorkItem, _depth: int = 0) -> Optional[Beads
     return None
 
 
+def _prefetch_children(parents: List[BeadsWorkItem]) -> None:
+    """Fetch the children of several parents with one bulk lookup.
+    
+    Walking down the hierarchy otherwise costs a `bd show` per parent, one
+    after another; with the children cached, the recursion doesn't call bd.
+    
+    Args:
+        parents: Parents whose children will be walked next.
+    """
+    if not parents or _direct_snapshot() is not None:
+        return
+    child_ids = []
+    for parent in parents:
+        # Cached by the bulk lookup that found the parent; never worth a bd call here
+        issue = _issue_cache.get(parent.id)
+        if issue and issue.dependents:
+            child_ids.extend(
+                dep.id for dep in issue.dependents
+                if dep.dependency_type in PARENT_DEPENDENCY_TYPES
+            )
+    if child_ids:
+        get_issues_bulk(child_ids)
+
+
 def all_children_complete(parent_id: str) -> bool:
     """Check if all children of a parent are complete.
     
@@ -260,16 +316,21 @@ def all_children_complete(parent_id: str) -> bool:
     )
 
 
-def close_parent_if_complete(parent_id: str) -> bool:
+def close_parent_if_complete(parent_id: str, graph: Optional['BeadsGraph'] = None) -> bool:
     """Close a parent issue if all its children are complete.
     
     Args:
         parent_id: The parent issue ID to check and close.
+        graph: Optional issue snapshot to check children against instead
+            of querying bd. Updated with the new status on close.
         
     Returns:
         True if parent was closed, False otherwise.
     """
-    if not all_children_complete(parent_id):
+    if graph is not None:
+        if not graph.all_children_complete(parent_id):
+            return False
+    elif not all_children_complete(parent_id):
         return False
     
     try:
@@ -281,6 +342,9 @@ def close_parent_if_complete(parent_id: str) -> bool:
             check=True
         )
         print(f"✅ Auto-closed parent {parent_id} - all children complete")
+        invalidate_issue_cache(parent_id)
+        if graph is not None:
+            graph.set_status(parent_id, 'closed')
         return True
     except subprocess.CalledProcessError as e:
         print(f"⚠️  Failed to close parent {parent_id}: {e.stderr}")
@@ -296,13 +360,17 @@ def get_parent_id(child_id: str) -> Optional[str]:
     Returns:
         Parent ID if exists, None otherwise.
     """
+    graph = _direct_snapshot()
+    if graph is not None:
+        return graph.get_parent_id(child_id)
+    
     issue = get_issue_dependencies(child_id)
     if not issue or not issue.dependencies:
         return None
     
     # Find parent dependency
     for dep in issue.dependencies:
-        if dep.dependency_type == 'parent':
+        if dep.dependency_type in PARENT_DEPENDENCY_TYPES:
             return dep.id
     
     return None
@@ -317,16 +385,58 @@ def has_feature_parent(issue_id: str) -> bool:
     Returns:
         True if has feature parent, False otherwise.
     """
+    graph = _direct_snapshot()
+    if graph is not None:
+        return graph.has_feature_parent(issue_id)
+    
     try:
         issue = get_issue_dependencies(issue_id)
         if not issue or not issue.dependencies:
             return False
         
-        # Check if any dependency is a parent relationship with type 'feature'
-        return any(
-            dep.dependency_type == 'parent' and dep.issue_type == 'feature'
-            for dep in issue.dependencies
-        )
+        return _issue_has_feature_parent(issue)
     except Exception as e:
         print(f"Warning: Failed to check dependencies for {issue_id}: {e}")
         return False
+
+
+def _issue_has_feature_parent(issue: IssueWithDependencies) -> bool:
+    """Check if any dependency is a parent relationship with type 'feature'."""
+    return any(
+        dep.dependency_type in PARENT_DEPENDENCY_TYPES and dep.issue_type == 'feature'
+        for dep in issue.dependencies or []
+    )
+
+
+def get_feature_parent_ids(issue_ids: Iterable[str], graph: Optional['BeadsGraph'] = None) -> Set[str]:
+    """Find which of the given issues have a feature parent.
+    
+    Bulk equivalent of has_feature_parent: answered from the snapshot when
+    one is available, otherwise with batched `bd show` calls.
+    
+    Args:
+        issue_ids: The issue IDs to check.
+        graph: Optional issue snapshot (e.g. from one `bd export`).
+        
+    Returns:
+        Set of the IDs whose parent is a feature.
+    """
+    ids = list(issue_ids)
+    if not ids:
+        return set()
+    
+    if graph is None:
+        graph = _direct_snapshot()
+    if graph is not None:
+        return {issue_id for issue_id in ids if graph.has_feature_parent(issue_id)}
+    
+    try:
+        issues = get_issues_bulk(ids)
+    except Exception as e:
+        print(f"Warning: Failed to check dependencies in bulk: {e}")
+        return set()
+    
+    return {
+        issue_id for issue_id, issue in issues.items()
+        if _issue_has_feature_parent(issue)
+    }
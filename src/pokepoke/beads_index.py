@@ -0,0 +1,124 @@
+"""Hierarchy index over a BeadsGraph for fast leaf-task selection.
+
+Resolving an epic/feature to an assignable leaf means walking down its
+subtree. The index keeps each parent's children pre-sorted by priority and
+memoizes, per node, which leaf (if any) it resolves to. Subtrees with no
+available leaf are recorded as fully blocked and skipped without a walk.
+
+The memo is only valid for one selection pass: lease expiry, assignee
+changes and registry claims change which leaf is eligible without touching
+the graph, so callers build a fresh index per pass. Within a pass, a status
+change only invalidates the changed node and its ancestors.
+"""
+
+from typing import Dict, List, Optional, Set
+
+from .types import BeadsWorkItem
+from .beads_graph import BeadsGraph, COMPLETE_STATUSES
+from .beads_hierarchy import (
+    HUMAN_REQUIRED_LABEL,
+    _is_assigned_to_current_user,
+    close_parent_if_complete,
+)
+
+PARENT_ISSUE_TYPES = ('epic', 'feature')
+
+_MAX_DEPTH = 10
+
+
+class HierarchyIndex:
+    """Memoized parent -> leaf resolution for one selection pass over a BeadsGraph."""
+
+    def __init__(self, graph: BeadsGraph, skip_ids: Optional[Set[str]] = None) -> None:
+        self._graph = graph
+        # Items never to resolve to (e.g. held by another worker)
+        self._skip_ids = frozenset(skip_ids or ())
+        self._sorted_children: Dict[str, List[str]] = {}
+        # node id -> id of the leaf it resolves to (None: nothing available)
+        self._leaf: Dict[str, Optional[str]] = {}
+        self.blocked: Set[str] = set()
+        self.resolutions = 0
+        self.nodes_walked = 0
+
+    def _children_of(self, parent_id: str) -> List[str]:
+        """Child IDs of a parent, highest priority first (stable)."""
+        children = self._sorted_children.get(parent_id)
+        if children is None:
+            items = self._graph.get_children(parent_id)
+            items.sort(key=lambda x: x.priority)
+            children = [child.id for child in items]
+            self._sorted_children[parent_id] = children
+        return children
+
+    def _is_available(self, item: BeadsWorkItem) -> bool:
+        """Same availability rule as beads_hierarchy._get_available_children."""
+        return (
+            item.id not in self._skip_ids
+            and item.status not in COMPLETE_STATUSES
+            and _is_assigned_to_current_user(item)
+            and not (item.labels and HUMAN_REQUIRED_LABEL in item.labels)
+        )
+
+    def invalidate(self, issue_id: str) -> None:
+        """Forget cached results for an issue and all of its ancestors."""
+        node: Optional[str] = issue_id
+        for _ in range(_MAX_DEPTH + 1):
+            if node is None:
+                break
+            self._leaf.pop(node, None)
+            self.blocked.discard(node)
+            node = self._graph.get_parent_id(node)
+
+    def resolve(self, item: BeadsWorkItem) -> Optional[BeadsWorkItem]:
+        """Resolve an epic/feature to an assignable leaf task.
+
+        Same rules as ``beads_hierarchy.resolve_to_leaf_task``: leaf items and
+        childless parents are returned directly, parents whose children are
+        all complete are auto-closed, and fully blocked parents are skipped.
+        """
+        self.resolutions += 1
+        if item.issue_type not in PARENT_ISSUE_TYPES:
+            return item
+        leaf_id = self._resolve_id(item.id, 0)
+        if leaf_id is None:
+            return None
+        if leaf_id == item.id:
+            return item
+        return self._graph.get(leaf_id)
+
+    def _resolve_id(self, node_id: str, depth: int) -> Optional[str]:
+        if node_id in self._leaf:
+            return self._leaf[node_id]
+        if depth >= _MAX_DEPTH:
+            return None
+        self.nodes_walked += 1
+
+        children = self._children_of(node_id)
+        if not children:
+            # Childless epic/feature - the agent should break it down
+            self._leaf[node_id] = node_id
+            return node_id
+
+        leaf_id: Optional[str] = None
+        for child_id in children:
+            child = self._graph.get(child_id)
+            if child is None or not self._is_available(child):
+                continue
+            if child.issue_type in PARENT_ISSUE_TYPES:
+                leaf_id = self._resolve_id(child_id, depth + 1)
+                if leaf_id is not None:
+                    break
+                continue
+            leaf_id = child_id
+            break
+
+        if leaf_id is None:
+            # Auto-close when everything below is done; otherwise the whole
+            # subtree is blocked (claimed by others, human-required, ...)
+            if close_parent_if_complete(node_id, graph=self._graph):
+                self.invalidate(node_id)
+                return None
+            self.blocked.add(node_id)
+
+        self._leaf[node_id] = leaf_id
+        return leaf_id
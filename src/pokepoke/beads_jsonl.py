@@ -0,0 +1,278 @@
+"""Direct reader for the beads JSONL export (.beads/issues.jsonl).
+
+Beads keeps its canonical data in ``.beads/issues.jsonl`` (one JSON issue
+per line, later lines superseding earlier ones). Reading that file is far
+cheaper than spawning ``bd ready``/``bd stats``/``bd show`` on every loop
+iteration, so when ``beads.direct_read`` is enabled the query helpers answer
+from a snapshot kept up to date here.
+
+The file is memory-mapped and the reader remembers how far it has parsed
+(byte offset) and which file it parsed (inode). On the next poll only the
+newly appended lines are parsed; a replaced, truncated or rewritten file
+triggers a full reload. Graphs already handed out are never modified: any
+change builds a new graph from the parsed records and swaps it in. Any record that does not look like a beads issue
+marks the format as unknown and callers fall back to the ``bd`` CLI.
+
+bd writes the file some time after a command returns, so right after one of
+our own ``bd update``/``bd close`` calls the file still shows the old state
+(an item we just claimed or closed would still look ready). Our writes are
+noted with ``note_own_write()``, and until the file has been written again
+since then callers fall back to the ``bd`` CLI, which sees the change.
+"""
+
+import json
+import mmap
+import os
+import threading
+import time
+from pathlib import Path
+from typing import Any, Dict, Optional
+
+from .beads_graph import BeadsGraph
+from .config import get_config
+
+# Fields (and their types) every issue record must carry
+_REQUIRED_FIELDS: Dict[str, Any] = {
+    'id': str,
+    'title': str,
+    'status': str,
+    'priority': int,
+    'issue_type': str,
+}
+
+# Status bd uses for deleted issues that are kept for sync
+TOMBSTONE_STATUS = 'tombstone'
+
+# Bytes kept from the end of the parsed region to detect in-place rewrites
+_TAIL_CHECK_BYTES = 64
+
+
+def _is_issue_record(record: Any) -> bool:
+    """Check that a parsed line has the shape of a beads issue."""
+    if not isinstance(record, dict):
+        return False
+    for name, expected in _REQUIRED_FIELDS.items():
+        value = record.get(name)
+        if not isinstance(value, expected) or isinstance(value, bool):
+            return False
+    deps = record.get('dependencies')
+    return deps is None or isinstance(deps, list)
+
+
+class IssuesJsonlReader:
+    """Incrementally parsed view of a single issues.jsonl file.
+
+    Shared by every thread that queries beads; ``snapshot`` is serialized
+    and each change produces a fresh graph, so callers can iterate the one
+    they got without holding the lock.
+    """
+
+    def __init__(self, path: Path) -> None:
+        self.path = path
+        self._lock = threading.Lock()
+        self._records: Dict[str, Dict[str, Any]] = {}
+        self._graph: Optional[BeadsGraph] = None
+        self._inode: Optional[int] = None
+        self._offset = 0
+        self._mtime_ns = 0
+        self._tail = b''
+        self._format_ok = True
+        self.full_reloads = 0
+        self.incremental_reads = 0
+
+    def snapshot(self, written_after_ns: int = 0) -> Optional[BeadsGraph]:
+        """Bring the snapshot up to date and return it.
+
+        Args:
+            written_after_ns: Only use a file last modified after this time
+                (``time.time_ns()``); an older one misses a write of ours.
+
+        Returns:
+            The current issue graph, or None if the file is missing, older
+            than ``written_after_ns`` or its format is not recognised (use
+            the bd CLI instead).
+        """
+        with self._lock:
+            graph = self._snapshot()
+            if graph is not None and self._mtime_ns <= written_after_ns:
+                return None
+            return graph
+
+    def _snapshot(self) -> Optional[BeadsGraph]:
+        try:
+            with open(self.path, 'rb') as f:
+                st = os.fstat(f.fileno())
+                if self._needs_full_reload(f, st):
+                    self._reset()
+                    self.full_reloads += 1
+                elif st.st_size == self._offset:
+                    return self._graph if self._format_ok else None
+                else:
+                    self.incremental_reads += 1
+                self._read_from_offset(f, st)
+        except OSError:
+            self._reset()
+            return None
+
+        if not self._format_ok:
+            return None
+        if self._graph is None:
+            self._graph = BeadsGraph.from_records(self._records.values())
+        return self._graph
+
+    def _needs_full_reload(self, f: Any, st: os.stat_result) -> bool:
+        """Detect a replaced, truncated or rewritten file."""
+        if self._inode is None or st.st_ino != self._inode:
+            return True
+        if st.st_size < self._offset:
+            return True
+        if st.st_size == self._offset:
+            # Same length but touched: rewritten in place
+            return st.st_mtime_ns != self._mtime_ns
+        if self._tail:
+            f.seek(self._offset - len(self._tail))
+            return bool(f.read(len(self._tail)) != self._tail)
+        return False
+
+    def _reset(self) -> None:
+        self._records = {}
+        self._graph = None
+        self._inode = None
+        self._offset = 0
+        self._mtime_ns = 0
+        self._tail = b''
+        self._format_ok = True
+
+    def _read_from_offset(self, f: Any, st: os.stat_result) -> None:
+        """Parse every complete line appended since the last read."""
+        self._inode = st.st_ino
+        self._mtime_ns = st.st_mtime_ns
+        if st.st_size <= self._offset:
+            return
+
+        # mmap cannot map empty files (size checked above)
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            end = mm.rfind(b'\n', self._offset) + 1
+            if end <= self._offset:
+                # Only a partial line so far; wait for the writer to finish it
+                return
+            for raw in mm[self._offset:end].splitlines():
+                self._apply_line(raw)
+            self._tail = mm[max(0, end - _TAIL_CHECK_BYTES):end]
+        self._offset = end
+
+    def _apply_line(self, raw: bytes) -> None:
+        line = raw.strip()
+        if not line:
+            return
+        try:
+            record = json.loads(line)
+        except (json.JSONDecodeError, UnicodeDecodeError):
+            self._format_ok = False
+            return
+        if not _is_issue_record(record):
+            self._format_ok = False
+            return
+
+        issue_id = record['id']
+        if record['status'] == TOMBSTONE_STATUS:
+            if self._records.pop(issue_id, None) is not None:
+                self._graph = None
+            return
+
+        # Other threads may be reading the current graph; build a new one
+        self._records[issue_id] = record
+        self._graph = None
+
+
+def find_issues_jsonl(start: Optional[Path] = None) -> Optional[Path]:
+    """Locate the issues.jsonl export for the current repository.
+
+    Walks up from ``start`` (default: cwd) to the nearest ``.beads``
+    directory, follows a worktree ``.beads/redirect`` file if present and
+    honours the ``jsonl_export`` name from ``.beads/metadata.json``.
+
+    Returns:
+        Path to the JSONL file, or None if no beads directory was found.
+    """
+    current = (start or Path.cwd()).resolve()
+    for directory in (current, *current.parents):
+        beads_dir = directory / '.beads'
+        if beads_dir.is_dir():
+            break
+    else:
+        return None
+
+    redirect = beads_dir / 'redirect'
+    if redirect.is_file():
+        try:
+            target = redirect.read_text(encoding='utf-8').strip()
+        except OSError:
+            target = ''
+        if target:
+            for base in (beads_dir, directory):
+                candidate = (base / target).resolve()
+                if candidate.is_dir():
+                    beads_dir = candidate
+                    break
+
+    export_name = 'issues.jsonl'
+    try:
+        with open(beads_dir / 'metadata.json', encoding='utf-8') as f:
+            export_name = json.load(f).get('jsonl_export') or export_name
+    except (OSError, ValueError, AttributeError):
+        pass
+
+    return beads_dir / export_name
+
+
+_readers: Dict[Path, IssuesJsonlReader] = {}
+_readers_lock = threading.Lock()
+
+# When we last changed beads through bd (time.time_ns())
+_own_write_ns = 0
+
+
+def note_own_write() -> None:
+    """Record that we just changed beads, so older snapshots are not used."""
+    global _own_write_ns
+    with _readers_lock:
+        _own_write_ns = time.time_ns()
+
+
+def get_issues_reader(path: Optional[Path] = None) -> Optional[IssuesJsonlReader]:
+    """Get the shared reader for a JSONL file (located automatically by default)."""
+    if path is None:
+        path = find_issues_jsonl()
+        if path is None:
+            return None
+    with _readers_lock:
+        reader = _readers.get(path)
+        if reader is None:
+            reader = IssuesJsonlReader(path)
+            _readers[path] = reader
+        return reader
+
+
+def reset_issues_readers() -> None:
+    """Forget all cached readers and our last write (for testing)."""
+    global _own_write_ns
+    with _readers_lock:
+        _readers.clear()
+        _own_write_ns = 0
+
+
+def load_direct_snapshot() -> Optional[BeadsGraph]:
+    """Return an up-to-date snapshot read straight from issues.jsonl.
+
+    Returns:
+        The issue graph, or None when direct reads are disabled in the
+        project config, the file cannot be used or it has not been written
+        since our last change (callers use bd instead).
+    """
+    if not get_config().beads.direct_read:
+        return None
+    reader = get_issues_reader()
+    if reader is None:
+        return None
+    return reader.snapshot(written_after_ns=_own_write_ns)
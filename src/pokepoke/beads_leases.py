@@ -0,0 +1,209 @@
+"""Claim leases - expiring claims renewed by a heartbeat.
+
+A claimed item carries a ``lease:<epoch seconds>`` label holding the time
+its claim expires. The first lease is written by the same ``bd update`` that
+claims the item, so a reclaimed item never carries only the expired lease of
+its previous owner. The agent working on the item then renews the lease from
+a heartbeat thread; if the agent crashes the lease runs out and selection
+treats the item as claimable again.
+
+Items without a lease label (claimed by hand, or by an agent that predates
+leases) keep the old behaviour: any assignee is a permanent claim.
+
+The heartbeat also renews the item's claim in the claim registry, which is
+kept even when beads leases are disabled.
+"""
+
+import subprocess
+import threading
+import time
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from .beads_query import invalidate_issue_cache
+from .beads_sync import request_sync
+from .claim_registry import DEFAULT_CLAIM_TTL_SECONDS, get_claim_registry
+from .config import get_config
+from .shutdown import is_shutting_down
+
+LEASE_LABEL_PREFIX = 'lease:'
+
+# Lease labels written by a claim, handed over to the item's heartbeat
+_claim_leases: Dict[str, str] = {}
+_claim_leases_lock = threading.Lock()
+
+
+def lease_labels(labels: Optional[Iterable[str]]) -> List[str]:
+    """Lease labels among an item's labels."""
+    return [label for label in labels or () if label.startswith(LEASE_LABEL_PREFIX)]
+
+
+def lease_expiry(labels: Optional[Iterable[str]]) -> Optional[float]:
+    """Latest lease expiry (epoch seconds) in the labels, or None if unleased."""
+    expiries = []
+    for label in lease_labels(labels):
+        try:
+            expiries.append(float(label[len(LEASE_LABEL_PREFIX):]))
+        except ValueError:
+            continue
+    return max(expiries) if expiries else None
+
+
+def is_lease_expired(labels: Optional[Iterable[str]], now: Optional[float] = None) -> bool:
+    """True if the item has a claim lease and it has run out."""
+    expiry = lease_expiry(labels)
+    if expiry is None:
+        return False
+    return expiry <= (time.time() if now is None else now)
+
+
+def _new_lease_label(lease_seconds: float) -> str:
+    return f"{LEASE_LABEL_PREFIX}{int(time.time() + lease_seconds)}"
+
+
+def claim_lease_args(existing_labels: Optional[Iterable[str]]) -> Tuple[List[str], Optional[str]]:
+    """Extra ``bd update`` arguments that write a fresh lease with the claim.
+
+    Args:
+        existing_labels: The item's current labels; their lease labels are removed.
+
+    Returns:
+        The arguments and the new lease label (nothing when leases are disabled).
+    """
+    lease_seconds = get_config().beads.lease_seconds
+    if lease_seconds <= 0:
+        return [], None
+    label = _new_lease_label(lease_seconds)
+    args = ['--add-label', label]
+    for old in lease_labels(existing_labels):
+        if old != label:
+            args += ['--remove-label', old]
+    return args, label
+
+
+def remember_claim_lease(item_id: str, label: str) -> None:
+    """Record the lease a successful claim wrote, for the item's heartbeat to adopt."""
+    with _claim_leases_lock:
+        _claim_leases[item_id] = label
+
+
+def _take_claim_lease(item_id: str) -> Optional[str]:
+    with _claim_leases_lock:
+        label = _claim_leases.pop(item_id, None)
+    if label is None or is_lease_expired([label]):
+        return None
+    return label
+
+
+def renew_lease(item_id: str, lease_seconds: float, stale_labels: Iterable[str] = ()) -> Optional[str]:
+    """Write a fresh lease label and drop the ones it replaces.
+
+    Args:
+        item_id: Claimed item.
+        lease_seconds: How long the new lease lasts.
+        stale_labels: Previous lease labels to remove.
+
+    Returns:
+        The new lease label, or None if it could not be written.
+    """
+    label = _new_lease_label(lease_seconds)
+    timeout = get_config().beads.command_timeout
+    try:
+        subprocess.run(
+            ['bd', 'label', 'add', item_id, label, '--json'],
+            capture_output=True,
+            text=True,
+            encoding='utf-8',
+            check=True,
+            timeout=timeout
+        )
+    except (subprocess.CalledProcessError, subprocess.TimeoutExpired, OSError) as e:
+        print(f"⚠️  Failed to renew lease on {item_id}: {e}")
+        return None
+    try:
+        # bd label remove takes <issue-ids...> <label>: one label per call
+        for old in stale_labels:
+            if old == label:
+                continue
+            subprocess.run(
+                ['bd', 'label', 'remove', item_id, old, '--json'],
+                capture_output=True,
+                text=True,
+                encoding='utf-8',
+                timeout=timeout
+            )
+    except (subprocess.TimeoutExpired, OSError) as e:
+        # The new lease is written; a stale one left behind has an older expiry
+        print(f"⚠️  Failed to remove old lease labels from {item_id}: {e}")
+    invalidate_issue_cache(item_id)
+    # Push the renewal without waiting for it
+    request_sync()
+    return label
+
+
+class LeaseHeartbeat:
+    """Keeps the lease on a claimed item alive until stopped.
+
+    The last lease is left in place on stop: once the item is closed it no
+    longer matters, and if the agent gave up on it the item returns to the
+    pool when the lease expires.
+    """
+
+    def __init__(
+        self,
+        item_id: str,
+        existing_labels: Optional[Iterable[str]] = None,
+        lease_seconds: Optional[float] = None,
+    ) -> None:
+        self.item_id = item_id
+        self.lease_seconds = get_config().beads.lease_seconds if lease_seconds is None else lease_seconds
+        self.renewals = 0
+        # Adopt the lease our claim just wrote instead of writing another
+        claimed = _take_claim_lease(item_id)
+        self._labels = [claimed] if claimed else lease_labels(existing_labels)
+        self._fresh = claimed is not None
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def start(self) -> None:
+        """Write the first lease (unless the claim did) and keep renewing it in the background."""
+        if self._thread is not None:
+            return
+        if self._fresh:
+            get_claim_registry().renew(self.item_id)
+        else:
+            self._renew()
+        self._thread = threading.Thread(
+            target=self._run, daemon=True, name=f"lease-{self.item_id}"
+        )
+        self._thread.start()
+
+    def stop(self) -> None:
+        """Stop renewing the lease."""
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join(timeout=5)
+            self._thread = None
+
+    def __enter__(self) -> 'LeaseHeartbeat':
+        self.start()
+        return self
+
+    def __exit__(self, *exc: object) -> None:
+        self.stop()
+
+    def _renew(self) -> None:
+        get_claim_registry().renew(self.item_id)
+        if self.lease_seconds <= 0:
+            return
+        label = renew_lease(self.item_id, self.lease_seconds, self._labels)
+        if label is not None:
+            self._labels = [label]
+            self.renewals += 1
+
+    def _run(self) -> None:
+        # Renew well before expiry so one failed write doesn't lose the claim
+        interval = (self.lease_seconds if self.lease_seconds > 0 else DEFAULT_CLAIM_TTL_SECONDS) / 3
+        while not self._stop.wait(interval):
+            if is_shutting_down():
+                return
+            self._renew()
@@ -1,12 +1,21 @@
-"""Beads item management - create, close, filter work items."""
+"""Beads item management - assign, close, filter work items."""
 
 import json
 import os
 import subprocess
-from typing import List, Optional
+from typing import List, Optional, Set, TYPE_CHECKING
 
 from .types import BeadsWorkItem
-from .beads_hierarchy import has_feature_parent, get_next_child_task, close_parent_if_complete, get_children, resolve_to_leaf_task, HUMAN_REQUIRED_LABEL
+from .beads_parsing import parse_bd_json
+from .beads_query import invalidate_issue_cache
+from .beads_sync import SyncLockBusy, request_sync, await_sync
+from .beads_leases import claim_lease_args, is_lease_expired, remember_claim_lease
+from .beads_stats import record_status_change
+from .beads_hierarchy import get_feature_parent_ids, get_next_child_task, close_parent_if_complete, get_children, resolve_to_leaf_task, HUMAN_REQUIRED_LABEL
+from .beads_index import HierarchyIndex
+
+if TYPE_CHECKING:
+    from .beads_graph import BeadsGraph
 
 
 def assign_and_sync_item(item_id: str, agent_name: Optional[str] = None) -> bool:
@@ -17,6 +26,7 @@ def assign_and_sync_item(item_id: str, agent_name: Optional[str] = None) -> bool
     
     CRITICAL: Verifies item is still claimable immediately before assignment
     to catch race conditions where another agent claimed it between fetch and now.
+    A claim whose lease has expired (see beads_leases) may be taken over.
     
     Args:
         item_id: The item ID to assign.
@@ -27,6 +37,8 @@ def assign_and_sync_item(item_id: str, agent_name: Optional[str] = None) -> bool
     """
     if agent_name is None:
         agent_name = os.environ.get('AGENT_NAME', 'agent')
+    current_status = 'open'
+    current_labels: Optional[List[str]] = None
     
     # CRITICAL: Check current ownership RIGHT BEFORE claiming
     # This catches race conditions where another agent claimed between fetch and now
@@ -40,17 +52,8 @@ def assign_and_sync_item(item_id: str, agent_name: Optional[str] = None) -> bool
         )
         
         # Parse current item state
-        filtered_lines = [
-            line for line in result.stdout.split('\n')
-            if line.strip() and not line.strip().startswith(('Note:', 'Warning:', 'Hint:'))
-        ]
-        json_start = next(
-            (i for i, line in enumerate(filtered_lines) if line.strip().startswith('[') or line.strip().startswith('{')),
-            None
-        )
-        if json_start is not None:
-            json_text = '\n'.join(filtered_lines[json_start:])
-            data = json.loads(json_text)
+        data = parse_bd_json(result.stdout)
+        if data:
             current_item = data[0] if isinstance(data, list) else data
             
             # CRITICAL: Check 'assignee' field, NOT 'owner' field!
@@ -58,6 +61,7 @@ def assign_and_sync_item(item_id: str, agent_name: Optional[str] = None) -> bool
             # - owner: The human user who owns it (e.g., user@example.com)
             current_assignee = current_item.get('assignee', '')
             current_status = current_item.get('status', '')
+            current_labels = current_item.get('labels')
             
             # DEBUG: Show what we're checking
             print(f"🔍 [DEBUG] Ownership check for {item_id}:")
@@ -74,7 +78,9 @@ def assign_and_sync_item(item_id: str, agent_name: Optional[str] = None) -> bool
                 
                 print(f"   Is ours? {is_ours}")
                 
-                if not is_ours:
+                if not is_ours and is_lease_expired(current_item.get('labels')):
+                    print(f"   ♻️  Claim lease of {current_assignee} expired - reclaiming")
+                elif not is_ours:
                     print(f"⚠️  RACE CONDITION DETECTED: {item_id} already assigned to {current_assignee}")
                     print(f"   Skipping to prevent conflict - another agent claimed it first")
                     return False
@@ -85,29 +91,42 @@ def assign_and_sync_item(item_id: str, agent_name: Optional[str] = None) -> bool
         print(f"⚠️  Failed to verify {item_id} ownership: {e}")
         return False
     
+    # Write the new lease in the claim itself: until then a reclaimed item
+    # would still carry the expired lease and could be taken again
+    lease_args, lease_label = claim_lease_args(current_labels)
     try:
         # Now safe to claim - we verified it's unassigned or ours
         subprocess.run(
-            ['bd', 'update', item_id, '--status', 'in_progress', '-a', agent_name, '--json'],
+            ['bd', 'update', item_id, '--status', 'in_progress', '-a', agent_name] + lease_args + ['--json'],
             capture_output=True,
             text=True,
             encoding='utf-8',
             check=True
         )
+        if lease_label:
+            remember_claim_lease(item_id, lease_label)
         print(f"✅ Assigned {item_id} to {agent_name} and marked in_progress")
+        invalidate_issue_cache(item_id)
+        record_status_change(item_id, current_status, 'in_progress')
         
-        # Sync to push assignment to other agents
-        sync_result = subprocess.run(
-            ['bd', 'sync'],
-            capture_output=True,
-            text=True,
-            encoding='utf-8'
-        )
+        # Sync to push assignment to other agents. The background worker
+        # batches this with any other pending claims/merges. The claim stands
+        # even if the sync does not finish in time: workers in this process
+        # are kept off the item by the claim registry, and the sync stays
+        # queued for other processes.
+        sync_result = await_sync(request_sync())
         
-        if sync_result.returncode == 0:
+        if isinstance(sync_result, subprocess.CompletedProcess) and sync_result.returncode == 0:
             print(f"✅ Synced assignment - other agents will see {item_id} is claimed")
         else:
-            print(f"⚠️  bd sync returned non-zero: {sync_result.returncode}")
+            if sync_result is None:
+                print("⚠️  bd sync did not complete in time - it stays queued")
+            elif isinstance(sync_result, SyncLockBusy):
+                print("⚠️  bd sync put off while another worker holds the merge lock - it will be retried")
+            elif isinstance(sync_result, BaseException):
+                print(f"⚠️  bd sync failed: {sync_result}")
+            else:
+                print(f"⚠️  bd sync returned non-zero: {sync_result.returncode}")
             print(f"   Assignment may not be immediately visible to other agents")
         
         return True
@@ -136,6 +155,8 @@ def close_item(item_id: str, message: str = "Completed") -> bool:
             check=True
         )
         print(f"✅ Closed {item_id}")
+        invalidate_issue_cache(item_id)
+        record_status_change(item_id, 'in_progress', 'closed')
         return True
     except subprocess.CalledProcessError as e:
         print(f"⚠️  Failed to close {item_id}: {e.stderr}")
@@ -167,143 +188,30 @@ def add_comment(item_id: str, comment: str) -> bool:
         return False
 
 
-def create_issue(
-    title: str,
-    issue_type: str = "task",
-    priority: int = 1,
-    description: str = "",
-    labels: Optional[List[str]] = None,
-    parent_id: Optional[str] = None
-) -> Optional[str]:
-    """Create a new beads issue.
-    
-    Args:
-        title: Issue title
-        issue_type: Type of issue (task, bug, feature, epic, chore)
-        priority: Priority (0=critical, 1=high, 2=medium, 3=low, 4=backlog)
-        description: Issue description
-        labels: List of labels to add
-        parent_id: Parent issue ID for dependencies
-        
-    Returns:
-        Created issue ID, or None if creation failed
-    """
-    try:
-        cmd = ['bd', 'create', title, '-t', issue_type, '-p', str(priority)]
-        
-        if description:
-            cmd.extend(['-d', description])
-        
-        if parent_id:
-            cmd.extend(['--deps', f'parent:{parent_id}'])
-        
-        cmd.append('--json')
-        
-        result = subprocess.run(
-            cmd,
-            capture_output=True,
-            text=True,
-            encoding='utf-8',
-            check=True
-        )
-        
-        if not result.stdout:
-            return None
-        
-        # Parse JSON output to get issue ID
-        filtered_lines = [
-            line for line in result.stdout.split('\n')
-            if line.strip() 
-            and not line.strip().startswith(('Note:', 'Warning:', 'Hint:', 'Created'))
-        ]
-        
-        # Find JSON object start
-        json_start = next(
-            (i for i, line in enumerate(filtered_lines) if line.strip().startswith('{') or line.strip().startswith('[')),
-            None
-        )
-        
-        if json_start is not None:
-            json_text = '\n'.join(filtered_lines[json_start:])
-            data = json.loads(json_text)
-            
-            # Handle both array and single object responses
-            if isinstance(data, list):
-                issue_id = data[0].get('id') if data else None
-            else:
-                issue_id = data.get('id')
-            
-            # Add labels if provided
-            if labels and issue_id:
-                subprocess.run(
-                    ['bd', 'label', 'add', issue_id] + labels + ['--json'],
-                    capture_output=True,
-                    text=True,
-                    encoding='utf-8'
-                )
-            
-            return issue_id
-        
-        return None
-        
-    except (subprocess.CalledProcessError, json.JSONDecodeError, KeyError) as e:
-        print(f"⚠️  Failed to create issue: {e}")
-        return None
-
-
-def create_cleanup_delegation_issue(
-    title: str,
-    description: str,
-    labels: Optional[List[str]] = None,
-    parent_id: Optional[str] = None,
-    priority: int = 0
-) -> Optional[str]:
-    """Create a cleanup/delegation issue for agent to handle.
-    
-    Used when automated operations fail and require manual/agent intervention.
-    
-    Args:
-        title: Issue title
-        description: Detailed description of the cleanup needed
-        labels: Labels to add (defaults to ['cleanup', 'delegation'])
-        parent_id: Optional parent issue that this relates to
-        priority: Priority (default 0 = critical, needs immediate attention)
-        
-    Returns:
-        Created issue ID, or None if creation failed
-    """
-    default_labels = ['cleanup', 'delegation']
-    all_labels = list(set(default_labels + (labels or [])))
-    
-    issue_id = create_issue(
-        title=title,
-        issue_type='task',
-        priority=priority,
-        description=description,
-        labels=all_labels,
-        parent_id=parent_id
-    )
-    
-    if issue_id:
-        print(f"\n📋 Created delegation issue: {issue_id}")
-        print("   An agent will handle this cleanup automatically")
-    
-    return issue_id
-
-
-def filter_work_items(items: List[BeadsWorkItem]) -> List[BeadsWorkItem]:
+def filter_work_items(
+    items: List[BeadsWorkItem],
+    graph: Optional['BeadsGraph'] = None
+) -> List[BeadsWorkItem]:
     """Filter work items based on selection criteria.
     
     - Exclude epics (too broad)
     - Include features
     - Include tasks/bugs/chores only if NOT parented to a feature
     
+    Parent types for the whole list are resolved in one pass: from the
+    snapshot when given, otherwise with batched `bd show` calls.
+    
     Args:
         items: Array of work items to filter.
+        graph: Optional in-memory issue snapshot.
         
     Returns:
         Filtered array.
     """
+    feature_parented = get_feature_parent_ids(
+        (item.id for item in items if item.issue_type in ('task', 'bug', 'chore')),
+        graph=graph
+    )
     filtered = []
     
     for item in items:
@@ -319,7 +227,7 @@ def filter_work_items(items: List[BeadsWorkItem]) -> List[BeadsWorkItem]:
         
         # For tasks, bugs, chores - only include if NOT parented to a feature
         if item.issue_type in ('task', 'bug', 'chore'):
-            if has_feature_parent(item.id):
+            if item.id in feature_parented:
                 print(f"   ⏭️  Skipping {item.issue_type} with feature parent: {item.id} - {item.title}")
                 continue
             filtered.append(item)
@@ -338,12 +246,21 @@ def get_first_ready_work_item() -> Optional[BeadsWorkItem]:
         First ready work item, or None if none available.
     """
     from .beads_query import get_ready_work_items
+    from .beads_graph import load_beads_graph
     items = get_ready_work_items()
-    filtered = filter_work_items(items)
+    if not items:
+        return None
+    # One export for the whole ready list; None falls back to batched bd show
+    graph = load_beads_graph()
+    filtered = filter_work_items(items, graph=graph)
     return filtered[0] if filtered else None
 
 
-def select_next_hierarchical_item(items: List[BeadsWorkItem]) -> Optional[BeadsWorkItem]:
+def select_next_hierarchical_item(
+    items: List[BeadsWorkItem],
+    graph: Optional['BeadsGraph'] = None,
+    skip_ids: Optional[Set[str]] = None
+) -> Optional[BeadsWorkItem]:
     """Select next work item using hierarchical assignment strategy.
     
     Core rule: NEVER directly assign an epic/feature that has children.
@@ -363,6 +280,10 @@ def select_next_hierarchical_item(items: List[BeadsWorkItem]) -> Optional[BeadsW
     
     Args:
         items: List of ready work items.
+        graph: Optional in-memory issue snapshot. When given, the hierarchy
+            is resolved from memory instead of one ``bd show`` per issue.
+        skip_ids: Item IDs not to select, at the top level or as a leaf
+            (e.g. items other workers hold in the claim registry).
         
     Returns:
         Next item to work on, or None if none available.
@@ -373,17 +294,25 @@ def select_next_hierarchical_item(items: List[BeadsWorkItem]) -> Optional[BeadsW
     # Sort by priority for consistent ordering
     sorted_items = sorted(items, key=lambda x: x.priority)
     
+    # Fresh memo per pass: claims and leases change without touching the graph
+    index = HierarchyIndex(graph, skip_ids) if graph is not None else None
+    
     for item in sorted_items:
         # Skip items that require human intervention
         if item.labels and HUMAN_REQUIRED_LABEL in item.labels:
             continue
+        if skip_ids and item.id in skip_ids:
+            continue
         
         # Check if this is an epic or feature
         if item.issue_type in ('epic', 'feature'):
             # Recursively resolve to a leaf task
             # This handles nested hierarchies (epic → feature → task)
             # and ensures we never directly assign a parent with children
-            resolved = resolve_to_leaf_task(item)
+            if index is not None:
+                resolved = index.resolve(item)
+            else:
+                resolved = resolve_to_leaf_task(item, skip_ids=skip_ids)
             if resolved:
                 return resolved
             # Could not resolve to an assignable item - skip
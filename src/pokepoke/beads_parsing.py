@@ -0,0 +1,77 @@
+"""Parsing of `bd ... --json` output shared by all beads operations.
+
+bd prints Note:/Warning:/Hint: (and for `bd create`, Created ...) lines
+around its JSON payload. Rather than filtering every line, the parser jumps
+straight to the first line that opens a JSON array or object and decodes
+from there, ignoring anything after the payload.
+"""
+
+import json
+import re
+from typing import Any, Dict, Optional
+
+from .types import BeadsWorkItem, IssueWithDependencies, Dependency
+
+# First line whose first non-blank character opens a JSON array or object
+_JSON_START = re.compile(r'^[ \t]*[\[{]', re.MULTILINE)
+
+_DECODER = json.JSONDecoder()
+
+WORK_ITEM_FIELDS = frozenset({
+    'id', 'title', 'status', 'priority', 'issue_type', 'description',
+    'owner', 'assignee', 'created_at', 'created_by', 'updated_at', 'labels',
+    'dependency_count', 'dependent_count', 'notes'
+})
+
+ISSUE_FIELDS = frozenset({
+    'id', 'title', 'status', 'priority', 'issue_type', 'description',
+    'dependencies', 'dependents', 'owner', 'assignee', 'created_at', 'created_by',
+    'updated_at', 'labels', 'notes'
+})
+
+DEPENDENCY_FIELDS = frozenset({
+    'id', 'title', 'issue_type', 'dependency_type', 'status', 'priority',
+    'description', 'owner', 'created_at', 'created_by', 'updated_at',
+    'labels', 'notes'
+})
+
+
+def parse_bd_json(output: Optional[str]) -> Any:
+    """Extract the JSON payload from bd command output.
+
+    Args:
+        output: Raw stdout of a bd command run with --json.
+
+    Returns:
+        The decoded JSON value, or None if the output contains no JSON.
+
+    Raises:
+        json.JSONDecodeError: If the payload is not valid JSON.
+    """
+    if not output:
+        return None
+    match = _JSON_START.search(output)
+    if match is None:
+        return None
+    start = match.end() - 1
+    value, _ = _DECODER.raw_decode(output, start)
+    return value
+
+
+def work_item_from_dict(data: Dict[str, Any]) -> BeadsWorkItem:
+    """Build a BeadsWorkItem, dropping fields the dataclass doesn't know."""
+    return BeadsWorkItem(**{k: v for k, v in data.items() if k in WORK_ITEM_FIELDS})
+
+
+def _dependency_from_dict(data: Dict[str, Any]) -> Dependency:
+    return Dependency(**{k: v for k, v in data.items() if k in DEPENDENCY_FIELDS})
+
+
+def issue_from_dict(data: Dict[str, Any]) -> IssueWithDependencies:
+    """Build an IssueWithDependencies from one `bd show --json` entry."""
+    fields = {k: v for k, v in data.items() if k in ISSUE_FIELDS}
+    if fields.get('dependencies'):
+        fields['dependencies'] = [_dependency_from_dict(d) for d in fields['dependencies']]
+    if fields.get('dependents'):
+        fields['dependents'] = [_dependency_from_dict(d) for d in fields['dependents']]
+    return IssueWithDependencies(**fields)
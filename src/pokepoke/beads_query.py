@@ -1,11 +1,23 @@
 """Beads query operations - fetch work items and dependencies."""
 
 import json
+import os
 import subprocess
+import threading
 from pathlib import Path
-from typing import List, Optional
+from typing import Dict, Iterable, List, Optional, Tuple, TYPE_CHECKING
 
-from .types import BeadsWorkItem, IssueWithDependencies, Dependency, BeadsStats
+from .types import BeadsWorkItem, IssueWithDependencies, BeadsStats, BeadsCacheStats
+from .beads_parsing import parse_bd_json, issue_from_dict, work_item_from_dict
+from .beads_executor import BdOutcome, get_beads_executor
+from .config import get_config
+
+if TYPE_CHECKING:
+    from .beads_graph import BeadsGraph
+
+
+# Main repo root per working directory (it never changes while we run)
+_main_repo_roots: Dict[str, Optional[Path]] = {}
 
 
 def _get_main_repo_root() -> Optional[Path]:
@@ -14,23 +26,175 @@ def _get_main_repo_root() -> Optional[Path]:
     Returns:
         Path to the main repo root, or None if not in a git repository.
     """
+    cwd = os.getcwd()
+    if cwd in _main_repo_roots:
+        return _main_repo_roots[cwd]
     try:
         result = subprocess.run(
             ["git", "rev-parse", "--git-common-dir"],
             capture_output=True, text=True, encoding='utf-8', check=True
         )
-        git_common_dir = Path(result.stdout.strip())
-        return git_common_dir.parent
+        # --git-common-dir may be relative to the working directory
+        git_common_dir = Path(cwd, result.stdout.strip())
+        root: Optional[Path] = git_common_dir.parent
     except subprocess.CalledProcessError:
-        return None
+        root = None
+    _main_repo_roots[cwd] = root
+    return root
+
+
+# Fingerprint of the beads database files: (mtime_ns, size) per file
+_DbSignature = Tuple[Optional[Tuple[int, int]], ...]
+
+
+class _IssueCache:
+    """Read-through cache of `bd show` results keyed on the database state.
+    
+    Entries are valid only while the database files (issues.jsonl plus the
+    SQLite database and its WAL) keep the same mtime and size; any change
+    drops the whole cache. Our own writes invalidate affected ids explicitly.
+    Worker, prefetch and maintenance threads share it, so every access holds
+    the lock.
+    """
+    
+    def __init__(self) -> None:
+        self._lock = threading.RLock()
+        self._entries: Dict[str, IssueWithDependencies] = {}
+        self._signature: Optional[_DbSignature] = None
+        self._db_files: Dict[str, Tuple[Path, ...]] = {}
+        self.stats = BeadsCacheStats()
+    
+    def _files(self) -> Tuple[Path, ...]:
+        """Locate the database files for the current directory (memoized)."""
+        cwd = os.getcwd()
+        files = self._db_files.get(cwd)
+        if files is None:
+            from .beads_jsonl import find_issues_jsonl
+            jsonl = find_issues_jsonl(Path(cwd))
+            if jsonl is None:
+                files = ()
+            else:
+                database = 'beads.db'
+                try:
+                    with open(jsonl.parent / 'metadata.json', encoding='utf-8') as f:
+                        database = json.load(f).get('database') or database
+                except (OSError, ValueError, AttributeError):
+                    pass
+                db_path = jsonl.parent / database
+                files = (jsonl, db_path, db_path.with_name(db_path.name + '-wal'))
+            self._db_files[cwd] = files
+        return files
+    
+    def _current_signature(self) -> Optional[_DbSignature]:
+        """Stat the database files; None when there is nothing to key on."""
+        signature: List[Optional[Tuple[int, int]]] = []
+        for path in self._files():
+            try:
+                st = os.stat(path)
+                signature.append((st.st_mtime_ns, st.st_size))
+            except OSError:
+                signature.append(None)
+        if not any(signature):
+            return None
+        return tuple(signature)
+    
+    def _validate(self) -> bool:
+        """Drop stale entries; returns False if caching is impossible."""
+        signature = self._current_signature()
+        if signature is None:
+            self.clear()
+            return False
+        if signature != self._signature:
+            if self._entries:
+                self.stats.invalidations += len(self._entries)
+            self._entries.clear()
+            self._signature = signature
+        return True
+    
+    def get(self, issue_id: str) -> Optional[IssueWithDependencies]:
+        with self._lock:
+            if not self._validate():
+                return None
+            issue = self._entries.get(issue_id)
+            if issue is None:
+                self.stats.misses += 1
+            else:
+                self.stats.hits += 1
+            return issue
+    
+    def put(self, issue: IssueWithDependencies) -> None:
+        with self._lock:
+            if self._signature is not None:
+                self._entries[issue.id] = issue
+    
+    def invalidate(self, issue_id: str) -> None:
+        """Drop an issue and every cached issue that embeds it as a dependency."""
+        with self._lock:
+            stale = [
+                cached_id for cached_id, issue in self._entries.items()
+                if cached_id == issue_id
+                or any(dep.id == issue_id for dep in issue.dependencies or [])
+                or any(dep.id == issue_id for dep in issue.dependents or [])
+            ]
+            for cached_id in stale:
+                del self._entries[cached_id]
+            self.stats.invalidations += len(stale)
+    
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._signature = None
+            self._db_files.clear()
+
+
+_issue_cache = _IssueCache()
+
+
+def invalidate_issue_cache(issue_id: Optional[str] = None) -> None:
+    """Invalidate cached lookups after we modified beads ourselves.
+    
+    The issues.jsonl snapshot is not used again until bd has rewritten the
+    file, so direct reads cannot return the item as it was before our change.
+    
+    Args:
+        issue_id: The issue we changed, or None to drop everything.
+    """
+    from .beads_jsonl import note_own_write
+    note_own_write()
+    if issue_id is None:
+        _issue_cache.clear()
+    else:
+        _issue_cache.invalidate(issue_id)
+
+
+def get_issue_cache_stats() -> BeadsCacheStats:
+    """Get the live hit/miss counters of the issue lookup cache."""
+    return _issue_cache.stats
+
+
+def _direct_snapshot() -> Optional['BeadsGraph']:
+    """Get the issues.jsonl snapshot when direct reads are enabled.
+    
+    Returns:
+        The issue graph, or None to query through the bd CLI instead.
+    """
+    from .beads_jsonl import load_direct_snapshot
+    return load_direct_snapshot()
 
 
 def get_ready_work_items() -> List[BeadsWorkItem]:
     """Query beads database for ready work items.
     
+    Answered from .beads/issues.jsonl when direct reads are enabled,
+    otherwise via `bd ready`.
+    
     Returns:
         List of ready work items.
     """
+    graph = _direct_snapshot()
+    if graph is not None:
+        return graph.ready_items()
+    
     result = subprocess.run(
         ['bd', 'ready', '--json'],
         capture_output=True,
@@ -39,43 +203,11 @@ def get_ready_work_items() -> List[BeadsWorkItem]:
         check=True
     )
     
-    if not result.stdout:
-        return []
-    
-    # Filter out warning/note lines
-    filtered_lines = [
-        line for line in result.stdout.split('\n')
-        if line.strip() 
-        and not line.strip().startswith(('Note:', 'Warning:', 'Hint:'))
-    ]
-    
-    # Find JSON array start
-    json_start = next(
-        (i for i, line in enumerate(filtered_lines) if line.strip().startswith('[')),
-        None
-    )
-    
-    if json_start is None:
+    items_data = parse_bd_json(result.stdout)
+    if not items_data:
         return []
     
-    json_text = '\n'.join(filtered_lines[json_start:])
-    
-    if json_text.strip() == '[]':
-        return []
-    
-    items_data = json.loads(json_text)
-    
-    # Filter out fields not in BeadsWorkItem dataclass
-    valid_work_item_fields = {
-        'id', 'title', 'status', 'priority', 'issue_type', 'description',
-        'owner', 'assignee', 'created_at', 'created_by', 'updated_at', 'labels',
-        'dependency_count', 'dependent_count', 'notes'
-    }
-    
-    return [
-        BeadsWorkItem(**{k: v for k, v in item.items() if k in valid_work_item_fields})
-        for item in items_data
-    ]
+    return [work_item_from_dict(item) for item in items_data]
 
 
 def get_issue_dependencies(issue_id: str) -> Optional[IssueWithDependencies]:
@@ -85,110 +217,143 @@ def get_issue_dependencies(issue_id: str) -> Optional[IssueWithDependencies]:
         issue_id: The issue ID to query.
         
     Returns:
-        Issue with dependencies, or None if not found.
+        Issue with dependencies, or None if not found or bd did not answer
+        within ``beads.command_timeout``.
     """
+    cached = _issue_cache.get(issue_id)
+    if cached is not None:
+        return cached
+    
     try:
         result = subprocess.run(
             ['bd', 'show', issue_id, '--json'],
             capture_output=True,
             text=True,
             encoding='utf-8',
-            check=True
+            check=True,
+            timeout=get_config().beads.command_timeout
         )
-    except subprocess.CalledProcessError:
+    except (subprocess.CalledProcessError, subprocess.TimeoutExpired):
         return None
     
-    if not result.stdout:
-        return None
-    
-    # Filter out warning/note lines
-    filtered_lines = [
-        line for line in result.stdout.split('\n')
-        if line.strip() 
-        and not line.strip().startswith(('Note:', 'Warning:', 'Hint:'))
-    ]
-    
-    # Find JSON array start
-    json_start = next(
-        (i for i, line in enumerate(filtered_lines) if line.strip().startswith('[')),
-        None
-    )
-    
-    if json_start is None:
-        return None
-    
-    json_text = '\n'.join(filtered_lines[json_start:])
-    issues_data = json.loads(json_text)
-    
+    issues_data = parse_bd_json(result.stdout)
+    if isinstance(issues_data, dict):
+        issues_data = [issues_data]
     if not issues_data:
         return None
     
-    issue_dict = issues_data[0]
+    issue = issue_from_dict(issues_data[0])
+    _issue_cache.put(issue)
+    return issue
+
+
+# Ids per `bd show` call; keeps command lines well under OS length limits
+_BULK_SHOW_CHUNK = 50
+
+
+def _collect_show_output(outcome: BdOutcome, issues: Dict[str, IssueWithDependencies]) -> bool:
+    """Add the issues from one `bd show` outcome; False if the call failed."""
+    if isinstance(outcome, BaseException):
+        return False
+    try:
+        data = parse_bd_json(outcome.stdout) or []
+        if isinstance(data, dict):
+            data = [data]
+        for issue_dict in data:
+            issue = issue_from_dict(issue_dict)
+            issues[issue.id] = issue
+            _issue_cache.put(issue)
+    except (json.JSONDecodeError, TypeError):
+        return False
+    return True
+
+
+def get_issues_bulk(issue_ids: Iterable[str]) -> Dict[str, IssueWithDependencies]:
+    """Get detailed information for many issues with one `bd show` per chunk.
+    
+    Chunks run concurrently on the beads executor. If a batched call fails
+    (e.g. one of the ids no longer exists), that chunk falls back to
+    per-issue lookups so the remaining ids still resolve.
     
-    # Filter out fields not in IssueWithDependencies dataclass
-    valid_issue_fields = {
-        'id', 'title', 'status', 'priority', 'issue_type', 'description',
-        'dependencies', 'dependents', 'owner', 'assignee', 'created_at', 'created_by',
-        'updated_at', 'labels', 'notes'
-    }
-    filtered_issue = {k: v for k, v in issue_dict.items() if k in valid_issue_fields}
+    Args:
+        issue_ids: Issue IDs to query (duplicates are ignored).
+        
+    Returns:
+        Dict of issue ID to issue with dependencies; missing ids are omitted.
+    """
+    issues: Dict[str, IssueWithDependencies] = {}
+    ids = []
+    for issue_id in dict.fromkeys(issue_ids):
+        cached = _issue_cache.get(issue_id)
+        if cached is not None:
+            issues[issue_id] = cached
+        else:
+            ids.append(issue_id)
     
-    # Filter out fields not in Dependency dataclass
-    valid_dep_fields = {
-        'id', 'title', 'issue_type', 'dependency_type', 'status', 'priority',
-        'description', 'owner', 'created_at', 'created_by', 'updated_at',
-        'labels', 'notes'
-    }
+    # Chunks (and any per-id retries) run concurrently
+    executor = get_beads_executor()
+    chunks = [ids[i:i + _BULK_SHOW_CHUNK] for i in range(0, len(ids), _BULK_SHOW_CHUNK)]
+    outcomes = executor.run_many([['bd', 'show', *chunk, '--json'] for chunk in chunks])
     
-    # Convert dependencies if present
-    if 'dependencies' in filtered_issue and filtered_issue['dependencies']:
-        filtered_issue['dependencies'] = [
-            Dependency(**{k: v for k, v in dep.items() if k in valid_dep_fields})
-            for dep in filtered_issue['dependencies']
-        ]
+    retry_ids: List[str] = []
+    for chunk, outcome in zip(chunks, outcomes):
+        if not _collect_show_output(outcome, issues) and len(chunk) > 1:
+            retry_ids.extend(chunk)
     
-    if 'dependents' in filtered_issue and filtered_issue['dependents']:
-        filtered_issue['dependents'] = [
-            Dependency(**{k: v for k, v in dep.items() if k in valid_dep_fields})
-            for dep in filtered_issue['dependents']
-        ]
+    if retry_ids:
+        outcomes = executor.run_many([['bd', 'show', issue_id, '--json'] for issue_id in retry_ids])
+        for outcome in outcomes:
+            _collect_show_output(outcome, issues)
     
-    return IssueWithDependencies(**filtered_issue)
+    return issues
 
 
-def get_beads_stats() -> Optional[BeadsStats]:
+def get_beads_stats(allow_subprocess: bool = True) -> Optional[BeadsStats]:
     """Get current beads database statistics.
     
     Runs from the main repository root to ensure beads database is accessible
-    even when called from a worktree.
+    even when called from a worktree. Computed from .beads/issues.jsonl
+    instead when direct reads are enabled.
+    
+    Args:
+        allow_subprocess: If False, never run bd; answer from the local
+            snapshot or last known stats instead (see beads_stats). Use
+            this on shutdown paths.
     
     Returns:
         BeadsStats object with current counts, or None if command fails.
     """
+    graph = _direct_snapshot()
+    if graph is not None:
+        return graph.stats()
+    
+    from .beads_stats import local_beads_stats, remember_stats
+    if not allow_subprocess:
+        return local_beads_stats()
+    
     try:
         # Get main repo root to ensure beads database is accessible
         main_repo = _get_main_repo_root()
         cwd = str(main_repo) if main_repo else None
         
-        result = subprocess.run(
-            ['bd', 'stats', '--json'],
-            capture_output=True,
-            text=True,
-            encoding='utf-8',
-            check=True,
-            cwd=cwd
-        )
+        # Runs on the executor so it is bounded by the timeout and
+        # abandoned promptly on shutdown
+        outcome = get_beads_executor().run_many([['bd', 'stats', '--json']], cwd=cwd)[0]
+        if isinstance(outcome, BaseException):
+            raise outcome
         
-        data = json.loads(result.stdout)
+        data = json.loads(outcome.stdout)
         summary = data.get('summary', {})
         
-        return BeadsStats(
+        stats = BeadsStats(
             total_issues=summary.get('total_issues', 0),
             open_issues=summary.get('open_issues', 0),
             in_progress_issues=summary.get('in_progress_issues', 0),
             closed_issues=summary.get('closed_issues', 0),
             ready_issues=summary.get('ready_issues', 0)
         )
+        remember_stats(stats)
+        return stats
     except Exception as e:
         print(f"⚠️  Warning: Failed to get beads stats: {e}")
         return None
@@ -0,0 +1,89 @@
+"""Beads statistics that never wait on a subprocess.
+
+Session stats are collected on every exit path, including Ctrl+C, where the
+shutdown watchdog only allows a few seconds. ``local_beads_stats`` answers
+from the issues.jsonl snapshot when there is one. Otherwise it returns the
+last stats ``bd stats`` reported, adjusted by the status changes this
+process made since then.
+"""
+
+import threading
+from typing import Dict, Optional, Tuple
+
+from .beads_jsonl import get_issues_reader
+from .types import BeadsStats
+
+_lock = threading.Lock()
+_last_known: Optional[BeadsStats] = None
+# item id -> (status before our first change, status after our last change)
+_local_changes: Dict[str, Tuple[Optional[str], str]] = {}
+
+_COUNTED_STATUSES = {
+    'open': 'open_issues',
+    'in_progress': 'in_progress_issues',
+    'closed': 'closed_issues',
+}
+
+
+def remember_stats(stats: BeadsStats) -> None:
+    """Store stats fetched from bd as the new baseline."""
+    global _last_known
+    with _lock:
+        _last_known = stats
+        _local_changes.clear()
+
+
+def record_status_change(item_id: str, old_status: Optional[str], new_status: str) -> None:
+    """Note a status change made by this process.
+
+    Args:
+        item_id: Item whose status changed.
+        old_status: Status before the change, or None for a newly created item.
+        new_status: Status after the change.
+    """
+    with _lock:
+        original = _local_changes.get(item_id, (old_status, new_status))[0]
+        _local_changes[item_id] = (original, new_status)
+
+
+def _apply_local_changes(base: BeadsStats) -> BeadsStats:
+    counts = {
+        'total_issues': base.total_issues,
+        'open_issues': base.open_issues,
+        'in_progress_issues': base.in_progress_issues,
+        'closed_issues': base.closed_issues,
+    }
+    for original, current in _local_changes.values():
+        if original is None:
+            counts['total_issues'] += 1
+        elif original in _COUNTED_STATUSES:
+            counts[_COUNTED_STATUSES[original]] -= 1
+        if current in _COUNTED_STATUSES:
+            counts[_COUNTED_STATUSES[current]] += 1
+    # Readiness depends on blockers we can't see, so it stays as last reported
+    return BeadsStats(ready_issues=base.ready_issues, **counts)
+
+
+def local_beads_stats() -> Optional[BeadsStats]:
+    """Compute beads stats in-process, without spawning bd.
+
+    Returns:
+        Stats from the issues.jsonl snapshot, else the last known stats plus
+        our own changes, or None if neither is available.
+    """
+    reader = get_issues_reader()
+    graph = reader.snapshot() if reader is not None else None
+    if graph is not None:
+        return graph.stats()
+    with _lock:
+        if _last_known is None:
+            return None
+        return _apply_local_changes(_last_known)
+
+
+def reset_local_stats() -> None:
+    """Forget the baseline and recorded changes. Only for tests."""
+    global _last_known
+    with _lock:
+        _last_known = None
+        _local_changes.clear()
@@ -0,0 +1,216 @@
+"""Background `bd sync` service that coalesces sync requests.
+
+Claims and merges both need the beads database pushed so that other agents
+see the change, but each one running its own `bd sync` serializes everyone
+behind the slowest sync. Instead, callers ask for a sync with
+``request_sync()``, which returns a barrier, and wait for it with
+``await_sync(barrier)``. A single worker thread collects requests for a
+short window and runs one `bd sync` that satisfies all of them.
+
+`bd sync` commits to the main repo, so it runs under the merge lock like
+every other main-repo write. The worker waits for that lock no longer than
+the sync timeout: if it stays busy, waiters get a ``SyncLockBusy`` outcome
+and the sync is retried in the background. A caller that already holds the
+lock (a merge) must not wait on the worker; it uses ``sync_now()`` to run
+the sync in its own thread instead.
+"""
+
+import subprocess
+import threading
+import time
+from typing import Optional
+
+from .beads_executor import BdOutcome
+from .config import get_config
+from .merge_queue import merge_lock_within
+from .shutdown import is_shutting_down
+from .types import BeadsSyncStats
+
+# How often waiting threads check for a shutdown request (seconds)
+_SHUTDOWN_POLL_SECONDS = 0.1
+
+# Number of recent sync durations kept for the latency report
+_MAX_LATENCY_SAMPLES = 256
+
+
+class SyncLockBusy(Exception):
+    """The merge lock stayed busy, so `bd sync` did not run; it is retried later."""
+
+
+class SyncService:
+    """Runs coalesced `bd sync` calls on a daemon worker thread.
+
+    Requests are numbered; a flush started after request N was made covers
+    every request up to the newest one seen when it started.
+    """
+
+    def __init__(self, coalesce_seconds: float = 0.1, timeout: float = 30.0) -> None:
+        self.coalesce_seconds = max(0.0, coalesce_seconds)
+        self.timeout = timeout
+        self.stats = BeadsSyncStats()
+        self._cond = threading.Condition()
+        self._requested = 0
+        self._completed = 0
+        self._last_outcome: Optional[BdOutcome] = None
+        self._worker: Optional[threading.Thread] = None
+
+    def request_sync(self) -> int:
+        """Ask for a sync and return the barrier to pass to await_sync."""
+        with self._cond:
+            self._requested += 1
+            self.stats.requests += 1
+            self._ensure_worker()
+            self._cond.notify_all()
+            return self._requested
+
+    @property
+    def default_wait(self) -> float:
+        """Longest a sync can take to cover a request: one already running, then ours.
+
+        Each waits up to ``timeout`` for the merge lock and up to ``timeout``
+        for `bd sync` itself.
+        """
+        return 2 * (2 * self.timeout + self.coalesce_seconds) + 1.0
+
+    def await_sync(self, barrier: int, timeout: Optional[float] = None) -> Optional[BdOutcome]:
+        """Wait for a sync covering ``barrier``.
+
+        Args:
+            barrier: Value returned by request_sync.
+            timeout: Seconds to wait (default: ``default_wait``).
+
+        Returns:
+            The result of the covering `bd sync` (a CompletedProcess, or the
+            exception it raised; ``SyncLockBusy`` if it could not get the
+            merge lock), or None if the wait timed out or PokePoke is
+            shutting down. Either way the request stays covered by a later
+            sync, so callers carry on rather than undo their change.
+        """
+        deadline = time.monotonic() + (self.default_wait if timeout is None else timeout)
+        with self._cond:
+            while self._completed < barrier:
+                if is_shutting_down():
+                    return None
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    return None
+                self._cond.wait(min(_SHUTDOWN_POLL_SECONDS, remaining))
+            return self._last_outcome
+
+    def _ensure_worker(self) -> None:
+        if self._worker is None or not self._worker.is_alive():
+            self._worker = threading.Thread(
+                target=self._run, daemon=True, name="beads-sync"
+            )
+            self._worker.start()
+
+    def _run(self) -> None:
+        while not is_shutting_down():
+            with self._cond:
+                if self._requested == self._completed:
+                    self._cond.wait(_SHUTDOWN_POLL_SECONDS)
+                    continue
+            # Let requests from other agents pile up behind this flush
+            if self.coalesce_seconds:
+                time.sleep(self.coalesce_seconds)
+            with self._cond:
+                target = self._requested
+
+            self._flush(target)
+
+    def sync_now(self) -> BdOutcome:
+        """Run a `bd sync` in the calling thread, covering every request so far.
+
+        For callers holding the merge lock, which the worker needs.
+
+        Returns:
+            The CompletedProcess, or the exception the sync raised.
+        """
+        with self._cond:
+            target = self._requested
+        return self._flush(target)
+
+    def _flush(self, target: int) -> BdOutcome:
+        started = time.monotonic()
+        outcome = self._sync_once()
+        elapsed = time.monotonic() - started
+
+        with self._cond:
+            # A flush started earlier may finish after a later one
+            self._completed = max(self._completed, target)
+            self._last_outcome = outcome
+            if isinstance(outcome, SyncLockBusy):
+                # Nothing was pushed: queue another sync for the same changes
+                self.stats.lock_busy += 1
+                if self._requested == self._completed:
+                    self._requested += 1
+            else:
+                self.stats.syncs_run += 1
+                if isinstance(outcome, BaseException) or outcome.returncode != 0:
+                    self.stats.failures += 1
+                self.stats.latencies.append(elapsed)
+                del self.stats.latencies[:-_MAX_LATENCY_SAMPLES]
+            self._cond.notify_all()
+        return outcome
+
+    def _sync_once(self) -> BdOutcome:
+        try:
+            # bd sync commits .beads/ in the main repo
+            with merge_lock_within(self.timeout, "beads sync") as locked:
+                if not locked:
+                    return SyncLockBusy(f"merge lock busy for {self.timeout:.0f}s")
+                return subprocess.run(
+                    ['bd', 'sync'],
+                    capture_output=True,
+                    text=True,
+                    encoding='utf-8',
+                    timeout=self.timeout
+                )
+        except Exception as e:
+            # Any failure (e.g. undecodable output) is this sync's outcome;
+            # the worker must survive it or waiting callers never wake
+            return e
+
+
+_service: Optional[SyncService] = None
+_service_lock = threading.Lock()
+
+
+def get_sync_service() -> SyncService:
+    """Return the process-wide sync service, creating it on first use."""
+    global _service
+    with _service_lock:
+        if _service is None:
+            beads_config = get_config().beads
+            _service = SyncService(
+                coalesce_seconds=beads_config.sync_coalesce_seconds,
+                timeout=beads_config.command_timeout,
+            )
+        return _service
+
+
+def request_sync() -> int:
+    """Ask the background worker for a `bd sync`; returns a barrier."""
+    return get_sync_service().request_sync()
+
+
+def await_sync(barrier: int, timeout: Optional[float] = None) -> Optional[BdOutcome]:
+    """Wait until a `bd sync` covering ``barrier`` has finished."""
+    return get_sync_service().await_sync(barrier, timeout=timeout)
+
+
+def sync_now() -> BdOutcome:
+    """Run a `bd sync` in the calling thread; for holders of the merge lock."""
+    return get_sync_service().sync_now()
+
+
+def get_sync_stats() -> BeadsSyncStats:
+    """Live sync counters and latencies for the session."""
+    return get_sync_service().stats
+
+
+def reset_sync_service() -> None:
+    """Drop the sync service so the next call re-reads config. Only for tests."""
+    global _service
+    with _service_lock:
+        _service = None
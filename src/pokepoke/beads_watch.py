@@ -0,0 +1,145 @@
+"""Wait for changes to the beads issues export instead of polling bd.
+
+In watch mode the orchestrator does not exit when there is no ready work.
+It blocks until ``.beads/issues.jsonl`` changes (new issues, closed
+blockers, synced updates from other agents) or shutdown is requested.
+
+On Linux the ``.beads`` directory is watched with inotify. Everywhere else
+the file is polled with ``stat``. ``arm()`` takes a baseline before the
+ready list is fetched, so a change that lands between the fetch and
+``wait()`` still wakes the waiter.
+"""
+
+import ctypes
+import ctypes.util
+import os
+import select
+import struct
+import sys
+import time
+from pathlib import Path
+from typing import Optional, Tuple
+
+from .beads_jsonl import find_issues_jsonl
+from .shutdown import is_shutting_down, wait_for_shutdown
+
+# inotify constants (linux/inotify.h)
+_IN_MODIFY = 0x00000002
+_IN_CLOSE_WRITE = 0x00000008
+_IN_MOVED_TO = 0x00000080
+_IN_CREATE = 0x00000100
+_IN_NONBLOCK = 0o4000
+_IN_CLOEXEC = 0o2000000
+_EVENT_HEADER = struct.Struct('iIII')
+
+# Longest a single select() blocks, so shutdown is noticed promptly
+_SHUTDOWN_CHECK_SECONDS = 0.5
+
+# Re-check the ready list this often even without a change, since issues
+# can become ready without the export being rewritten (e.g. deferred ones)
+WATCH_RECHECK_SECONDS = 300.0
+
+_Signature = Optional[Tuple[int, int, int]]
+
+
+def _signature(path: Optional[Path]) -> _Signature:
+    """Identity of the file's current contents (inode, size, mtime)."""
+    if path is None:
+        return None
+    try:
+        st = os.stat(path)
+    except OSError:
+        return None
+    return (st.st_ino, st.st_size, st.st_mtime_ns)
+
+
+def _open_inotify(directory: Path) -> Optional[int]:
+    """Create an inotify descriptor watching ``directory``, or None."""
+    if not sys.platform.startswith('linux'):
+        return None
+    try:
+        libc = ctypes.CDLL(ctypes.util.find_library('c') or None, use_errno=True)
+        fd = libc.inotify_init1(_IN_NONBLOCK | _IN_CLOEXEC)
+        if fd < 0:
+            return None
+        mask = _IN_MODIFY | _IN_CLOSE_WRITE | _IN_MOVED_TO | _IN_CREATE
+        if libc.inotify_add_watch(fd, os.fsencode(directory), mask) < 0:
+            os.close(fd)
+            return None
+        return int(fd)
+    except (OSError, AttributeError):
+        return None
+
+
+class BeadsWatcher:
+    """Blocks until the beads issues export changes."""
+
+    def __init__(self, path: Optional[Path] = None, poll_interval: float = 1.0) -> None:
+        self.path = path if path is not None else find_issues_jsonl()
+        self.poll_interval = poll_interval
+        self._fd = _open_inotify(self.path.parent) if self.path is not None else None
+        self._baseline: _Signature = _signature(self.path)
+
+    @property
+    def mode(self) -> str:
+        """'inotify', 'polling', or 'none' when there is no beads directory."""
+        if self.path is None:
+            return 'none'
+        return 'inotify' if self._fd is not None else 'polling'
+
+    def arm(self) -> None:
+        """Start watching from now: forget earlier changes."""
+        self._drain()
+        self._baseline = _signature(self.path)
+
+    def wait(self, timeout: Optional[float] = None) -> bool:
+        """Block until the file changes, shutdown is requested, or timeout.
+
+        Returns:
+            True if the file changed since ``arm()``, False otherwise.
+        """
+        deadline = None if timeout is None else time.monotonic() + timeout
+        while not is_shutting_down():
+            if self._changed():
+                return True
+            remaining = None if deadline is None else deadline - time.monotonic()
+            if remaining is not None and remaining <= 0:
+                return False
+            if self._fd is None:
+                step = self.poll_interval if remaining is None else min(self.poll_interval, remaining)
+                wait_for_shutdown(step)
+                continue
+            step = _SHUTDOWN_CHECK_SECONDS if remaining is None else min(_SHUTDOWN_CHECK_SECONDS, remaining)
+            readable, _, _ = select.select([self._fd], [], [], step)
+            if readable and self._drain():
+                return True
+        return False
+
+    def close(self) -> None:
+        if self._fd is not None:
+            os.close(self._fd)
+            self._fd = None
+
+    def _changed(self) -> bool:
+        return _signature(self.path) != self._baseline
+
+    def _drain(self) -> bool:
+        """Read queued inotify events; True if any concerned our file."""
+        if self._fd is None or self.path is None:
+            return False
+        name = os.fsencode(self.path.name)
+        hit = False
+        while True:
+            try:
+                data = os.read(self._fd, 4096)
+            except OSError:  # BlockingIOError once the queue is empty
+                return hit
+            if not data:
+                return hit
+            offset = 0
+            while offset + _EVENT_HEADER.size <= len(data):
+                _, _, _, length = _EVENT_HEADER.unpack_from(data, offset)
+                start = offset + _EVENT_HEADER.size
+                if data[start:start + length].rstrip(b'\0') == name:
+                    hit = True
+                offset = start + length
@@ -0,0 +1,226 @@
+"""Registry of work items claimed by PokePoke workers.
+
+All workers in a run share one agent name, so beads alone can't tell them
+apart: an item one worker has claimed still looks like "ours" to the others.
+Across processes, the beads assignee check only sees another claim after a
+`bd sync`, which leaves a window for two agents to pick the same item.
+
+Workers therefore reserve an item in a registry before claiming it in beads
+(and before creating its worktree), and release it when they are done.
+``LocalClaimRegistry`` keeps the reservations in ``.pokepoke/claims.db`` so
+every PokePoke process on the repository shares them; ``ClaimRegistry`` is
+the in-memory fallback.
+"""
+
+import os
+import sqlite3
+import sys
+import threading
+import time
+from pathlib import Path
+from typing import Dict, Optional, Set, Union
+
+CLAIMS_DB = Path(".pokepoke") / "claims.db"
+
+# Safety net for claims held by a process that hangs rather than exits
+# (renewed by the item's lease heartbeat while it is being worked on)
+DEFAULT_CLAIM_TTL_SECONDS = 3 * 3600.0
+
+
+class ClaimRegistry:
+    """Thread-safe map of item id -> worker that is processing it."""
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._claims: Dict[str, str] = {}
+
+    def try_claim(self, item_id: str, owner: str) -> bool:
+        """Reserve an item for a worker.
+
+        Returns:
+            True if the item is now held by ``owner`` (or already was),
+            False if another worker holds it.
+        """
+        with self._lock:
+            holder = self._claims.get(item_id)
+            if holder is not None and holder != owner:
+                return False
+            self._claims[item_id] = owner
+            return True
+
+    def renew(self, item_id: str) -> None:
+        """Keep a claim alive (in-memory claims never expire)."""
+
+    def release(self, item_id: str, owner: Optional[str] = None) -> None:
+        """Release an item (only if ``owner`` holds it, when given)."""
+        with self._lock:
+            if owner is None or self._claims.get(item_id) == owner:
+                self._claims.pop(item_id, None)
+
+    def holder(self, item_id: str) -> Optional[str]:
+        """Worker currently holding an item, if any."""
+        with self._lock:
+            return self._claims.get(item_id)
+
+    def claimed_ids(self) -> Set[str]:
+        """Snapshot of all reserved item ids."""
+        with self._lock:
+            return set(self._claims)
+
+
+def _pid_alive(pid: int) -> bool:
+    """Check whether a process on this machine is still running."""
+    if pid == os.getpid():
+        return True
+    if sys.platform == 'win32':
+        # os.kill(pid, 0) would send CTRL_C_EVENT on Windows
+        import ctypes
+        kernel32 = ctypes.windll.kernel32  # type: ignore[attr-defined]
+        handle = kernel32.OpenProcess(0x1000, False, pid)  # PROCESS_QUERY_LIMITED_INFORMATION
+        if not handle:
+            return False
+        try:
+            exit_code = ctypes.c_ulong()
+            kernel32.GetExitCodeProcess(handle, ctypes.byref(exit_code))
+            return exit_code.value == 259  # STILL_ACTIVE
+        finally:
+            kernel32.CloseHandle(handle)
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    except PermissionError:
+        return True
+    return True
+
+
+class LocalClaimRegistry:
+    """Claims shared by all PokePoke processes through a SQLite database.
+
+    A claim is a row (item id, owner, pid, expiry). ``try_claim`` is an
+    atomic compare-and-set inside a ``BEGIN IMMEDIATE`` transaction: it
+    succeeds if the item is unclaimed, already ours, or held by a claim that
+    is stale (its process exited or its TTL ran out).
+    """
+
+    def __init__(self, path: Path = CLAIMS_DB, ttl_seconds: float = DEFAULT_CLAIM_TTL_SECONDS) -> None:
+        self.path = path
+        self.ttl_seconds = ttl_seconds
+        self._lock = threading.Lock()
+        path.parent.mkdir(parents=True, exist_ok=True)
+        self._conn = sqlite3.connect(
+            str(path), timeout=10.0, isolation_level=None, check_same_thread=False
+        )
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS claims ("
+            "item_id TEXT PRIMARY KEY, owner TEXT NOT NULL, "
+            "pid INTEGER NOT NULL, expires_at REAL NOT NULL)"
+        )
+
+    def _is_live(self, pid: int, expires_at: float, now: float) -> bool:
+        return expires_at > now and _pid_alive(pid)
+
+    def try_claim(self, item_id: str, owner: str) -> bool:
+        """Atomically reserve an item for ``owner``.
+
+        Returns:
+            True if the item is now held by ``owner`` (re-claiming refreshes
+            the expiry), False if someone else holds a live claim.
+        """
+        now = time.time()
+        with self._lock:
+            self._conn.execute("BEGIN IMMEDIATE")
+            try:
+                row = self._conn.execute(
+                    "SELECT owner, pid, expires_at FROM claims WHERE item_id = ?", (item_id,)
+                ).fetchone()
+                if row is not None and row[0] != owner and self._is_live(row[1], row[2], now):
+                    self._conn.execute("ROLLBACK")
+                    return False
+                self._conn.execute(
+                    "INSERT OR REPLACE INTO claims (item_id, owner, pid, expires_at) VALUES (?, ?, ?, ?)",
+                    (item_id, owner, os.getpid(), now + self.ttl_seconds),
+                )
+                self._conn.execute("COMMIT")
+                return True
+            except BaseException:
+                self._conn.execute("ROLLBACK")
+                raise
+
+    def renew(self, item_id: str) -> None:
+        """Push back the expiry of this process's claim on an item.
+
+        Called by the item's lease heartbeat, so a claim outlives the TTL for
+        as long as its worker is alive and still working on the item.
+        """
+        try:
+            with self._lock:
+                self._conn.execute(
+                    "UPDATE claims SET expires_at = ? WHERE item_id = ? AND pid = ?",
+                    (time.time() + self.ttl_seconds, item_id, os.getpid()),
+                )
+        except sqlite3.Error as e:
+            print(f"⚠️  Failed to renew the claim on {item_id}: {e}")
+
+    def release(self, item_id: str, owner: Optional[str] = None) -> None:
+        """Release an item (only if ``owner`` holds it, when given)."""
+        with self._lock:
+            if owner is None:
+                self._conn.execute("DELETE FROM claims WHERE item_id = ?", (item_id,))
+            else:
+                self._conn.execute(
+                    "DELETE FROM claims WHERE item_id = ? AND owner = ?", (item_id, owner)
+                )
+
+    def holder(self, item_id: str) -> Optional[str]:
+        """Owner of the live claim on an item, if any."""
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT owner, pid, expires_at FROM claims WHERE item_id = ?", (item_id,)
+            ).fetchone()
+        if row is None or not self._is_live(row[1], row[2], time.time()):
+            return None
+        return str(row[0])
+
+    def claimed_ids(self) -> Set[str]:
+        """Items with a live claim held by any process."""
+        now = time.time()
+        with self._lock:
+            rows = self._conn.execute("SELECT item_id, pid, expires_at FROM claims").fetchall()
+        return {row[0] for row in rows if self._is_live(row[1], row[2], now)}
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
+
+
+AnyClaimRegistry = Union[ClaimRegistry, LocalClaimRegistry]
+
+_registry: Optional[AnyClaimRegistry] = None
+_registry_lock = threading.Lock()
+
+
+def get_claim_registry() -> AnyClaimRegistry:
+    """Return the registry shared by this process's workers.
+
+    Uses ``.pokepoke/claims.db`` so other PokePoke processes see the same
+    claims; falls back to an in-memory registry if the database can't be
+    opened.
+    """
+    global _registry
+    with _registry_lock:
+        if _registry is None:
+            try:
+                _registry = LocalClaimRegistry()
+            except (sqlite3.Error, OSError) as e:
+                print(f"⚠️  Claim registry unavailable ({e}) - claims are only coordinated in-process")
+                _registry = ClaimRegistry()
+        return _registry
+
+
+def claim_owner(worker: Optional[str] = None) -> str:
+    """Owner string for this process (and worker, if any)."""
+    base = f"{os.environ.get('AGENT_NAME', 'agent')}:{os.getpid()}"
+    return f"{base}/{worker}" if worker else base
@@ -3,26 +3,25 @@
 import os
 import subprocess
 from pathlib import Path
-from typing import Optional
+from typing import Optional, TYPE_CHECKING
 
+from pokepoke.agent_timing import merge_agent_stats
 from pokepoke.copilot import invoke_copilot
+from pokepoke.prompts import get_prompt_service, item_prompt_variables
 from pokepoke.types import BeadsWorkItem, AgentStats, CopilotResult
 from pokepoke.git_operations import verify_main_repo_clean, commit_all_changes
 from pokepoke import terminal_ui
 
+if TYPE_CHECKING:
+    from pokepoke.logging_utils import ItemLogger
+
 def aggregate_cleanup_stats(result_stats: Optional[AgentStats], cleanup_stats: Optional[AgentStats]) -> None:
     """Aggregate cleanup agent stats into result stats."""
     if cleanup_stats and result_stats:
-        result_stats.wall_duration += cleanup_stats.wall_duration
-        result_stats.api_duration += cleanup_stats.api_duration
-        result_stats.input_tokens += cleanup_stats.input_tokens
-        result_stats.output_tokens += cleanup_stats.output_tokens
-        result_stats.lines_added += cleanup_stats.lines_added
-        result_stats.lines_removed += cleanup_stats.lines_removed
-        result_stats.premium_requests += cleanup_stats.premium_requests
+        merge_agent_stats(result_stats, cleanup_stats)
 
 
-def run_cleanup_loop(item: BeadsWorkItem, result: CopilotResult, repo_root: Path, cwd: Optional[str] = None) -> tuple[bool, int]:
+def run_cleanup_loop(item: BeadsWorkItem, result: CopilotResult, repo_root: Path, cwd: Optional[str] = None, item_logger: Optional['ItemLogger'] = None) -> tuple[bool, int]:
     """Run cleanup loop to commit changes and fix validation failures."""
     cleanup_agent_runs = 0
     cleanup_attempt = 0
@@ -50,7 +49,7 @@ def run_cleanup_loop(item: BeadsWorkItem, result: CopilotResult, repo_root: Path
         
         print("\n🧹 Invoking cleanup agent to fix validation errors...")
         cleanup_agent_runs += 1
-        cleanup_success, cleanup_stats = invoke_cleanup_agent(item, repo_root, cwd=cwd)
+        cleanup_success, cleanup_stats = invoke_cleanup_agent(item, repo_root, cwd=cwd, item_logger=item_logger)
         
         aggregate_cleanup_stats(result.stats, cleanup_stats)
         
@@ -124,8 +123,8 @@ def _get_current_git_context(cwd: Optional[str] = None) -> tuple[str, str, bool]
     return current_dir, current_branch, is_worktree
 
 
-def invoke_cleanup_agent(item: BeadsWorkItem, repo_root: Path, cwd: Optional[str] = None) -> tuple[bool, Optional[AgentStats]]:
-    """Invoke cleanup agent to commit uncommitted changes."""
+def invoke_cleanup_agent(item: BeadsWorkItem, repo_root: Path, cwd: Optional[str] = None, item_logger: Optional['ItemLogger'] = None) -> tuple[bool, Optional[AgentStats]]:
+    """Invoke cleanup agent to commit uncommitted changes; its output goes to ``item_logger``."""
     terminal_ui.ui.set_current_agent("Cleanup Agent")
     try:
         prompts_dir = get_pokepoke_prompts_dir()
@@ -142,29 +141,17 @@ def invoke_cleanup_agent(item: BeadsWorkItem, repo_root: Path, cwd: Optional[str
     
     # Get current context information
     current_dir, current_branch, is_worktree = _get_current_git_context(cwd=cwd)
+    git_context = (
+        f"**Status:** {item.status}\n"
+        f"**Current Working Directory:** {current_dir}\n"
+        f"**Current Branch:** {current_branch}\n"
+        f"**Is Worktree:** {is_worktree}"
+    )
     
-    # Replace placeholders in template
-    cleanup_prompt_template = cleanup_prompt_template.replace("{cwd}", current_dir)
-    cleanup_prompt_template = cleanup_prompt_template.replace("{branch}", current_branch)
-    cleanup_prompt_template = cleanup_prompt_template.replace("{is_worktree}", str(is_worktree))
-    
-    work_item_context = f"""
-# Work Item Being Cleaned Up
-
-**ID:** {item.id}
-**Title:** {item.title}
-**Type:** {item.issue_type}
-**Priority:** {item.priority}
-**Status:** {item.status}
-
-**Description:**
-{item.description}
-"""
-    
-    if item.labels:
-        work_item_context += f"\n**Labels:** {', '.join(item.labels)}\n"
-    
-    cleanup_prompt = f"{work_item_context}\n\n---\n\n{cleanup_prompt_template}"
+    # Instructions first, item and worktree last, so cleanup prompts share a cacheable prefix
+    cleanup_prompt = get_prompt_service().append_item(
+        cleanup_prompt_template, item_prompt_variables(item, context=git_context)
+    )
     
     cleanup_item = BeadsWorkItem(
         id=f"{item.id}-cleanup",
@@ -177,7 +164,7 @@ def invoke_cleanup_agent(item: BeadsWorkItem, repo_root: Path, cwd: Optional[str
     )
     
     print("\n🧹 Invoking cleanup agent...")
-    copilot_result = invoke_copilot(cleanup_item, prompt=cleanup_prompt, cwd=cwd)
+    copilot_result = invoke_copilot(cleanup_item, prompt=cleanup_prompt, cwd=cwd, item_logger=item_logger)
     
     return copilot_result.success, copilot_result.stats
 
@@ -187,7 +174,8 @@ def invoke_merge_conflict_cleanup_agent(
     repo_root: Path, 
     error_msg: str,
     unmerged_files: Optional[list[str]] = None,
-    cwd: Optional[str] = None
+    cwd: Optional[str] = None,
+    item_logger: Optional['ItemLogger'] = None
 ) -> tuple[bool, Optional[AgentStats]]:
     """Invoke cleanup agent to resolve merge conflicts.
     
@@ -197,6 +185,7 @@ def invoke_merge_conflict_cleanup_agent(
         error_msg: Description of the merge error
         unmerged_files: Optional list of files with merge conflicts
         cwd: Optional working directory for the Copilot process.
+        item_logger: Log for the agent's full output.
     """
     terminal_ui.ui.set_current_agent("Merge Conflict Cleanup")
     from pokepoke.git_operations import is_merge_in_progress, get_unmerged_files as git_get_unmerged
@@ -211,7 +200,7 @@ def invoke_merge_conflict_cleanup_agent(
     if not cleanup_prompt_path.exists():
         # Fallback to standard cleanup
         print(f"⚠️ Merge conflict cleanup prompt not found at {cleanup_prompt_path}, falling back to standard cleanup")
-        return invoke_cleanup_agent(item, repo_root)
+        return invoke_cleanup_agent(item, repo_root, item_logger=item_logger)
     
     cleanup_prompt_template = cleanup_prompt_path.read_text(encoding='utf-8')
     
@@ -284,6 +273,6 @@ def invoke_merge_conflict_cleanup_agent(
         if len(unmerged_files) > 5:
             print(f"      ... and {len(unmerged_files) - 5} more")
     
-    copilot_result = invoke_copilot(cleanup_item, prompt=cleanup_prompt, cwd=cwd)
+    copilot_result = invoke_copilot(cleanup_item, prompt=cleanup_prompt, cwd=cwd, item_logger=item_logger)
     
     return copilot_result.success, copilot_result.stats
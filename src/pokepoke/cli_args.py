@@ -0,0 +1,70 @@
+"""Command-line arguments for the PokePoke orchestrator."""
+
+import argparse
+from typing import Optional
+
+
+def build_parser() -> argparse.ArgumentParser:
+    """Build the argument parser for the ``pokepoke`` command."""
+    parser = argparse.ArgumentParser(
+        description="PokePoke - Autonomous Beads + Copilot CLI Orchestrator"
+    )
+    parser.add_argument(
+        "--interactive",
+        action="store_true",
+        default=True,
+        help="Interactive mode: prompt for user input (default)",
+    )
+    parser.add_argument(
+        "--autonomous",
+        action="store_true",
+        help="Autonomous mode: automatic decision making",
+    )
+    parser.add_argument(
+        "--continuous",
+        action="store_true",
+        help="Continuous mode: loop through multiple items instead of single-shot",
+    )
+    parser.add_argument(
+        "--beta-first",
+        action="store_true",
+        help="Run beta tester at startup before processing work items",
+    )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=1,
+        help="Process N work items concurrently, each in its own worktree (autonomous mode)",
+    )
+    parser.add_argument(
+        "--prefetch",
+        action="store_true",
+        help="Stage the next item and its worktree while the gate agent runs (autonomous mode)",
+    )
+    parser.add_argument(
+        "--watch",
+        action="store_true",
+        help="Keep running when no work is ready and wake when beads issues change (autonomous, implies --continuous)",
+    )
+    parser.add_argument(
+        "--init",
+        action="store_true",
+        help="Initialize .pokepoke/ directory with sample config and templates",
+    )
+    return parser
+
+
+def validate_args(args: argparse.Namespace) -> Optional[str]:
+    """Check option combinations.
+
+    Returns:
+        An error message, or None if the arguments are usable.
+    """
+    interactive = not args.autonomous
+    if args.workers > 1 and interactive:
+        return "--workers requires --autonomous"
+    if args.prefetch and (interactive or args.workers > 1):
+        return "--prefetch requires --autonomous and a single worker"
+    if args.watch and interactive:
+        return "--watch requires --autonomous"
+    return None
@@ -25,6 +25,13 @@ class ModelConfig:
     default: str = "claude-opus-4.6"
     fallback: str = "claude-sonnet-4.5"
     candidate_models: List[str] = field(default_factory=list)
+    # Models tried in order when the requested one is rate limited.
+    # Empty means the fallback model, then the candidate models.
+    fallback_chain: List[str] = field(default_factory=list)
+    # Seconds a rate-limited model is avoided (doubles on repeated limits).
+    rate_limit_cooldown: float = 30.0
+    # Invocations allowed on one model at once (0 = no limit until rate limited).
+    max_concurrent_per_model: int = 0
 
 
 @dataclass
@@ -43,6 +50,12 @@ class MaintenanceAgentConfig:
 class MaintenanceConfig:
     """Maintenance agent scheduling configuration."""
     agents: List[MaintenanceAgentConfig] = field(default_factory=list)
+    # Run agents on a background lane instead of between work items.
+    background: bool = False
+    # Maximum maintenance agents running at once on the background lane.
+    max_concurrent: int = 1
+    # Hold queued agents while at least this many items are ready (0 = never).
+    pause_at_ready: int = 0
 
     @staticmethod
     def defaults() -> 'MaintenanceConfig':
@@ -116,6 +129,38 @@ class GitConfig:
         return None
 
 
+@dataclass
+class BeadsConfig:
+    """How PokePoke reads the beads database."""
+    # Read .beads/issues.jsonl directly instead of spawning bd for queries.
+    # Falls back to the bd CLI when the file is missing or its format is unknown.
+    direct_read: bool = False
+    # Maximum bd processes run at once for independent lookups.
+    max_concurrency: int = 4
+    # Seconds before a bd call is killed.
+    command_timeout: float = 30.0
+    # Seconds the background sync worker waits to batch bd sync requests.
+    sync_coalesce_seconds: float = 0.1
+    # Seconds a claim lease lasts without renewal (0 disables leases).
+    lease_seconds: float = 600.0
+
+
+@dataclass
+class CopilotConfig:
+    """How PokePoke runs the Copilot SDK client."""
+    # Seconds a started client is kept warm for reuse (0 stops it after each agent).
+    pool_idle_timeout: float = 300.0
+    # Warm clients kept per working directory.
+    pool_max_idle: int = 2
+    # Keep the work agent's session open and send gate feedback as a follow-up message.
+    reuse_work_session: bool = False
+    # Characters of a tool's arguments or result shown and logged (head and tail; 0 shows all).
+    # Longer output is saved whole to the item's tool-results file.
+    tool_output_limit: int = 2000
+    # Per-tool overrides of tool_output_limit, e.g. {"view": 500}.
+    tool_output_limits: Dict[str, int] = field(default_factory=dict)
+
+
 @dataclass
 class TestDataEntry:
     """A single piece of test data for prompt templates."""
@@ -132,6 +177,8 @@ class ProjectConfig:
     maintenance: MaintenanceConfig = field(default_factory=MaintenanceConfig.defaults)
     mcp_server: MpcServerConfig = field(default_factory=MpcServerConfig)
     git: GitConfig = field(default_factory=GitConfig)
+    beads: BeadsConfig = field(default_factory=BeadsConfig)
+    copilot: CopilotConfig = field(default_factory=CopilotConfig)
     test_data: Dict[str, str] = field(default_factory=dict)
     work_artifacts_dir: Optional[str] = None
 
@@ -148,6 +195,9 @@ class ProjectConfig:
             default=models_data.get("default", "claude-opus-4.6"),
             fallback=models_data.get("fallback", "claude-sonnet-4.5"),
             candidate_models=models_data.get("candidate_models", []),
+            fallback_chain=models_data.get("fallback_chain", []),
+            rate_limit_cooldown=models_data.get("rate_limit_cooldown", 30.0),
+            max_concurrent_per_model=models_data.get("max_concurrent_per_model", 0),
         )
 
         # Git
@@ -165,6 +215,26 @@ class ProjectConfig:
             name=mcp_data.get("name"),
         )
 
+        # Beads
+        beads_data = data.get("beads", {})
+        config.beads = BeadsConfig(
+            direct_read=beads_data.get("direct_read", False),
+            max_concurrency=beads_data.get("max_concurrency", 4),
+            command_timeout=beads_data.get("command_timeout", 30.0),
+            sync_coalesce_seconds=beads_data.get("sync_coalesce_seconds", 0.1),
+            lease_seconds=beads_data.get("lease_seconds", 600.0),
+        )
+
+        # Copilot
+        copilot_data = data.get("copilot", {})
+        config.copilot = CopilotConfig(
+            pool_idle_timeout=copilot_data.get("pool_idle_timeout", 300.0),
+            pool_max_idle=copilot_data.get("pool_max_idle", 2),
+            reuse_work_session=copilot_data.get("reuse_work_session", False),
+            tool_output_limit=copilot_data.get("tool_output_limit", 2000),
+            tool_output_limits=copilot_data.get("tool_output_limits", {}),
+        )
+
         # Test data
         config.test_data = data.get("test_data", {})
 
@@ -175,7 +245,7 @@ class ProjectConfig:
         maint_data = data.get("maintenance", {})
         agents_data = maint_data.get("agents")
         if agents_data is not None:
-            config.maintenance = MaintenanceConfig(agents=[
+            config.maintenance.agents = [
                 MaintenanceAgentConfig(
                     name=a.get("name", ""),
                     prompt_file=a.get("prompt_file", ""),
@@ -186,8 +256,11 @@ class ProjectConfig:
                     enabled=a.get("enabled", True),
                 )
                 for a in agents_data
-            ])
+            ]
         # else: keep defaults from field(default_factory=...)
+        config.maintenance.background = maint_data.get("background", False)
+        config.maintenance.max_concurrent = maint_data.get("max_concurrent", 1)
+        config.maintenance.pause_at_ready = maint_data.get("pause_at_ready", 0)
 
         return config
 
@@ -14,6 +14,7 @@ from .copilot_sdk import invoke_copilot_sdk_sync
 
 if TYPE_CHECKING:
     from .logging_utils import ItemLogger
+    from .copilot_conversation import CopilotConversation
 
 
 def get_allowed_directories() -> list[str]:
@@ -111,6 +112,23 @@ Please implement this task according to the project guidelines and best practice
 Work independently and let me know when complete."""
 
 
+def build_gate_feedback_prompt(work_item: BeadsWorkItem, feedback: str) -> str:
+    """Build the follow-up message that sends gate feedback to a kept session.
+    
+    Args:
+        work_item: The beads work item the session is working on.
+        feedback: The gate agent's rejection reason.
+        
+    Returns:
+        Follow-up prompt string.
+    """
+    return f"""The gate agent reviewed your work on {work_item.id} and rejected it:
+
+{feedback}
+
+Address this feedback in the same worktree, keep all quality gates passing, and commit your changes. You already have the task context from earlier in this session - don't re-explore what you already know."""
+
+
 def invoke_copilot(
     work_item: BeadsWorkItem,
     prompt: Optional[str] = None,
@@ -119,7 +137,8 @@ def invoke_copilot(
     deny_write: bool = False,
     item_logger: Optional['ItemLogger'] = None,
     model: Optional[str] = None,
-    cwd: Optional[str] = None
+    cwd: Optional[str] = None,
+    conversation: Optional['CopilotConversation'] = None
 ) -> CopilotResult:
     """Invoke GitHub Copilot using SDK.
     
@@ -132,6 +151,7 @@ def invoke_copilot(
         item_logger: Optional item logger for file logging.
         model: Optional model name to use (e.g., 'gpt-5.1-codex', defaults to 'claude-opus-4.6').
         cwd: Optional working directory for the Copilot process (for thread-safe worktree isolation).
+        conversation: Optional kept session; continued if open, otherwise opened by this call.
         
     Returns:
         Result of the Copilot invocation.
@@ -144,6 +164,7 @@ def invoke_copilot(
         deny_write=deny_write,
         item_logger=item_logger,
         model=model,
-        cwd=cwd
+        cwd=cwd,
+        conversation=conversation
     )
 
@@ -0,0 +1,85 @@
+"""Keep a work-agent session open across gate-rejection retries.
+
+Without a conversation, every work-agent rerun after a gate rejection
+starts a new session from the full work prompt. The agent then re-reads the
+codebase, paying the input tokens and exploration tool calls again. With a
+``CopilotConversation`` the first invocation leaves its session (and client)
+open. Later invocations send the gate feedback as a follow-up message in
+that session.
+
+``WorkRetryStats`` counts the tokens and turns spent on reruns of either
+kind, so the two can be compared.
+"""
+
+import threading
+from typing import Any, Optional
+
+from .async_runtime import run_coroutine
+from .copilot_pool import get_client_pool
+from .types import AgentStats, WorkRetryStats
+
+
+class CopilotConversation:
+    """A Copilot session kept open for follow-up messages."""
+
+    def __init__(self) -> None:
+        self.client: Any = None
+        self.session: Any = None
+        self.model: Optional[str] = None
+        self.messages_sent = 0
+
+    @property
+    def is_open(self) -> bool:
+        return self.session is not None
+
+    def attach(self, client: Any, session: Any, model: str) -> None:
+        """Take over a pooled client and its session after the first message."""
+        self.client, self.session, self.model = client, session, model
+
+    def detach(self) -> None:
+        """Forget the session without closing it (its client is being stopped)."""
+        self.client = self.session = self.model = None
+
+    async def close(self) -> None:
+        """Destroy the session and return its client to the pool."""
+        client, session = self.client, self.session
+        self.detach()
+        if session is None:
+            return
+        healthy = True
+        try:
+            await session.destroy()
+        except Exception as e:
+            print(f"\n[SDK] Error closing kept session: {e}")
+            healthy = False
+        await get_client_pool().release(client, healthy=healthy)
+
+    def close_sync(self) -> None:
+        """Blocking ``close`` for synchronous callers."""
+        if self.is_open:
+            run_coroutine(self.close())
+
+
+_retry_stats = WorkRetryStats()
+_retry_stats_lock = threading.Lock()
+
+
+def record_work_retry(follow_up: bool, stats: Optional[AgentStats]) -> None:
+    """Count one work-agent rerun and the tokens and turns it used."""
+    stats = stats or AgentStats()
+    with _retry_stats_lock:
+        if follow_up:
+            _retry_stats.follow_up_retries += 1
+            _retry_stats.follow_up_input_tokens += stats.input_tokens
+            _retry_stats.follow_up_turns += stats.premium_requests
+            _retry_stats.follow_up_tool_calls += stats.tool_calls
+        else:
+            _retry_stats.fresh_retries += 1
+            _retry_stats.fresh_input_tokens += stats.input_tokens
+            _retry_stats.fresh_turns += stats.premium_requests
+            _retry_stats.fresh_tool_calls += stats.tool_calls
+
+
+def get_retry_stats() -> WorkRetryStats:
+    """Live rerun counters for this process."""
+    return _retry_stats
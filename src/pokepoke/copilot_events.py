@@ -0,0 +1,360 @@
+"""Collect the output and usage of one Copilot message exchange.
+
+A ``SessionEventCollector`` is subscribed to a session for one sent
+message. It echoes streaming output and tool activity to the terminal,
+accumulates the agent's output and token usage, and sets ``done`` when the
+exchange has finished (or failed). A session that receives a follow-up
+message gets a new collector, so every exchange reports its own deltas.
+
+Output is streamed to the item's log file as it arrives. Only a bounded
+tail of it is kept in memory, along with the assistant's last message in
+full (which holds verdicts such as the gate agent's JSON block). Long tool
+arguments and results are shown as their head and tail only (see
+``tool_output``).
+
+Completion is detected from the events themselves: once the assistant has
+sent a message without tool requests and no tool is still running, the
+turn end (or the session going idle) finishes the exchange. Only an idle
+session without such a final answer falls back to waiting for more
+activity. That wait adapts to how long sessions have been seen to stay
+idle before resuming, capped at ``idle_timeout``.
+
+The collector also times the exchange. Model time runs from the send, a
+turn boundary or the last running tool finishing until the assistant's
+message arrives. Tool time is measured from each tool's start to its
+completion.
+"""
+
+import asyncio
+import itertools
+import threading
+import time
+from collections import deque
+from typing import TYPE_CHECKING, Any, Deque, Dict, List, Optional, Tuple
+
+from . import terminal_ui
+from .agent_timing import record_latency
+from .model_governor import is_rate_limit_error
+from .tool_output import cap_tool_output, tool_output_limit
+from .types import AgentStats, CompletionStats, LatencyHistogram
+
+if TYPE_CHECKING:
+    from .logging_utils import ItemLogger
+
+# Shortest fallback wait once enough idle-then-resume gaps have been seen
+_MIN_IDLE_WAIT_SECONDS = 2.0
+# Fallback wait = this factor x the longest observed idle-then-resume gap
+_IDLE_WAIT_MARGIN = 1.5
+# Gaps needed before the fallback wait is shortened
+_MIN_GAP_SAMPLES = 3
+# Characters of agent output kept in memory (the full output goes to the item log)
+OUTPUT_TAIL_CHARS = 64_000
+
+_resume_gaps: Deque[float] = deque(maxlen=50)
+_completion_stats = CompletionStats()
+_stats_lock = threading.Lock()
+
+
+def adaptive_idle_wait(ceiling: float) -> float:
+    """How long an idle session without a final answer is given to resume."""
+    with _stats_lock:
+        if len(_resume_gaps) < _MIN_GAP_SAMPLES:
+            return ceiling
+        longest = max(_resume_gaps)
+    return min(ceiling, max(_MIN_IDLE_WAIT_SECONDS, longest * _IDLE_WAIT_MARGIN))
+
+
+def get_completion_stats() -> CompletionStats:
+    """Live completion counters for this process."""
+    return _completion_stats
+
+
+def _event_type(event: Any) -> str:
+    return event.type.value if hasattr(event.type, 'value') else str(event.type)
+
+
+class SessionEventCollector:
+    """Handles the session events of one sent message."""
+
+    def __init__(self, model: str, idle_timeout: float = 10.0, item_logger: Optional['ItemLogger'] = None) -> None:
+        self.model = model
+        self.idle_timeout = idle_timeout
+        self.item_logger = item_logger
+        # The exchange failed because the model is rate limited
+        self.rate_limited = False
+        self.done = asyncio.Event()
+        self._tail: Deque[str] = deque()
+        self._tail_chars = 0
+        self.dropped_chars = 0  # Output no longer held in memory
+        self.last_message: Optional[str] = None
+        if item_logger is not None:
+            item_logger.log_with_timestamp(f"Copilot exchange started ({model})")
+        self.errors: List[str] = []
+        self.pending_tool_calls = 0
+        self.input_tokens = self.output_tokens = 0
+        self.cache_read_tokens = self.cache_write_tokens = 0
+        self.turns = self.tool_calls = 0
+        self._idle_task: Optional['asyncio.Task[None]'] = None
+        self._closed = False
+        # The assistant has answered without asking for tools
+        self.final_answer_seen = False
+        # How the exchange finished: 'turn_end', 'idle', 'fallback' or None
+        self.completion: Optional[str] = None
+        self.idle_wait_seconds = 0.0  # Spent waiting to confirm completion
+        self.idle_wait_saved_seconds = 0.0  # Versus always waiting idle_timeout
+        self._idle_since: Optional[float] = None
+        self._started = time.monotonic()
+        self._finished: Optional[float] = None
+        # When the model started on its current response (None while tools run or once it answered)
+        self._model_since: Optional[float] = self._started
+        self.first_token_seconds: Optional[float] = None
+        self.model_seconds = self.tool_seconds = 0.0
+        self.turn_latency = LatencyHistogram()
+        self.tool_latency: Dict[str, LatencyHistogram] = {}
+        self._running_tools: Dict[Any, Tuple[str, float]] = {}  # Call id -> (tool name, start)
+        self._call_ids = itertools.count()
+
+    def __call__(self, event: Any) -> None:
+        if self._closed:
+            # Stray event after the exchange ended (e.g. the SDK can't unsubscribe)
+            return
+        event_type = _event_type(event)
+        data = getattr(event, 'data', None) if hasattr(event, 'data') else None
+        if event_type in ("assistant.message_delta", "assistant.message", "tool.execution_start"):
+            self._on_activity()
+        if event_type in ("assistant.message_delta", "assistant.message") and self.first_token_seconds is None:
+            self.first_token_seconds = time.monotonic() - self._started
+
+        if event_type == "assistant.message_delta":
+            terminal_ui.ui.set_style("green")
+            # Streaming message chunk
+            delta = None
+            if data is not None:
+                delta = getattr(data, 'delta_content', None) or \
+                        getattr(data, 'delta', None) or \
+                        getattr(data, 'content', None)
+            if delta:
+                print(delta, end="", flush=True)
+                self._emit(delta)
+
+        elif event_type == "assistant.message":
+            terminal_ui.ui.set_style("green")
+            # Complete message - may have text content or tool requests
+            content = getattr(data, 'content', None) if data is not None else None
+            tool_requests = getattr(data, 'tool_requests', None) if data is not None else None
+            self._end_model_time()
+            if content:
+                print(content)
+                self._emit(content)
+                self.last_message = content
+            # Reset style for tool announcements
+            terminal_ui.ui.set_style(None)
+            if tool_requests and len(tool_requests) > 0:
+                print(f"\n[Copilot] Calling {len(tool_requests)} tool(s)...")
+                self.final_answer_seen = False
+            elif content:
+                self.final_answer_seen = True
+
+        elif event_type == "tool.execution_start":
+            terminal_ui.ui.set_style(None)
+            self.tool_calls += 1
+            self.pending_tool_calls += 1
+            self.final_answer_seen = False
+            self._start_tool(data)
+            if data is not None:
+                tool_name = getattr(data, 'tool_name', 'unknown')
+                args_str = cap_tool_output(
+                    str(getattr(data, 'arguments', {})), tool_output_limit(str(tool_name)), self.item_logger
+                )
+                print(f"  🔧 {tool_name}({args_str})")
+                self._emit(f"\n[Tool] {tool_name}({args_str})\n")
+
+        elif event_type == "tool.execution_complete":
+            terminal_ui.ui.set_style(None)
+            self.pending_tool_calls = max(0, self.pending_tool_calls - 1)
+            tool_name = self._finish_tool(data)
+            if data is not None:
+                result = getattr(data, 'result', None)
+                success = getattr(data, 'success', True)
+                if result:
+                    # Result object has a 'content' attribute
+                    result_content = getattr(result, 'content', str(result)) if hasattr(result, 'content') else str(result)
+                    result_str = cap_tool_output(str(result_content), tool_output_limit(tool_name), self.item_logger)
+                    status = "✅" if success else "❌"
+                    print(f"  {status} Result: {result_str}")
+                    self._emit(f"[Result] {result_str}\n")
+
+        elif event_type == "assistant.usage":
+            terminal_ui.ui.set_style(None)
+            if data is not None:
+                self.input_tokens += getattr(data, 'input_tokens', 0) or 0
+                self.output_tokens += getattr(data, 'output_tokens', 0) or 0
+                self.cache_read_tokens += getattr(data, 'cache_read_tokens', 0) or 0
+                self.cache_write_tokens += getattr(data, 'cache_write_tokens', 0) or 0
+
+        elif event_type == "assistant.turn_start":
+            if self._model_since is None and not self._running_tools:
+                self._model_since = time.monotonic()
+
+        elif event_type == "assistant.turn_end":
+            self.turns += 1
+            if self._model_since is None and not self._running_tools:
+                self._model_since = time.monotonic()
+            if self._answered():
+                self._complete("turn_end")
+
+        elif event_type == "session.idle":
+            self._on_idle()
+
+        elif event_type == "session.error":
+            error_msg = getattr(data, 'message', 'Unknown error') if data is not None else 'Unknown error'
+            print(f"\n[SDK] ERROR: {error_msg}")
+            self.rate_limited = self.rate_limited or is_rate_limit_error(error_msg)
+            self.errors.append(error_msg)
+            self._finished = self._finished or time.monotonic()
+            self.done.set()
+
+    def _emit(self, text: str) -> None:
+        """Stream output to the item log and keep its tail."""
+        if self.item_logger is not None:
+            self.item_logger.stream(text)
+        kept = text[-OUTPUT_TAIL_CHARS:]
+        self.dropped_chars += len(text) - len(kept)
+        self._tail.append(kept)
+        self._tail_chars += len(kept)
+        while self._tail_chars > OUTPUT_TAIL_CHARS:
+            dropped = len(self._tail.popleft())
+            self._tail_chars -= dropped
+            self.dropped_chars += dropped
+
+    def _answered(self) -> bool:
+        return self.final_answer_seen and self.pending_tool_calls == 0
+
+    def _on_activity(self) -> None:
+        """The session is working; a pending idle check was premature."""
+        if self._idle_since is not None:
+            gap = asyncio.get_running_loop().time() - self._idle_since
+            with _stats_lock:
+                _resume_gaps.append(gap)
+            self._idle_since = None
+        self._cancel_idle_check()
+
+    def _on_idle(self) -> None:
+        """Session idle - complete if the agent has answered, else wait for more activity."""
+        self._cancel_idle_check()
+        if self.pending_tool_calls > 0:
+            print(f"\n[SDK] Session idle but {self.pending_tool_calls} tool(s) still executing - continuing...")
+            return
+        if self._answered():
+            self._complete("idle")
+            return
+        wait = adaptive_idle_wait(self.idle_timeout)
+        print(f"\n[SDK] Session idle without a final answer - waiting {wait:.1f}s to confirm completion...")
+        self._idle_since = asyncio.get_running_loop().time()
+
+        # Use a delay to distinguish between "thinking" and "done"
+        async def check_still_idle() -> None:
+            try:
+                await asyncio.sleep(wait)
+                if not self.done.is_set() and self.pending_tool_calls == 0:
+                    print("[SDK] Session confirmed idle - processing complete")
+                    self._complete("fallback", waited=wait)
+            except asyncio.CancelledError:
+                pass  # Task was cancelled, that's fine
+
+        self._idle_task = asyncio.create_task(check_still_idle())
+
+    def _complete(self, how: str, waited: float = 0.0) -> None:
+        if self.done.is_set():
+            return
+        self._cancel_idle_check()
+        self._idle_since = None
+        self.completion = how
+        self.idle_wait_seconds = waited
+        self.idle_wait_saved_seconds = max(0.0, self.idle_timeout - waited)
+        with _stats_lock:
+            if how == "fallback":
+                _completion_stats.fallback += 1
+            else:
+                _completion_stats.deterministic += 1
+            _completion_stats.idle_wait_seconds += waited
+            _completion_stats.idle_wait_saved_seconds += self.idle_wait_saved_seconds
+        self._finished = time.monotonic()
+        self.done.set()
+
+    def _end_model_time(self) -> None:
+        """The assistant's message arrived; count the model time since it started."""
+        if self._model_since is not None:
+            latency = time.monotonic() - self._model_since
+            self.model_seconds += latency
+            record_latency(self.turn_latency, latency)
+            self._model_since = None
+
+    def _start_tool(self, data: Any) -> None:
+        call_id = getattr(data, 'tool_call_id', None)
+        name = getattr(data, 'tool_name', None)
+        if not isinstance(call_id, str):
+            call_id = next(self._call_ids)
+        self._running_tools[call_id] = (name if isinstance(name, str) else "unknown", time.monotonic())
+        self._model_since = None
+
+    def _finish_tool(self, data: Any) -> str:
+        """Time the tool that completed and return its name."""
+        call_id = getattr(data, 'tool_call_id', None)
+        if call_id not in self._running_tools:
+            # No (known) call id - pair with the longest-running tool
+            call_id = next(iter(self._running_tools), None)
+        if call_id is None:
+            return "unknown"
+        name, started = self._running_tools.pop(call_id)
+        now = time.monotonic()
+        self.tool_seconds += now - started
+        record_latency(self.tool_latency.setdefault(name, LatencyHistogram()), now - started)
+        if not self._running_tools:
+            self._model_since = now
+        return name
+
+    def _cancel_idle_check(self) -> None:
+        if self._idle_task and not self._idle_task.done():
+            self._idle_task.cancel()
+        self._idle_task = None
+
+    def close(self) -> None:
+        """Stop handling events and any pending idle check (the exchange is over)."""
+        self._closed = True
+        self._finished = self._finished or time.monotonic()
+        self._cancel_idle_check()
+
+    @property
+    def output(self) -> str:
+        """The output tail, noting how much came before it."""
+        tail = "".join(self._tail)
+        if not self.dropped_chars:
+            return tail
+        where = f"full output in {self.item_logger.log_path}" if self.item_logger is not None else "not saved - no item log"
+        return f"[... {self.dropped_chars:,} earlier characters omitted ({where})]\n{tail}"
+
+    @property
+    def success(self) -> bool:
+        return not self.errors
+
+    def stats(self) -> AgentStats:
+        """Usage and timings of this exchange."""
+        first_token = LatencyHistogram()
+        if self.first_token_seconds is not None:
+            record_latency(first_token, self.first_token_seconds)
+        return AgentStats(
+            input_tokens=self.input_tokens,
+            output_tokens=self.output_tokens,
+            cache_read_tokens=self.cache_read_tokens,
+            cache_write_tokens=self.cache_write_tokens,
+            premium_requests=self.turns,  # Approximation: 1 turn = 1 premium request
+            tool_calls=self.tool_calls,
+            api_duration=self.model_seconds,
+            wall_duration=(self._finished or time.monotonic()) - self._started,
+            tool_duration=self.tool_seconds,
+            idle_wait_duration=self.idle_wait_seconds,
+            first_token_latency=first_token,
+            turn_latency=self.turn_latency,
+            tool_latency=self.tool_latency,
+        )
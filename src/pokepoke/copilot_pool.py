@@ -0,0 +1,225 @@
+"""Pool of started Copilot clients, reused across agent invocations.
+
+Starting a ``CopilotClient`` launches the Copilot CLI process and waits for
+it to come up, which every agent invocation used to pay before it could
+create a session. The pool keeps started clients warm between invocations,
+keyed by their options, so a new session is created against a client that
+is already running. Clients are started from the repo root and each session
+names its own working directory, so one warm client serves every worktree.
+
+An idle client is pinged before it is handed out and replaced if the ping
+fails. Clients idle longer than ``idle_timeout`` are stopped. All pool
+methods run on the shared event loop (``async_runtime``); clients are bound
+to the loop that started them, so the loop is part of the key.
+"""
+
+import asyncio
+import atexit
+import threading
+import time
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from .async_runtime import get_runtime
+from .config import get_config
+from .types import CopilotPoolStats
+
+_PoolKey = Tuple[asyncio.AbstractEventLoop, str]
+
+
+@dataclass
+class _PooledClient:
+    client: Any
+    key: _PoolKey
+    startup_seconds: float
+    idle_since: float = 0.0
+
+
+def _options_key(options: Dict[str, Any]) -> str:
+    return repr(sorted(options.items()))
+
+
+class CopilotClientPool:
+    """Started Copilot clients, handed out one invocation at a time."""
+
+    def __init__(
+        self,
+        idle_timeout: float = 300.0,
+        max_idle_per_key: int = 2,
+        health_timeout: float = 5.0,
+    ) -> None:
+        self.idle_timeout = idle_timeout
+        self.max_idle_per_key = max_idle_per_key
+        self.health_timeout = health_timeout
+        self.stats = CopilotPoolStats()
+        self._idle: Dict[_PoolKey, List[_PooledClient]] = {}
+        self._in_use: Dict[int, _PooledClient] = {}
+        self._sweep: Optional[asyncio.TimerHandle] = None
+
+    @property
+    def enabled(self) -> bool:
+        return self.idle_timeout > 0 and self.max_idle_per_key > 0
+
+    async def acquire(self, options: Dict[str, Any], factory: Callable[..., Any]) -> Any:
+        """Return a started client for ``options``, reusing a warm one if healthy.
+
+        Raises:
+            Whatever ``client.start()`` raises when a new client can't start.
+        """
+        key = (asyncio.get_running_loop(), _options_key(options))
+        self.stats.acquires += 1
+        await self._evict_idle()
+        idle = self._idle.get(key, [])
+        while idle:
+            entry = idle.pop()
+            if await self._healthy(entry.client):
+                self.stats.hits += 1
+                self.stats.startup_seconds_saved += entry.startup_seconds
+                self._in_use[id(entry.client)] = entry
+                print("[SDK] Reusing warm Copilot client")
+                return entry.client
+            self.stats.health_failures += 1
+            await _stop_client(entry.client)
+
+        self.stats.misses += 1
+        print("[SDK] Starting Copilot client...")
+        client = factory(options)
+        started = time.monotonic()
+        try:
+            await client.start()
+        except BaseException:
+            await _stop_client(client)
+            raise
+        startup = time.monotonic() - started
+        self.stats.startup_seconds += startup
+        self._in_use[id(client)] = _PooledClient(client, key, startup)
+        return client
+
+    async def release(self, client: Any, healthy: bool = True) -> None:
+        """Give a client back; it is kept warm unless unhealthy or surplus."""
+        entry = self._in_use.pop(id(client), None)
+        if entry is None or not healthy or not self.enabled:
+            await _stop_client(client)
+            return
+        idle = self._idle.setdefault(entry.key, [])
+        entry.idle_since = time.monotonic()
+        idle.append(entry)
+        while len(idle) > self.max_idle_per_key:
+            self.stats.evictions += 1
+            await _stop_client(idle.pop(0).client)
+        self._schedule_sweep()
+
+    async def close(self) -> None:
+        """Stop every idle client (clients in use are stopped on release)."""
+        if self._sweep is not None:
+            self._sweep.cancel()
+            self._sweep = None
+        idle, self._idle = self._idle, {}
+        self.idle_timeout = 0.0
+        loop = asyncio.get_running_loop()
+        for key, entries in idle.items():
+            if key[0] is loop:
+                for entry in entries:
+                    await _stop_client(entry.client)
+
+    def idle_count(self) -> int:
+        return sum(len(entries) for entries in self._idle.values())
+
+    async def _healthy(self, client: Any) -> bool:
+        try:
+            await asyncio.wait_for(client.ping(), self.health_timeout)
+            return True
+        except Exception:
+            return False
+
+    async def _evict_idle(self) -> None:
+        """Stop clients that have been idle longer than ``idle_timeout``."""
+        now = time.monotonic()
+        loop = asyncio.get_running_loop()
+        for key in list(self._idle):
+            if key[0].is_closed():
+                # Their loop is gone, and so is any way to stop them cleanly
+                del self._idle[key]
+                continue
+            if key[0] is not loop:
+                continue
+            keep = []
+            for entry in self._idle[key]:
+                if now - entry.idle_since >= self.idle_timeout:
+                    self.stats.evictions += 1
+                    await _stop_client(entry.client)
+                else:
+                    keep.append(entry)
+            if keep:
+                self._idle[key] = keep
+            else:
+                del self._idle[key]
+
+    def _schedule_sweep(self) -> None:
+        if self._sweep is not None:
+            return
+        loop = asyncio.get_running_loop()
+
+        def sweep() -> None:
+            self._sweep = None
+            loop.create_task(self._evict_then_reschedule())
+
+        self._sweep = loop.call_later(self.idle_timeout, sweep)
+
+    async def _evict_then_reschedule(self) -> None:
+        await self._evict_idle()
+        if self._idle:
+            self._schedule_sweep()
+
+
+async def _stop_client(client: Any) -> None:
+    try:
+        await client.stop()
+        print("\n[SDK] Client stopped")
+    except UnicodeDecodeError:
+        # The Copilot subprocess may emit non-UTF-8 bytes when killed
+        # during shutdown.  Swallow the encoding error so we get a
+        # clean exit with stats printed.
+        print("\n[SDK] Client stopped (encoding error suppressed)")
+    except Exception as e:
+        print(f"\n[SDK] Error stopping client: {e}")
+
+
+_pool: Optional[CopilotClientPool] = None
+_pool_lock = threading.Lock()
+
+
+def get_client_pool() -> CopilotClientPool:
+    """Return the process-wide pool, configured from the project config."""
+    global _pool
+    with _pool_lock:
+        if _pool is None:
+            copilot = get_config().copilot
+            _pool = CopilotClientPool(
+                idle_timeout=copilot.pool_idle_timeout,
+                max_idle_per_key=copilot.pool_max_idle,
+            )
+            # Register after the runtime's own exit handler, so ours runs first
+            get_runtime()
+            atexit.register(close_client_pool)
+        return _pool
+
+
+def get_pool_stats() -> CopilotPoolStats:
+    """Live counters of the process-wide pool."""
+    return get_client_pool().stats
+
+
+def close_client_pool() -> None:
+    """Stop the pool's idle clients (blocks until they have stopped)."""
+    with _pool_lock:
+        pool = _pool
+    if pool is None:
+        return
+    runtime = get_runtime()
+    if not runtime.running:
+        return
+    try:
+        runtime.run(pool.close(), timeout=30.0)
+    except Exception as e:
+        print(f"⚠️  Could not stop pooled Copilot clients: {e}")
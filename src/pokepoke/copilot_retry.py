@@ -0,0 +1,74 @@
+"""Classify Copilot SDK failures and space out retries.
+
+``invoke_copilot_sdk`` retries an invocation whose client start, session
+creation or send failed for a transient reason (a dropped connection, a
+server error, a CLI that exited mid-request). Failures that would only
+repeat (authentication, a missing CLI, an unknown model, a programming
+error) fail the invocation immediately. Rate limits are not retried here;
+the model governor already waits them out or falls back to another model.
+"""
+
+import asyncio
+import random
+import re
+from typing import Union
+
+from .model_governor import is_rate_limit_error
+from .shutdown import is_shutting_down
+from .types import RetryConfig
+
+_FATAL_PATTERN = re.compile(
+    r'unauthori[sz]ed|forbidden|\b40[13]\b|authenticat|not logged in|invalid model|'
+    r'model .*not (?:found|supported|available)|quota',
+    re.IGNORECASE,
+)
+_TRANSIENT_PATTERN = re.compile(
+    r'time[d ]?out|connection|reset by peer|broken pipe|\beof\b|closed|unavailable|overloaded|'
+    r'temporar|try again|internal server error|bad gateway|\b50[0234]\b|econn|epipe',
+    re.IGNORECASE,
+)
+
+
+def is_retryable_error(error: Union[BaseException, str]) -> bool:
+    """Whether a failed invocation is worth retrying.
+
+    Args:
+        error: The exception raised by the SDK, or the error message of a
+            failed session.
+    """
+    if isinstance(error, (FileNotFoundError, PermissionError, NotADirectoryError)):
+        return False  # Missing CLI or bad working directory
+    if isinstance(error, (ConnectionError, TimeoutError, asyncio.TimeoutError, EOFError)):
+        return True
+    message = str(error)
+    if is_rate_limit_error(message) or _FATAL_PATTERN.search(message):
+        return False
+    if _TRANSIENT_PATTERN.search(message):
+        return True
+    # Unknown OS-level failures are usually the CLI process going away
+    return isinstance(error, OSError)
+
+
+def retry_delay(config: RetryConfig, retry: int) -> float:
+    """Seconds to wait before the ``retry``-th retry (1-based)."""
+    delay: float = min(config.max_delay, config.initial_delay * config.backoff_factor ** (retry - 1))
+    if config.jitter:
+        # Keep at least half the backoff so retries still spread out
+        delay = random.uniform(delay / 2, delay)
+    return delay
+
+
+async def backoff_sleep(delay: float) -> bool:
+    """Sleep for ``delay`` seconds unless shutdown is requested.
+
+    Returns:
+        False if shutdown interrupted the wait.
+    """
+    loop = asyncio.get_running_loop()
+    deadline = loop.time() + delay
+    while not is_shutting_down():
+        remaining = deadline - loop.time()
+        if remaining <= 0:
+            return True
+        await asyncio.sleep(min(1.0, remaining))
+    return False
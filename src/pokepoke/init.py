@@ -21,6 +21,9 @@ project_name: {project_name}
 models:
   default: claude-opus-4.6
   fallback: claude-sonnet-4.5
+  # fallback_chain: []          # models tried in order when rate limited (default: fallback, then candidates)
+  # rate_limit_cooldown: 30     # seconds a rate-limited model is avoided (doubles on repeats)
+  # max_concurrent_per_model: 0 # invocations on one model at once (0 = until rate limited)
 
 # Git branch configuration
 # If not set, auto-detects from git user.email
@@ -28,6 +31,24 @@ git:
   # default_branch: your-username/dev
   fallback_branch: master
 
+# Beads database access
+# direct_read: read .beads/issues.jsonl instead of running bd for every query
+beads:
+  direct_read: false
+  # max_concurrency: 4      # bd processes run at once for independent lookups
+  # command_timeout: 30     # seconds before a bd call is killed
+  # sync_coalesce_seconds: 0.1  # window for batching bd sync requests
+  # lease_seconds: 600      # claims expire unless renewed (0 disables)
+
+# Copilot SDK client
+# copilot:
+#   pool_idle_timeout: 300  # seconds a started client stays warm for reuse (0 disables)
+#   pool_max_idle: 2        # warm clients kept per working directory
+#   reuse_work_session: false  # send gate feedback as a follow-up in the work agent's session
+#   tool_output_limit: 2000    # characters of a tool result shown (head and tail); the rest is saved to a file
+#   tool_output_limits:        # per-tool overrides
+#     view: 500
+
 # MCP server integration (optional)
 # Set enabled: true if your project uses an MCP server
 mcp_server:
@@ -38,6 +59,9 @@ mcp_server:
 # Maintenance agent scheduling
 # Each agent runs every N work items completed.
 maintenance:
+  # background: false     # run agents alongside work agents instead of between items
+  # max_concurrent: 1     # maintenance agents running at once in the background
+  # pause_at_ready: 0     # hold queued agents while this many items are ready (0 = never)
   agents:
     - name: Tech Debt
       prompt_file: tech-debt.md
@@ -74,7 +98,19 @@ maintenance:
 # work_artifacts_dir: work_artifacts
 """
 
+# Instructions first and item details last, so prompts share a cacheable prefix
 _BEADS_ITEM_TEMPLATE = """\
+## Instructions
+
+Complete the work item described below. Follow project conventions and
+ensure all tests pass before finishing.
+
+{{#test_data_section}}
+## Test Data
+
+{{test_data_section}}
+{{/test_data_section}}
+
 # Work Item: {{title}}
 
 **ID:** {{item_id}}
@@ -87,17 +123,6 @@ _BEADS_ITEM_TEMPLATE = """\
 ## Description
 
 {{description}}
-
-## Instructions
-
-Complete the work described above. Follow project conventions and
-ensure all tests pass before finishing.
-
-{{#test_data_section}}
-## Test Data
-
-{{test_data_section}}
-{{/test_data_section}}
 """
 
 
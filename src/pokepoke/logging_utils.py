@@ -1,9 +1,10 @@
 """Logging utilities for PokePoke - File-based logging for runs and work items."""
 
 import sys
+import threading
 from datetime import datetime
 from pathlib import Path
-from typing import Optional, TYPE_CHECKING
+from typing import BinaryIO, Dict, Optional, TextIO, TYPE_CHECKING
 import uuid
 
 if TYPE_CHECKING:
@@ -35,8 +36,9 @@ class RunLogger:
         self.item_logs_dir = self.run_dir / "items"
         self.item_logs_dir.mkdir(exist_ok=True)
         
-        # Track current item logger
-        self._current_item_logger: Optional['ItemLogger'] = None
+        # Open item loggers by item ID (workers process several items at once)
+        self._item_loggers: Dict[str, 'ItemLogger'] = {}
+        self._log_lock = threading.Lock()
         
         # Write initial orchestrator log entry
         self._init_orchestrator_log()
@@ -69,7 +71,7 @@ class RunLogger:
             level: Log level (INFO, WARNING, ERROR, etc.)
         """
         timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-        with open(self.orchestrator_log_path, 'a', encoding='utf-8') as f:
+        with self._log_lock, open(self.orchestrator_log_path, 'a', encoding='utf-8') as f:
             f.write(f"[{timestamp}] [{level}] {message}\n")
     
     def start_item_log(self, item_id: str, item_title: str) -> 'ItemLogger':
@@ -82,34 +84,38 @@ class RunLogger:
         Returns:
             ItemLogger instance for the work item
         """
-        # Close previous item logger if exists
-        if self._current_item_logger:
-            self._current_item_logger.close()
-        
-        self._current_item_logger = ItemLogger(
+        item_logger = ItemLogger(
             self.item_logs_dir,
             item_id,
             item_title
         )
+        with self._log_lock:
+            # Close a logger left open by an earlier attempt at the same item
+            previous = self._item_loggers.pop(item_id, None)
+            self._item_loggers[item_id] = item_logger
+        if previous is not None:
+            previous.close()
         
         self.log_orchestrator(f"Started processing work item: {item_id} - {item_title}")
-        return self._current_item_logger
+        return item_logger
     
-    def end_item_log(self, success: bool, request_count: int) -> None:
-        """End logging for the current work item.
+    def end_item_log(self, item_id: str, success: bool, request_count: int) -> None:
+        """End logging for a work item.
         
         Args:
+            item_id: Work item ID passed to ``start_item_log``
             success: Whether the work item was completed successfully
             request_count: Number of agent requests made
         """
-        if self._current_item_logger:
-            self._current_item_logger.log_summary(success, request_count)
-            self._current_item_logger.close()
-            self._current_item_logger = None
+        with self._log_lock:
+            item_logger = self._item_loggers.pop(item_id, None)
+        if item_logger is not None:
+            item_logger.log_summary(success, request_count)
+            item_logger.close()
         
         status = "SUCCESS" if success else "FAILURE"
         self.log_orchestrator(
-            f"Completed work item with {request_count} agent requests - Status: {status}"
+            f"Completed work item {item_id} with {request_count} agent requests - Status: {status}"
         )
     
     def log_maintenance(self, agent_type: str, message: str) -> None:
@@ -188,6 +194,8 @@ class ItemLogger:
         # Create log file with sanitized filename
         safe_id = item_id.replace('/', '_').replace('\\', '_')
         self.log_path = logs_dir / f"{safe_id}.log"
+        # Full tool output too long to show in the log (see save_tool_output)
+        self.tool_results_path = logs_dir / f"{safe_id}.tool-results.log"
         
         # Initialize log file
         with open(self.log_path, 'w', encoding='utf-8') as f:
@@ -198,8 +206,13 @@ class ItemLogger:
             f.write(f"Started: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n")
             f.write("=" * 80 + "\n\n")
         
-        # Track whether file is open
-        self._file_handle: Optional[object] = None
+        # Kept open while agent output is streamed in (see stream); the
+        # handles are written from the event loop thread and closed from the
+        # worker thread, so both go through the lock
+        self._handle_lock = threading.Lock()
+        self._file_handle: Optional[TextIO] = None
+        self._stream_failed = False
+        self._tool_results_handle: Optional[BinaryIO] = None
     
     def log(self, message: str) -> None:
         """Log a message to the item log.
@@ -211,6 +224,50 @@ class ItemLogger:
             f.write(message)
             # Don't add newline - let caller control formatting
     
+    def stream(self, text: str) -> None:
+        """Append streamed agent output as it arrives.
+
+        Unlike ``log``, the file stays open between calls, so a long run of
+        small chunks doesn't reopen it each time. Each chunk is flushed so the
+        log can be followed live. A write failure is reported once and later
+        chunks are dropped rather than failing the agent.
+        
+        Args:
+            text: Output chunk to append
+        """
+        with self._handle_lock:
+            if self._stream_failed:
+                return
+            try:
+                if self._file_handle is None:
+                    self._file_handle = open(self.log_path, 'a', encoding='utf-8', errors='replace')
+                self._file_handle.write(text)
+                self._file_handle.flush()
+            except (OSError, ValueError) as e:
+                print(f"⚠️  Could not write agent output to {self.log_path}: {e}")
+                self._stream_failed = True
+    
+    def save_tool_output(self, text: str) -> Optional[int]:
+        """Append full tool output to the item's tool-results file.
+        
+        Args:
+            text: Tool arguments or result
+            
+        Returns:
+            Byte offset of the output in the file, or None if it couldn't be written
+        """
+        with self._handle_lock:
+            try:
+                if self._tool_results_handle is None:
+                    self._tool_results_handle = open(self.tool_results_path, 'ab')
+                offset = self._tool_results_handle.tell()
+                self._tool_results_handle.write(text.encode('utf-8', errors='replace') + b"\n")
+                self._tool_results_handle.flush()
+                return offset
+            except (OSError, ValueError) as e:
+                print(f"⚠️  Could not save tool output to {self.tool_results_path}: {e}")
+                return None
+    
     def log_with_timestamp(self, message: str, level: str = "INFO") -> None:
         """Log a message with timestamp.
         
@@ -240,5 +297,10 @@ class ItemLogger:
     
     def close(self) -> None:
         """Close the item logger."""
-        # Nothing to do - we use context managers for writes
-        pass
+        with self._handle_lock:
+            if self._file_handle is not None:
+                self._file_handle.close()
+                self._file_handle = None
+            if self._tool_results_handle is not None:
+                self._tool_results_handle.close()
+                self._tool_results_handle = None
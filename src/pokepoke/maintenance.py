@@ -1,17 +1,31 @@
 """Periodic maintenance agent orchestration."""
 
+import subprocess
+from datetime import datetime
 from pathlib import Path
+from typing import List, Optional
 
-from pokepoke.config import get_config
-from pokepoke.types import AgentStats, SessionStats
+from pokepoke.agent_timing import item_latency_record, merge_agent_stats
+from pokepoke.config import MaintenanceAgentConfig, get_config
+from pokepoke.types import AgentStats, ModelCompletionRecord, SessionStats
 from pokepoke.agent_runner import run_maintenance_agent
+from pokepoke.claim_registry import get_claim_registry
+from pokepoke.merge_queue import serialized_merge
 from pokepoke.terminal_ui import set_terminal_banner
 from pokepoke import terminal_ui
-from pokepoke.logging_utils import RunLogger
+from pokepoke.logging_utils import ItemLogger, RunLogger
 
 # Agents that have special runner functions instead of the generic one
 _SPECIAL_AGENTS = {"Beta Tester", "Worktree Cleanup"}
 
+# Agents that must never run on the background maintenance lane: Worktree
+# Cleanup merges or deletes worktrees, so it runs inline, told which
+# worktrees are in use
+FOREGROUND_ONLY_AGENTS = {"Worktree Cleanup"}
+
+# Longest the post-agent commit's git commands may take (seconds)
+_GIT_TIMEOUT_SECONDS = 60
+
 # Map of agent stat attribute names by agent name
 _AGENT_STAT_ATTRS = {
     "Tech Debt": "tech_debt_agent_runs",
@@ -25,76 +39,174 @@ _AGENT_STAT_ATTRS = {
 
 def aggregate_stats(session_stats: SessionStats, item_stats: AgentStats) -> None:
     """Aggregate item statistics into session statistics."""
-    session_stats.agent_stats.wall_duration += item_stats.wall_duration
-    session_stats.agent_stats.api_duration += item_stats.api_duration
-    session_stats.agent_stats.input_tokens += item_stats.input_tokens
-    session_stats.agent_stats.output_tokens += item_stats.output_tokens
-    session_stats.agent_stats.lines_added += item_stats.lines_added
-    session_stats.agent_stats.lines_removed += item_stats.lines_removed
-    session_stats.agent_stats.premium_requests += item_stats.premium_requests
-    session_stats.agent_stats.tool_calls += item_stats.tool_calls
-    session_stats.agent_stats.retries += item_stats.retries
-
-
-def _run_special_agent(name: str, repo_root: Path) -> AgentStats | None:
+    merge_agent_stats(session_stats.agent_stats, item_stats)
+
+
+def record_item_result(
+    session_stats: SessionStats,
+    requests: int,
+    item_stats: Optional[AgentStats],
+    cleanup_runs: int,
+    gate_runs: int,
+    model_completion: Optional[ModelCompletionRecord],
+) -> None:
+    """Fold one processed work item's counters into the session statistics."""
+    # Every request after the first is a retry; item_stats already counts the
+    # SDK-level ones, so only add the rest (work-agent reruns)
+    already_counted = item_stats.retries if item_stats else 0
+    if requests - 1 > already_counted:
+        session_stats.agent_stats.retries += requests - 1 - already_counted
+    session_stats.work_agent_runs += 1
+    session_stats.cleanup_agent_runs += cleanup_runs
+    session_stats.gate_agent_runs += gate_runs
+    if item_stats:
+        aggregate_stats(session_stats, item_stats)
+    if model_completion:
+        session_stats.model_completions.append(model_completion)
+        if item_stats:
+            session_stats.item_latencies.append(
+                item_latency_record(model_completion.item_id, model_completion.duration_seconds, item_stats)
+            )
+
+
+def _run_special_agent(name: str, repo_root: Path, item_logger: Optional[ItemLogger] = None) -> AgentStats | None:
     """Run a special agent that has its own runner function."""
     if name == "Beta Tester":
         from pokepoke.agent_runner import run_beta_tester
-        return run_beta_tester(repo_root=repo_root)
+        return run_beta_tester(repo_root=repo_root, item_logger=item_logger)
     if name == "Worktree Cleanup":
         from pokepoke.agent_runner import run_worktree_cleanup
-        return run_worktree_cleanup(repo_root=repo_root)
+        # Items reserved by any worker or process still have live worktrees
+        return run_worktree_cleanup(
+            repo_root=repo_root, keep_item_ids=get_claim_registry().claimed_ids(), item_logger=item_logger
+        )
     return None
 
 
-def run_periodic_maintenance(items_completed: int, session_stats: SessionStats, run_logger: RunLogger) -> None:
-    """Run periodic maintenance agents based on config and completion count."""
-    pokepoke_repo = Path.cwd()
+def _works_in_main_repo(agent_cfg: MaintenanceAgentConfig) -> bool:
+    """True for agents that run in the main repository rather than a worktree of their own."""
+    if agent_cfg.name in _SPECIAL_AGENTS:
+        return agent_cfg.name == "Worktree Cleanup"
+    return not agent_cfg.needs_worktree
 
+
+def due_maintenance_agents(items_completed: int) -> List[MaintenanceAgentConfig]:
+    """Enabled maintenance agents whose frequency divides the completion count."""
     if items_completed == 0:
-        return
+        return []
+    return [
+        agent_cfg for agent_cfg in get_config().maintenance.agents
+        if agent_cfg.enabled and agent_cfg.frequency > 0 and items_completed % agent_cfg.frequency == 0
+    ]
+
+
+def run_maintenance_agent_config(
+    agent_cfg: MaintenanceAgentConfig,
+    session_stats: SessionStats,
+    run_logger: RunLogger,
+    foreground: bool = True,
+) -> None:
+    """Run one configured maintenance agent and record its stats.
+
+    Args:
+        agent_cfg: The agent to run.
+        session_stats: Stats to update with the run.
+        run_logger: Run logger for the maintenance log.
+        foreground: If False (background lane), leave the terminal banner
+            and header to the work agent.
+    """
+    pokepoke_repo = Path.cwd()
+    name = agent_cfg.name
+    log_key = name.lower().replace(" ", "_")
 
-    config = get_config()
-    agents = config.maintenance.agents
+    if foreground:
+        set_terminal_banner(f"PokePoke - Synced {name} Agent")
+        terminal_ui.ui.update_header("MAINTENANCE", f"{name} Agent", "Running")
+    print(f"\n🔧 Running {name} Agent...")
+    run_logger.log_maintenance(log_key, f"Starting {name} Agent")
+
+    # Update run count on session stats if attribute exists
+    stat_attr = _AGENT_STAT_ATTRS.get(name)
+    if stat_attr and hasattr(session_stats, stat_attr):
+        setattr(session_stats, stat_attr, getattr(session_stats, stat_attr) + 1)
+
+    # Each run gets its own log for the agent's full output
+    log_id = f"maintenance-{log_key}-{datetime.now():%Y%m%d-%H%M%S}"
+    agent_logger = run_logger.start_item_log(log_id, f"{name} Agent")
+    result = None
+    try:
+        # Never under the merge lock: a session can take hours, and item
+        # selection, worktree creation, merges and bd sync all need the lock
+        result = _run_agent(agent_cfg, pokepoke_repo, agent_logger)
+    finally:
+        run_logger.end_item_log(log_id, result is not None, 0)
+
+    # Only committing what a main-repo agent left behind needs the lock
+    if _works_in_main_repo(agent_cfg):
+        with serialized_merge(f"{name} Agent"):
+            _commit_beads_changes(pokepoke_repo, name)
+
+    if result:
+        aggregate_stats(session_stats, result)
+        if name == "Janitor":
+            session_stats.janitor_lines_removed += result.lines_removed
+        run_logger.log_maintenance(log_key, f"{name} Agent completed successfully")
+    else:
+        run_logger.log_maintenance(log_key, f"{name} Agent failed")
+
+
+def _commit_beads_changes(repo_root: Path, name: str) -> None:
+    """Commit beads changes a main-repo agent left uncommitted.
+
+    Call with the merge lock held.
+    """
+    try:
+        status = subprocess.run(
+            ["git", "status", "--porcelain", "--", ".beads/"],
+            capture_output=True, text=True, encoding='utf-8', check=True,
+            cwd=str(repo_root), timeout=_GIT_TIMEOUT_SECONDS
+        ).stdout.strip()
+        if not status:
+            return
+        subprocess.run(["git", "add", ".beads/"], capture_output=True, check=True,
+                       cwd=str(repo_root), timeout=_GIT_TIMEOUT_SECONDS)
+        subprocess.run(["git", "commit", "-m", f"chore: sync beads after {name} Agent"],
+                       capture_output=True, check=True, cwd=str(repo_root), timeout=_GIT_TIMEOUT_SECONDS)
+        print(f"✅ Committed beads changes from {name} Agent")
+    except (subprocess.SubprocessError, OSError) as e:
+        print(f"⚠️  Could not commit beads changes from {name} Agent: {e}")
+
+
+def _run_agent(agent_cfg: MaintenanceAgentConfig, repo_root: Path, item_logger: Optional[ItemLogger] = None) -> AgentStats | None:
+    if agent_cfg.name in _SPECIAL_AGENTS:
+        return _run_special_agent(agent_cfg.name, repo_root, item_logger)
+    return run_maintenance_agent(
+        agent_cfg.name,
+        agent_cfg.prompt_file,
+        repo_root=repo_root,
+        needs_worktree=agent_cfg.needs_worktree,
+        merge_changes=agent_cfg.merge_changes,
+        model=agent_cfg.model,
+        item_logger=item_logger,
+    )
 
-    for agent_cfg in agents:
-        if not agent_cfg.enabled:
-            continue
-        if agent_cfg.frequency <= 0:
-            continue
-        if items_completed % agent_cfg.frequency != 0:
-            continue
 
-        name = agent_cfg.name
-        log_key = name.lower().replace(" ", "_")
+def run_periodic_maintenance(items_completed: int, session_stats: SessionStats, run_logger: RunLogger) -> None:
+    """Run periodic maintenance agents based on config and completion count."""
+    for agent_cfg in due_maintenance_agents(items_completed):
+        run_maintenance_agent_config(agent_cfg, session_stats, run_logger)
+
+
+# SessionStats counters a maintenance run can change
+_MAINTENANCE_COUNTERS = (
+    'tech_debt_agent_runs', 'janitor_agent_runs', 'janitor_lines_removed',
+    'backlog_cleanup_agent_runs', 'cleanup_agent_runs', 'beta_tester_agent_runs',
+    'code_review_agent_runs', 'worktree_cleanup_agent_runs',
+)
 
-        set_terminal_banner(f"PokePoke - Synced {name} Agent")
-        terminal_ui.ui.update_header("MAINTENANCE", f"{name} Agent", "Running")
-        print(f"\n🔧 Running {name} Agent...")
-        run_logger.log_maintenance(log_key, f"Starting {name} Agent")
-
-        # Update run count on session stats if attribute exists
-        stat_attr = _AGENT_STAT_ATTRS.get(name)
-        if stat_attr and hasattr(session_stats, stat_attr):
-            setattr(session_stats, stat_attr, getattr(session_stats, stat_attr) + 1)
-
-        # Run the agent
-        if name in _SPECIAL_AGENTS:
-            result = _run_special_agent(name, pokepoke_repo)
-        else:
-            result = run_maintenance_agent(
-                name,
-                agent_cfg.prompt_file,
-                repo_root=pokepoke_repo,
-                needs_worktree=agent_cfg.needs_worktree,
-                merge_changes=agent_cfg.merge_changes,
-                model=agent_cfg.model,
-            )
 
-        if result:
-            aggregate_stats(session_stats, result)
-            if name == "Janitor":
-                session_stats.janitor_lines_removed += result.lines_removed
-            run_logger.log_maintenance(log_key, f"{name} Agent completed successfully")
-        else:
-            run_logger.log_maintenance(log_key, f"{name} Agent failed")
+def merge_maintenance_stats(target: SessionStats, scratch: SessionStats) -> None:
+    """Add the counters a maintenance run recorded on scratch stats."""
+    aggregate_stats(target, scratch.agent_stats)
+    for name in _MAINTENANCE_COUNTERS:
+        setattr(target, name, getattr(target, name) + getattr(scratch, name))
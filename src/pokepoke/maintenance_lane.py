@@ -0,0 +1,177 @@
+"""Background lane for periodic maintenance agents.
+
+Maintenance agents (Tech Debt, Janitor, Code Review, Beta Tester, ...) each
+take as long as a work-agent session. Run inline, they hold up the next
+work item. With ``maintenance.background`` enabled they are queued on this
+lane instead and run alongside the work agents, at most
+``maintenance.max_concurrent`` at a time.
+
+Agents that need a worktree get their own, as they do inline; their merges
+go through ``merge_worktree`` and are therefore serialized with the work
+merges (see merge_queue). No agent holds the merge lock while it runs;
+agents working in the main repository take it only to commit what they
+left behind. Worktree Cleanup never runs here: ``schedule``
+runs it inline, since it would otherwise merge or delete the worktrees of
+items still being worked on. While at least ``maintenance.pause_at_ready``
+items are ready, queued agents wait and the work queue gets priority.
+
+Each agent records its stats on scratch ``SessionStats``. The owner of the
+session stats folds them in with ``collect``, so the lane never writes to
+stats another thread is updating.
+"""
+
+import threading
+from collections import deque
+from typing import Deque, List, Optional, Set, TYPE_CHECKING
+
+from pokepoke.config import MaintenanceAgentConfig, get_config
+from pokepoke.maintenance import (
+    FOREGROUND_ONLY_AGENTS,
+    due_maintenance_agents,
+    merge_maintenance_stats,
+    run_maintenance_agent_config,
+)
+from pokepoke.shutdown import is_shutting_down
+from pokepoke.types import AgentStats, SessionStats
+
+if TYPE_CHECKING:
+    from pokepoke.logging_utils import RunLogger
+
+# Longest a runner waits before re-checking for shutdown
+_WAIT_SECONDS = 0.5
+
+
+class MaintenanceLane:
+    """Runs maintenance agents on background threads."""
+
+    def __init__(self, run_logger: 'RunLogger', max_concurrent: int = 1, pause_at_ready: int = 0) -> None:
+        self.run_logger = run_logger
+        self.max_concurrent = max(1, max_concurrent)
+        self.pause_at_ready = pause_at_ready
+        self._cond = threading.Condition()
+        self._pending: Deque[MaintenanceAgentConfig] = deque()
+        # Agents queued or running - an agent is never queued twice
+        self._active_names: Set[str] = set()
+        self._results: List[SessionStats] = []
+        self._threads: List[threading.Thread] = []
+        self._ready_count = 0
+        self._closing = False
+
+    def schedule(self, items_completed: int) -> None:
+        """Queue the agents due at this completion count.
+
+        Foreground-only agents (Worktree Cleanup) run inline on the calling
+        thread instead; their stats are collected like the lane's.
+        """
+        for agent_cfg in due_maintenance_agents(items_completed):
+            if agent_cfg.name in FOREGROUND_ONLY_AGENTS:
+                self._run(agent_cfg, foreground=True)
+            else:
+                self.submit(agent_cfg)
+
+    def submit(self, agent_cfg: MaintenanceAgentConfig) -> bool:
+        """Queue one agent.
+
+        Returns:
+            False if the agent may not run in the background, the lane is
+            closing, or the agent is already queued or running.
+        """
+        if agent_cfg.name in FOREGROUND_ONLY_AGENTS:
+            print(f"⏭️  {agent_cfg.name} Agent can't run on the maintenance lane - not queuing it")
+            return False
+        with self._cond:
+            if self._closing:
+                print(f"⏭️  Maintenance lane is shutting down - not queuing {agent_cfg.name} Agent")
+                return False
+            if agent_cfg.name in self._active_names:
+                print(f"⏭️  {agent_cfg.name} Agent already queued - not queuing it again")
+                return False
+            self._pending.append(agent_cfg)
+            self._active_names.add(agent_cfg.name)
+            if len(self._threads) < self.max_concurrent:
+                thread = threading.Thread(
+                    target=self._runner, name=f"pokepoke-maintenance-{len(self._threads) + 1}", daemon=True
+                )
+                self._threads.append(thread)
+                thread.start()
+            self._cond.notify()
+        print(f"🔧 Queued {agent_cfg.name} Agent on the maintenance lane")
+        return True
+
+    def set_ready_count(self, count: int) -> None:
+        """Report how many work items are ready (pauses the lane when hot)."""
+        with self._cond:
+            self._ready_count = count
+            self._cond.notify_all()
+
+    @property
+    def paused(self) -> bool:
+        """True while the work queue is hot enough to hold maintenance back."""
+        return 0 < self.pause_at_ready <= self._ready_count
+
+    def pending_count(self) -> int:
+        with self._cond:
+            return len(self._pending)
+
+    def collect(self, session_stats: SessionStats) -> None:
+        """Fold the stats of finished agents into ``session_stats``."""
+        with self._cond:
+            results, self._results = self._results, []
+        for scratch in results:
+            merge_maintenance_stats(session_stats, scratch)
+
+    def close(self, session_stats: Optional[SessionStats] = None, wait: bool = True) -> None:
+        """Stop accepting agents and, with ``wait``, finish the queued ones.
+
+        Queued agents are dropped instead when shutdown has been requested.
+        """
+        with self._cond:
+            self._closing = True
+            self._cond.notify_all()
+            threads = list(self._threads)
+        if wait:
+            if any(thread.is_alive() for thread in threads):
+                print("\n⏳ Waiting for background maintenance agents to finish...")
+            for thread in threads:
+                thread.join()
+        if session_stats is not None:
+            self.collect(session_stats)
+
+    def _next_agent(self) -> Optional[MaintenanceAgentConfig]:
+        with self._cond:
+            while not is_shutting_down():
+                # A closing lane drains its queue regardless of the work queue
+                if self._pending and (self._closing or not self.paused):
+                    return self._pending.popleft()
+                if self._closing and not self._pending:
+                    return None
+                self._cond.wait(_WAIT_SECONDS)
+            return None
+
+    def _runner(self) -> None:
+        while True:
+            agent_cfg = self._next_agent()
+            if agent_cfg is None:
+                return
+            self._run(agent_cfg, foreground=False)
+            with self._cond:
+                self._active_names.discard(agent_cfg.name)
+
+    def _run(self, agent_cfg: MaintenanceAgentConfig, foreground: bool) -> None:
+        """Run one agent on scratch stats and keep them for ``collect``."""
+        scratch = SessionStats(agent_stats=AgentStats())
+        try:
+            run_maintenance_agent_config(agent_cfg, scratch, self.run_logger, foreground=foreground)
+        except Exception as e:
+            print(f"⚠️  {agent_cfg.name} Agent failed on the maintenance lane: {e}")
+            self.run_logger.log_orchestrator(f"Maintenance lane: {agent_cfg.name} failed: {e}", level="ERROR")
+        with self._cond:
+            self._results.append(scratch)
+
+
+def create_maintenance_lane(run_logger: 'RunLogger') -> Optional[MaintenanceLane]:
+    """Create the lane if ``maintenance.background`` is enabled, else None."""
+    config = get_config().maintenance
+    if not config.background:
+        return None
+    return MaintenanceLane(run_logger, config.max_concurrent, config.pause_at_ready)
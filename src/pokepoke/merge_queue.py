@@ -0,0 +1,57 @@
+"""Serialized merge step shared by parallel workers.
+
+Merging a worktree checks out the default branch in the main repository,
+merges, pushes and cleans up. Two of those running at once would fight over
+the main repository's working tree, so every merge (and anything else that
+writes to the main repository) runs inside ``serialized_merge()``.
+"""
+
+import threading
+import time
+from contextlib import contextmanager
+from typing import Iterator, Optional
+
+# Re-entrant so a merge can call helpers that also take the lock
+_merge_lock = threading.RLock()
+
+
+@contextmanager
+def serialized_merge(label: Optional[str] = None) -> Iterator[None]:
+    """Hold the process-wide merge lock for the duration of the block.
+
+    Args:
+        label: What is being merged, shown while waiting for the lock.
+    """
+    if not _merge_lock.acquire(blocking=False):
+        what = f" for {label}" if label else ""
+        print(f"⏳ Waiting for another worker's merge to finish{what}...")
+        started = time.time()
+        _merge_lock.acquire()
+        print(f"   Merge lock acquired after {time.time() - started:.1f}s")
+    try:
+        yield
+    finally:
+        _merge_lock.release()
+
+
+@contextmanager
+def merge_lock_within(timeout: float, label: Optional[str] = None) -> Iterator[bool]:
+    """Like serialized_merge, but give up if the lock stays busy for ``timeout``.
+
+    Args:
+        timeout: Longest to wait for the lock (seconds).
+        label: What needs the lock, shown while waiting for it.
+
+    Yields:
+        True if the lock is held for the block, False if the wait timed out.
+    """
+    acquired = _merge_lock.acquire(blocking=False)
+    if not acquired:
+        what = f" for {label}" if label else ""
+        print(f"⏳ Waiting up to {timeout:.0f}s for another worker's merge to finish{what}...")
+        acquired = _merge_lock.acquire(timeout=max(0.0, timeout))
+    try:
+        yield acquired
+    finally:
+        if acquired:
+            _merge_lock.release()
@@ -0,0 +1,192 @@
+"""Process-wide rate-limit governor for Copilot models.
+
+Every agent invocation asks the governor for a model before it starts and
+hands the model back when it finishes. The governor tracks each model's
+throttle state, shared by all workers and the maintenance lane:
+
+- A rate-limit error puts the model in a cooldown that grows with repeated
+  limits (or follows a "retry after N seconds" hint). It also halves the
+  number of invocations allowed to run on the model at once.
+- Successful invocations raise that limit again, one at a time, until it is
+  lifted.
+- ``acquire`` walks the model's fallback chain and returns the first model
+  that is not throttled. If every model in the chain is throttled, it waits
+  for the earliest cooldown to end instead of failing the invocation.
+
+The chain is the requested model followed by ``models.fallback_chain``, or
+by ``models.fallback`` and then ``models.candidate_models`` when no chain
+is configured.
+"""
+
+import asyncio
+import re
+import threading
+import time
+from typing import Dict, Iterable, List, Optional
+
+from .config import get_config
+from .shutdown import is_shutting_down
+from .types import ModelThrottleState
+
+# Longest single sleep while waiting for a model, so shutdown is noticed
+_WAIT_POLL_SECONDS = 1.0
+
+# Learned concurrency limits above this are lifted entirely
+_MAX_LEARNED_LIMIT = 8
+
+# 429 as an HTTP status ("HTTP 429", "status code: 429", "CAPIError: 429"),
+# not digits inside an id or a number
+_HTTP_429_PATTERN = re.compile(r'(?:http|status|code|error)[^0-9a-z]{0,20}(?<!\d)429(?!\d)', re.IGNORECASE)
+
+_RETRY_AFTER_PATTERN = re.compile(r'(?:retry|try again)[^0-9]{0,20}(\d+(?:\.\d+)?)\s*(?:s\b|sec|second)', re.IGNORECASE)
+
+
+def is_rate_limit_error(message: str) -> bool:
+    """Whether an SDK error message reports a rate limit."""
+    lower = message.lower()
+    return ('rate' in lower and 'limit' in lower) or 'too many requests' in lower or bool(_HTTP_429_PATTERN.search(message))
+
+
+def _retry_after_seconds(message: str) -> Optional[float]:
+    match = _RETRY_AFTER_PATTERN.search(message)
+    return float(match.group(1)) if match else None
+
+
+class ModelGovernor:
+    """Throttle state per model, shared by every invocation in the process."""
+
+    def __init__(
+        self,
+        fallback_chain: Iterable[str] = (),
+        base_cooldown: float = 30.0,
+        max_cooldown: float = 600.0,
+        max_concurrent: int = 0,
+    ) -> None:
+        self.fallback_chain = list(fallback_chain)
+        self.base_cooldown = base_cooldown
+        self.max_cooldown = max_cooldown
+        # Configured cap on concurrent invocations per model (0 = none)
+        self.max_concurrent = max_concurrent
+        self.states: Dict[str, ModelThrottleState] = {}
+        self._consecutive: Dict[str, int] = {}
+        self._lock = threading.Lock()
+
+    def chain(self, model: str) -> List[str]:
+        """``model`` followed by the models to fall back to, without repeats."""
+        ordered: List[str] = []
+        for name in [model, *self.fallback_chain]:
+            if name and name not in ordered:
+                ordered.append(name)
+        return ordered
+
+    async def acquire(self, model: str, pinned: bool = False, max_wait: Optional[float] = None) -> str:
+        """Reserve a slot on ``model`` or the first unthrottled model in its chain.
+
+        Args:
+            model: The model the invocation asked for.
+            pinned: Only ``model`` will do (e.g. a session that can't switch
+                models); wait for it rather than falling back.
+            max_wait: Stop waiting after this many seconds and use the first
+                model in the chain anyway.
+
+        Returns:
+            The model to use. The caller must ``release`` it afterwards.
+        """
+        chain = [model] if pinned else self.chain(model)
+        started = time.monotonic()
+        announced = False
+        while True:
+            with self._lock:
+                now = time.time()
+                waited = time.monotonic() - started
+                out_of_time = is_shutting_down() or (max_wait is not None and waited >= max_wait)
+                for name in chain:
+                    state = self._state(name)
+                    if out_of_time or self._available(state, now):
+                        return self._reserve(name, chain[0], waited)
+                wake = min(self._state(name).cooldown_until for name in chain)
+            if not announced:
+                print(f"[SDK] {', '.join(chain)} throttled - waiting for a model to free up...")
+                announced = True
+            delay = wake - time.time() if wake > time.time() else _WAIT_POLL_SECONDS
+            await asyncio.sleep(max(0.05, min(_WAIT_POLL_SECONDS, delay)))
+
+    def release(self, model: str, succeeded: bool = True) -> None:
+        """Return a slot taken by ``acquire``."""
+        with self._lock:
+            state = self._state(model)
+            state.in_flight = max(0, state.in_flight - 1)
+            if not succeeded:
+                return
+            self._consecutive[model] = 0
+            if state.concurrency_limit:
+                # Additive increase after a multiplicative decrease
+                state.concurrency_limit += 1
+                limit_cap = self.max_concurrent or _MAX_LEARNED_LIMIT
+                if state.concurrency_limit > limit_cap:
+                    state.concurrency_limit = self.max_concurrent
+
+    def report_rate_limit(self, model: str, message: str = "") -> float:
+        """Record a rate-limit error on ``model``.
+
+        Returns:
+            The cooldown applied, in seconds.
+        """
+        with self._lock:
+            state = self._state(model)
+            consecutive = self._consecutive.get(model, 0) + 1
+            self._consecutive[model] = consecutive
+            cooldown = _retry_after_seconds(message)
+            if cooldown is None:
+                cooldown = min(self.max_cooldown, self.base_cooldown * 2 ** (consecutive - 1))
+            state.rate_limits += 1
+            state.cooldown_until = max(state.cooldown_until, time.time() + cooldown)
+            state.concurrency_limit = max(1, state.in_flight // 2)
+        print(f"[SDK] Rate limit on {model} - cooling down for {cooldown:.0f}s")
+        return cooldown
+
+    def _state(self, model: str) -> ModelThrottleState:
+        state = self.states.get(model)
+        if state is None:
+            state = self.states[model] = ModelThrottleState(concurrency_limit=self.max_concurrent)
+        return state
+
+    @staticmethod
+    def _available(state: ModelThrottleState, now: float) -> bool:
+        if state.cooldown_until > now:
+            return False
+        return not state.concurrency_limit or state.in_flight < state.concurrency_limit
+
+    def _reserve(self, model: str, requested: str, waited: float) -> str:
+        state = self._state(model)
+        state.in_flight += 1
+        state.invocations += 1
+        state.deferred_seconds += waited
+        if model != requested:
+            self._state(requested).fallbacks_from += 1
+            print(f"[SDK] {requested} is throttled - using {model}")
+        return model
+
+
+_governor: Optional[ModelGovernor] = None
+_governor_lock = threading.Lock()
+
+
+def get_model_governor() -> ModelGovernor:
+    """Return the process-wide governor, configured from the project config."""
+    global _governor
+    with _governor_lock:
+        if _governor is None:
+            models = get_config().models
+            chain = models.fallback_chain or [models.fallback, *models.candidate_models]
+            _governor = ModelGovernor(
+                fallback_chain=chain,
+                base_cooldown=models.rate_limit_cooldown,
+                max_concurrent=models.max_concurrent_per_model,
+            )
+        return _governor
+
+
+def get_throttle_states() -> Dict[str, ModelThrottleState]:
+    """Live throttle state of every model used in this process."""
+    return get_model_governor().states
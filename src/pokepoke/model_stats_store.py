@@ -17,6 +17,10 @@ File layout (.pokepoke/model_stats.json):
       "total_retries": int,
       "average_duration": float,
       "success_rate": float,           # 0.0–1.0
+      "total_input_tokens": int,
+      "total_cache_read_tokens": int,
+      "total_cache_write_tokens": int,
+      "cache_hit_ratio": float,        # 0.0–1.0, share of input tokens read from the prompt cache
       "last_used": "<iso-timestamp>"
     }
   }
@@ -32,6 +36,7 @@ from datetime import datetime, timezone
 from pathlib import Path
 from typing import Any, Dict, List, Optional
 
+from pokepoke.prompt_cache import cache_hit_ratio
 from pokepoke.types import ModelCompletionRecord
 
 STATS_FILE = Path(".pokepoke") / "model_stats.json"
@@ -53,6 +58,9 @@ def _record_to_dict(record: ModelCompletionRecord) -> Dict[str, Any]:
         "model": record.model,
         "duration_seconds": record.duration_seconds,
         "gate_passed": record.gate_passed,
+        "input_tokens": record.input_tokens,
+        "cache_read_tokens": record.cache_read_tokens,
+        "cache_write_tokens": record.cache_write_tokens,
         "timestamp": datetime.now(timezone.utc).isoformat(),
     }
 
@@ -71,6 +79,10 @@ def _rebuild_summary(log: List[Dict[str, Any]]) -> Dict[str, Dict[str, Any]]:
                 "total_retries": 0,
                 "average_duration": 0.0,
                 "success_rate": 0.0,
+                "total_input_tokens": 0,
+                "total_cache_read_tokens": 0,
+                "total_cache_write_tokens": 0,
+                "cache_hit_ratio": 0.0,
                 "last_used": "",
             }
         s = summary[model]
@@ -82,6 +94,10 @@ def _rebuild_summary(log: List[Dict[str, Any]]) -> Dict[str, Dict[str, Any]]:
             s["total_items_failed"] += 1
         # If gate_passed is None the item is neither success nor failure
         s["total_duration_seconds"] += entry.get("duration_seconds", 0.0)
+        s["total_input_tokens"] += entry.get("input_tokens", 0)
+        s["total_cache_read_tokens"] += entry.get("cache_read_tokens", 0)
+        s["total_cache_write_tokens"] += entry.get("cache_write_tokens", 0)
+        s["cache_hit_ratio"] = round(cache_hit_ratio(s["total_input_tokens"], s["total_cache_read_tokens"]), 4)
         ts = entry.get("timestamp", "")
         if ts and ts > s["last_used"]:
             s["last_used"] = ts
@@ -223,5 +239,8 @@ def print_model_leaderboard(path: Optional[Path] = None) -> None:
         print(f"\n  #{i} {display_name}")
         print(f"     Attempted: {attempted}  |  ✅ {succeeded}  ❌ {failed}  |  Rate: {rate:.0%}")
         print(f"     Avg time:  {avg_dur:.1f}s  |  Last used: {last[:19]}")
+        if s.get("total_cache_read_tokens") or s.get("total_cache_write_tokens"):
+            print(f"     Cache:     {s.get('cache_hit_ratio', 0.0):.0%} of {s.get('total_input_tokens', 0):,} input tokens  "
+                  f"|  {s.get('total_cache_write_tokens', 0):,} written")
 
     print("\n" + "=" * 70)
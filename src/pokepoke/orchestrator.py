@@ -1,15 +1,18 @@
 """PokePoke Orchestrator - Main entry point for autonomous and interactive modes."""
 
-import argparse
 import atexit
 import os
-import shutil
-import subprocess
 import sys
 import time
 from pathlib import Path
+from typing import Optional
 
-from pokepoke.beads import get_ready_work_items, get_beads_stats
+from pokepoke.beads import get_ready_work_items, get_beads_stats, get_issue_cache_stats
+from pokepoke.beads_sync import get_sync_stats
+from pokepoke.copilot_pool import get_pool_stats, close_client_pool
+from pokepoke.copilot_conversation import get_retry_stats
+from pokepoke.copilot_events import get_completion_stats
+from pokepoke.model_governor import get_throttle_states
 from pokepoke.types import AgentStats, SessionStats
 from pokepoke.stats import print_stats
 from pokepoke.workflow import process_work_item
@@ -19,61 +22,38 @@ from pokepoke.agent_names import initialize_agent_name
 from pokepoke.terminal_ui import set_terminal_banner, format_work_item_banner, clear_terminal_banner
 from pokepoke import terminal_ui
 from pokepoke.maintenance_state import increment_items_completed
-from pokepoke.repo_check import check_and_commit_main_repo
-from pokepoke.maintenance import run_periodic_maintenance, aggregate_stats
+from pokepoke.repo_check import check_and_commit_main_repo, check_beads_available as _check_beads_available
+from pokepoke.maintenance import run_periodic_maintenance, record_item_result
 from pokepoke.shutdown import is_shutting_down, request_shutdown
 from pokepoke.model_stats_store import record_completion, print_model_leaderboard
+from pokepoke.claim_registry import get_claim_registry, claim_owner
+from pokepoke.prefetch import Prefetcher, discard_worktree
+from pokepoke.beads_watch import BeadsWatcher, WATCH_RECHECK_SECONDS
+from pokepoke.cli_args import build_parser, validate_args
+from pokepoke.maintenance_lane import MaintenanceLane, create_maintenance_lane
+from pokepoke.merge_queue import serialized_merge
 
 
-def _check_beads_available() -> bool:
-    """Check that beads (bd) is installed and initialized in the current directory.
-    
-    Returns:
-        True if beads is available and initialized, False otherwise.
-    """
-    # Check that bd command exists
-    if not shutil.which('bd'):
-        print("\nError: 'bd' (beads) command not found.", file=sys.stderr)
-        print("   PokePoke requires beads for work item tracking.", file=sys.stderr)
-        print("   Install beads: pip install beads", file=sys.stderr)
-        print("   Then initialize: bd init", file=sys.stderr)
-        return False
-    
-    # Check that beads is initialized (bd info should succeed)
-    try:
-        result = subprocess.run(
-            ['bd', 'info', '--json'],
-            capture_output=True, text=True, encoding='utf-8',
-            timeout=10
-        )
-        if result.returncode != 0:
-            print("\nError: This directory is not a beads repository.", file=sys.stderr)
-            print("   Run 'bd init' to set up beads tracking.", file=sys.stderr)
-            return False
-    except subprocess.TimeoutExpired:
-        print("\nError: 'bd info' timed out. Beads may not be configured correctly.", file=sys.stderr)
-        return False
-    except Exception as e:
-        print(f"\nError: Failed to check beads status: {e}", file=sys.stderr)
-        print("   Ensure beads is installed and initialized: bd init", file=sys.stderr)
-        return False
-    
-    return True
-
-
-def run_orchestrator(interactive: bool = True, continuous: bool = False, run_beta_first: bool = False) -> int:
+def run_orchestrator(interactive: bool = True, continuous: bool = False, run_beta_first: bool = False, workers: int = 1, prefetch: bool = False,
+                     watch: bool = False) -> int:
     """Main orchestrator loop.
     
     Args:
         interactive: If True, prompt for user input at decision points
         continuous: If True, loop continuously; if False, process one item and exit
         run_beta_first: If True, run beta tester at startup before processing work items
+        workers: Number of work items to process concurrently (autonomous mode only)
+        prefetch: If True, stage the next item and its worktree while the gate agent runs
+        watch: If True, wait for beads changes instead of exiting when no work is ready
         
     Returns:
         Exit code (0 for success, 1 for failure)
     """
     # UI is started by run_with_orchestrator - just update header
     terminal_ui.ui.update_header("PokePoke", f"Initializing {interactive and 'Interactive' or 'Autonomous'} Mode...")
+    prefetcher: Optional[Prefetcher] = None
+    watcher: Optional[BeadsWatcher] = None
+    lane: Optional[MaintenanceLane] = None
 
     try:
         # TELLTALE: Version identifier to verify correct code is running
@@ -109,10 +89,20 @@ def run_orchestrator(interactive: bool = True, continuous: bool = False, run_bet
         start_time = time.time()
         items_completed = 0
         total_requests = 0
-        session_stats = SessionStats(agent_stats=AgentStats())
+        session_stats = SessionStats(
+            agent_stats=AgentStats(),
+            beads_cache=get_issue_cache_stats(),
+            beads_sync=get_sync_stats(),
+            copilot_pool=get_pool_stats(),
+            work_retries=get_retry_stats(),
+            completions=get_completion_stats(),
+            model_throttle=get_throttle_states(),
+        )
         print("📊 Recording starting beads statistics...")
         run_logger.log_orchestrator("Recording starting beads statistics")
-        session_stats.starting_beads_stats = get_beads_stats()
+        # Ending stats are computed in-process (exit paths must not wait on
+        # bd), so prefer the same source for the starting point
+        session_stats.starting_beads_stats = get_beads_stats(allow_subprocess=False) or get_beads_stats()
         
         # Set session start time for real-time clock updates
         terminal_ui.ui.set_session_start_time(start_time)
@@ -137,35 +127,62 @@ def run_orchestrator(interactive: bool = True, continuous: bool = False, run_bet
             
         # Track items that failed claiming to avoid infinite retry loops
         failed_claim_ids: set[str] = set()
+        claim_registry = get_claim_registry()
+        if prefetch and workers <= 1:
+            prefetcher = Prefetcher(claim_registry, claim_owner(), run_logger)
+        if watch and workers <= 1:
+            watcher = BeadsWatcher()
+        lane = create_maintenance_lane(run_logger)
+        
+        pool = None
+        if workers > 1:
+            from pokepoke.worker_pool import WorkerPool
+            pool = WorkerPool(workers, session_stats, run_logger, main_repo_path, continuous, watch=watch, lane=lane)
+            try:
+                pool.run()
+            finally:
+                items_completed, total_requests = pool.items_completed, pool.total_requests
         
-        while not is_shutting_down():
+        while pool is None and not is_shutting_down():
             # Check main repo status before processing
             print("\n\ud83d\udd0d Checking main repository status...")
             run_logger.log_orchestrator("Checking main repository status")
-            if not check_and_commit_main_repo(main_repo_path, run_logger):
+            # Background maintenance agents may be merging into the main repo
+            with serialized_merge():
+                repo_ready = check_and_commit_main_repo(main_repo_path, run_logger)
+            if not repo_ready:
                 run_logger.log_orchestrator("Main repo check failed", level="ERROR")
                 return 1
-            print("\nFetching ready work from beads...")
-            run_logger.log_orchestrator("Fetching ready work from beads")
-            ready_items = get_ready_work_items()
-            
-            # Pause UI for interactive selection
-            if interactive:
-                terminal_ui.ui.stop()
-            selected_item = select_work_item(ready_items, interactive, skip_ids=failed_claim_ids)
-            if interactive:
-                terminal_ui.ui.start()
+            selected_item = prefetcher.take() if prefetcher else None
+            prefetched = selected_item is not None
+            if selected_item is None:
+                if watcher:
+                    watcher.arm()
+                print("\nFetching ready work from beads...")
+                run_logger.log_orchestrator("Fetching ready work from beads")
+                ready_items = get_ready_work_items()
+                if lane:
+                    lane.set_ready_count(len(ready_items))
+                
+                # Pause UI for interactive selection
+                if interactive:
+                    terminal_ui.ui.stop()
+                # Items other PokePoke processes have reserved are skipped too
+                selected_item = select_work_item(
+                    ready_items, interactive, skip_ids=failed_claim_ids | claim_registry.claimed_ids()
+                )
+                if interactive:
+                    terminal_ui.ui.start()
             
+            if selected_item is None and watcher is not None:
+                print(f"\n💤 No ready work - waiting for beads changes ({watcher.mode})...")
+                terminal_ui.ui.update_header("PokePoke", f"{mode_name} Mode", "Watching...")
+                watcher.wait(timeout=WATCH_RECHECK_SECONDS)
+                continue
             if selected_item is None:
-                terminal_ui.ui.stop_and_capture()
-                # Get ending stats and print session stats before exiting
-                session_stats.ending_beads_stats = get_beads_stats()
-                elapsed = time.time() - start_time
-                print("\n👋 Exiting PokePoke - no work items available.")
                 run_logger.log_orchestrator("No work items available - exiting")
-                print_stats(items_completed, total_requests, elapsed, session_stats)
-                run_logger.finalize(items_completed, total_requests, elapsed, session_stats)
-                clear_terminal_banner()
+                _finish_session(session_stats, run_logger, items_completed, total_requests, start_time, lane,
+                                "\n👋 Exiting PokePoke - no work items available.")
                 return 0
             
             # Process the selected item
@@ -176,12 +193,24 @@ def run_orchestrator(interactive: bool = True, continuous: bool = False, run_bet
             set_terminal_banner(banner)
             terminal_ui.ui.update_header(selected_item.id, selected_item.title)
             
-            success, requests, item_stats, cleanup_runs, gate_runs, model_completion = process_work_item(
-                selected_item, interactive, run_logger=run_logger
-            )
+            # Reserve locally before claiming in beads and creating the worktree
+            if not claim_registry.try_claim(selected_item.id, claim_owner()):
+                print(f"⏭️  {selected_item.id} is reserved by another PokePoke process")
+                failed_claim_ids.add(selected_item.id)
+                continue
+            try:
+                success, requests, item_stats, cleanup_runs, gate_runs, model_completion = process_work_item(
+                    selected_item, interactive, run_logger=run_logger,
+                    on_gate_start=(lambda: prefetcher.start(failed_claim_ids)) if prefetcher else None
+                )
+            finally:
+                claim_registry.release(selected_item.id, claim_owner())
             
             # Track items that failed claiming to avoid re-selecting them
             if not success and requests == 0:
+                if prefetched:
+                    # Never got to use the worktree the prefetch stage created
+                    discard_worktree(selected_item.id)
                 failed_claim_ids.add(selected_item.id)
                 run_logger.log_orchestrator(
                     f"Item {selected_item.id} failed to claim, added to skip list "
@@ -192,21 +221,10 @@ def run_orchestrator(interactive: bool = True, continuous: bool = False, run_bet
                 failed_claim_ids.clear()
             
             total_requests += requests
-            if requests > 1:
-                session_stats.agent_stats.retries += (requests - 1)
-            
-            session_stats.work_agent_runs += 1
-            session_stats.cleanup_agent_runs += cleanup_runs
-            session_stats.gate_agent_runs += gate_runs
-            
-            # Aggregate statistics
-            if item_stats:
-                aggregate_stats(session_stats, item_stats)
+            record_item_result(session_stats, requests, item_stats, cleanup_runs, gate_runs, model_completion)
             
-            # Record model completion for A/B testing
+            # Persist to .pokepoke/model_stats.json for cross-session A/B tracking
             if model_completion:
-                session_stats.model_completions.append(model_completion)
-                # Persist to .pokepoke/model_stats.json for cross-session tracking
                 record_completion(model_completion)
             
             # Increment counter on successful processing
@@ -219,19 +237,19 @@ def run_orchestrator(interactive: bool = True, continuous: bool = False, run_bet
                 print(f"📈 Total items completed (lifetime): {total_persistent_count}")
                 run_logger.log_orchestrator(f"Items completed this session: {items_completed}")
                 
-                run_periodic_maintenance(total_persistent_count, session_stats, run_logger)
+                if lane:
+                    lane.schedule(total_persistent_count)
+                else:
+                    run_periodic_maintenance(total_persistent_count, session_stats, run_logger)
 
             # Update UI stats with current runtime
+            if lane:
+                lane.collect(session_stats)
             terminal_ui.ui.update_stats(session_stats, time.time() - start_time)
             
             # Decide whether to continue
             if not continuous:
-                terminal_ui.ui.stop_and_capture()
-                session_stats.ending_beads_stats = get_beads_stats()
-                elapsed = time.time() - start_time
-                print_stats(items_completed, total_requests, elapsed, session_stats)
-                run_logger.finalize(items_completed, total_requests, elapsed, session_stats)
-                clear_terminal_banner()
+                _finish_session(session_stats, run_logger, items_completed, total_requests, start_time, lane)
                 return 0 if success else 1
             
             if interactive:
@@ -244,15 +262,11 @@ def run_orchestrator(interactive: bool = True, continuous: bool = False, run_bet
                 terminal_ui.ui.start()
                 
                 if cont and cont != 'y':
-                    terminal_ui.ui.stop_and_capture()
-                    session_stats.ending_beads_stats = get_beads_stats()
-                    elapsed = time.time() - start_time
-                    print("\n👋 Exiting PokePoke.")
-                    print_stats(items_completed, total_requests, elapsed, session_stats)
-                    run_logger.finalize(items_completed, total_requests, elapsed, session_stats)
-                    clear_terminal_banner()
+                    _finish_session(session_stats, run_logger, items_completed, total_requests, start_time, lane,
+                                    "\n👋 Exiting PokePoke.")
                     return 0
-            else:
+            elif watcher is None and not (prefetcher and prefetcher.has_item()):
+                # Watch mode and a prefetched item need no pause between items
                 terminal_ui.ui.update_header("PokePoke", f"{mode_name} Mode", "Sleeping...")
                 print("\n⏳ Waiting 5 seconds before next iteration...")
                 for _ in range(10):
@@ -260,26 +274,25 @@ def run_orchestrator(interactive: bool = True, continuous: bool = False, run_bet
                         break
                     time.sleep(0.5)
 
-        # Shutdown requested - clean exit
-        terminal_ui.ui.stop_and_capture()
-        session_stats.ending_beads_stats = get_beads_stats()
-        elapsed = time.time() - start_time
-        print("\n\ud83d\udc4b Shutdown requested - exiting PokePoke.")
-        print_stats(items_completed, total_requests, elapsed, session_stats)
-        run_logger.finalize(items_completed, total_requests, elapsed, session_stats)
-        clear_terminal_banner()
-        return 0
+        # Shutdown requested (or all workers finished) - clean exit
+        workers_done = pool is not None and not is_shutting_down()
+        _finish_session(session_stats, run_logger, items_completed, total_requests, start_time, lane,
+                        "\n\ud83d\udc4b All workers finished - exiting PokePoke." if workers_done
+                        else "\n\ud83d\udc4b Shutdown requested - exiting PokePoke.")
+        return 1 if pool is not None and pool.failed else 0
     
     except KeyboardInterrupt:
         # Clean shutdown on Ctrl+C
         request_shutdown()
+        if lane:
+            lane.close(session_stats, wait=False)
         terminal_ui.ui.stop_and_capture()
         print("\n\n⚠️  Interrupted by user (Ctrl+C)")
         print("📊 Collecting final statistics...")
         
         # Try to get ending stats, but don't fail if interrupted again
         try:
-            session_stats.ending_beads_stats = get_beads_stats()
+            session_stats.ending_beads_stats = get_beads_stats(allow_subprocess=False)
         except KeyboardInterrupt:
             print("⚠️  Stats collection interrupted, skipping...")
             session_stats.ending_beads_stats = None
@@ -291,10 +304,12 @@ def run_orchestrator(interactive: bool = True, continuous: bool = False, run_bet
         clear_terminal_banner()
         return 0
     except Exception as e:
+        if lane:
+            lane.close(session_stats, wait=False)
         terminal_ui.ui.stop_and_capture()
         print("\n📊 Collecting final statistics...")
         try:
-            session_stats.ending_beads_stats = get_beads_stats()
+            session_stats.ending_beads_stats = get_beads_stats(allow_subprocess=False)
         except KeyboardInterrupt:
             print("⚠️  Stats collection interrupted, skipping...")
             session_stats.ending_beads_stats = None
@@ -309,9 +324,35 @@ def run_orchestrator(interactive: bool = True, continuous: bool = False, run_bet
         clear_terminal_banner()
         return 1
     finally:
+        if prefetcher:
+            prefetcher.discard()
+        if watcher:
+            watcher.close()
+        close_client_pool()
         terminal_ui.ui.stop()
 
 
+def _finish_session(
+    session_stats: SessionStats,
+    run_logger: RunLogger,
+    items_completed: int,
+    total_requests: int,
+    start_time: float,
+    lane: Optional[MaintenanceLane],
+    message: Optional[str] = None,
+) -> None:
+    """Wait for background maintenance, then print and log the session stats."""
+    if lane:
+        lane.close(session_stats)
+    terminal_ui.ui.stop_and_capture()
+    session_stats.ending_beads_stats = get_beads_stats(allow_subprocess=False)
+    elapsed = time.time() - start_time
+    if message:
+        print(message)
+    print_stats(items_completed, total_requests, elapsed, session_stats)
+    run_logger.finalize(items_completed, total_requests, elapsed, session_stats)
+    clear_terminal_banner()
+
 
 def main() -> int:
     """Main entry point for PokePoke CLI.
@@ -319,36 +360,7 @@ def main() -> int:
     Returns:
         Exit code (0 for success, 1 for failure)
     """
-    parser = argparse.ArgumentParser(
-        description="PokePoke - Autonomous Beads + Copilot CLI Orchestrator"
-    )
-    parser.add_argument(
-        "--interactive",
-        action="store_true",
-        default=True,
-        help="Interactive mode: prompt for user input (default)",
-    )
-    parser.add_argument(
-        "--autonomous",
-        action="store_true",
-        help="Autonomous mode: automatic decision making",
-    )
-    parser.add_argument(
-        "--continuous",
-        action="store_true",
-        help="Continuous mode: loop through multiple items instead of single-shot",
-    )
-    parser.add_argument(
-        "--beta-first",
-        action="store_true",
-        help="Run beta tester at startup before processing work items",
-    )
-    parser.add_argument(
-        "--init",
-        action="store_true",
-        help="Initialize .pokepoke/ directory with sample config and templates",
-    )
-    args = parser.parse_args()
+    args = build_parser().parse_args()
 
     if args.init:
         from pokepoke.init import init_project
@@ -356,6 +368,10 @@ def main() -> int:
 
     # Autonomous flag overrides interactive
     interactive = not args.autonomous
+    error = validate_args(args)
+    if error:
+        print(f"Error: {error}", file=sys.stderr)
+        return 1
     
     # Check beads availability BEFORE starting any UI
     # so error messages print directly to stdout
@@ -369,8 +385,11 @@ def main() -> int:
     def orchestrator_func() -> int:
         return run_orchestrator(
             interactive=interactive,
-            continuous=args.continuous,
-            run_beta_first=args.beta_first
+            continuous=args.continuous or args.watch,
+            run_beta_first=args.beta_first,
+            workers=args.workers,
+            prefetch=args.prefetch,
+            watch=args.watch
         )
     
     return active_ui.run_with_orchestrator(orchestrator_func)
@@ -0,0 +1,156 @@
+"""Prefetch the next work item while the current one is being gated.
+
+Between items the loop fetches the ready list, selects an item and creates
+its worktree, all serially. With prefetching, once the gate agent starts on
+item K a background stage selects item K+1, reserves it in the claim
+registry and creates its worktree. The next iteration then starts the work
+agent right away.
+
+The reservation is tentative: the beads claim still happens in
+``process_work_item``. If the run stops before the item is used,
+``discard`` removes the worktree and releases the reservation; if the
+beads claim fails, the caller removes it with ``discard_worktree``.
+"""
+
+import subprocess
+import threading
+from pathlib import Path
+from typing import Optional, Set, TYPE_CHECKING
+
+from pokepoke.beads import get_ready_work_items
+from pokepoke.claim_registry import AnyClaimRegistry
+from pokepoke.git_operations import get_default_branch
+from pokepoke.merge_queue import serialized_merge
+from pokepoke.shutdown import is_shutting_down
+from pokepoke.types import BeadsWorkItem
+from pokepoke.work_item_selection import select_work_item
+from pokepoke.worktrees import create_worktree, cleanup_worktree
+
+if TYPE_CHECKING:
+    from pokepoke.logging_utils import RunLogger
+
+
+class Prefetcher:
+    """Background stage that gets the next item ready."""
+
+    def __init__(self, registry: AnyClaimRegistry, owner: str, run_logger: Optional['RunLogger'] = None) -> None:
+        self.registry = registry
+        self.owner = owner
+        self.run_logger = run_logger
+        self._lock = threading.Lock()
+        self._thread: Optional[threading.Thread] = None
+        self._item: Optional[BeadsWorkItem] = None
+        self._worktree: Optional[Path] = None
+
+    def start(self, skip_ids: Set[str]) -> None:
+        """Start staging the next item, unless one is staged or being staged.
+
+        Args:
+            skip_ids: Items not to select (e.g. ones that failed to claim).
+                Items reserved in the registry, including the current one,
+                are always skipped.
+        """
+        with self._lock:
+            if self._thread is not None or self._item is not None or is_shutting_down():
+                return
+            self._thread = threading.Thread(
+                target=self._stage, args=(set(skip_ids),), name="pokepoke-prefetch", daemon=True
+            )
+            self._thread.start()
+
+    def has_item(self) -> bool:
+        """True if an item is staged (or still being staged)."""
+        with self._lock:
+            return self._thread is not None or self._item is not None
+
+    def take(self) -> Optional[BeadsWorkItem]:
+        """Hand over the staged item, waiting for the stage to finish.
+
+        The caller becomes responsible for the reservation and worktree.
+        The worktree is fast-forwarded first, since items merged while it
+        was staged are not in its base yet.
+
+        Returns:
+            The staged item, or None if nothing was staged.
+        """
+        self._join()
+        with self._lock:
+            item, worktree = self._item, self._worktree
+            self._item = self._worktree = None
+        if item is None:
+            return None
+        if worktree is not None:
+            _fast_forward(worktree)
+        print(f"\n⚡ Using prefetched item {item.id}")
+        self._log(f"Using prefetched item: {item.id} - {item.title}")
+        return item
+
+    def discard(self) -> None:
+        """Release the staged item's worktree and reservation, if any."""
+        self._join()
+        with self._lock:
+            item, worktree = self._item, self._worktree
+            self._item = self._worktree = None
+        if item is None:
+            return
+        if worktree is not None:
+            discard_worktree(item.id)
+        self.registry.release(item.id, self.owner)
+        self._log(f"Released prefetched item: {item.id}")
+
+    def _join(self) -> None:
+        thread = self._thread
+        if thread is not None:
+            thread.join()
+        with self._lock:
+            self._thread = None
+
+    def _stage(self, skip_ids: Set[str]) -> None:
+        try:
+            item = select_work_item(
+                get_ready_work_items(), interactive=False, skip_ids=skip_ids | self.registry.claimed_ids()
+            )
+            if item is None or is_shutting_down():
+                return
+            # try_claim succeeds for our own owner, so it can't tell the
+            # item being worked on right now from a free one
+            if self.registry.holder(item.id) is not None or not self.registry.try_claim(item.id, self.owner):
+                return
+            try:
+                worktree = create_worktree(item.id)
+            except Exception as e:
+                # The work loop will try to create it again
+                print(f"⚠️  Prefetch could not create worktree for {item.id}: {e}")
+                worktree = None
+            with self._lock:
+                self._item, self._worktree = item, worktree
+            self._log(f"Prefetched next item: {item.id} - {item.title}")
+        except Exception as e:
+            print(f"⚠️  Prefetch failed: {e}")
+            self._log(f"Prefetch failed: {e}", level="WARNING")
+
+    def _log(self, message: str, level: str = "INFO") -> None:
+        if self.run_logger:
+            self.run_logger.log_orchestrator(message, level=level)
+
+
+def discard_worktree(item_id: str) -> None:
+    """Remove a prefetched item's worktree and branch when the item won't be worked on."""
+    with serialized_merge():
+        cleanup_worktree(item_id, force=True)
+
+
+def _fast_forward(worktree: Path) -> None:
+    """Bring a fresh worktree branch up to the default branch."""
+    try:
+        subprocess.run(
+            ["git", "merge", "--ff-only", get_default_branch()],
+            cwd=str(worktree),
+            check=True,
+            capture_output=True,
+            text=True,
+            encoding='utf-8'
+        )
+    except (subprocess.CalledProcessError, OSError) as e:
+        stderr = getattr(e, 'stderr', None)
+        print(f"⚠️  Could not fast-forward prefetched worktree: {stderr or e}")
@@ -0,0 +1,28 @@
+"""Prompt-cache effectiveness.
+
+Agent prompts start with a prefix that is the same for every item (see
+``PromptService.render_with_item``), so the model's prompt cache can serve
+it. The SDK reports the input tokens read from and written to that cache
+with each ``assistant.usage`` event. The hit ratio is the share of input
+tokens that came from the cache.
+"""
+
+from typing import List
+
+from .types import AgentStats
+
+
+def cache_hit_ratio(input_tokens: int, cache_read_tokens: int) -> float:
+    """Share of input tokens served from the prompt cache (0.0-1.0)."""
+    if input_tokens <= 0:
+        return 0.0
+    return min(1.0, cache_read_tokens / input_tokens)
+
+
+def cache_summary(stats: AgentStats) -> List[str]:
+    """Lines describing prompt-cache use, for the session statistics."""
+    if not (stats.cache_read_tokens or stats.cache_write_tokens):
+        return []
+    ratio = cache_hit_ratio(stats.input_tokens, stats.cache_read_tokens)
+    return [f"🗄️  Prompt cache:       {stats.cache_read_tokens:,} read / {stats.cache_write_tokens:,} written "
+            f"({ratio:.0%} of input tokens)"]
@@ -1,9 +1,58 @@
-"""Prompt template loading and rendering service."""
+"""Prompt template loading and rendering service.
+
+Agent prompts are assembled cache-friendly: the template's instructions
+and repo context come first, and the item-specific details come last (see
+``render_with_item``). Consecutive prompts for the same agent then share a
+long identical prefix, which the model's prompt cache can serve instead of
+reprocessing it.
+"""
 
 from pathlib import Path
 from typing import Dict, Any, Optional
 import re
 
+from .types import BeadsWorkItem
+
+# Item details appended to agent prompts when the prompts directory has no item-context template
+_DEFAULT_ITEM_CONTEXT = """# Work Item
+
+**ID:** {{item_id}}
+**Title:** {{title}}
+**Type:** {{issue_type}}
+**Priority:** {{priority}}
+{{#labels}}
+**Labels:** {{labels}}
+{{/labels}}
+
+**Description:**
+{{description}}
+{{#context}}
+
+{{context}}
+{{/context}}
+"""
+
+# A template using these renders its item details itself
+_ITEM_FIELD_PATTERN = re.compile(r'\{\{[#/]?(?:item_id|title|description)\}\}')
+
+
+def item_prompt_variables(work_item: BeadsWorkItem, context: Optional[str] = None) -> Dict[str, Any]:
+    """Variables describing a work item, for ``PromptService.render_with_item``.
+
+    Args:
+        work_item: The item the agent works on.
+        context: Optional extra item-specific text (e.g. the worktree path).
+    """
+    return {
+        "item_id": work_item.id,
+        "title": work_item.title,
+        "description": work_item.description or "",
+        "issue_type": work_item.issue_type,
+        "priority": work_item.priority,
+        "labels": ", ".join(work_item.labels) if work_item.labels else None,
+        "context": context,
+    }
+
 
 class PromptService:
     """Service for loading and rendering prompt templates."""
@@ -137,6 +186,39 @@ class PromptService:
         """
         template = self.load_prompt(template_name)
         return self.render_prompt(template, variables)
+    
+    def render_with_item(
+        self, template_name: str, variables: Dict[str, Any], item_variables: Dict[str, Any]
+    ) -> str:
+        """Render an agent prompt as a stable prefix followed by the item details.
+        
+        The template holds the instructions shared by every item and is rendered
+        from ``variables`` that don't change between items (config, repo
+        context). The item details come last, from the ``item-context``
+        template. A template that places the item fields itself is rendered
+        as written.
+        
+        Args:
+            template_name: Name of the agent's template (without .md extension)
+            variables: Item-independent variables
+            item_variables: Item variables, see ``item_prompt_variables``
+            
+        Returns:
+            Rendered prompt
+        """
+        template = self.load_prompt(template_name)
+        if _ITEM_FIELD_PATTERN.search(template):
+            return self.render_prompt(template, {**variables, **item_variables})
+        return self.append_item(self.render_prompt(template, variables), item_variables)
+    
+    def append_item(self, prefix: str, item_variables: Dict[str, Any]) -> str:
+        """Append the item details (``item-context`` template) to a rendered prompt."""
+        try:
+            item_template = self.load_prompt("item-context")
+        except FileNotFoundError:
+            item_template = _DEFAULT_ITEM_CONTEXT
+        item = self.render_prompt(item_template, item_variables)
+        return f"{prefix.rstrip()}\n\n---\n\n{item.strip()}\n"
 
 
 # Singleton instance for easy access
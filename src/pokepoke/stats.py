@@ -6,6 +6,8 @@ from dataclasses import asdict
 from pathlib import Path
 from typing import Any, Optional, Dict, List
 
+from pokepoke.agent_timing import latency_summary
+from pokepoke.prompt_cache import cache_hit_ratio, cache_summary
 from pokepoke.types import AgentStats, SessionStats, ModelCompletionRecord
 
 
@@ -108,6 +110,51 @@ def print_stats(items_completed: int, total_requests: int, elapsed_seconds: floa
         print(f"✅ Closed issues:     {start.closed_issues:5} → {end.closed_issues:5} ({end.closed_issues - start.closed_issues:+d})")
         print(f"🚀 Ready to work:     {start.ready_issues:5} → {end.ready_issues:5} ({end.ready_issues - start.ready_issues:+d})")
     
+    # Print beads lookup cache effectiveness
+    if session_stats and (session_stats.beads_cache.hits or session_stats.beads_cache.misses):
+        cache = session_stats.beads_cache
+        lookups = cache.hits + cache.misses
+        print(f"🗃️  Lookup cache:      {cache.hits} hits / {cache.misses} misses "
+              f"({cache.hits / lookups * 100:.0f}% hit rate, {cache.hits} bd calls saved)")
+    
+    # Print background bd sync latencies
+    if session_stats and session_stats.beads_sync.syncs_run:
+        sync = session_stats.beads_sync
+        latencies = sorted(sync.latencies)
+        print(f"🔄 bd sync:           {sync.syncs_run} runs for {sync.requests} requests "
+              f"({sync.failures} failed, {sync.lock_busy} put off for a busy merge lock) - p50 {_percentile(latencies, 50):.1f}s, "
+              f"p90 {_percentile(latencies, 90):.1f}s, max {latencies[-1]:.1f}s")
+    
+    # Print Copilot client pool effectiveness
+    if session_stats and session_stats.copilot_pool.acquires:
+        pool = session_stats.copilot_pool
+        print(f"♻️  Copilot clients:   {pool.hits} reused / {pool.misses} started "
+              f"({pool.hits / pool.acquires * 100:.0f}% hit rate, "
+              f"{pool.startup_seconds_saved:.1f}s startup saved)")
+    
+    # Print how agent completion was detected and the idle wait it avoided
+    if session_stats and (session_stats.completions.deterministic or session_stats.completions.fallback):
+        done = session_stats.completions
+        print(f"⏱️  Agent completion:  {done.deterministic} detected / {done.fallback} by idle wait "
+              f"({done.idle_wait_saved_seconds:.0f}s idle wait saved)")
+    
+    # Print models that were rate limited, fallen back from, or waited for
+    for name, throttle in dict(session_stats.model_throttle if session_stats else {}).items():
+        if throttle.rate_limits or throttle.fallbacks_from or throttle.deferred_seconds >= 1:
+            print(f"🚦 {name}: {throttle.rate_limits} rate limits, {throttle.fallbacks_from} fallbacks, "
+                  f"{throttle.deferred_seconds:.0f}s waiting ({throttle.invocations} invocations)")
+    
+    # Print the cost of work-agent reruns after gate rejections
+    if session_stats and (session_stats.work_retries.fresh_retries or session_stats.work_retries.follow_up_retries):
+        retries = session_stats.work_retries
+        for label, count, tokens, turns in (
+            ("new session", retries.fresh_retries, retries.fresh_input_tokens, retries.fresh_turns),
+            ("follow-up", retries.follow_up_retries, retries.follow_up_input_tokens, retries.follow_up_turns),
+        ):
+            if count:
+                print(f"🔁 Gate retries ({label}): {count} - avg {tokens // count:,} input tokens, "
+                      f"{turns / count:.1f} turns")
+    
     # Print agent run counts
     if session_stats:
         print("\n" + "=" * 60)
@@ -154,6 +201,8 @@ def print_stats(items_completed: int, total_requests: int, elapsed_seconds: floa
             print(f"➖ Lines removed:      {agent.lines_removed:,}")
         if agent.premium_requests > 0:
             print(f"💎 Premium requests:   {agent.premium_requests}")
+        for line in cache_summary(agent) + latency_summary(agent):
+            print(line)
     else:
         print("\n⚠️  No agent statistics available (stats parsing may have failed)")
     
@@ -196,6 +245,12 @@ def _format_duration(seconds: float) -> str:
     return f"{secs}s"
 
 
+def _percentile(sorted_values: List[float], pct: int) -> float:
+    """Nearest-rank percentile of an already sorted, non-empty list."""
+    index = max(0, -(-len(sorted_values) * pct // 100) - 1)
+    return sorted_values[index]
+
+
 def _print_model_comparison(completions: List[ModelCompletionRecord]) -> None:
     """Print per-model comparison statistics for A/B testing.
 
@@ -268,6 +323,8 @@ def serialize_session_stats(
         "total_requests": total_requests,
         "elapsed_seconds": round(elapsed_seconds, 2),
         "agent_stats": asdict(session_stats.agent_stats),
+        "cache_hit_ratio": round(cache_hit_ratio(session_stats.agent_stats.input_tokens,
+                                                 session_stats.agent_stats.cache_read_tokens), 4),
         "run_counts": {
             "work_agent": session_stats.work_agent_runs,
             "gate_agent": session_stats.gate_agent_runs,
@@ -287,6 +344,13 @@ def serialize_session_stats(
         "model_completions": [
             asdict(mc) for mc in session_stats.model_completions
         ],
+        "beads_cache": asdict(session_stats.beads_cache),
+        "beads_sync": asdict(session_stats.beads_sync),
+        "copilot_pool": asdict(session_stats.copilot_pool),
+        "work_retries": asdict(session_stats.work_retries),
+        "completions": asdict(session_stats.completions),
+        "model_throttle": {name: asdict(t) for name, t in dict(session_stats.model_throttle).items()},
+        "item_latencies": [asdict(rec) for rec in session_stats.item_latencies],
     }
 
     # Beads deltas
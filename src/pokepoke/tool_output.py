@@ -0,0 +1,49 @@
+"""Cap the tool output shown in the terminal and item log.
+
+A single ``view`` or ``grep`` result can be megabytes. Printed whole it
+floods the terminal, the desktop app's log buffer and the item log, and
+the cost of handling each tool event grows with its size. Tool arguments
+and results longer than the configured limit are shown as their head and
+tail with a note of how many bytes were left out. The full text goes to
+the item's tool-results file, referenced by byte offset; without an item
+log the note says the rest was discarded.
+"""
+
+from typing import TYPE_CHECKING, Optional
+
+from .config import get_config
+
+if TYPE_CHECKING:
+    from .logging_utils import ItemLogger
+
+
+def _byte_size(text: str) -> int:
+    return len(text.encode('utf-8', errors='replace'))
+
+
+def tool_output_limit(tool_name: str) -> int:
+    """Characters of ``tool_name``'s output to show (0 means no limit)."""
+    copilot = get_config().copilot
+    return copilot.tool_output_limits.get(tool_name, copilot.tool_output_limit)
+
+
+def cap_tool_output(text: str, limit: int, item_logger: Optional['ItemLogger'] = None) -> str:
+    """Head and tail of ``text`` if it is longer than ``limit`` characters.
+
+    Args:
+        text: Tool arguments or result.
+        limit: Characters to keep (0 keeps everything).
+        item_logger: Where to save the full text, if given.
+    """
+    if limit <= 0 or len(text) <= limit:
+        return text
+    head, tail = text[:limit // 2], text[len(text) - (limit - limit // 2):]
+    omitted = _byte_size(text) - _byte_size(head) - _byte_size(tail)
+    where = " - not saved (no item log)"
+    if item_logger is not None:
+        offset = item_logger.save_tool_output(text)
+        if offset is not None:
+            where = f" - full output in {item_logger.tool_results_path.name} at byte {offset:,}"
+        else:
+            where = f" - could not be saved to {item_logger.tool_results_path.name}"
+    return f"{head}\n[... {omitted:,} bytes omitted{where} ...]\n{tail}"
@@ -1,7 +1,7 @@
 """Type definitions for PokePoke orchestrator."""
 
 from dataclasses import dataclass, field
-from typing import Optional, List
+from typing import Dict, Optional, List
 
 
 @dataclass
@@ -72,6 +72,18 @@ class RetryConfig:
     jitter: bool = True  # Add random jitter to prevent thundering herd
 
 
+# Upper bounds (seconds) of the latency histogram buckets; a last bucket takes the rest
+LATENCY_BUCKETS = (0.5, 1.0, 2.0, 5.0, 10.0, 30.0, 60.0, 120.0, 300.0)
+
+
+@dataclass
+class LatencyHistogram:
+    """Durations counted into LATENCY_BUCKETS."""
+    counts: List[int] = field(default_factory=lambda: [0] * (len(LATENCY_BUCKETS) + 1))
+    total_seconds: float = 0.0
+    max_seconds: float = 0.0
+
+
 @dataclass
 class AgentStats:
     """Statistics from agent execution."""
@@ -79,11 +91,18 @@ class AgentStats:
     api_duration: float = 0.0  # seconds
     input_tokens: int = 0
     output_tokens: int = 0
+    cache_read_tokens: int = 0  # Input tokens served from the prompt cache
+    cache_write_tokens: int = 0  # Input tokens written to the prompt cache
     lines_added: int = 0
     lines_removed: int = 0
     premium_requests: int = 0
     retries: int = 0
     tool_calls: int = 0
+    tool_duration: float = 0.0  # seconds tools spent executing
+    idle_wait_duration: float = 0.0  # seconds spent confirming an idle session was done
+    first_token_latency: LatencyHistogram = field(default_factory=LatencyHistogram)  # Per message sent
+    turn_latency: LatencyHistogram = field(default_factory=LatencyHistogram)  # Model time per turn
+    tool_latency: Dict[str, LatencyHistogram] = field(default_factory=dict)  # Execution time per tool
 
 
 @dataclass
@@ -103,6 +122,89 @@ class ModelCompletionRecord:
     model: str
     duration_seconds: float
     gate_passed: Optional[bool] = None  # None = gate not run
+    input_tokens: int = 0
+    cache_read_tokens: int = 0
+    cache_write_tokens: int = 0
+
+
+@dataclass
+class ItemLatencyRecord:
+    """Where one work item's time went (seconds)."""
+    item_id: str
+    total: float  # Worktree setup to finalization
+    agent: float  # Agent sessions, the sum of the next three plus agent overhead
+    model: float
+    tools: float
+    idle_wait: float
+    turns: int = 0
+    turn_p50: float = 0.0
+    turn_p90: float = 0.0
+    first_token_p50: float = 0.0
+    slowest_tools: Dict[str, float] = field(default_factory=dict)  # Tool name -> total seconds
+
+
+@dataclass
+class BeadsCacheStats:
+    """Hit/miss counters for the beads issue lookup cache."""
+    hits: int = 0
+    misses: int = 0
+    invalidations: int = 0  # Entries dropped because the database changed or we wrote to it
+
+
+@dataclass
+class BeadsSyncStats:
+    """Counters and timings for the background bd sync worker."""
+    requests: int = 0  # request_sync() calls
+    syncs_run: int = 0  # bd sync invocations actually made
+    failures: int = 0
+    lock_busy: int = 0  # Syncs put off because the merge lock stayed busy
+    latencies: List[float] = field(default_factory=list)  # Recent bd sync durations (seconds)
+
+
+@dataclass
+class CopilotPoolStats:
+    """Counters for the pool of warm Copilot clients."""
+    acquires: int = 0
+    hits: int = 0  # Served by an already-running client
+    misses: int = 0  # Had to start a new client
+    health_failures: int = 0  # Idle clients that failed their ping
+    evictions: int = 0  # Idle clients stopped for age or surplus
+    startup_seconds: float = 0.0  # Time spent starting clients
+    startup_seconds_saved: float = 0.0  # Startup time of the clients reused on hits
+
+
+@dataclass
+class ModelThrottleState:
+    """Rate-limit state of one model, as learned by the model governor."""
+    invocations: int = 0
+    in_flight: int = 0
+    rate_limits: int = 0
+    cooldown_until: float = 0.0  # Epoch seconds; in the past when not cooling down
+    concurrency_limit: int = 0  # Invocations allowed at once (0 = unlimited)
+    deferred_seconds: float = 0.0  # Time invocations waited for a model to free up
+    fallbacks_from: int = 0  # Invocations moved to another model because this one was throttled
+
+
+@dataclass
+class CompletionStats:
+    """How agent exchanges were recognised as finished."""
+    deterministic: int = 0  # From a final answer followed by turn end or idle
+    fallback: int = 0  # After waiting for an idle session to stay idle
+    idle_wait_seconds: float = 0.0  # Time spent in those fallback waits
+    idle_wait_saved_seconds: float = 0.0  # Versus waiting the full idle timeout every time
+
+
+@dataclass
+class WorkRetryStats:
+    """Cost of work-agent reruns after a gate rejection."""
+    fresh_retries: int = 0  # Reruns that started a new session
+    fresh_input_tokens: int = 0
+    fresh_turns: int = 0
+    fresh_tool_calls: int = 0
+    follow_up_retries: int = 0  # Reruns sent as a follow-up in the kept session
+    follow_up_input_tokens: int = 0
+    follow_up_turns: int = 0
+    follow_up_tool_calls: int = 0
 
 
 @dataclass
@@ -124,6 +226,13 @@ class SessionStats:
     starting_beads_stats: Optional[BeadsStats] = None
     ending_beads_stats: Optional[BeadsStats] = None
     model_completions: List[ModelCompletionRecord] = field(default_factory=list)
+    beads_cache: BeadsCacheStats = field(default_factory=BeadsCacheStats)
+    beads_sync: BeadsSyncStats = field(default_factory=BeadsSyncStats)
+    copilot_pool: CopilotPoolStats = field(default_factory=CopilotPoolStats)
+    work_retries: WorkRetryStats = field(default_factory=WorkRetryStats)
+    completions: CompletionStats = field(default_factory=CompletionStats)
+    model_throttle: Dict[str, ModelThrottleState] = field(default_factory=dict)
+    item_latencies: List[ItemLatencyRecord] = field(default_factory=list)
 
 
 @dataclass
@@ -131,10 +240,11 @@ class CopilotResult:
     """Result from invoking Copilot CLI."""
     work_item_id: str
     success: bool
-    output: Optional[str] = None
+    output: Optional[str] = None  # Tail of the agent output (the full output is in the item log)
     error: Optional[str] = None
     validation_errors: Optional[List[str]] = None
     attempt_count: int = 1
     is_rate_limited: bool = False  # True if error was due to rate limiting
     stats: Optional[AgentStats] = None
     model: Optional[str] = None  # Model used for this invocation
+    final_message: Optional[str] = None  # The agent's last message in full
@@ -4,7 +4,8 @@ import os
 from typing import Optional
 
 from .types import BeadsWorkItem
-from .beads import select_next_hierarchical_item
+from .beads import select_next_hierarchical_item, load_beads_graph
+from .beads_leases import is_lease_expired
 from .shutdown import is_shutting_down
 
 # Label that marks items as requiring human intervention - PokePoke will skip these
@@ -41,6 +42,8 @@ def _is_assigned_to_current_user(item: BeadsWorkItem) -> bool:
     an additional signal: if status is 'in_progress' with no assignee info,
     another agent likely has it.
     
+    Either way, a claim whose lease has expired no longer blocks the item.
+    
     Args:
         item: Work item to check.
         
@@ -51,6 +54,12 @@ def _is_assigned_to_current_user(item: BeadsWorkItem) -> bool:
     assignee = getattr(item, 'assignee', None) or ''
     agent_name = os.environ.get('AGENT_NAME', '')
     
+    # The claiming agent stopped renewing its lease (crashed or killed)
+    if is_lease_expired(item.labels):
+        if assignee or item.status == 'in_progress':
+            print(f"   \u267b\ufe0f  {item.id} claim lease expired - available again")
+        return True
+    
     if assignee:
         # Has an assignee - check if it's THIS agent
         if agent_name and agent_name.lower() == assignee.lower():
@@ -139,7 +148,7 @@ def select_work_item(ready_items: list[BeadsWorkItem], interactive: bool, skip_i
     if interactive:
         return interactive_selection(ready_items)
     else:
-        return autonomous_selection(ready_items)
+        return autonomous_selection(ready_items, skip_ids)
 
 
 def interactive_selection(ready_items: list[BeadsWorkItem]) -> Optional[BeadsWorkItem]:
@@ -163,9 +172,15 @@ def interactive_selection(ready_items: list[BeadsWorkItem]) -> Optional[BeadsWor
             return None
     return None
 
-def autonomous_selection(ready_items: list[BeadsWorkItem]) -> Optional[BeadsWorkItem]:
-    """Use hierarchical selection for autonomous mode."""
-    selected = select_next_hierarchical_item(ready_items)
+def autonomous_selection(ready_items: list[BeadsWorkItem], skip_ids: Optional[set[str]] = None) -> Optional[BeadsWorkItem]:
+    """Use hierarchical selection for autonomous mode.
+    
+    Loads one snapshot of the issue graph up front so resolving epics and
+    features to leaf tasks costs a single bd call instead of one per child.
+    ``skip_ids`` also applies to the leaf an epic or feature resolves to.
+    """
+    graph = load_beads_graph()
+    selected = select_next_hierarchical_item(ready_items, graph=graph, skip_ids=skip_ids)
     if selected:
         print(f"🤖 Hierarchically selected item: {selected.id}")
         print(f"   Type: {selected.issue_type} | Priority: {selected.priority}")
@@ -0,0 +1,192 @@
+"""Parallel worker pool - run several work items at once.
+
+Each worker runs the normal ``process_work_item`` pipeline (claim, worktree,
+agent, gate, merge) in its own thread and its own worktree. Workers share:
+
+- the claim registry, so no two workers (in this or another PokePoke
+  process) pick the same item;
+- the merge lock (merge_queue), so merges into the main repo are serialized;
+- the session stats, which are only updated under the pool's stats lock.
+"""
+
+import threading
+import time
+from pathlib import Path
+from typing import List, Optional, Set, TYPE_CHECKING
+
+from pokepoke.beads import get_ready_work_items
+from pokepoke.beads_watch import BeadsWatcher, WATCH_RECHECK_SECONDS
+from pokepoke.claim_registry import AnyClaimRegistry, claim_owner, get_claim_registry
+from pokepoke.maintenance import run_periodic_maintenance, merge_maintenance_stats, record_item_result
+from pokepoke.maintenance_state import increment_items_completed
+from pokepoke.merge_queue import serialized_merge
+from pokepoke.model_stats_store import record_completion
+from pokepoke.repo_check import check_and_commit_main_repo
+from pokepoke.shutdown import is_shutting_down, request_shutdown
+from pokepoke.types import AgentStats, BeadsWorkItem, SessionStats
+from pokepoke.work_item_selection import select_work_item
+from pokepoke.workflow import process_work_item
+
+if TYPE_CHECKING:
+    from pokepoke.logging_utils import RunLogger
+    from pokepoke.maintenance_lane import MaintenanceLane
+
+# Seconds an idle worker waits before looking for work again
+_IDLE_POLL_SECONDS = 5.0
+
+# Selection attempts per round when the chosen item is held by another worker
+_MAX_SELECT_ATTEMPTS = 3
+
+
+class WorkerPool:
+    """Runs up to ``num_workers`` work items concurrently."""
+
+    def __init__(
+        self,
+        num_workers: int,
+        session_stats: SessionStats,
+        run_logger: 'RunLogger',
+        main_repo_path: Path,
+        continuous: bool = False,
+        registry: Optional[AnyClaimRegistry] = None,
+        watch: bool = False,
+        lane: Optional['MaintenanceLane'] = None,
+    ) -> None:
+        self.num_workers = max(1, num_workers)
+        self.session_stats = session_stats
+        self.run_logger = run_logger
+        self.main_repo_path = main_repo_path
+        self.continuous = continuous
+        self.watch = watch
+        self.lane = lane
+        self.registry = registry if registry is not None else get_claim_registry()
+        self.items_completed = 0
+        self.total_requests = 0
+        self.failed = False
+        self._stats_lock = threading.Lock()
+        self._select_lock = threading.Lock()
+        self._failed_claim_ids: Set[str] = set()
+        self._busy = 0
+
+    def run(self) -> None:
+        """Start the workers and wait until they have all finished."""
+        print(f"\n👥 Starting {self.num_workers} workers")
+        self.run_logger.log_orchestrator(f"Starting worker pool with {self.num_workers} workers")
+        threads: List[threading.Thread] = [
+            threading.Thread(target=self._worker, args=(claim_owner(f"worker-{n}"),), name=f"pokepoke-worker-{n}", daemon=True)
+            for n in range(1, self.num_workers + 1)
+        ]
+        for thread in threads:
+            thread.start()
+        try:
+            # join() with a timeout so Ctrl+C reaches the main thread
+            while any(thread.is_alive() for thread in threads):
+                for thread in threads:
+                    thread.join(timeout=0.5)
+        except KeyboardInterrupt:
+            request_shutdown()
+            raise
+
+    def _worker(self, name: str) -> None:
+        # In watch mode idle workers wait for beads changes instead of exiting
+        watcher = BeadsWatcher() if self.watch else None
+        try:
+            while not is_shutting_down():
+                if watcher:
+                    watcher.arm()
+                item = self._next_item(name)
+                if item is None:
+                    if self.failed or not self.continuous or (watcher is None and self._idle_without_peers()):
+                        return
+                    if watcher:
+                        watcher.wait(timeout=WATCH_RECHECK_SECONDS)
+                    else:
+                        self._sleep(_IDLE_POLL_SECONDS)
+                    continue
+                try:
+                    self._process(name, item)
+                finally:
+                    self.registry.release(item.id, name)
+                    with self._stats_lock:
+                        self._busy -= 1
+                if not self.continuous:
+                    return
+        except Exception as e:
+            self.failed = True
+            print(f"\n❌ {name} crashed: {e}")
+            self.run_logger.log_orchestrator(f"{name} crashed: {e}", level="ERROR")
+        finally:
+            if watcher:
+                watcher.close()
+
+    def _next_item(self, name: str) -> Optional[BeadsWorkItem]:
+        """Select an item no other worker holds and reserve it."""
+        with self._select_lock:
+            with serialized_merge():
+                if not check_and_commit_main_repo(self.main_repo_path, self.run_logger):
+                    self.run_logger.log_orchestrator("Main repo check failed", level="ERROR")
+                    self.failed = True
+                    return None
+            skip_ids = self._failed_claim_ids | self.registry.claimed_ids()
+            for _ in range(_MAX_SELECT_ATTEMPTS):
+                ready_items = get_ready_work_items()
+                if self.lane:
+                    self.lane.set_ready_count(len(ready_items))
+                item = select_work_item(ready_items, interactive=False, skip_ids=skip_ids)
+                if item is None:
+                    return None
+                if self.registry.try_claim(item.id, name):
+                    with self._stats_lock:
+                        self._busy += 1
+                    self.run_logger.log_orchestrator(f"{name} selected item: {item.id} - {item.title}")
+                    return item
+                # Resolved to a leaf another worker already has
+                skip_ids.add(item.id)
+            return None
+
+    def _idle_without_peers(self) -> bool:
+        """No work and nobody busy - nothing will free up, so stop."""
+        with self._stats_lock:
+            return self._busy == 0
+
+    def _process(self, name: str, item: BeadsWorkItem) -> None:
+        print(f"\n👷 {name} picked up {item.id}")
+        success, requests, item_stats, cleanup_runs, gate_runs, model_completion = process_work_item(
+            item, interactive=False, run_logger=self.run_logger
+        )
+        stats = self.session_stats
+        with self._stats_lock:
+            if not success and requests == 0:
+                self._failed_claim_ids.add(item.id)
+            elif success:
+                self._failed_claim_ids.clear()
+            self.total_requests += requests
+            record_item_result(stats, requests, item_stats, cleanup_runs, gate_runs, model_completion)
+            if model_completion:
+                record_completion(model_completion)
+            if not success:
+                return
+            self.items_completed += 1
+            stats.items_completed = self.items_completed
+            stats.completed_items_list.append(item)
+            total_persistent_count = increment_items_completed()
+        print(f"\n📈 Items completed this session: {self.items_completed}")
+        self.run_logger.log_orchestrator(f"{name} completed {item.id} ({self.items_completed} this session)")
+        self._run_maintenance(total_persistent_count)
+
+    def _run_maintenance(self, total_persistent_count: int) -> None:
+        """Run periodic maintenance, folding its counters in under the lock."""
+        if self.lane:
+            self.lane.schedule(total_persistent_count)
+            with self._stats_lock:
+                self.lane.collect(self.session_stats)
+            return
+        scratch = SessionStats(agent_stats=AgentStats())
+        run_periodic_maintenance(total_persistent_count, scratch, self.run_logger)
+        with self._stats_lock:
+            merge_maintenance_stats(self.session_stats, scratch)
+
+    def _sleep(self, seconds: float) -> None:
+        deadline = time.time() + seconds
+        while time.time() < deadline and not is_shutting_down():
+            time.sleep(0.5)
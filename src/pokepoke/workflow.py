@@ -2,13 +2,17 @@
 
 import time
 from pathlib import Path
-from typing import Optional, TYPE_CHECKING
+from typing import Callable, Optional, TYPE_CHECKING
 
-from pokepoke.copilot import invoke_copilot
+from pokepoke.agent_timing import merge_agent_stats
+from pokepoke.copilot import invoke_copilot, build_gate_feedback_prompt
+from pokepoke.copilot_conversation import CopilotConversation, record_work_retry
+from pokepoke.config import get_config
 from pokepoke.types import BeadsWorkItem, AgentStats, CopilotResult, ModelCompletionRecord
 from pokepoke.worktrees import create_worktree, cleanup_worktree
 from pokepoke.git_operations import has_uncommitted_changes, has_commits_ahead
 from pokepoke.beads import assign_and_sync_item, add_comment
+from pokepoke.beads_leases import LeaseHeartbeat
 from pokepoke.agent_runner import run_cleanup_loop, run_beta_tester, run_gate_agent
 from pokepoke.worktree_finalization import finalize_work_item
 from pokepoke.work_item_selection import select_work_item
@@ -19,7 +23,7 @@ from pokepoke.shutdown import is_shutting_down
 from pokepoke.model_selection import select_model_for_item
 
 if TYPE_CHECKING:
-    from pokepoke.logging_utils import RunLogger
+    from pokepoke.logging_utils import RunLogger, ItemLogger
 
 
 def process_work_item(
@@ -28,7 +32,8 @@ def process_work_item(
     timeout_hours: float = 2.0, 
     run_cleanup_agents: bool = False, 
     run_beta_test: bool = False,
-    run_logger: Optional['RunLogger'] = None
+    run_logger: Optional['RunLogger'] = None,
+    on_gate_start: Optional[Callable[[], None]] = None
 ) -> tuple[bool, int, Optional[AgentStats], int, int, Optional[ModelCompletionRecord]]:
     """Process a single work item with timeout protection.
     
@@ -39,15 +44,12 @@ def process_work_item(
         run_cleanup_agents: If True, run maintenance agents after completion (default: False)
         run_beta_test: If True, run beta tester after completion (default: True)
         run_logger: Optional run logger instance for file logging
+        on_gate_start: Optional callback run each time the gate agent starts
         
     Returns:
         Tuple of (success, request_count, stats, cleanup_agent_runs, gate_agent_runs, model_completion)
     """
     start_time = time.time()
-    timeout_seconds = timeout_hours * 3600
-    request_count = 0
-    cleanup_agent_runs = 0
-    gate_agent_runs = 0
     
     # Select model for this work item (A/B testing)
     selected_model = select_model_for_item(item.id)
@@ -69,7 +71,7 @@ def process_work_item(
         if confirm and confirm != 'y':
             print("⏭️  Skipped.")
             if run_logger:
-                run_logger.end_item_log(False, 0)
+                run_logger.end_item_log(item.id, False, 0)
             return False, 0, None, 0, 0, None
     
     # Assign and sync BEFORE creating worktree to prevent parallel conflicts
@@ -77,16 +79,52 @@ def process_work_item(
     if not assign_and_sync_item(item.id):
         print(f"❌ Failed to assign work item {item.id}")
         if run_logger:
-            run_logger.end_item_log(False, 0)
+            run_logger.end_item_log(item.id, False, 0)
         return False, 0, None, 0, 0, None
     
+    # Renew the claim's lease for as long as we are working on the item
+    with LeaseHeartbeat(item.id, item.labels):
+        while True:
+            outcome = _process_claimed_item(
+                item, interactive, timeout_hours, run_cleanup_agents, run_beta_test,
+                run_logger, item_logger, selected_model, start_time, on_gate_start
+            )
+            if outcome is not None:
+                return outcome
+            # Timed out - start over, still holding the claim and its heartbeat
+            start_time = time.time()
+
+
+def _process_claimed_item(
+    item: BeadsWorkItem,
+    interactive: bool,
+    timeout_hours: float,
+    run_cleanup_agents: bool,
+    run_beta_test: bool,
+    run_logger: Optional['RunLogger'],
+    item_logger: Optional['ItemLogger'],
+    selected_model: str,
+    start_time: float,
+    on_gate_start: Optional[Callable[[], None]] = None
+) -> Optional[tuple[bool, int, Optional[AgentStats], int, int, Optional[ModelCompletionRecord]]]:
+    """Work on a claimed item: worktree, agent/cleanup/gate loop, finalization.
+
+    Returns:
+        The same tuple as process_work_item, or None if the item timed out
+        and should be restarted.
+    """
+    timeout_seconds = timeout_hours * 3600
+    request_count = 0
+    cleanup_agent_runs = 0
+    gate_agent_runs = 0
+    
     # Use current working directory as repo root
     pokepoke_root = Path.cwd()
     worktree_path = _setup_worktree(item)
     
     if worktree_path is None:
         if run_logger:
-            run_logger.end_item_log(False, 0)
+            run_logger.end_item_log(item.id, False, 0)
         return False, 0, None, 0, 0, None
     
     worktree_cwd = str(worktree_path)
@@ -97,82 +135,98 @@ def process_work_item(
     # Initialize accumulated stats
     accumulated_stats = AgentStats()
     gate_success = False  # Track last gate result for model completion record
+    # Optionally keep the work agent's session open so gate feedback is a follow-up message
+    conversation = CopilotConversation() if get_config().copilot.reuse_work_session else None
+    work_attempts = 0
     
-    while not is_shutting_down():
-        # Check timeout before invoking Copilot
-        elapsed = time.time() - start_time
-        if elapsed >= timeout_seconds:
-            print(f"\n⏱️  TIMEOUT: Execution exceeded {timeout_hours} hours")
-            print(f"   Restarting item {item.id} in same worktree...\n")
-            return process_work_item(item, interactive, timeout_hours, run_cleanup_agents, run_beta_test, run_logger)
-        
-        remaining_timeout = timeout_seconds - elapsed
-        
-        # Append feedback if retrying
-        if last_feedback:
-             print(f"\n🔄 Restarting Work Agent with feedback...")
-             current_desc = item.description or ""
-             if "**PREVIOUS GATE AGENT FEEDBACK:**" not in current_desc:
-                 current_desc += "\n\n**PREVIOUS GATE AGENT FEEDBACK:**\n"
-             current_desc += f"\n- {last_feedback}"
-             item.description = current_desc
+    try:
+        while not is_shutting_down():
+            # Check timeout before invoking Copilot
+            elapsed = time.time() - start_time
+            if elapsed >= timeout_seconds:
+                print(f"\n⏱️  TIMEOUT: Execution exceeded {timeout_hours} hours")
+                print(f"   Restarting item {item.id} in same worktree...\n")
+                return None
+            
+            remaining_timeout = timeout_seconds - elapsed
+            
+            # Append feedback if retrying
+            prompt = None
+            follow_up = conversation is not None and conversation.is_open
+            if last_feedback:
+                 current_desc = item.description or ""
+                 if "**PREVIOUS GATE AGENT FEEDBACK:**" not in current_desc:
+                     current_desc += "\n\n**PREVIOUS GATE AGENT FEEDBACK:**\n"
+                 current_desc += f"\n- {last_feedback}"
+                 item.description = current_desc
+                 if follow_up:
+                     print(f"\n🔄 Sending gate feedback to the running Work Agent session...")
+                     prompt = build_gate_feedback_prompt(item, last_feedback)
+                 else:
+                     print(f"\n🔄 Restarting Work Agent with feedback...")
 
-        terminal_ui.ui.set_current_agent("Work Agent")
-        result = invoke_copilot(item, timeout=remaining_timeout, item_logger=item_logger, model=selected_model, cwd=worktree_cwd)
-        request_count += result.attempt_count
-        
-        # Aggregate stats
-        current_stats = result.stats if result.stats else (parse_agent_stats(result.output) if result.output else None)
-        if current_stats:
-            accumulated_stats.wall_duration += current_stats.wall_duration
-            accumulated_stats.api_duration += current_stats.api_duration
-            accumulated_stats.input_tokens += current_stats.input_tokens
-            accumulated_stats.output_tokens += current_stats.output_tokens
-            accumulated_stats.lines_added += current_stats.lines_added
-            accumulated_stats.lines_removed += current_stats.lines_removed
-            accumulated_stats.premium_requests += current_stats.premium_requests
-            accumulated_stats.tool_calls += current_stats.tool_calls
-            accumulated_stats.retries += current_stats.retries
+            terminal_ui.ui.set_current_agent("Work Agent")
+            result = invoke_copilot(
+                item, prompt=prompt, timeout=remaining_timeout, item_logger=item_logger,
+                model=selected_model, cwd=worktree_cwd, conversation=conversation
+            )
+            work_attempts += 1
+            request_count += result.attempt_count
+            
+            # Aggregate stats
+            current_stats = result.stats if result.stats else (parse_agent_stats(result.output) if result.output else None)
+            if current_stats:
+                merge_agent_stats(accumulated_stats, current_stats)
+            if work_attempts > 1:
+                _record_retry(item, work_attempts, follow_up, current_stats, run_logger)
 
-        # If work agent failed, break
-        if not result.success:
-            break
-        
-        if not has_uncommitted_changes(cwd=worktree_cwd):
-            commits_ahead = has_commits_ahead(cwd=worktree_cwd)
-            if commits_ahead > 0:
-                print(f"\n✅ All changes already committed ({commits_ahead} commit{'s' if commits_ahead != 1 else ''} ahead)")
-                print("   Skipping cleanup and commit steps")
-            else:
-                print("\n✅ No changes made - work item may already be complete")
-                print("   Skipping cleanup and commit steps")
-        
-        # Run cleanup loop with timeout checking
-        cleanup_success, cleanup_runs = _run_cleanup_with_timeout(
-            item, result, pokepoke_root, start_time, timeout_seconds, timeout_hours, worktree_cwd
-        )
-        cleanup_agent_runs += cleanup_runs
-        
-        if not cleanup_success:
-            # Cleanup failed (e.g. timeout), consider item failed or retry?
-            # For now, if cleanup fails, we fail the cycle.
-            result.success = False
-            if run_logger:
-                run_logger.end_item_log(False, request_count)
-            return False, request_count, accumulated_stats, cleanup_agent_runs, gate_agent_runs, None
+            # If work agent failed, break
+            if not result.success:
+                break
+            
+            if not has_uncommitted_changes(cwd=worktree_cwd):
+                commits_ahead = has_commits_ahead(cwd=worktree_cwd)
+                if commits_ahead > 0:
+                    print(f"\n✅ All changes already committed ({commits_ahead} commit{'s' if commits_ahead != 1 else ''} ahead)")
+                    print("   Skipping cleanup and commit steps")
+                else:
+                    print("\n✅ No changes made - work item may already be complete")
+                    print("   Skipping cleanup and commit steps")
+            
+            # Run cleanup loop with timeout checking
+            cleanup_success, cleanup_runs = _run_cleanup_with_timeout(
+                item, result, pokepoke_root, start_time, timeout_seconds, timeout_hours, worktree_cwd,
+                item_logger=item_logger
+            )
+            cleanup_agent_runs += cleanup_runs
+            
+            if not cleanup_success:
+                # Cleanup failed (e.g. timeout), consider item failed or retry?
+                # For now, if cleanup fails, we fail the cycle.
+                result.success = False
+                if run_logger:
+                    run_logger.end_item_log(item.id, False, request_count)
+                return False, request_count, accumulated_stats, cleanup_agent_runs, gate_agent_runs, None
 
-        # --- GATE AGENT CHECK ---
-        gate_success, gate_reason, gate_stats = run_gate_agent(item, cwd=worktree_cwd)
-        gate_agent_runs += 1
-        
-        if gate_success:
-            print("\n✅ Gate Agent signed off!")
-            break
-        else:
-            print(f"\n❌ Gate Agent rejected fix: {gate_reason}")
-            add_comment(item.id, f"Gate Agent Rejection:\n{gate_reason}")
-            last_feedback = gate_reason
-            # Loop continues...
+            # --- GATE AGENT CHECK ---
+            if on_gate_start:
+                on_gate_start()
+            gate_success, gate_reason, gate_stats = run_gate_agent(item, cwd=worktree_cwd, item_logger=item_logger)
+            gate_agent_runs += 1
+            
+            if gate_success:
+                print("\n✅ Gate Agent signed off!")
+                break
+            else:
+                print(f"\n❌ Gate Agent rejected fix: {gate_reason}")
+                add_comment(item.id, f"Gate Agent Rejection:\n{gate_reason}")
+                last_feedback = gate_reason
+                # Loop continues...
+    
+    finally:
+        # The session's cwd is the worktree, so close it before finalization
+        if conversation:
+            conversation.close_sync()
     
     if result.success:
         set_terminal_banner(format_work_item_banner(item.id, item.title, "Finalizing"))
@@ -189,18 +243,13 @@ def process_work_item(
         # Run beta tester after successful completion
         if success and run_beta_test:
             set_terminal_banner(format_work_item_banner(item.id, item.title, "Beta Testing"))
-            beta_stats = run_beta_tester()
+            beta_stats = run_beta_tester(item_logger=item_logger)
             if beta_stats and item_stats:
-                # Aggregate beta tester stats
-                item_stats.wall_duration += beta_stats.wall_duration
-                item_stats.api_duration += beta_stats.api_duration
-                item_stats.input_tokens += beta_stats.input_tokens
-                item_stats.output_tokens += beta_stats.output_tokens
-                item_stats.premium_requests += beta_stats.premium_requests
+                merge_agent_stats(item_stats, beta_stats)
             set_terminal_banner(format_work_item_banner(item.id, item.title, "Completed"))
         
         if run_logger:
-            run_logger.end_item_log(success, request_count)
+            run_logger.end_item_log(item.id, success, request_count)
         
         terminal_ui.ui.set_current_agent(None)
         
@@ -211,6 +260,9 @@ def process_work_item(
             model=selected_model,
             duration_seconds=item_duration,
             gate_passed=gate_success if gate_agent_runs > 0 else None,
+            input_tokens=accumulated_stats.input_tokens,
+            cache_read_tokens=accumulated_stats.cache_read_tokens,
+            cache_write_tokens=accumulated_stats.cache_write_tokens,
         ) if success else None
         
         return success, request_count, item_stats, cleanup_agent_runs, gate_agent_runs, model_completion
@@ -221,7 +273,7 @@ def process_work_item(
         cleanup_worktree(item.id, force=True)
         
         if run_logger:
-            run_logger.end_item_log(False, request_count)
+            run_logger.end_item_log(item.id, False, request_count)
         
         terminal_ui.ui.set_current_agent(None)
         
@@ -232,11 +284,33 @@ def process_work_item(
             model=selected_model,
             duration_seconds=item_duration,
             gate_passed=False,
+            input_tokens=accumulated_stats.input_tokens,
+            cache_read_tokens=accumulated_stats.cache_read_tokens,
+            cache_write_tokens=accumulated_stats.cache_write_tokens,
         )
         
         return False, request_count, None, cleanup_agent_runs, gate_agent_runs, model_completion
 
 
+def _record_retry(
+    item: BeadsWorkItem,
+    attempt: int,
+    follow_up: bool,
+    stats: Optional[AgentStats],
+    run_logger: Optional['RunLogger']
+) -> None:
+    """Count a work-agent rerun and report what it cost."""
+    record_work_retry(follow_up, stats)
+    stats = stats or AgentStats()
+    message = (
+        f"Work agent attempt {attempt} on {item.id} ({'follow-up' if follow_up else 'new session'}): "
+        f"{stats.input_tokens:,} input tokens, {stats.premium_requests} turns, {stats.tool_calls} tool calls"
+    )
+    print(f"\n🔁 {message}")
+    if run_logger:
+        run_logger.log_orchestrator(message)
+
+
 def _setup_worktree(item: BeadsWorkItem) -> Optional[Path]:
     """Create worktree for work item processing."""
     print(f"\n🌳 Creating worktree for {item.id}...")
@@ -249,7 +323,7 @@ def _setup_worktree(item: BeadsWorkItem) -> Optional[Path]:
         return None
 
 
-def _run_cleanup_with_timeout(item: BeadsWorkItem, result: CopilotResult, repo_root: Path, start_time: float, timeout_seconds: float, timeout_hours: float, cwd: Optional[str] = None) -> tuple[bool, int]:
+def _run_cleanup_with_timeout(item: BeadsWorkItem, result: CopilotResult, repo_root: Path, start_time: float, timeout_seconds: float, timeout_hours: float, cwd: Optional[str] = None, item_logger: Optional['ItemLogger'] = None) -> tuple[bool, int]:
     """Run cleanup loop with timeout checking."""
     cleanup_agent_runs = 0
     cleanup_attempt = 0
@@ -263,7 +337,7 @@ def _run_cleanup_with_timeout(item: BeadsWorkItem, result: CopilotResult, repo_r
         
         cleanup_attempt += 1
         set_terminal_banner(format_work_item_banner(item.id, item.title, f"Cleanup #{cleanup_attempt}"))
-        cleanup_success, cleanup_runs = run_cleanup_loop(item, result, repo_root, cwd=cwd)
+        cleanup_success, cleanup_runs = run_cleanup_loop(item, result, repo_root, cwd=cwd, item_logger=item_logger)
         cleanup_agent_runs += cleanup_runs
         
         if not cleanup_success:
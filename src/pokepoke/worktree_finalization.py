@@ -8,7 +8,9 @@ from .types import BeadsWorkItem
 from .worktrees import merge_worktree, cleanup_worktree
 from .git_operations import check_main_repo_ready_for_merge, get_default_branch
 from .beads_hierarchy import get_parent_id, close_parent_if_complete
-from .beads_management import close_item, create_cleanup_delegation_issue
+from .beads_management import close_item
+from .beads_create import create_cleanup_delegation_issue
+from .merge_queue import serialized_merge
 
 
 def finalize_work_item(item: BeadsWorkItem, worktree_path: Path) -> bool:
@@ -20,8 +22,10 @@ def finalize_work_item(item: BeadsWorkItem, worktree_path: Path) -> bool:
     print("\n✅ Successfully completed work item!")
     print("   All changes committed and validated")
     
-    if not check_and_merge_worktree(item, worktree_path):
-        return False
+    # Merges touch the main repo - one worker at a time
+    with serialized_merge(item.id):
+        if not check_and_merge_worktree(item, worktree_path):
+            return False
     
     close_work_item_and_parents(item)
     
@@ -4,6 +4,8 @@ import subprocess
 from pathlib import Path
 from typing import Optional
 
+from pokepoke.beads_sync import sync_now
+from pokepoke.merge_queue import serialized_merge
 from pokepoke.git_operations import (
     sanitize_branch_name,
     get_default_branch,
@@ -24,7 +26,17 @@ from pokepoke.git_operations import (
 
 
 def create_worktree(item_id: str, base_branch: Optional[str] = None) -> Path:
-    """Create a git worktree for a work item. Returns existing path if already exists."""
+    """Create a git worktree for a work item. Returns existing path if already exists.
+    
+    Runs under the merge lock: ``git worktree add`` writes to the main
+    repository, and the Worktree Cleanup agent relies on no new worktree
+    appearing while it runs.
+    """
+    with serialized_merge(item_id):
+        return _create_worktree(item_id, base_branch)
+
+
+def _create_worktree(item_id: str, base_branch: Optional[str]) -> Path:
     # Sanitize the item_id for use in branch names
     sanitized_id = sanitize_branch_name(item_id)
     
@@ -107,11 +119,16 @@ def merge_worktree(item_id: str, target_branch: Optional[str] = None, cleanup: b
         - If failed due to conflicts: (False, list_of_conflicted_files)
         - If failed for other reasons: (False, [])
     """
+    # Maintenance agents merge too, not only finalize_work_item
+    with serialized_merge(item_id):
+        return _merge_worktree(item_id, target_branch, cleanup)
+
+
+def _merge_worktree(item_id: str, target_branch: Optional[str], cleanup: bool) -> tuple[bool, list[str]]:
     sanitized_id = sanitize_branch_name(item_id)
     branch_name = f"task/{sanitized_id}"
     worktree_path = Path("worktrees") / f"task-{sanitized_id}"
 
-
     if target_branch is None:
         target_branch = get_default_branch()
     
@@ -295,20 +312,18 @@ def _sync_and_ensure_clean_main_repo(branch_name: str) -> bool:
     """Sync beads and ensure main repo is clean before merge."""
     # CRITICAL: Sync beads before merge to avoid uncommitted .beads files blocking checkout
     print("🔄 Syncing beads database before merge...")
-    try:
-        bd_sync_result = subprocess.run(
-            ["bd", "sync"],
-            capture_output=True,
-            text=True,
-            encoding='utf-8',
-            timeout=30
-        )
-        if bd_sync_result.returncode != 0:
-            print(f"⚠️  bd sync returned non-zero: {bd_sync_result.returncode}")
-            print(f"   stdout: {bd_sync_result.stdout}")
-            print(f"   stderr: {bd_sync_result.stderr}")
-    except subprocess.TimeoutExpired:
-        print("⚠️  bd sync timed out")
+    # We hold the merge lock, which the background sync worker needs
+    bd_sync_result = sync_now()
+    if isinstance(bd_sync_result, subprocess.TimeoutExpired):
+        # The sync may still be writing .beads/ - checking out now is unsafe
+        print("❌ bd sync timed out - cannot merge until beads is synced")
+        return False
+    elif isinstance(bd_sync_result, BaseException):
+        print(f"⚠️  bd sync failed: {bd_sync_result}")
+    elif bd_sync_result.returncode != 0:
+        print(f"⚠️  bd sync returned non-zero: {bd_sync_result.returncode}")
+        print(f"   stdout: {bd_sync_result.stdout}")
+        print(f"   stderr: {bd_sync_result.stderr}")
 
     # Verify main repo is clean before checkout
     try:
@@ -1,6 +1,12 @@
 """Test configuration for PokePoke tests."""
+import functools
+import importlib
 import sys
 import os
+from types import ModuleType
+from typing import Iterator
+
+import pytest
 
 # Fix Windows encoding issues with emojis in test output
 # Set environment variable before any imports that might use stdout
@@ -8,3 +14,79 @@ if sys.platform == 'win32':
     # Set console code page to UTF-8 for Windows
     os.environ.setdefault('PYTHONIOENCODING', 'utf-8')
 
+
+def _both_imports(module: str) -> Iterator[ModuleType]:
+    """Yield ``pokepoke.<module>`` and ``src.pokepoke.<module>``, whichever import.
+
+    Tests import the package both ways, which gives two separate module
+    objects, each with its own module-level state to reset.
+    """
+    for prefix in ('pokepoke', 'src.pokepoke'):
+        try:
+            yield importlib.import_module(f'{prefix}.{module}')
+        except ImportError:
+            continue
+
+
+@pytest.fixture(autouse=True)
+def clear_beads_issue_cache():
+    """Keep cached bd lookups (and repo roots) from leaking between tests."""
+    modules = list(_both_imports('beads_query'))
+    for module in modules:
+        module.invalidate_issue_cache()
+        module._main_repo_roots.clear()
+    yield
+    for module in modules:
+        module.invalidate_issue_cache()
+        module._main_repo_roots.clear()
+
+
+@pytest.fixture(autouse=True)
+def in_memory_claim_registry():
+    """Keep tests from sharing claims through the real .pokepoke/claims.db."""
+    modules = list(_both_imports('claim_registry'))
+    for module in modules:
+        module._registry = module.ClaimRegistry()
+    yield
+    for module in modules:
+        module._registry = None
+
+
+@pytest.fixture(autouse=True)
+def fresh_copilot_pool():
+    """Give each test its own Copilot client pool so warm mock clients don't leak between tests."""
+    modules = list(_both_imports('copilot_pool'))
+    for module in modules:
+        module._pool = module.CopilotClientPool()
+    yield
+    for module in modules:
+        module._pool = None
+
+
+@pytest.fixture(autouse=True)
+def fresh_model_governor():
+    """Keep rate-limit cooldowns and in-flight counts from leaking between tests."""
+    modules = list(_both_imports('model_governor'))
+    for module in modules:
+        module._governor = None
+    yield
+    for module in modules:
+        module._governor = None
+
+
+@pytest.fixture
+def no_post_agent_commits(monkeypatch):
+    """Keep maintenance runs from committing this checkout's .beads/ changes."""
+    for module in _both_imports('maintenance'):
+        monkeypatch.setattr(module, '_commit_beads_changes', lambda repo_root, name: None)
+
+
+@pytest.fixture
+def run_artifacts_in_tmp_path(tmp_path, monkeypatch, no_post_agent_commits):
+    """Write run logs and the maintenance counter under tmp_path, not the repo."""
+    for module in _both_imports('maintenance_state'):
+        monkeypatch.setattr(module, 'STATE_FILE', tmp_path / 'maintenance_state.json')
+    for module in _both_imports('orchestrator'):
+        monkeypatch.setattr(
+            module, 'RunLogger', functools.partial(module.RunLogger, base_dir=str(tmp_path / 'logs'))
+        )
@@ -121,7 +121,7 @@ class TestRunGateAgent:
     ) -> None:
         """Test successful gate agent verification with JSON output."""
         mock_service = Mock()
-        mock_service.load_and_render.return_value = "Gate prompt"
+        mock_service.render_with_item.return_value = "Gate prompt"
         mock_service_cls.return_value = mock_service
         
         mock_invoke.return_value = CopilotResult(
@@ -140,7 +140,7 @@ class TestRunGateAgent:
         assert success is True
         assert "All tests pass" in reason
         assert stats is not None
-        mock_invoke.assert_called_once_with(work_item, prompt="Gate prompt", deny_write=True, cwd=None)
+        mock_invoke.assert_called_once_with(work_item, prompt="Gate prompt", deny_write=True, cwd=None, item_logger=None)
     
     @patch('pokepoke.agent_runner.parse_agent_stats')
     @patch('pokepoke.agent_runner.invoke_copilot')
@@ -233,7 +233,7 @@ class TestRunGateAgent:
     ) -> None:
         """Test gate agent when prompt rendering fails."""
         mock_service = Mock()
-        mock_service.load_and_render.side_effect = Exception("Template not found")
+        mock_service.render_with_item.side_effect = Exception("Template not found")
         mock_service_cls.return_value = mock_service
         
         success, reason, stats = run_gate_agent(work_item)
@@ -267,6 +267,31 @@ class TestRunGateAgent:
         assert success is False
         assert "did not explicitly approve" in reason
 
+    @patch('pokepoke.agent_runner.invoke_copilot')
+    @patch('pokepoke.agent_runner.PromptService')
+    def test_verdict_in_final_message_beyond_output_tail(
+        self,
+        mock_service_cls: Mock,
+        mock_invoke: Mock,
+        work_item: BeadsWorkItem
+    ) -> None:
+        """The verdict is found even when it fell out of the output tail."""
+        mock_service_cls.return_value.render_with_item.return_value = "Gate prompt"
+        stats = AgentStats(input_tokens=10)
+        mock_invoke.return_value = CopilotResult(
+            work_item_id="test-123",
+            success=True,
+            output="[... 90,000 earlier characters omitted]\n...end of a long report",
+            final_message='Report\n```json\n{"status": "success", "message": "Verified"}\n```\n...end of a long report',
+            stats=stats,
+        )
+
+        success, reason, result_stats = run_gate_agent(work_item)
+
+        assert success is True
+        assert reason == "Verified"
+        assert result_stats is stats
+
 
 
 
@@ -409,7 +434,8 @@ class TestRunBeadsOnlyAgent:
             prompt="Test prompt", 
             deny_write=True,
             model=None,
-            cwd=None
+            cwd=None,
+            item_logger=None
         )
     
     @patch('pokepoke.agent_runner.invoke_copilot')
@@ -437,6 +463,28 @@ class TestRunBeadsOnlyAgent:
         
         assert stats is None
 
+    @patch('pokepoke.agent_runner.invoke_copilot')
+    def test_uses_sdk_stats_when_output_has_none(self, mock_invoke: Mock) -> None:
+        """Stats the SDK reported are kept even if the output has no stats text."""
+        agent_item = BeadsWorkItem(
+            id="maintenance-test",
+            title="Test Maintenance",
+            status="in_progress",
+            priority=0,
+            issue_type="task"
+        )
+        sdk_stats = AgentStats(input_tokens=100, output_tokens=50, premium_requests=1)
+        mock_invoke.return_value = CopilotResult(
+            work_item_id="maintenance-test",
+            success=True,
+            output="Done",
+            stats=sdk_stats
+        )
+
+        stats = _run_beads_only_agent("Test", agent_item, "Test prompt")
+
+        assert stats is sdk_stats
+
 
 class TestRunWorktreeAgent:
     """Test _run_worktree_agent function."""
@@ -507,6 +555,61 @@ class TestRunWorktreeAgent:
         mock_merge.assert_called_once_with("maintenance-test", cleanup=True)
         mock_cleanup.assert_not_called()
     
+    @patch('pokepoke.git_operations.check_main_repo_ready_for_merge')
+    @patch('pokepoke.agent_runner.cleanup_worktree')
+    @patch('pokepoke.agent_runner.merge_worktree')
+    @patch('pokepoke.agent_runner.run_cleanup_loop')
+    @patch('os.chdir')
+    @patch('os.getcwd')
+    @patch('pokepoke.agent_runner.invoke_copilot')
+    @patch('pokepoke.agent_runner.create_worktree')
+    @pytest.mark.parametrize("merge_changes", [True, False])
+    def test_uses_sdk_stats_when_output_has_none(
+        self,
+        mock_create: Mock,
+        mock_invoke: Mock,
+        mock_getcwd: Mock,
+        mock_chdir: Mock,
+        mock_cleanup_loop: Mock,
+        mock_merge: Mock,
+        mock_cleanup: Mock,
+        mock_check_ready: Mock,
+        merge_changes: bool
+    ) -> None:
+        """Stats the SDK reported are kept whether or not the worktree is merged."""
+        agent_item = BeadsWorkItem(
+            id="maintenance-test",
+            title="Test Maintenance",
+            status="in_progress",
+            priority=0,
+            issue_type="task"
+        )
+        sdk_stats = AgentStats(input_tokens=100, output_tokens=50, premium_requests=1)
+        mock_create.return_value = Path("/fake/worktree")
+        mock_getcwd.return_value = "/original"
+        mock_invoke.return_value = CopilotResult(
+            work_item_id="maintenance-test",
+            success=True,
+            output="Done",
+            stats=sdk_stats
+        )
+        mock_cleanup_loop.return_value = (True, 0)
+        mock_check_ready.return_value = (True, "")
+        mock_merge.return_value = (True, [])
+
+        stats = _run_worktree_agent(
+            "Test",
+            "maintenance-test",
+            agent_item,
+            "Test prompt",
+            Path("/fake/repo"),
+            merge_changes=merge_changes
+        )
+
+        assert stats is not None
+        assert stats.input_tokens == 100
+        assert stats.premium_requests == 1
+
     @patch('pokepoke.agent_runner.create_worktree')
     def test_worktree_creation_failure(self, mock_create: Mock) -> None:
         """Test worktree agent when worktree creation fails."""
@@ -1170,7 +1273,7 @@ class TestRunMainRepoAgent:
         assert stats.wall_duration == 15.0
         # Verify deny_write=False (write access enabled)
         mock_invoke.assert_called_once_with(
-            agent_item, prompt="cleanup prompt", deny_write=False, model=None, cwd=None
+            agent_item, prompt="cleanup prompt", deny_write=False, model=None, cwd=None, item_logger=None
         )
 
     @patch('pokepoke.agent_runner.invoke_copilot')
@@ -1325,6 +1428,30 @@ class TestRunWorktreeCleanup:
         stats = run_worktree_cleanup()
         assert stats is None
 
+    @patch('pokepoke.agent_runner._run_main_repo_agent')
+    @patch('pokepoke.agent_runner.get_pokepoke_prompts_dir')
+    def test_worktree_cleanup_told_to_keep_live_worktrees(
+        self,
+        mock_get_prompts: Mock,
+        mock_main_repo_agent: Mock
+    ) -> None:
+        """Worktrees of items being worked on are listed as off limits."""
+        mock_dir = MagicMock()
+        mock_get_prompts.return_value = mock_dir
+        mock_file = Mock()
+        mock_file.exists.return_value = True
+        mock_file.read_text.return_value = "prompt"
+        mock_dir.__truediv__.return_value = mock_file
+        mock_main_repo_agent.return_value = None
+
+        from pokepoke.agent_runner import run_worktree_cleanup
+        run_worktree_cleanup(keep_item_ids={"task-2", "task-1"})
+
+        prompt = mock_main_repo_agent.call_args[0][2]
+        assert prompt.startswith("prompt")
+        assert "Do NOT Touch" in prompt
+        assert prompt.index("worktrees/task-task-1") < prompt.index("worktrees/task-task-2")
+
     @patch('pokepoke.agent_runner.get_pokepoke_prompts_dir')
     def test_worktree_cleanup_prompt_missing(
         self,
@@ -0,0 +1,116 @@
+"""Tests for latency histograms and agent timing roll-ups."""
+
+import json
+
+from pokepoke.agent_timing import (
+    histogram_count,
+    histogram_percentile,
+    item_latency_record,
+    latency_summary,
+    merge_agent_stats,
+    merge_histogram,
+    record_latency,
+)
+from pokepoke.maintenance import record_item_result
+from pokepoke.stats import print_stats, serialize_session_stats
+from pokepoke.types import AgentStats, LatencyHistogram, ModelCompletionRecord, SessionStats
+
+
+def _histogram(*samples: float) -> LatencyHistogram:
+    histogram = LatencyHistogram()
+    for seconds in samples:
+        record_latency(histogram, seconds)
+    return histogram
+
+
+class TestHistogram:
+    """Test recording, merging and reading histograms."""
+
+    def test_records_into_buckets(self) -> None:
+        histogram = _histogram(0.2, 0.5, 3.0, 1000.0)
+
+        assert histogram.counts[0] == 2
+        assert histogram.counts[3] == 1
+        assert histogram.counts[-1] == 1
+        assert histogram.total_seconds == 1003.7
+        assert histogram.max_seconds == 1000.0
+
+    def test_percentiles_are_bucket_bounds_capped_at_max(self) -> None:
+        histogram = _histogram(*[0.3] * 8, 4.0, 7.0)
+
+        assert histogram_percentile(histogram, 50) == 0.5
+        assert histogram_percentile(histogram, 90) == 5.0
+        assert histogram_percentile(histogram, 100) == 7.0
+        assert histogram_percentile(LatencyHistogram(), 50) == 0.0
+
+    def test_merge_adds_counts(self) -> None:
+        target = _histogram(1.0)
+        merge_histogram(target, _histogram(1.0, 400.0))
+
+        assert histogram_count(target) == 3
+        assert target.max_seconds == 400.0
+
+
+class TestMergeAgentStats:
+    """merge_agent_stats adds every field, histograms included."""
+
+    def test_merges_timings(self) -> None:
+        target = AgentStats(wall_duration=10.0, tool_latency={"bash": _histogram(2.0)})
+        source = AgentStats(
+            wall_duration=5.0, api_duration=3.0, tool_duration=2.0, idle_wait_duration=1.0, retries=1,
+            turn_latency=_histogram(3.0), tool_latency={"bash": _histogram(1.0), "view": _histogram(0.1)},
+        )
+
+        merge_agent_stats(target, source)
+
+        assert target.wall_duration == 15.0
+        assert target.api_duration == 3.0
+        assert target.tool_duration == 2.0
+        assert target.idle_wait_duration == 1.0
+        assert target.retries == 1
+        assert histogram_count(target.turn_latency) == 1
+        assert histogram_count(target.tool_latency["bash"]) == 2
+        assert "view" in target.tool_latency
+
+
+class TestItemLatency:
+    """Per-item breakdowns reach stats.json and the printed summary."""
+
+    def _item_stats(self) -> AgentStats:
+        return AgentStats(
+            wall_duration=900.0, api_duration=600.0, tool_duration=250.0, idle_wait_duration=4.0,
+            first_token_latency=_histogram(1.5),
+            turn_latency=_histogram(8.0, 20.0, 25.0),
+            tool_latency={"bash": _histogram(200.0), "view": _histogram(50.0)},
+        )
+
+    def test_record(self) -> None:
+        record = item_latency_record("task-1", 1200.0, self._item_stats())
+
+        assert record.total == 1200.0
+        assert record.model == 600.0
+        assert record.turns == 3
+        assert record.turn_p50 == 25.0
+        assert record.first_token_p50 == 1.5
+        assert list(record.slowest_tools) == ["bash", "view"]
+
+    def test_recorded_per_item_and_serialized(self) -> None:
+        session = SessionStats(agent_stats=AgentStats())
+        completion = ModelCompletionRecord(item_id="task-1", model="m", duration_seconds=1200.0)
+
+        record_item_result(session, 1, self._item_stats(), 0, 1, completion)
+        data = json.loads(json.dumps(serialize_session_stats(session, 1200.0, 1, 1)))
+
+        assert data["item_latencies"][0]["item_id"] == "task-1"
+        assert data["item_latencies"][0]["tools"] == 250.0
+        assert data["agent_stats"]["turn_latency"]["max_seconds"] == 25.0
+
+    def test_printed_with_agent_usage(self, capsys) -> None:
+        session = SessionStats(agent_stats=self._item_stats())
+
+        print_stats(1, 1, 1200.0, session)
+
+        output = capsys.readouterr().out
+        assert "Model per turn" in output
+        assert "bash 200s" in output
+        assert latency_summary(AgentStats()) == []
@@ -0,0 +1,125 @@
+"""Unit tests for the shared asyncio runtime."""
+
+import asyncio
+import threading
+
+import pytest
+
+from pokepoke.async_runtime import AsyncRuntime, get_runtime, run_coroutine, stop_runtime
+
+
+@pytest.fixture
+def runtime():
+    rt = AsyncRuntime(name="test-async")
+    yield rt
+    rt.stop()
+
+
+class TestAsyncRuntime:
+    """Test running coroutines on the long-lived loop."""
+
+    def test_runs_coroutine_and_returns_result(self, runtime: AsyncRuntime) -> None:
+        async def add(a: int, b: int) -> int:
+            await asyncio.sleep(0)
+            return a + b
+
+        assert runtime.run(add(1, 2)) == 3
+
+    def test_loop_is_reused(self, runtime: AsyncRuntime) -> None:
+        async def current_loop() -> asyncio.AbstractEventLoop:
+            return asyncio.get_running_loop()
+
+        first = runtime.run(current_loop())
+        second = runtime.run(current_loop())
+
+        assert first is second
+        assert runtime.running
+
+    def test_exceptions_propagate(self, runtime: AsyncRuntime) -> None:
+        async def fail() -> None:
+            raise ValueError("boom")
+
+        with pytest.raises(ValueError, match="boom"):
+            runtime.run(fail())
+
+    def test_callers_on_several_threads_share_the_loop(self, runtime: AsyncRuntime) -> None:
+        """Blocking callers overlap: their coroutines interleave on one loop."""
+        active = 0
+        peak = 0
+        loops = set()
+
+        async def agent() -> None:
+            nonlocal active, peak
+            loops.add(id(asyncio.get_running_loop()))
+            active += 1
+            peak = max(peak, active)
+            await asyncio.sleep(0.05)
+            active -= 1
+
+        threads = [threading.Thread(target=runtime.run, args=(agent(),)) for _ in range(4)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+
+        assert len(loops) == 1
+        assert peak == 4
+
+    def test_timeout_cancels_coroutine(self, runtime: AsyncRuntime) -> None:
+        cancelled = threading.Event()
+
+        async def slow() -> None:
+            try:
+                await asyncio.sleep(10)
+            except asyncio.CancelledError:
+                cancelled.set()
+                raise
+
+        with pytest.raises(TimeoutError):
+            runtime.run(slow(), timeout=0.1)
+        assert cancelled.wait(2)
+
+    def test_run_from_loop_thread_is_rejected(self, runtime: AsyncRuntime) -> None:
+        async def noop() -> None:
+            pass
+
+        async def nested() -> None:
+            runtime.run(noop())
+
+        with pytest.raises(RuntimeError, match="event loop thread"):
+            runtime.run(nested())
+
+    def test_stop_cancels_pending_and_restarts_on_use(self, runtime: AsyncRuntime) -> None:
+        cancelled = threading.Event()
+
+        async def forever() -> None:
+            try:
+                await asyncio.sleep(60)
+            except asyncio.CancelledError:
+                cancelled.set()
+                raise
+
+        runtime.submit(forever())
+        runtime.stop()
+
+        assert cancelled.is_set()
+        assert not runtime.running
+
+        async def answer() -> int:
+            return 42
+
+        assert runtime.run(answer()) == 42
+
+
+class TestSharedRuntime:
+    """Test the process-wide accessor."""
+
+    def test_run_coroutine_uses_shared_runtime(self) -> None:
+        async def answer() -> int:
+            return 7
+
+        try:
+            assert run_coroutine(answer()) == 7
+            assert get_runtime() is get_runtime()
+        finally:
+            stop_runtime()
@@ -1,6 +1,7 @@
 """Unit tests for beads integration."""
 
 import subprocess
+from typing import Optional
 from unittest.mock import Mock, patch
 import json
 import pytest
@@ -125,7 +126,17 @@ class TestBeadsIntegration:
         
         # Should return None when issue not found
         assert result is None
-    
+
+    @patch('src.pokepoke.beads_query.subprocess.run')
+    def test_get_issue_dependencies_timeout(self, mock_run: Mock) -> None:
+        """A hung bd show is killed after the command timeout and treated as not found."""
+        from src.pokepoke.config import get_config
+
+        mock_run.side_effect = subprocess.TimeoutExpired(['bd', 'show'], 30)
+
+        assert get_issue_dependencies("task-1") is None
+        assert mock_run.call_args[1]['timeout'] == get_config().beads.command_timeout
+
     @patch('src.pokepoke.beads_query.subprocess.run')
     def test_get_issue_dependencies_empty_result(self, mock_run: Mock) -> None:
         """Test getting dependencies when issue returns empty array."""
@@ -154,8 +165,8 @@ class TestBeadsIntegration:
 class TestFilterWorkItems:
     """Test work item filtering functions."""
     
-    @patch('src.pokepoke.beads_management.has_feature_parent')
-    def test_filter_work_items_excludes_epics(self, mock_has_feature_parent: Mock) -> None:
+    @patch('src.pokepoke.beads_management.get_feature_parent_ids')
+    def test_filter_work_items_excludes_epics(self, mock_feature_parents: Mock) -> None:
         """Test that epics are excluded from filtered items."""
         from src.pokepoke.beads import filter_work_items
         from src.pokepoke.types import IssueWithDependencies, Dependency
@@ -178,15 +189,15 @@ class TestFilterWorkItems:
                 issue_type="task"
             )
         ]
-        mock_has_feature_parent.return_value = False
+        mock_feature_parents.return_value = set()
         
         filtered = filter_work_items(items)
         
         assert len(filtered) == 1
         assert filtered[0].id == "task-1"
     
-    @patch('src.pokepoke.beads_management.has_feature_parent')
-    def test_filter_work_items_includes_features(self, mock_has_feature_parent: Mock) -> None:
+    @patch('src.pokepoke.beads_management.get_feature_parent_ids')
+    def test_filter_work_items_includes_features(self, mock_feature_parents: Mock) -> None:
         """Test that features are included in filtered items."""
         from src.pokepoke.beads import filter_work_items
         
@@ -206,10 +217,10 @@ class TestFilterWorkItems:
         assert len(filtered) == 1
         assert filtered[0].id == "feature-1"
     
-    @patch('src.pokepoke.beads_management.has_feature_parent')
+    @patch('src.pokepoke.beads_management.get_feature_parent_ids')
     def test_filter_work_items_excludes_tasks_with_feature_parent(
         self, 
-        mock_has_feature_parent: Mock
+        mock_feature_parents: Mock
     ) -> None:
         """Test that tasks with feature parents are excluded."""
         from src.pokepoke.beads import filter_work_items
@@ -224,16 +235,16 @@ class TestFilterWorkItems:
                 issue_type="task"
             )
         ]
-        mock_has_feature_parent.return_value = True
+        mock_feature_parents.return_value = {"task-1"}
         
         filtered = filter_work_items(items)
         
         assert len(filtered) == 0
     
-    @patch('src.pokepoke.beads_management.has_feature_parent')
+    @patch('src.pokepoke.beads_management.get_feature_parent_ids')
     def test_filter_work_items_includes_standalone_tasks(
         self, 
-        mock_has_feature_parent: Mock
+        mock_feature_parents: Mock
     ) -> None:
         """Test that standalone tasks are included."""
         from src.pokepoke.beads import filter_work_items
@@ -248,13 +259,74 @@ class TestFilterWorkItems:
                 issue_type="task"
             )
         ]
-        mock_has_feature_parent.return_value = False
+        mock_feature_parents.return_value = set()
         
         filtered = filter_work_items(items)
         
         assert len(filtered) == 1
         assert filtered[0].id == "task-1"
     
+    def test_filter_work_items_graph_matches_bulk_path(self) -> None:
+        """The snapshot path gives the same result as batched bd show."""
+        from src.pokepoke.beads import filter_work_items
+        from src.pokepoke.beads_graph import BeadsGraph
+        from src.pokepoke.types import IssueWithDependencies, Dependency
+        
+        def dep(parent: str, issue_type: str) -> Dependency:
+            return Dependency(id=parent, title=parent, issue_type=issue_type,
+                              dependency_type="parent", status="open", priority=1)
+        
+        items = [
+            BeadsWorkItem(id=f"task-{i}", title="T", description="", status="open",
+                          priority=1, issue_type="task")
+            for i in range(4)
+        ] + [BeadsWorkItem(id="epic-9", title="E", description="", status="open",
+                           priority=1, issue_type="epic")]
+        parents = {"task-0": ("feat-1", "feature"), "task-1": ("epic-1", "epic"), "task-3": ("feat-1", "feature")}
+        show_results = {
+            item.id: IssueWithDependencies(
+                id=item.id, title="T", description="", status="open", priority=1, issue_type="task",
+                dependencies=[dep(*parents[item.id])] if item.id in parents else None
+            )
+            for item in items[:4]
+        }
+        graph = BeadsGraph.from_records(
+            [{"id": "feat-1", "title": "F", "status": "open", "priority": 1, "issue_type": "feature"},
+             {"id": "epic-1", "title": "E", "status": "open", "priority": 1, "issue_type": "epic"}]
+            + [{"id": i, "title": "T", "status": "open", "priority": 1, "issue_type": "task",
+                "dependencies": [{"depends_on_id": parents[i][0], "type": "parent"}] if i in parents else []}
+               for i in show_results]
+        )
+        
+        with patch('src.pokepoke.beads_hierarchy.get_issues_bulk', return_value=show_results) as mock_bulk:
+            bulk_ids = [i.id for i in filter_work_items(items)]
+            graph_ids = [i.id for i in filter_work_items(items, graph=graph)]
+        
+        assert bulk_ids == graph_ids == ["task-1", "task-2"]
+        mock_bulk.assert_called_once()
+    
+    @patch('src.pokepoke.beads_graph.load_beads_graph')
+    @patch('src.pokepoke.beads_query.get_ready_work_items')
+    @patch('src.pokepoke.beads_management.get_feature_parent_ids')
+    def test_get_first_ready_work_item_loads_graph_once(
+        self, mock_feature_parents: Mock, mock_ready: Mock, mock_load: Mock
+    ) -> None:
+        """The whole ready list is filtered against one snapshot."""
+        from src.pokepoke.beads import get_first_ready_work_item
+        
+        mock_ready.return_value = [
+            BeadsWorkItem(id=f"task-{i}", title="T", description="", status="open",
+                          priority=1, issue_type="task")
+            for i in range(3)
+        ]
+        mock_feature_parents.return_value = {"task-0"}
+        
+        item = get_first_ready_work_item()
+        
+        assert item is not None and item.id == "task-1"
+        mock_load.assert_called_once_with()
+        assert mock_feature_parents.call_args.kwargs["graph"] is mock_load.return_value
+    
     @patch('src.pokepoke.beads_hierarchy.get_issue_dependencies')
     def test_has_feature_parent_true(self, mock_get_issue: Mock) -> None:
         """Test has_feature_parent returns True when parent is feature."""
@@ -284,6 +356,24 @@ class TestFilterWorkItems:
         
         assert result is True
     
+    @patch('src.pokepoke.beads_hierarchy.get_issue_dependencies')
+    def test_parent_child_edge_on_bd_show_path(self, mock_get_issue: Mock) -> None:
+        """Newer bd's 'parent-child' edges count as parents without the snapshot too."""
+        from src.pokepoke.beads import has_feature_parent
+        from src.pokepoke.beads_hierarchy import get_parent_id
+        from src.pokepoke.types import IssueWithDependencies, Dependency
+        
+        mock_get_issue.return_value = IssueWithDependencies(
+            id="task-1", title="Task", description="", status="open", priority=1, issue_type="task",
+            dependencies=[Dependency(
+                id="feature-1", title="Feature", issue_type="feature",
+                dependency_type="parent-child", status="open", priority=1,
+            )],
+        )
+        
+        assert has_feature_parent("task-1") is True
+        assert get_parent_id("task-1") == "feature-1"
+    
     @patch('src.pokepoke.beads_hierarchy.get_issue_dependencies')
     def test_has_feature_parent_false_no_dependencies(self, mock_get_issue: Mock) -> None:
         """Test has_feature_parent returns False when no dependencies."""
@@ -372,6 +462,32 @@ class TestAssignAndSyncItem:
         assert result is True
         assert mock_run.call_count == 3
     
+    @pytest.mark.parametrize("outcome, message", [
+        (None, "stays queued"),
+        ("lock busy", "will be retried"),
+    ])
+    @patch('src.pokepoke.beads_management.await_sync')
+    @patch('src.pokepoke.beads_management.request_sync')
+    @patch('src.pokepoke.beads_management.subprocess.run')
+    def test_claim_stands_when_sync_does_not_finish(
+        self, mock_run: Mock, mock_request: Mock, mock_await: Mock,
+        outcome: Optional[str], message: str, capsys: pytest.CaptureFixture[str]
+    ) -> None:
+        """A sync that times out or is put off leaves the claim in place."""
+        from src.pokepoke.beads import assign_and_sync_item
+        from src.pokepoke.beads_sync import SyncLockBusy
+
+        mock_run.side_effect = [
+            Mock(stdout=json.dumps([{"id": "task-1", "status": "open"}]), returncode=0),
+            Mock(returncode=0),
+        ]
+        mock_await.return_value = SyncLockBusy() if outcome else None
+
+        assert assign_and_sync_item("task-1", "test-agent") is True
+        # Only bd show and the claim itself: nothing is rolled back
+        assert mock_run.call_count == 2
+        assert message in capsys.readouterr().out
+
     @patch('src.pokepoke.beads_management.subprocess.run')
     @patch('src.pokepoke.beads_management.os.environ.get')
     def test_assign_detects_race_condition(self, mock_env: Mock, mock_run: Mock) -> None:
@@ -0,0 +1,181 @@
+"""Unit tests for the mtime-keyed beads lookup cache."""
+
+import json
+import threading
+from pathlib import Path
+from unittest.mock import Mock, patch
+
+import pytest
+
+from pokepoke.beads_query import (
+    get_issue_dependencies,
+    get_issues_bulk,
+    get_issue_cache_stats,
+    invalidate_issue_cache,
+)
+from pokepoke.beads_management import close_item
+from pokepoke.stats import serialize_session_stats
+from pokepoke.types import AgentStats, SessionStats
+
+
+def _show(issue_id: str, deps=None) -> str:
+    return json.dumps([{
+        "id": issue_id, "title": issue_id, "status": "open", "priority": 1,
+        "issue_type": "task", "dependencies": deps or [],
+    }])
+
+
+@pytest.fixture
+def beads_repo(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> Path:
+    """A working directory with a .beads database to key the cache on."""
+    beads_dir = tmp_path / ".beads"
+    beads_dir.mkdir()
+    (beads_dir / "issues.jsonl").write_text("{}\n")
+    (beads_dir / "beads.db").write_bytes(b"db")
+    monkeypatch.chdir(tmp_path)
+    stats = get_issue_cache_stats()
+    stats.hits = stats.misses = stats.invalidations = 0
+    return beads_dir
+
+
+class TestIssueCache:
+    """Test read-through caching of bd show."""
+
+    @patch('pokepoke.beads_query.subprocess.run')
+    def test_repeat_lookup_hits_cache(self, mock_run: Mock, beads_repo: Path) -> None:
+        """The second lookup of the same id does not spawn bd."""
+        mock_run.return_value = Mock(stdout=_show("task-1"), returncode=0)
+
+        first = get_issue_dependencies("task-1")
+        second = get_issue_dependencies("task-1")
+
+        assert first is not None and second is first
+        mock_run.assert_called_once()
+        stats = get_issue_cache_stats()
+        assert (stats.hits, stats.misses) == (1, 1)
+
+    @patch('pokepoke.beads_query.subprocess.run')
+    def test_database_change_drops_entries(self, mock_run: Mock, beads_repo: Path) -> None:
+        """Touching the JSONL export invalidates everything."""
+        mock_run.return_value = Mock(stdout=_show("task-1"), returncode=0)
+        get_issue_dependencies("task-1")
+
+        with open(beads_repo / "issues.jsonl", "a") as f:
+            f.write("{}\n")
+        get_issue_dependencies("task-1")
+
+        assert mock_run.call_count == 2
+        assert get_issue_cache_stats().invalidations == 1
+
+    @patch('pokepoke.beads_query.subprocess.run')
+    def test_wal_change_drops_entries(self, mock_run: Mock, beads_repo: Path) -> None:
+        """Writes that only reach the SQLite WAL are noticed too."""
+        mock_run.return_value = Mock(stdout=_show("task-1"), returncode=0)
+        get_issue_dependencies("task-1")
+
+        (beads_repo / "beads.db-wal").write_bytes(b"wal")
+        get_issue_dependencies("task-1")
+
+        assert mock_run.call_count == 2
+
+    @patch('pokepoke.beads_query.subprocess.run')
+    def test_own_close_invalidates(self, mock_run: Mock, beads_repo: Path) -> None:
+        """Closing an issue drops it and issues that reference it."""
+        blocker_dep = [{"id": "task-1", "title": "t", "issue_type": "task",
+                        "dependency_type": "blocks", "status": "open", "priority": 1}]
+        mock_run.side_effect = [
+            Mock(stdout=_show("task-1"), returncode=0),
+            Mock(stdout=_show("task-2", blocker_dep), returncode=0),
+            Mock(stdout="", returncode=0),  # bd close
+            Mock(stdout=_show("task-1"), returncode=0),
+            Mock(stdout=_show("task-2", blocker_dep), returncode=0),
+        ]
+        get_issue_dependencies("task-1")
+        get_issue_dependencies("task-2")
+
+        assert close_item("task-1") is True
+        get_issue_dependencies("task-1")
+        get_issue_dependencies("task-2")
+
+        assert mock_run.call_count == 5
+
+    @patch('pokepoke.beads_query.subprocess.run')
+    def test_bulk_only_fetches_misses(self, mock_run: Mock, beads_repo: Path) -> None:
+        """Cached ids are left out of the batched bd show."""
+        mock_run.side_effect = [
+            Mock(stdout=_show("task-1"), returncode=0),
+            Mock(stdout=_show("task-2"), returncode=0),
+        ]
+        get_issue_dependencies("task-1")
+
+        issues = get_issues_bulk(["task-1", "task-2"])
+
+        assert set(issues) == {"task-1", "task-2"}
+        assert mock_run.call_args[0][0] == ['bd', 'show', 'task-2', '--json']
+
+    @patch('pokepoke.beads_query.subprocess.run')
+    def test_no_database_no_caching(self, mock_run: Mock, tmp_path: Path,
+                                    monkeypatch: pytest.MonkeyPatch) -> None:
+        """Without database files to key on, every lookup goes to bd."""
+        monkeypatch.chdir(tmp_path)
+        with patch('pokepoke.beads_jsonl.Path.cwd', return_value=tmp_path):
+            mock_run.return_value = Mock(stdout=_show("task-1"), returncode=0)
+            get_issue_dependencies("task-1")
+            get_issue_dependencies("task-1")
+
+        assert mock_run.call_count == 2
+
+    @patch('pokepoke.beads_query.subprocess.run')
+    def test_explicit_clear(self, mock_run: Mock, beads_repo: Path) -> None:
+        mock_run.return_value = Mock(stdout=_show("task-1"), returncode=0)
+        get_issue_dependencies("task-1")
+
+        invalidate_issue_cache()
+        get_issue_dependencies("task-1")
+
+        assert mock_run.call_count == 2
+
+    def test_concurrent_put_and_invalidate(self) -> None:
+        """Threads adding and invalidating entries don't trip over each other."""
+        from pokepoke.beads_query import _IssueCache
+        from pokepoke.types import IssueWithDependencies
+
+        cache = _IssueCache()
+        cache._signature = ((1, 1),)
+        errors = []
+
+        def writer(base: int) -> None:
+            try:
+                for n in range(500):
+                    cache.put(IssueWithDependencies(f"t-{base}-{n}", "t", "open", 1, "task"))
+            except Exception as e:  # pragma: no cover - only on a race
+                errors.append(e)
+
+        def invalidator() -> None:
+            try:
+                for n in range(500):
+                    cache.invalidate(f"t-0-{n}")
+            except Exception as e:  # pragma: no cover - only on a race
+                errors.append(e)
+
+        threads = [threading.Thread(target=writer, args=(i,)) for i in range(3)]
+        threads.append(threading.Thread(target=invalidator))
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert errors == []
+
+
+class TestCacheStatsReporting:
+    """Test the counters reach the session stats."""
+
+    def test_serialized(self) -> None:
+        session = SessionStats(agent_stats=AgentStats())
+        session.beads_cache.hits = 3
+        session.beads_cache.misses = 1
+
+        data = serialize_session_stats(session, 1.0, 0, 0)
+
+        assert data["beads_cache"] == {"hits": 3, "misses": 1, "invalidations": 0}
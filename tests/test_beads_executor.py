@@ -0,0 +1,129 @@
+"""Unit tests for the async bd executor."""
+
+import subprocess
+import sys
+import time
+from unittest.mock import patch
+
+import pytest
+
+from pokepoke.beads_executor import BeadsCommandCancelled, BeadsExecutor, get_beads_executor
+from pokepoke.config import ProjectConfig
+
+
+def _py(code: str) -> list:
+    """A command that runs a snippet in a fresh interpreter."""
+    return [sys.executable, "-c", code]
+
+
+class TestBeadsExecutor:
+    """Test concurrent execution, timeouts and cancellation."""
+
+    def test_runs_commands_concurrently(self) -> None:
+        """Independent commands overlap instead of running back to back."""
+        executor = BeadsExecutor(max_concurrency=4, timeout=10)
+        commands = [_py("import time; time.sleep(0.5); print('ok')") for _ in range(4)]
+
+        start = time.monotonic()
+        outcomes = executor.run_many(commands)
+        elapsed = time.monotonic() - start
+
+        assert [o.stdout.strip() for o in outcomes] == ["ok"] * 4
+        assert elapsed < 1.8
+
+    def test_concurrency_is_bounded(self) -> None:
+        """No more than max_concurrency commands run at once."""
+        executor = BeadsExecutor(max_concurrency=1, timeout=10)
+        commands = [_py("import time; time.sleep(0.3)") for _ in range(3)]
+
+        start = time.monotonic()
+        executor.run_many(commands)
+
+        assert time.monotonic() - start >= 0.9
+
+    def test_errors_returned_per_command(self) -> None:
+        """A failing command doesn't hide the others' results."""
+        executor = BeadsExecutor(timeout=10)
+
+        outcomes = executor.run_many([
+            _py("import sys; sys.exit(3)"),
+            _py("print('fine')"),
+        ])
+
+        assert isinstance(outcomes[0], subprocess.CalledProcessError)
+        assert outcomes[0].returncode == 3
+        assert outcomes[1].stdout.strip() == "fine"
+
+    def test_timeout_kills_command(self) -> None:
+        executor = BeadsExecutor(timeout=0.3)
+
+        outcomes = executor.run_many([_py("import time; time.sleep(5)"), _py("pass")])
+
+        assert isinstance(outcomes[0], subprocess.TimeoutExpired)
+        assert outcomes[1].returncode == 0
+
+    def test_shutdown_cancels_commands(self) -> None:
+        """Nothing new starts (and running calls stop) once shutdown is requested."""
+        executor = BeadsExecutor(timeout=10)
+
+        with patch('pokepoke.beads_executor.is_shutting_down', return_value=True):
+            outcomes = executor.run_many([_py("pass"), _py("pass")])
+            single = executor.run_many([_py("pass")])
+
+        assert all(isinstance(o, BeadsCommandCancelled) for o in outcomes + single)
+
+    def test_single_command_runs_blocking(self) -> None:
+        """One command skips the event loop and uses subprocess.run."""
+        with patch('subprocess.run') as mock_run:
+            BeadsExecutor(timeout=7).run_many([['bd', 'stats', '--json']], cwd="/repo")
+
+        mock_run.assert_called_once()
+        assert mock_run.call_args.kwargs["cwd"] == "/repo"
+        assert mock_run.call_args.kwargs["timeout"] == 7
+
+    def test_settings_from_config(self) -> None:
+        config = ProjectConfig.from_dict({"beads": {"max_concurrency": 2, "command_timeout": 5}})
+        with patch('pokepoke.beads_executor.get_config', return_value=config):
+            executor = get_beads_executor()
+
+        assert executor.max_concurrency == 2
+        assert executor.timeout == 5
+
+    def test_one_executor_per_process(self) -> None:
+        """Every caller shares one executor (and so one concurrency limit)."""
+        config = ProjectConfig.from_dict({"beads": {"max_concurrency": 2}})
+        with patch('pokepoke.beads_executor.get_config', return_value=config):
+            assert get_beads_executor() is get_beads_executor()
+
+    def test_limit_holds_across_threads(self) -> None:
+        """Blocking calls from several threads share the slots."""
+        import threading
+
+        executor = BeadsExecutor(max_concurrency=1, timeout=10)
+        threads = [
+            threading.Thread(target=executor.run_many, args=([_py("import time; time.sleep(0.3)")],))
+            for _ in range(3)
+        ]
+
+        start = time.monotonic()
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert time.monotonic() - start >= 0.9
+
+    def test_batches_and_blocking_calls_share_the_limit(self) -> None:
+        """A batch on the event loop and a blocking call in another thread take the same slots."""
+        import threading
+
+        executor = BeadsExecutor(max_concurrency=1, timeout=10)
+        sleep = _py("import time; time.sleep(0.3)")
+        single = threading.Thread(target=executor.run_many, args=([sleep],))
+
+        start = time.monotonic()
+        single.start()
+        executor.run_many([sleep, sleep])
+        single.join()
+
+        assert time.monotonic() - start >= 0.9
@@ -0,0 +1,264 @@
+"""Unit tests for the in-memory beads issue graph snapshot."""
+
+import json
+import subprocess
+from typing import Any, Dict, List, Optional
+from unittest.mock import Mock, patch
+
+from pokepoke.beads_graph import BeadsGraph, load_beads_graph
+from pokepoke.beads_management import select_next_hierarchical_item
+from pokepoke.types import BeadsWorkItem
+
+
+def _record(
+    issue_id: str,
+    issue_type: str = "task",
+    status: str = "open",
+    priority: int = 1,
+    parent: Optional[str] = None,
+    blocks: Optional[List[str]] = None,
+    **extra: Any
+) -> Dict[str, Any]:
+    """Build an issues.jsonl style record."""
+    deps = []
+    if parent:
+        deps.append({"issue_id": issue_id, "depends_on_id": parent, "type": "parent-child"})
+    for blocker in blocks or []:
+        deps.append({"issue_id": issue_id, "depends_on_id": blocker, "type": "blocks"})
+    record: Dict[str, Any] = {
+        "id": issue_id,
+        "title": f"Title {issue_id}",
+        "status": status,
+        "priority": priority,
+        "issue_type": issue_type,
+        "closed_at": None,
+        **extra,
+    }
+    if deps:
+        record["dependencies"] = deps
+    return record
+
+
+class TestBeadsGraph:
+    """Test graph construction and lookups."""
+
+    def test_children_and_parent(self) -> None:
+        """Parent/child edges are indexed in both directions."""
+        graph = BeadsGraph.from_records([
+            _record("epic-1", "epic"),
+            _record("task-1", parent="epic-1"),
+            _record("task-2", parent="epic-1"),
+            _record("task-3"),
+        ])
+
+        assert [c.id for c in graph.get_children("epic-1")] == ["task-1", "task-2"]
+        assert graph.get_parent_id("task-1") == "epic-1"
+        assert graph.get_parent_id("task-3") is None
+        assert graph.get_children("task-3") == []
+        assert len(graph) == 4
+        assert "task-2" in graph
+
+    def test_show_style_dependencies_accepted(self) -> None:
+        """Dependencies in the bd show shape are understood too."""
+        graph = BeadsGraph.from_records([
+            _record("feat-1", "feature"),
+            {
+                "id": "task-1", "title": "T", "status": "open", "priority": 1,
+                "issue_type": "task",
+                "dependencies": [{"id": "feat-1", "dependency_type": "parent"}],
+            },
+        ])
+
+        assert graph.get_parent_id("task-1") == "feat-1"
+        assert graph.has_feature_parent("task-1") is True
+
+    def test_has_feature_parent(self) -> None:
+        """Only feature parents count."""
+        graph = BeadsGraph.from_records([
+            _record("epic-1", "epic"),
+            _record("feat-1", "feature"),
+            _record("task-1", parent="epic-1"),
+            _record("task-2", parent="feat-1"),
+        ])
+
+        assert graph.has_feature_parent("task-1") is False
+        assert graph.has_feature_parent("task-2") is True
+        assert graph.has_feature_parent("missing") is False
+
+    def test_blockers_recorded(self) -> None:
+        """Blocks edges are kept separately from parent edges."""
+        graph = BeadsGraph.from_records([
+            _record("task-1"),
+            _record("task-2", blocks=["task-1"]),
+        ])
+
+        assert graph.get_blocker_ids("task-2") == ["task-1"]
+        assert graph.get_children("task-1") == []
+
+    def test_all_children_complete(self) -> None:
+        """Completion requires children, all of them closed."""
+        graph = BeadsGraph.from_records([
+            _record("epic-1", "epic"),
+            _record("task-1", status="closed", parent="epic-1"),
+            _record("task-2", status="open", parent="epic-1"),
+            _record("epic-2", "epic"),
+        ])
+
+        assert graph.all_children_complete("epic-1") is False
+        assert graph.all_children_complete("epic-2") is False
+
+        graph.set_status("task-2", "closed")
+        assert graph.all_children_complete("epic-1") is True
+
+    def test_replacing_record_moves_edges(self) -> None:
+        """Re-adding an issue replaces its old parent edge."""
+        graph = BeadsGraph.from_records([
+            _record("epic-1", "epic"),
+            _record("epic-2", "epic"),
+            _record("task-1", parent="epic-1"),
+        ])
+
+        graph.add_record(_record("task-1", parent="epic-2"))
+
+        assert graph.get_children("epic-1") == []
+        assert [c.id for c in graph.get_children("epic-2")] == ["task-1"]
+
+
+class TestGraphResolution:
+    """Test resolve_to_leaf_task from memory."""
+
+    def test_leaf_returned_directly(self) -> None:
+        """Tasks resolve to themselves."""
+        graph = BeadsGraph.from_records([_record("task-1")])
+        item = graph.get("task-1")
+        assert item is not None
+
+        assert graph.resolve_to_leaf_task(item) is item
+
+    def test_nested_hierarchy_resolves_highest_priority_leaf(self) -> None:
+        """epic -> feature -> task walks down by priority."""
+        graph = BeadsGraph.from_records([
+            _record("epic-1", "epic"),
+            _record("feat-1", "feature", priority=2, parent="epic-1"),
+            _record("feat-2", "feature", priority=1, parent="epic-1"),
+            _record("task-a", priority=1, parent="feat-1"),
+            _record("task-b", priority=3, parent="feat-2"),
+            _record("task-c", priority=2, parent="feat-2"),
+        ])
+        epic = graph.get("epic-1")
+        assert epic is not None
+
+        resolved = graph.resolve_to_leaf_task(epic)
+
+        assert resolved is not None
+        assert resolved.id == "task-c"
+
+    def test_childless_parent_returned(self) -> None:
+        """A feature without children is returned for decomposition."""
+        graph = BeadsGraph.from_records([_record("feat-1", "feature")])
+        feat = graph.get("feat-1")
+        assert feat is not None
+
+        assert graph.resolve_to_leaf_task(feat) is feat
+
+    @patch('pokepoke.beads_hierarchy.subprocess.run')
+    def test_complete_parent_auto_closed(self, mock_run: Mock) -> None:
+        """A parent whose children are all closed is closed and skipped."""
+        graph = BeadsGraph.from_records([
+            _record("epic-1", "epic"),
+            _record("task-1", status="closed", parent="epic-1"),
+        ])
+        epic = graph.get("epic-1")
+        assert epic is not None
+
+        assert graph.resolve_to_leaf_task(epic) is None
+
+        mock_run.assert_called_once()
+        assert mock_run.call_args[0][0][:3] == ['bd', 'close', 'epic-1']
+        closed = graph.get("epic-1")
+        assert closed is not None and closed.status == "closed"
+        # Items other callers already hold are not changed underneath them
+        assert epic.status == "open"
+
+    @patch('pokepoke.beads_hierarchy.subprocess.run')
+    def test_blocked_children_skip_parent(self, mock_run: Mock) -> None:
+        """Children claimed by others leave nothing to resolve, no close."""
+        graph = BeadsGraph.from_records([
+            _record("epic-1", "epic"),
+            _record("task-1", status="in_progress", parent="epic-1", assignee="someone-else"),
+            _record("task-2", parent="epic-1", labels=["human-required"]),
+        ])
+        epic = graph.get("epic-1")
+        assert epic is not None
+
+        assert graph.resolve_to_leaf_task(epic) is None
+        mock_run.assert_not_called()
+
+    @patch('pokepoke.beads_hierarchy.get_children')
+    def test_select_next_uses_graph_without_bd_show(self, mock_get_children: Mock) -> None:
+        """select_next_hierarchical_item never falls back to bd when given a graph."""
+        graph = BeadsGraph.from_records([
+            _record("epic-1", "epic", priority=0),
+            _record("task-1", parent="epic-1"),
+        ])
+        epic = graph.get("epic-1")
+        assert epic is not None
+
+        selected = select_next_hierarchical_item([epic], graph=graph)
+
+        assert selected is not None
+        assert selected.id == "task-1"
+        mock_get_children.assert_not_called()
+
+
+class TestLoadBeadsGraph:
+    """Test loading the snapshot from bd export."""
+
+    @patch('pokepoke.beads_graph.subprocess.run')
+    def test_load_parses_jsonl(self, mock_run: Mock) -> None:
+        """Export output is parsed line by line, skipping notes."""
+        lines = [
+            "Note: exporting",
+            json.dumps(_record("epic-1", "epic")),
+            json.dumps(_record("task-1", parent="epic-1")),
+        ]
+        mock_run.return_value = Mock(stdout="\n".join(lines), returncode=0)
+
+        graph = load_beads_graph()
+
+        assert graph is not None
+        assert len(graph) == 2
+        assert graph.get_parent_id("task-1") == "epic-1"
+        assert mock_run.call_args[0][0] == ['bd', 'export']
+
+    @patch('pokepoke.beads_graph.subprocess.run')
+    def test_load_failure_returns_none(self, mock_run: Mock) -> None:
+        """A failing export means callers fall back to bd show."""
+        mock_run.side_effect = subprocess.CalledProcessError(1, 'bd')
+
+        assert load_beads_graph() is None
+
+    @patch('pokepoke.beads_graph.subprocess.run')
+    def test_load_missing_bd_returns_none(self, mock_run: Mock) -> None:
+        """A missing bd binary is not fatal."""
+        mock_run.side_effect = FileNotFoundError("bd")
+
+        assert load_beads_graph() is None
+
+    @patch('pokepoke.beads_graph.subprocess.run')
+    def test_load_unknown_format_returns_none(self, mock_run: Mock) -> None:
+        """Records missing required fields are rejected."""
+        mock_run.return_value = Mock(stdout=json.dumps({"id": "x"}), returncode=0)
+
+        assert load_beads_graph() is None
+
+    def test_work_items_carry_fields(self) -> None:
+        """Snapshot items keep assignee and labels for claim checks."""
+        graph = BeadsGraph.from_records([
+            _record("task-1", assignee="agent-1", labels=["backend"], close_reason="x"),
+        ])
+        item = graph.get("task-1")
+
+        assert isinstance(item, BeadsWorkItem)
+        assert item.assignee == "agent-1"
+        assert item.labels == ["backend"]
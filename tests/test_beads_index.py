@@ -0,0 +1,166 @@
+"""Unit tests for the memoized hierarchy index."""
+
+from typing import Any, Dict, Optional
+from unittest.mock import Mock, patch
+
+from pokepoke.beads_graph import BeadsGraph
+from pokepoke.beads_index import HierarchyIndex
+
+
+def _record(
+    issue_id: str,
+    issue_type: str = "task",
+    status: str = "open",
+    priority: int = 1,
+    parent: Optional[str] = None,
+    **extra: Any
+) -> Dict[str, Any]:
+    """Build an issues.jsonl style record."""
+    record: Dict[str, Any] = {
+        "id": issue_id,
+        "title": f"Title {issue_id}",
+        "status": status,
+        "priority": priority,
+        "issue_type": issue_type,
+        **extra,
+    }
+    if parent:
+        record["dependencies"] = [
+            {"issue_id": issue_id, "depends_on_id": parent, "type": "parent-child"}
+        ]
+    return record
+
+
+def _deep_graph() -> BeadsGraph:
+    """epic -> two features -> tasks."""
+    return BeadsGraph.from_records([
+        _record("epic-1", "epic"),
+        _record("feat-1", "feature", priority=1, parent="epic-1"),
+        _record("feat-2", "feature", priority=2, parent="epic-1"),
+        _record("task-a", priority=2, parent="feat-1"),
+        _record("task-b", priority=1, parent="feat-1"),
+        _record("task-c", priority=1, parent="feat-2"),
+    ])
+
+
+class TestHierarchyIndex:
+    """Test leaf resolution, memoization and invalidation."""
+
+    def test_resolves_highest_priority_leaf(self) -> None:
+        """Children are visited in priority order at every level."""
+        graph = _deep_graph()
+        epic = graph.get("epic-1")
+        assert epic is not None
+
+        leaf = graph.resolve_to_leaf_task(epic)
+
+        assert leaf is not None and leaf.id == "task-b"
+
+    def test_repeat_resolution_is_memoized(self) -> None:
+        """A second resolution walks no nodes."""
+        graph = _deep_graph()
+        index = HierarchyIndex(graph)
+        epic = graph.get("epic-1")
+        assert epic is not None
+
+        index.resolve(epic)
+        walked = index.nodes_walked
+        index.resolve(epic)
+
+        assert index.nodes_walked == walked
+
+    def test_invalidate_rewalks_only_ancestors(self) -> None:
+        """Invalidating a claimed leaf re-walks just its path to the root."""
+        graph = _deep_graph()
+        index = HierarchyIndex(graph)
+        epic = graph.get("epic-1")
+        assert epic is not None
+        index.resolve(epic)
+        walked = index.nodes_walked
+
+        graph.set_status("task-b", "closed")
+        index.invalidate("task-b")
+        leaf = index.resolve(epic)
+
+        assert leaf is not None and leaf.id == "task-a"
+        # epic-1 and feat-1 recomputed; feat-2 untouched
+        assert index.nodes_walked == walked + 2
+
+    @patch('pokepoke.beads_hierarchy.subprocess.run')
+    def test_fully_blocked_subtree_recorded(self, mock_run: Mock) -> None:
+        """A subtree with only claimed work is skipped and remembered."""
+        graph = BeadsGraph.from_records([
+            _record("epic-1", "epic"),
+            _record("feat-1", "feature", priority=1, parent="epic-1"),
+            _record("task-a", status="in_progress", parent="feat-1", assignee="other"),
+            _record("task-b", priority=2, parent="epic-1"),
+        ])
+        index = HierarchyIndex(graph)
+        epic = graph.get("epic-1")
+        assert epic is not None
+
+        leaf = index.resolve(epic)
+
+        assert leaf is not None and leaf.id == "task-b"
+        assert index.blocked == {"feat-1"}
+        mock_run.assert_not_called()
+
+    @patch('pokepoke.beads_hierarchy.subprocess.run')
+    def test_completed_subtree_auto_closed(self, mock_run: Mock) -> None:
+        """Nested parents whose children are done are closed bottom-up."""
+        graph = BeadsGraph.from_records([
+            _record("epic-1", "epic"),
+            _record("feat-1", "feature", parent="epic-1"),
+            _record("task-a", status="closed", parent="feat-1"),
+        ])
+        epic = graph.get("epic-1")
+        assert epic is not None
+
+        index = HierarchyIndex(graph)
+
+        assert index.resolve(epic) is None
+
+        closed = [c[0][0][2] for c in mock_run.call_args_list]
+        assert closed == ["feat-1", "epic-1"]
+        assert index.blocked == set()
+
+    def test_skipped_leaf_resolves_to_next_sibling(self) -> None:
+        """A leaf held by another worker is passed over, not returned again."""
+        graph = _deep_graph()
+        epic = graph.get("epic-1")
+        assert epic is not None
+
+        leaf = HierarchyIndex(graph, skip_ids={"task-b"}).resolve(epic)
+
+        assert leaf is not None and leaf.id == "task-a"
+
+    def test_childless_parent_returned(self) -> None:
+        """A feature without children resolves to itself."""
+        graph = BeadsGraph.from_records([_record("feat-1", "feature")])
+        feat = graph.get("feat-1")
+        assert feat is not None
+
+        assert HierarchyIndex(graph).resolve(feat) is feat
+
+    def test_each_selection_pass_sees_expired_leases(self) -> None:
+        """A lease running out changes the next pass without touching the graph."""
+        from pokepoke.beads_management import select_next_hierarchical_item
+
+        graph = BeadsGraph.from_records([
+            _record("epic-1", "epic"),
+            _record("task-a", priority=2, parent="epic-1"),
+            _record(
+                "task-b", status="in_progress", priority=1, parent="epic-1",
+                assignee="other-agent", labels=["lease:1000"],
+            ),
+        ])
+        epic = graph.get("epic-1")
+        assert epic is not None
+
+        with patch('pokepoke.beads_leases.time.time', return_value=900.0):
+            first = select_next_hierarchical_item([epic], graph=graph)
+        with patch('pokepoke.beads_leases.time.time', return_value=1100.0):
+            second = select_next_hierarchical_item([epic], graph=graph)
+
+        assert first is not None and first.id == "task-a"
+        assert second is not None and second.id == "task-b"
@@ -0,0 +1,309 @@
+"""Unit tests for the direct issues.jsonl reader."""
+
+import json
+import os
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+from unittest.mock import Mock, patch
+
+import pytest
+
+from pokepoke.beads_jsonl import (
+    IssuesJsonlReader,
+    find_issues_jsonl,
+    load_direct_snapshot,
+    reset_issues_readers,
+)
+from pokepoke.beads_query import get_ready_work_items, get_beads_stats
+from pokepoke.config import ProjectConfig
+
+
+@pytest.fixture(autouse=True)
+def clear_readers():
+    """Drop shared readers between tests."""
+    reset_issues_readers()
+    yield
+    reset_issues_readers()
+
+
+def _record(
+    issue_id: str,
+    issue_type: str = "task",
+    status: str = "open",
+    priority: int = 1,
+    parent: Optional[str] = None,
+    blocks: Optional[List[str]] = None,
+) -> Dict[str, Any]:
+    """Build an issues.jsonl style record."""
+    deps = []
+    if parent:
+        deps.append({"issue_id": issue_id, "depends_on_id": parent, "type": "parent-child"})
+    for blocker in blocks or []:
+        deps.append({"issue_id": issue_id, "depends_on_id": blocker, "type": "blocks"})
+    return {
+        "id": issue_id,
+        "title": f"Title {issue_id}",
+        "status": status,
+        "priority": priority,
+        "issue_type": issue_type,
+        "dependencies": deps,
+    }
+
+
+def _write(path: Path, *records: Dict[str, Any], mode: str = "w") -> None:
+    with open(path, mode, encoding="utf-8", newline="\n") as f:
+        for record in records:
+            f.write(json.dumps(record) + "\n")
+
+
+class TestIssuesJsonlReader:
+    """Test incremental parsing."""
+
+    def test_initial_load(self, tmp_path: Path) -> None:
+        """All records are loaded into a graph on first poll."""
+        path = tmp_path / "issues.jsonl"
+        _write(path, _record("epic-1", "epic"), _record("task-1", parent="epic-1"))
+
+        graph = IssuesJsonlReader(path).snapshot()
+
+        assert graph is not None
+        assert len(graph) == 2
+        assert graph.get_parent_id("task-1") == "epic-1"
+
+    def test_appended_lines_parsed_incrementally(self, tmp_path: Path) -> None:
+        """Only new lines are parsed; later records supersede earlier ones."""
+        path = tmp_path / "issues.jsonl"
+        _write(path, _record("task-1"), _record("task-2"))
+        reader = IssuesJsonlReader(path)
+        first = reader.snapshot()
+
+        _write(path, _record("task-1", status="closed"), _record("task-3"), mode="a")
+        graph = reader.snapshot()
+
+        assert graph is not first
+        assert reader.full_reloads == 1
+        assert reader.incremental_reads == 1
+        assert len(graph) == 3
+        item = graph.get("task-1")
+        assert item is not None and item.status == "closed"
+        # The graph handed out earlier is left as it was
+        assert len(first) == 2
+        earlier = first.get("task-1")
+        assert earlier is not None and earlier.status == "open"
+
+    def test_unchanged_file_not_reparsed(self, tmp_path: Path) -> None:
+        """Polling an unchanged file returns the cached graph."""
+        path = tmp_path / "issues.jsonl"
+        _write(path, _record("task-1"))
+        reader = IssuesJsonlReader(path)
+        first = reader.snapshot()
+
+        assert reader.snapshot() is first
+        assert reader.full_reloads == 1
+        assert reader.incremental_reads == 0
+
+    def test_partial_line_waits_for_newline(self, tmp_path: Path) -> None:
+        """A half-written trailing line is picked up once completed."""
+        path = tmp_path / "issues.jsonl"
+        _write(path, _record("task-1"))
+        partial = json.dumps(_record("task-2"))
+        with open(path, "a", encoding="utf-8") as f:
+            f.write(partial[:10])
+        reader = IssuesJsonlReader(path)
+
+        graph = reader.snapshot()
+        assert graph is not None and len(graph) == 1
+
+        with open(path, "a", encoding="utf-8", newline="\n") as f:
+            f.write(partial[10:] + "\n")
+        graph = reader.snapshot()
+        assert graph is not None and "task-2" in graph
+
+    def test_rewritten_file_reloaded(self, tmp_path: Path) -> None:
+        """A replaced file (new inode or truncated) triggers a full reload."""
+        path = tmp_path / "issues.jsonl"
+        _write(path, _record("task-1"), _record("task-2"))
+        reader = IssuesJsonlReader(path)
+        reader.snapshot()
+
+        replacement = tmp_path / "issues.jsonl.tmp"
+        _write(replacement, _record("task-9"))
+        os.replace(replacement, path)
+        graph = reader.snapshot()
+
+        assert reader.full_reloads == 2
+        assert graph is not None
+        assert [i.id for i in graph.items()] == ["task-9"]
+
+    def test_tombstone_removes_issue(self, tmp_path: Path) -> None:
+        """Deleted issues disappear from the snapshot and their edges too."""
+        path = tmp_path / "issues.jsonl"
+        _write(path, _record("epic-1", "epic"), _record("task-1", parent="epic-1"))
+        reader = IssuesJsonlReader(path)
+        reader.snapshot()
+
+        _write(path, _record("task-1", status="tombstone"), mode="a")
+        graph = reader.snapshot()
+
+        assert graph is not None
+        assert "task-1" not in graph
+        assert graph.get_children("epic-1") == []
+
+    def test_unknown_format_falls_back(self, tmp_path: Path) -> None:
+        """Records without the beads issue shape disable the snapshot."""
+        path = tmp_path / "issues.jsonl"
+        _write(path, _record("task-1"), {"id": "x", "priority": "high"})
+
+        assert IssuesJsonlReader(path).snapshot() is None
+
+    def test_missing_file_returns_none(self, tmp_path: Path) -> None:
+        """No file means no snapshot."""
+        assert IssuesJsonlReader(tmp_path / "issues.jsonl").snapshot() is None
+
+    def test_empty_file_gives_empty_graph(self, tmp_path: Path) -> None:
+        """An empty export is valid (mmap is skipped)."""
+        path = tmp_path / "issues.jsonl"
+        path.write_text("")
+
+        graph = IssuesJsonlReader(path).snapshot()
+
+        assert graph is not None and len(graph) == 0
+
+
+class TestGraphQueries:
+    """Test ready/stats computed from a snapshot."""
+
+    def test_ready_items_respect_blockers(self, tmp_path: Path) -> None:
+        """Open blockers (own or inherited from a parent) hide an issue."""
+        path = tmp_path / "issues.jsonl"
+        _write(
+            path,
+            _record("task-1", priority=2),
+            _record("task-2", priority=1, blocks=["task-1"]),
+            _record("epic-1", "epic", priority=0, blocks=["task-1"]),
+            _record("task-3", priority=0, parent="epic-1"),
+            _record("task-4", priority=3, status="in_progress"),
+            _record("task-5", status="closed"),
+        )
+        graph = IssuesJsonlReader(path).snapshot()
+        assert graph is not None
+
+        assert [i.id for i in graph.ready_items()] == ["task-1", "task-4"]
+
+        graph.set_status("task-1", "closed")
+        assert [i.id for i in graph.ready_items()] == ["epic-1", "task-3", "task-2", "task-4"]
+
+    def test_stats(self, tmp_path: Path) -> None:
+        """Counts mirror bd stats."""
+        path = tmp_path / "issues.jsonl"
+        _write(
+            path,
+            _record("task-1"),
+            _record("task-2", status="in_progress"),
+            _record("task-3", status="closed"),
+            _record("task-4", blocks=["task-1"]),
+        )
+        graph = IssuesJsonlReader(path).snapshot()
+        assert graph is not None
+
+        stats = graph.stats()
+
+        assert stats.total_issues == 4
+        assert stats.open_issues == 2
+        assert stats.in_progress_issues == 1
+        assert stats.closed_issues == 1
+        assert stats.ready_issues == 2
+
+
+class TestFindIssuesJsonl:
+    """Test locating the export file."""
+
+    def test_walks_up_to_beads_dir(self, tmp_path: Path) -> None:
+        """The nearest .beads directory above the start is used."""
+        (tmp_path / ".beads").mkdir()
+        nested = tmp_path / "src" / "pkg"
+        nested.mkdir(parents=True)
+
+        assert find_issues_jsonl(nested) == (tmp_path / ".beads" / "issues.jsonl").resolve()
+
+    def test_follows_redirect_and_metadata(self, tmp_path: Path) -> None:
+        """Worktree redirects and custom export names are honoured."""
+        main_beads = tmp_path / "main" / ".beads"
+        main_beads.mkdir(parents=True)
+        (main_beads / "metadata.json").write_text(json.dumps({"jsonl_export": "custom.jsonl"}))
+        worktree = tmp_path / "main" / "worktrees" / "task-1"
+        (worktree / ".beads").mkdir(parents=True)
+        (worktree / ".beads" / "redirect").write_text("../../../.beads\n")
+
+        assert find_issues_jsonl(worktree) == main_beads.resolve() / "custom.jsonl"
+
+    def test_no_beads_dir(self, tmp_path: Path) -> None:
+        """Outside a beads project there is nothing to read."""
+        with patch('pokepoke.beads_jsonl.Path.cwd', return_value=tmp_path):
+            assert find_issues_jsonl() is None
+
+
+class TestDirectQueries:
+    """Test that query helpers use the snapshot when enabled."""
+
+    def _enable(self, tmp_path: Path) -> Mock:
+        path = tmp_path / "issues.jsonl"
+        _write(path, _record("task-1", priority=2), _record("task-2", priority=1))
+        config = ProjectConfig.from_dict({"beads": {"direct_read": True}})
+        return Mock(path=path, config=config)
+
+    def test_disabled_by_default(self) -> None:
+        """Without the config switch nothing is read."""
+        with patch('pokepoke.beads_jsonl.get_config', return_value=ProjectConfig()):
+            assert load_direct_snapshot() is None
+
+    @patch('pokepoke.beads_query.subprocess.run')
+    def test_ready_and_stats_skip_bd(self, mock_run: Mock, tmp_path: Path) -> None:
+        """Ready items and stats come from the file without spawning bd."""
+        env = self._enable(tmp_path)
+        with patch('pokepoke.beads_jsonl.get_config', return_value=env.config), \
+             patch('pokepoke.beads_jsonl.find_issues_jsonl', return_value=env.path):
+            ready = get_ready_work_items()
+            stats = get_beads_stats()
+
+        assert [i.id for i in ready] == ["task-2", "task-1"]
+        assert stats is not None and stats.ready_issues == 2
+        mock_run.assert_not_called()
+
+    @patch('pokepoke.beads_query.subprocess.run')
+    def test_unknown_format_uses_bd(self, mock_run: Mock, tmp_path: Path) -> None:
+        """An unrecognised file falls back to the CLI."""
+        path = tmp_path / "issues.jsonl"
+        path.write_text('{"unexpected": true}\n')
+        config = ProjectConfig.from_dict({"beads": {"direct_read": True}})
+        mock_run.return_value = Mock(stdout="[]", returncode=0)
+
+        with patch('pokepoke.beads_jsonl.get_config', return_value=config), \
+             patch('pokepoke.beads_jsonl.find_issues_jsonl', return_value=path):
+            assert get_ready_work_items() == []
+
+        assert mock_run.call_args[0][0] == ['bd', 'ready', '--json']
+
+    @patch('pokepoke.beads_query.subprocess.run')
+    def test_own_write_uses_bd_until_file_rewritten(self, mock_run: Mock, tmp_path: Path) -> None:
+        """An item we just closed is not selected again from the stale file."""
+        from pokepoke.beads_query import invalidate_issue_cache
+
+        env = self._enable(tmp_path)
+        mock_run.return_value = Mock(stdout=json.dumps([_record("task-1", priority=2)]), returncode=0)
+        with patch('pokepoke.beads_jsonl.get_config', return_value=env.config), \
+             patch('pokepoke.beads_jsonl.find_issues_jsonl', return_value=env.path):
+            assert [i.id for i in get_ready_work_items()] == ["task-2", "task-1"]
+
+            # We close task-2; bd has not written the file yet
+            invalidate_issue_cache("task-2")
+            assert [i.id for i in get_ready_work_items()] == ["task-1"]
+            assert mock_run.call_args[0][0] == ['bd', 'ready', '--json']
+
+            # bd writes the close out: the file is used again
+            _write(env.path, _record("task-2", status="closed"), mode="a")
+            later = os.stat(env.path).st_mtime_ns + 10**9
+            os.utime(env.path, ns=(later, later))
+            mock_run.reset_mock()
+            assert [i.id for i in get_ready_work_items()] == ["task-1"]
+            mock_run.assert_not_called()
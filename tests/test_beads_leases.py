@@ -0,0 +1,193 @@
+"""Unit tests for claim leases and the lease heartbeat."""
+
+import json
+import subprocess
+import time
+from unittest.mock import Mock, patch
+
+from pokepoke.beads_leases import (
+    LeaseHeartbeat,
+    claim_lease_args,
+    is_lease_expired,
+    lease_expiry,
+    remember_claim_lease,
+    renew_lease,
+)
+from pokepoke.config import get_config
+from pokepoke.types import BeadsWorkItem
+
+
+def _item(assignee: str = "", status: str = "open", labels=None) -> BeadsWorkItem:
+    return BeadsWorkItem(
+        id="task-1", title="Task", status=status, priority=1,
+        issue_type="task", assignee=assignee, labels=labels,
+    )
+
+
+class TestLeaseLabels:
+    """Test reading lease expiry from labels."""
+
+    def test_expiry_uses_latest_lease(self) -> None:
+        assert lease_expiry(["bug", "lease:100", "lease:250", "lease:junk"]) == 250.0
+
+    def test_unleased_never_expires(self) -> None:
+        assert lease_expiry(["bug"]) is None
+        assert is_lease_expired(None) is False
+        assert is_lease_expired(["bug"]) is False
+
+    def test_expired_and_live(self) -> None:
+        assert is_lease_expired(["lease:100"], now=200) is True
+        assert is_lease_expired(["lease:300"], now=200) is False
+
+
+class TestRenewLease:
+    """Test writing lease labels."""
+
+    @patch('pokepoke.beads_leases.request_sync')
+    @patch('pokepoke.beads_leases.subprocess.run')
+    def test_adds_new_and_removes_stale(self, mock_run: Mock, mock_sync: Mock) -> None:
+        label = renew_lease("task-1", 60, ["lease:1", "lease:2"])
+
+        assert label is not None and label.startswith("lease:")
+        assert abs(float(label[6:]) - (time.time() + 60)) < 5
+        commands = [c[0][0] for c in mock_run.call_args_list]
+        # bd label remove takes a single label, so each stale one gets its own call
+        assert commands == [
+            ['bd', 'label', 'add', 'task-1', label, '--json'],
+            ['bd', 'label', 'remove', 'task-1', 'lease:1', '--json'],
+            ['bd', 'label', 'remove', 'task-1', 'lease:2', '--json'],
+        ]
+        mock_sync.assert_called_once()
+
+    @patch('pokepoke.beads_leases.request_sync')
+    @patch('pokepoke.beads_leases.subprocess.run')
+    def test_failure_returns_none(self, mock_run: Mock, mock_sync: Mock) -> None:
+        mock_run.side_effect = OSError("bd not found")
+
+        assert renew_lease("task-1", 60) is None
+        mock_sync.assert_not_called()
+
+    @patch('pokepoke.beads_leases.request_sync')
+    @patch('pokepoke.beads_leases.subprocess.run')
+    def test_hung_bd_times_out(self, mock_run: Mock, mock_sync: Mock) -> None:
+        """A hung bd label add fails the renewal instead of stalling the heartbeat."""
+        mock_run.side_effect = subprocess.TimeoutExpired(['bd', 'label', 'add'], 30)
+
+        assert renew_lease("task-1", 60) is None
+        assert mock_run.call_args[1]['timeout'] == get_config().beads.command_timeout
+        mock_sync.assert_not_called()
+
+    @patch('pokepoke.beads_leases.request_sync')
+    @patch('pokepoke.beads_leases.subprocess.run')
+    def test_hung_remove_keeps_new_lease(self, mock_run: Mock, mock_sync: Mock) -> None:
+        """Once the new lease is written, a stale label that cannot be removed is left."""
+        mock_run.side_effect = [Mock(returncode=0), subprocess.TimeoutExpired(['bd', 'label', 'remove'], 30)]
+
+        label = renew_lease("task-1", 60, ["lease:1"])
+
+        assert label is not None and label.startswith("lease:")
+        assert all(c[1]['timeout'] == get_config().beads.command_timeout for c in mock_run.call_args_list)
+        mock_sync.assert_called_once()
+
+
+class TestLeaseHeartbeat:
+    """Test background lease renewal."""
+
+    @patch('pokepoke.beads_leases.renew_lease')
+    def test_renews_until_stopped(self, mock_renew: Mock) -> None:
+        mock_renew.side_effect = lambda item_id, seconds, stale: f"lease:{time.time()}"
+
+        with LeaseHeartbeat("task-1", ["lease:1", "bug"], lease_seconds=0.15) as heartbeat:
+            time.sleep(0.4)
+        renewals = heartbeat.renewals
+        time.sleep(0.15)
+
+        assert renewals >= 3
+        assert heartbeat.renewals == renewals
+        # The first renewal replaces the lease the item already carried
+        assert mock_renew.call_args_list[0][0][2] == ["lease:1"]
+
+    @patch('pokepoke.beads_leases.get_claim_registry')
+    @patch('pokepoke.beads_leases.renew_lease')
+    def test_adopts_claim_lease(self, mock_renew: Mock, mock_registry: Mock) -> None:
+        """The lease written by the claim is not written again, only replaced later."""
+        claimed = f"lease:{int(time.time()) + 600}"
+        remember_claim_lease("task-1", claimed)
+
+        heartbeat = LeaseHeartbeat("task-1", ["lease:1"], lease_seconds=60)
+        heartbeat.start()
+        heartbeat.stop()
+
+        mock_renew.assert_not_called()
+        mock_registry.return_value.renew.assert_called_once_with("task-1")
+        assert heartbeat._labels == [claimed]
+
+    @patch('pokepoke.beads_leases.renew_lease')
+    def test_disabled(self, mock_renew: Mock) -> None:
+        with LeaseHeartbeat("task-1", lease_seconds=0):
+            pass
+
+        mock_renew.assert_not_called()
+
+    @patch('pokepoke.beads_leases.get_claim_registry')
+    @patch('pokepoke.beads_leases.renew_lease')
+    def test_renews_registry_claim(self, mock_renew: Mock, mock_registry: Mock) -> None:
+        """The registry claim is renewed with the lease, even with leases disabled."""
+        with LeaseHeartbeat("task-1", lease_seconds=0.15):
+            time.sleep(0.2)
+        with LeaseHeartbeat("task-2", lease_seconds=0):
+            pass
+
+        renewed = [c.args[0] for c in mock_registry.return_value.renew.call_args_list]
+        assert renewed.count("task-1") >= 2
+        assert "task-2" in renewed
+
+
+class TestExpiredLeasesAreClaimable:
+    """Selection and claiming treat expired leases as free."""
+
+    @patch.dict('os.environ', {'AGENT_NAME': 'me'})
+    def test_selection_helpers(self) -> None:
+        from pokepoke.beads_hierarchy import _is_assigned_to_current_user as hierarchy_check
+        from pokepoke.work_item_selection import _is_assigned_to_current_user as selection_check
+
+        expired = _item("other", "in_progress", ["lease:100"])
+        live = _item("other", "in_progress", [f"lease:{int(time.time()) + 600}"])
+
+        for check in (hierarchy_check, selection_check):
+            assert check(expired) is True
+            assert check(live) is False
+            assert check(_item("other", "in_progress")) is False
+
+    @patch('pokepoke.beads_management.await_sync')
+    @patch('pokepoke.beads_management.request_sync')
+    @patch('pokepoke.beads_management.subprocess.run')
+    def test_assign_takes_over_expired_claim(
+        self, mock_run: Mock, mock_request: Mock, mock_await: Mock
+    ) -> None:
+        from pokepoke.beads_management import assign_and_sync_item
+
+        mock_run.side_effect = [
+            Mock(stdout=json.dumps([{
+                "id": "task-1", "assignee": "crashed-agent",
+                "status": "in_progress", "labels": ["lease:100"],
+            }]), returncode=0),
+            Mock(returncode=0),
+        ]
+        mock_await.return_value = Mock(returncode=0)
+
+        assert assign_and_sync_item("task-1", "me") is True
+        update = mock_run.call_args_list[1][0][0]
+        assert update[:2] == ['bd', 'update']
+        # The claim writes its own lease and drops the expired one
+        new_label = update[update.index('--add-label') + 1]
+        assert not is_lease_expired([new_label])
+        assert update[update.index('--remove-label') + 1] == 'lease:100'
+        # Hand-over to the heartbeat: the claimed lease is adopted once
+        heartbeat = LeaseHeartbeat("task-1", ["lease:100"], lease_seconds=60)
+        assert heartbeat._labels == [new_label]
+
+    def test_claim_args_disabled(self) -> None:
+        with patch('pokepoke.beads_leases.get_config') as mock_config:
+            mock_config.return_value.beads.lease_seconds = 0
+            assert claim_lease_args(["lease:100"]) == ([], None)
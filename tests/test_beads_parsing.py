@@ -0,0 +1,138 @@
+"""Unit tests for bd JSON output parsing and batched issue lookups."""
+
+import json
+import subprocess
+from unittest.mock import Mock, patch
+
+import pytest
+
+from pokepoke.beads_parsing import parse_bd_json, issue_from_dict, work_item_from_dict
+from pokepoke.beads_query import get_issues_bulk
+from pokepoke.beads_hierarchy import get_feature_parent_ids
+
+
+def _show_entry(issue_id: str, parent_type: str = "epic") -> dict:
+    return {
+        "id": issue_id,
+        "title": f"Title {issue_id}",
+        "status": "open",
+        "priority": 1,
+        "issue_type": "task",
+        "close_reason": "ignored",
+        "dependencies": [
+            {"id": "parent-1", "title": "Parent", "issue_type": parent_type,
+             "dependency_type": "parent", "status": "open", "priority": 1,
+             "extra": "ignored"}
+        ],
+    }
+
+
+class TestParseBdJson:
+    """Test extracting JSON from bd output."""
+
+    def test_plain_json(self) -> None:
+        assert parse_bd_json('[{"id": "a"}]') == [{"id": "a"}]
+
+    def test_skips_notes_and_trailing_output(self) -> None:
+        """Leading Note:/Warning:/Created lines and trailing hints are ignored."""
+        output = (
+            "Note: daemon not running\n"
+            "Warning: stale\n"
+            "Created issue: x-1\n"
+            '{\n  "id": "x-1"\n}\n'
+            "Hint: run bd sync\n"
+        )
+        assert parse_bd_json(output) == {"id": "x-1"}
+
+    def test_no_json_returns_none(self) -> None:
+        assert parse_bd_json("Note: nothing here") is None
+        assert parse_bd_json("") is None
+        assert parse_bd_json(None) is None
+
+    def test_invalid_json_raises(self) -> None:
+        with pytest.raises(json.JSONDecodeError):
+            parse_bd_json("[not json")
+
+    def test_issue_from_dict_filters_fields(self) -> None:
+        """Unknown fields are dropped at both issue and dependency level."""
+        issue = issue_from_dict(_show_entry("task-1"))
+
+        assert issue.id == "task-1"
+        assert issue.dependencies is not None
+        assert issue.dependencies[0].id == "parent-1"
+
+    def test_work_item_from_dict_filters_fields(self) -> None:
+        item = work_item_from_dict({**_show_entry("task-1"), "assignee": "me"})
+
+        assert item.id == "task-1"
+        assert item.assignee == "me"
+
+
+class TestGetIssuesBulk:
+    """Test batched bd show lookups."""
+
+    @patch('pokepoke.beads_query.subprocess.run')
+    def test_single_call_for_many_ids(self, mock_run: Mock) -> None:
+        """All ids go to one bd show invocation."""
+        entries = [_show_entry("task-1"), _show_entry("task-2")]
+        mock_run.return_value = Mock(stdout="Note: x\n" + json.dumps(entries), returncode=0)
+
+        issues = get_issues_bulk(["task-1", "task-2", "task-1"])
+
+        assert set(issues) == {"task-1", "task-2"}
+        mock_run.assert_called_once()
+        assert mock_run.call_args[0][0] == ['bd', 'show', 'task-1', 'task-2', '--json']
+
+    @patch('pokepoke.beads_query._BULK_SHOW_CHUNK', 2)
+    @patch('pokepoke.beads_query.get_beads_executor')
+    def test_chunks_run_together_on_executor(self, mock_executor: Mock) -> None:
+        """Ids are split into chunks that are submitted as one concurrent batch."""
+        run_many = mock_executor.return_value.run_many
+        run_many.return_value = [
+            Mock(stdout=json.dumps([_show_entry("a"), _show_entry("b")])),
+            Mock(stdout=json.dumps([_show_entry("c")])),
+        ]
+
+        issues = get_issues_bulk(["a", "b", "c"])
+
+        assert set(issues) == {"a", "b", "c"}
+        run_many.assert_called_once_with([
+            ['bd', 'show', 'a', 'b', '--json'],
+            ['bd', 'show', 'c', '--json'],
+        ])
+
+    @patch('pokepoke.beads_query.get_beads_executor')
+    def test_failed_batch_falls_back_per_id(self, mock_executor: Mock) -> None:
+        """A missing id fails the batch; the rest still resolve one by one."""
+        run_many = mock_executor.return_value.run_many
+        run_many.side_effect = [
+            [subprocess.CalledProcessError(1, 'bd')],
+            [Mock(stdout=json.dumps([_show_entry("task-1")])),
+             subprocess.CalledProcessError(1, 'bd')],
+        ]
+
+        issues = get_issues_bulk(["task-1", "gone"])
+
+        assert list(issues) == ["task-1"]
+        assert run_many.call_args[0][0] == [
+            ['bd', 'show', 'task-1', '--json'],
+            ['bd', 'show', 'gone', '--json'],
+        ]
+
+    @patch('pokepoke.beads_query.subprocess.run')
+    def test_empty_ids(self, mock_run: Mock) -> None:
+        assert get_issues_bulk([]) == {}
+        mock_run.assert_not_called()
+
+
+class TestGetFeatureParentIds:
+    """Test bulk feature-parent detection."""
+
+    @patch('pokepoke.beads_query.subprocess.run')
+    def test_matches_feature_parents(self, mock_run: Mock) -> None:
+        """Only issues whose parent is a feature are returned."""
+        entries = [_show_entry("task-1", "feature"), _show_entry("task-2", "epic")]
+        mock_run.return_value = Mock(stdout=json.dumps(entries), returncode=0)
+
+        assert get_feature_parent_ids(["task-1", "task-2"]) == {"task-1"}
+        mock_run.assert_called_once()
@@ -4,6 +4,15 @@ import json
 from unittest.mock import Mock, patch
 import pytest
 from pokepoke.beads import get_beads_stats
+from pokepoke.beads_stats import local_beads_stats, record_status_change, reset_local_stats
+from pokepoke.types import BeadsStats
+
+
+@pytest.fixture(autouse=True)
+def fresh_local_stats():
+    reset_local_stats()
+    yield
+    reset_local_stats()
 
 
 class TestGetBeadsStats:
@@ -76,3 +85,48 @@ class TestGetBeadsStats:
         result = get_beads_stats()
         
         assert result is None
+
+
+
+class TestLocalBeadsStats:
+    """Test stats computed without spawning bd (shutdown paths)."""
+    
+    @patch('pokepoke.beads_stats.get_issues_reader')
+    @patch('subprocess.run')
+    def test_snapshot_used_without_subprocess(self, mock_run: Mock, mock_reader: Mock) -> None:
+        """The issues.jsonl snapshot answers without running bd."""
+        expected = BeadsStats(3, 1, 1, 1, 2)
+        mock_reader.return_value.snapshot.return_value.stats.return_value = expected
+        
+        assert get_beads_stats(allow_subprocess=False) == expected
+        mock_run.assert_not_called()
+    
+    @patch('pokepoke.beads_stats.get_issues_reader', return_value=None)
+    @patch('subprocess.run')
+    def test_last_known_plus_local_changes(self, mock_run: Mock, mock_reader: Mock) -> None:
+        """Without a snapshot, the last bd stats are adjusted by our own writes."""
+        mock_run.return_value = Mock(
+            stdout=json.dumps({"summary": {
+                "total_issues": 10, "open_issues": 6, "in_progress_issues": 1,
+                "closed_issues": 3, "ready_issues": 4
+            }}),
+            returncode=0
+        )
+        get_beads_stats()
+        mock_run.reset_mock()
+        
+        record_status_change("task-1", "open", "in_progress")
+        record_status_change("task-1", "in_progress", "closed")
+        record_status_change("task-2", None, "open")
+        
+        result = get_beads_stats(allow_subprocess=False)
+        
+        assert result == BeadsStats(
+            total_issues=11, open_issues=6, in_progress_issues=1,
+            closed_issues=4, ready_issues=4
+        )
+        mock_run.assert_not_called()
+    
+    @patch('pokepoke.beads_stats.get_issues_reader', return_value=None)
+    def test_nothing_known(self, mock_reader: Mock) -> None:
+        assert local_beads_stats() is None
@@ -0,0 +1,216 @@
+"""Unit tests for the coalescing background bd sync worker."""
+
+import subprocess
+import threading
+import time
+from typing import Any, List
+from unittest.mock import Mock, patch
+
+import pytest
+
+from pokepoke import shutdown
+from pokepoke.beads_sync import SyncLockBusy, SyncService
+from pokepoke.stats import _percentile, print_stats, serialize_session_stats
+from pokepoke.types import AgentStats, SessionStats
+
+
+@pytest.fixture(autouse=True)
+def reset_shutdown():
+    shutdown.reset()
+    yield
+    shutdown.reset()
+
+
+class TestSyncService:
+    """Test request/await barriers and coalescing."""
+
+    @patch('pokepoke.beads_sync.subprocess.run')
+    def test_request_and_await(self, mock_run: Mock) -> None:
+        """A single request runs one bd sync and returns its result."""
+        mock_run.return_value = Mock(returncode=0)
+        service = SyncService(coalesce_seconds=0)
+
+        result = service.await_sync(service.request_sync(), timeout=5)
+
+        assert result is mock_run.return_value
+        assert mock_run.call_args[0][0] == ['bd', 'sync']
+        assert service.stats.syncs_run == 1
+        assert len(service.stats.latencies) == 1
+
+    @patch('pokepoke.beads_sync.subprocess.run')
+    def test_concurrent_requests_coalesce(self, mock_run: Mock) -> None:
+        """Requests made inside the window share one flush."""
+        mock_run.return_value = Mock(returncode=0)
+        service = SyncService(coalesce_seconds=0.2)
+        results: List[Any] = []
+
+        def claim() -> None:
+            results.append(service.await_sync(service.request_sync(), timeout=5))
+
+        threads = [threading.Thread(target=claim) for _ in range(5)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+
+        assert len(results) == 5 and all(r is mock_run.return_value for r in results)
+        assert mock_run.call_count == 1
+        assert service.stats.requests == 5
+        assert service.stats.syncs_run == 1
+
+    @patch('pokepoke.beads_sync.subprocess.run')
+    def test_request_during_flush_gets_next_flush(self, mock_run: Mock) -> None:
+        """A request made while bd sync is running is not covered by it."""
+        started = threading.Event()
+        release = threading.Event()
+
+        def slow_sync(*args: Any, **kwargs: Any) -> Mock:
+            started.set()
+            release.wait(5)
+            return Mock(returncode=0)
+
+        mock_run.side_effect = slow_sync
+        service = SyncService(coalesce_seconds=0)
+        first = service.request_sync()
+        assert started.wait(5)
+        second = service.request_sync()
+        release.set()
+
+        assert service.await_sync(first, timeout=5) is not None
+        assert service.await_sync(second, timeout=5) is not None
+        assert mock_run.call_count == 2
+
+    @patch('pokepoke.beads_sync.subprocess.run')
+    def test_failure_is_returned_and_counted(self, mock_run: Mock) -> None:
+        """Timeouts are reported to waiters rather than raised."""
+        mock_run.side_effect = subprocess.TimeoutExpired(['bd', 'sync'], 30)
+        service = SyncService(coalesce_seconds=0)
+
+        result = service.await_sync(service.request_sync(), timeout=5)
+
+        assert isinstance(result, subprocess.TimeoutExpired)
+        assert service.stats.failures == 1
+
+    @patch('pokepoke.beads_sync.subprocess.run')
+    def test_unexpected_error_keeps_worker_alive(self, mock_run: Mock) -> None:
+        """Any exception becomes the sync's outcome; later syncs still run."""
+        mock_run.side_effect = [UnicodeDecodeError('utf-8', b'\xff', 0, 1, 'bad byte'), Mock(returncode=0)]
+        service = SyncService(coalesce_seconds=0)
+
+        first = service.await_sync(service.request_sync(), timeout=5)
+        second = service.await_sync(service.request_sync(), timeout=5)
+
+        assert isinstance(first, UnicodeDecodeError)
+        assert second is not None and not isinstance(second, BaseException)
+        assert service.stats.failures == 1
+
+    @patch('pokepoke.beads_sync.subprocess.run')
+    def test_default_wait_is_bounded(self, mock_run: Mock) -> None:
+        """Without a timeout, a waiter gives up after the default wait."""
+        release = threading.Event()
+        mock_run.side_effect = lambda *a, **k: release.wait(5) and Mock(returncode=0)
+        service = SyncService(coalesce_seconds=0, timeout=0.1)
+
+        assert service.default_wait == pytest.approx(1.4)
+        start = time.monotonic()
+        assert service.await_sync(service.request_sync()) is None
+        assert time.monotonic() - start < 3
+        release.set()
+
+    @patch('pokepoke.beads_sync.subprocess.run')
+    def test_await_times_out(self, mock_run: Mock) -> None:
+        """A waiter gives up after its timeout while the flush is still running."""
+        release = threading.Event()
+        mock_run.side_effect = lambda *a, **k: release.wait(5) and Mock(returncode=0)
+        service = SyncService(coalesce_seconds=0)
+
+        start = time.monotonic()
+        assert service.await_sync(service.request_sync(), timeout=0.2) is None
+        assert time.monotonic() - start < 2
+        release.set()
+
+    @patch('pokepoke.beads_sync.subprocess.run')
+    def test_sync_holds_merge_lock(self, mock_run: Mock) -> None:
+        """bd sync commits to the main repo, so it waits for running merges."""
+        from pokepoke.merge_queue import _merge_lock, serialized_merge
+
+        mock_run.side_effect = lambda *a, **k: Mock(returncode=0, locked=_merge_lock._is_owned())
+        service = SyncService(coalesce_seconds=0)
+
+        with serialized_merge("merge"):
+            barrier = service.request_sync()
+            time.sleep(0.2)
+            mock_run.assert_not_called()
+        result = service.await_sync(barrier, timeout=5)
+
+        assert result is not None and result.locked is True
+
+    @patch('pokepoke.beads_sync.subprocess.run')
+    def test_busy_merge_lock_bounds_the_wait(self, mock_run: Mock) -> None:
+        """A merge lock held past the timeout is reported, and the sync runs once it frees."""
+        from pokepoke.merge_queue import serialized_merge
+
+        mock_run.return_value = Mock(returncode=0)
+        service = SyncService(coalesce_seconds=0, timeout=0.1)
+
+        with serialized_merge("long merge"):
+            start = time.monotonic()
+            result = service.await_sync(service.request_sync())
+            assert time.monotonic() - start < service.default_wait
+            mock_run.assert_not_called()
+
+        assert isinstance(result, SyncLockBusy)
+        assert service.stats.lock_busy >= 1
+        assert service.stats.failures == 0
+        deadline = time.monotonic() + 5
+        while not mock_run.called and time.monotonic() < deadline:
+            time.sleep(0.05)
+        assert mock_run.call_args[0][0] == ['bd', 'sync']
+
+    @patch('pokepoke.beads_sync.subprocess.run')
+    def test_sync_now_inside_merge(self, mock_run: Mock) -> None:
+        """A merge holding the lock syncs inline and covers pending requests."""
+        from pokepoke.merge_queue import serialized_merge
+
+        mock_run.return_value = Mock(returncode=0)
+        service = SyncService(coalesce_seconds=0)
+
+        with serialized_merge("merge"):
+            barrier = service.request_sync()
+            assert service.sync_now() is mock_run.return_value
+            assert service.await_sync(barrier, timeout=0) is mock_run.return_value
+
+    @patch('pokepoke.beads_sync.subprocess.run')
+    def test_shutdown_releases_waiters(self, mock_run: Mock) -> None:
+        """Waiters return None once shutdown is requested."""
+        shutdown._shutdown_event.set()
+        service = SyncService(coalesce_seconds=0)
+
+        assert service.await_sync(service.request_sync()) is None
+        mock_run.assert_not_called()
+
+
+class TestPercentile:
+    """Test the latency percentile helper used by the stats report."""
+
+    def test_nearest_rank(self) -> None:
+        values = [0.1 * i for i in range(1, 11)]
+        assert _percentile(values, 50) == pytest.approx(0.5)
+        assert _percentile(values, 90) == pytest.approx(0.9)
+        assert _percentile([2.0], 90) == 2.0
+
+
+class TestSyncStatsReporting:
+    """Test the sync counters reach the session stats."""
+
+    def test_serialized_and_printed(self, capsys: pytest.CaptureFixture[str]) -> None:
+        session = SessionStats(agent_stats=AgentStats())
+        session.beads_sync.requests = 4
+        session.beads_sync.syncs_run = 2
+        session.beads_sync.latencies = [1.0, 3.0]
+
+        data = serialize_session_stats(session, 1.0, 0, 0)
+        print_stats(0, 0, 1.0, session)
+
+        assert data["beads_sync"]["syncs_run"] == 2
+        assert "2 runs for 4 requests" in capsys.readouterr().out
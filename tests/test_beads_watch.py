@@ -0,0 +1,98 @@
+"""Unit tests for waiting on beads issue changes."""
+
+import sys
+import threading
+import time
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+
+from pokepoke import shutdown
+from pokepoke.beads_watch import BeadsWatcher
+
+
+@pytest.fixture(autouse=True)
+def reset_shutdown():
+    shutdown.reset()
+    yield
+    shutdown.reset()
+
+
+@pytest.fixture
+def issues_file(tmp_path: Path) -> Path:
+    beads_dir = tmp_path / ".beads"
+    beads_dir.mkdir()
+    path = beads_dir / "issues.jsonl"
+    path.write_text('{"id": "task-1"}\n', encoding='utf-8')
+    return path
+
+
+def _append_later(path: Path, delay: float = 0.1) -> threading.Thread:
+    def append() -> None:
+        time.sleep(delay)
+        with open(path, 'a', encoding='utf-8') as f:
+            f.write('{"id": "task-2"}\n')
+    thread = threading.Thread(target=append)
+    thread.start()
+    return thread
+
+
+@pytest.fixture(params=['inotify', 'polling'])
+def watcher(request: pytest.FixtureRequest, issues_file: Path):
+    if request.param == 'inotify' and not sys.platform.startswith('linux'):
+        pytest.skip("inotify is Linux-only")
+    if request.param == 'polling':
+        with patch('pokepoke.beads_watch._open_inotify', return_value=None):
+            w = BeadsWatcher(issues_file, poll_interval=0.02)
+    else:
+        w = BeadsWatcher(issues_file)
+    assert w.mode == request.param
+    yield w
+    w.close()
+
+
+class TestBeadsWatcher:
+    """Test change detection in both modes."""
+
+    def test_wakes_on_change(self, watcher: BeadsWatcher, issues_file: Path) -> None:
+        watcher.arm()
+        thread = _append_later(issues_file)
+
+        started = time.monotonic()
+        assert watcher.wait(timeout=5) is True
+        assert time.monotonic() - started < 2
+        thread.join()
+
+    def test_times_out_without_change(self, watcher: BeadsWatcher) -> None:
+        watcher.arm()
+
+        assert watcher.wait(timeout=0.1) is False
+
+    def test_change_before_wait_is_not_missed(self, watcher: BeadsWatcher, issues_file: Path) -> None:
+        watcher.arm()
+        _append_later(issues_file, delay=0).join()
+
+        assert watcher.wait(timeout=0) is True
+
+    def test_other_files_do_not_wake(self, watcher: BeadsWatcher, issues_file: Path) -> None:
+        watcher.arm()
+        (issues_file.parent / "beads.db-wal").write_bytes(b"x")
+
+        assert watcher.wait(timeout=0.2) is False
+
+    def test_shutdown_ends_wait(self, watcher: BeadsWatcher) -> None:
+        watcher.arm()
+        timer = threading.Timer(0.1, shutdown._shutdown_event.set)
+        timer.start()
+
+        assert watcher.wait() is False
+        timer.join()
+
+    def test_no_beads_directory(self, tmp_path: Path) -> None:
+        with patch('pokepoke.beads_watch.find_issues_jsonl', return_value=None):
+            w = BeadsWatcher()
+
+        assert w.mode == 'none'
+        w.arm()
+        assert w.wait(timeout=0.05) is False
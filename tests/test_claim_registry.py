@@ -0,0 +1,124 @@
+"""Unit tests for the cross-process claim registry."""
+
+import threading
+import time
+from pathlib import Path
+from typing import List
+from unittest.mock import patch
+
+import pytest
+
+from pokepoke import claim_registry
+from pokepoke.claim_registry import ClaimRegistry, LocalClaimRegistry, claim_owner, get_claim_registry
+
+
+@pytest.fixture
+def db_path(tmp_path: Path) -> Path:
+    return tmp_path / ".pokepoke" / "claims.db"
+
+
+class TestLocalClaimRegistry:
+    """Test claims stored in SQLite."""
+
+    def test_claim_is_exclusive(self, db_path: Path) -> None:
+        registry = LocalClaimRegistry(db_path)
+
+        assert registry.try_claim("task-1", "a:1") is True
+        assert registry.try_claim("task-1", "a:1") is True
+        assert registry.try_claim("task-1", "b:2") is False
+        assert registry.holder("task-1") == "a:1"
+        assert registry.claimed_ids() == {"task-1"}
+
+    def test_release_only_by_owner(self, db_path: Path) -> None:
+        registry = LocalClaimRegistry(db_path)
+        registry.try_claim("task-1", "a:1")
+
+        registry.release("task-1", "b:2")
+        assert registry.claimed_ids() == {"task-1"}
+
+        registry.release("task-1", "a:1")
+        assert registry.claimed_ids() == set()
+        assert registry.holder("task-1") is None
+
+    def test_claims_shared_between_registries(self, db_path: Path) -> None:
+        """Two connections to the same file behave like two processes."""
+        first = LocalClaimRegistry(db_path)
+        second = LocalClaimRegistry(db_path)
+
+        assert first.try_claim("task-1", "a:1") is True
+        assert second.try_claim("task-1", "b:2") is False
+        assert second.claimed_ids() == {"task-1"}
+
+        first.release("task-1", "a:1")
+        assert second.try_claim("task-1", "b:2") is True
+
+    def test_expired_claim_is_taken_over(self, db_path: Path) -> None:
+        registry = LocalClaimRegistry(db_path, ttl_seconds=-1)
+        registry.try_claim("task-1", "a:1")
+
+        assert registry.claimed_ids() == set()
+        assert registry.try_claim("task-1", "b:2") is True
+
+    def test_renew_keeps_claim_past_ttl(self, db_path: Path) -> None:
+        """A renewed claim outlives its original expiry."""
+        registry = LocalClaimRegistry(db_path, ttl_seconds=0.2)
+        registry.try_claim("task-1", "a:1")
+
+        time.sleep(0.15)
+        registry.renew("task-1")
+        time.sleep(0.15)
+
+        assert registry.holder("task-1") == "a:1"
+        assert registry.try_claim("task-1", "b:2") is False
+
+    def test_dead_process_claim_is_taken_over(self, db_path: Path) -> None:
+        registry = LocalClaimRegistry(db_path)
+        registry.try_claim("task-1", "a:1")
+
+        with patch('pokepoke.claim_registry._pid_alive', return_value=False):
+            assert registry.holder("task-1") is None
+            assert registry.try_claim("task-1", "b:2") is True
+        assert registry.holder("task-1") == "b:2"
+
+    def test_concurrent_claims_have_one_winner(self, db_path: Path) -> None:
+        registries = [LocalClaimRegistry(db_path) for _ in range(4)]
+        winners: List[str] = []
+
+        def claim(n: int) -> None:
+            if registries[n].try_claim("task-1", f"owner:{n}"):
+                winners.append(f"owner:{n}")
+
+        threads = [threading.Thread(target=claim, args=(n,)) for n in range(4)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+
+        assert len(winners) == 1
+
+    def test_claim_round_trip_is_fast(self, db_path: Path) -> None:
+        registry = LocalClaimRegistry(db_path)
+        started = time.perf_counter()
+        for n in range(50):
+            registry.try_claim(f"task-{n}", "a:1")
+            registry.release(f"task-{n}", "a:1")
+        # Generous bound - a bd round trip is hundreds of milliseconds
+        assert (time.perf_counter() - started) / 50 < 0.05
+
+
+class TestGetClaimRegistry:
+    """Test the process-wide registry accessor."""
+
+    def test_falls_back_to_memory(self) -> None:
+        claim_registry._registry = None
+        with patch('pokepoke.claim_registry.LocalClaimRegistry', side_effect=OSError("read-only")):
+            registry = get_claim_registry()
+
+        assert isinstance(registry, ClaimRegistry)
+        assert get_claim_registry() is registry
+
+    def test_owner_includes_pid_and_worker(self) -> None:
+        with patch.dict('os.environ', {'AGENT_NAME': 'bot'}), \
+             patch('pokepoke.claim_registry.os.getpid', return_value=42):
+            assert claim_owner() == "bot:42"
+            assert claim_owner("worker-1") == "bot:42/worker-1"
@@ -12,6 +12,7 @@ from pokepoke.config import (
     MaintenanceConfig,
     MaintenanceAgentConfig,
     GitConfig,
+    BeadsConfig,
     load_config,
     reset_config,
     get_config,
@@ -125,6 +126,32 @@ class TestGitConfig:
         assert config.get_preferred_branch() is None
 
 
+class TestBeadsConfig:
+    """Tests for BeadsConfig dataclass."""
+
+    def test_defaults(self):
+        config = BeadsConfig()
+        assert config.direct_read is False
+        assert config.max_concurrency == 4
+        assert config.command_timeout == 30.0
+        assert config.sync_coalesce_seconds == 0.1
+        assert config.lease_seconds == 600.0
+
+    def test_from_dict(self):
+        config = ProjectConfig.from_dict({
+            "beads": {"direct_read": True, "max_concurrency": 8, "command_timeout": 10,
+                      "lease_seconds": 120}
+        })
+        assert config.beads.direct_read is True
+        assert config.beads.max_concurrency == 8
+        assert config.beads.command_timeout == 10
+        assert config.beads.lease_seconds == 120
+
+    def test_from_dict_absent(self):
+        config = ProjectConfig.from_dict({})
+        assert config.beads.direct_read is False
+
+
 class TestProjectConfig:
     """Tests for ProjectConfig dataclass."""
 
@@ -209,6 +236,16 @@ class TestProjectConfig:
         """When maintenance section is absent, defaults are used."""
         config = ProjectConfig.from_dict({"project_name": "test"})
         assert len(config.maintenance.agents) == 6
+        assert config.maintenance.background is False
+
+    def test_from_dict_background_maintenance_keeps_default_agents(self):
+        """Lane settings can be set without replacing the agent list."""
+        data = {"maintenance": {"background": True, "max_concurrent": 2, "pause_at_ready": 3}}
+        config = ProjectConfig.from_dict(data)
+        assert len(config.maintenance.agents) == 6
+        assert config.maintenance.background is True
+        assert config.maintenance.max_concurrent == 2
+        assert config.maintenance.pause_at_ready == 3
 
 
 class TestDetectGitUsername:
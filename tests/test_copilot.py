@@ -130,6 +130,17 @@ class TestBuildPrompt:
         assert "Labels:" not in prompt
 
 
+class TestBuildGateFeedbackPrompt:
+    """Test the follow-up message sent to a kept session."""
+
+    def test_includes_item_and_feedback(self, sample_work_item):
+        from pokepoke.copilot import build_gate_feedback_prompt
+        prompt = build_gate_feedback_prompt(sample_work_item, "Coverage dropped below 80%")
+
+        assert sample_work_item.id in prompt
+        assert "Coverage dropped below 80%" in prompt
+
+
 class TestInvokeCopilot:
     """Tests for invoke_copilot function (SDK-based)."""
     
@@ -176,6 +187,7 @@ class TestInvokeCopilot:
             deny_write=True,
             item_logger=None,
             model=None,
-            cwd=None
+            cwd=None,
+            conversation=None
         )
 
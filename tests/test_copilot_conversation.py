@@ -0,0 +1,161 @@
+"""Tests for keeping a work-agent session open across gate retries."""
+
+import asyncio
+from typing import Any, Callable, List, Optional
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+import pokepoke.copilot_conversation as copilot_conversation
+from pokepoke.copilot_conversation import CopilotConversation, get_retry_stats, record_work_retry
+from pokepoke.copilot_pool import get_client_pool
+from pokepoke.copilot_sdk import invoke_copilot_sdk
+from pokepoke.types import AgentStats, BeadsWorkItem, WorkRetryStats
+
+
+def _event(event_type: str, **data: Any) -> MagicMock:
+    event = MagicMock()
+    event.type.value = event_type
+    event.data = MagicMock(**data)
+    return event
+
+
+class FakeSession:
+    """Replays usage, then goes idle, for every message it is sent."""
+
+    def __init__(self, session_id: str, input_tokens: int = 100, error: Optional[str] = None) -> None:
+        self.session_id = session_id
+        self.input_tokens = input_tokens
+        self.error = error
+        self.handlers: List[Callable[[Any], None]] = []
+        self.prompts: List[str] = []
+        self.destroy = AsyncMock()
+        self.abort = AsyncMock()
+
+    def on(self, handler: Callable[[Any], None]) -> Callable[[], None]:
+        self.handlers.append(handler)
+        return lambda: self.handlers.remove(handler)
+
+    async def send(self, message: dict) -> None:
+        self.prompts.append(message["prompt"])
+
+        async def reply() -> None:
+            await asyncio.sleep(0)
+            for handler in list(self.handlers):
+                handler(_event("assistant.usage", input_tokens=self.input_tokens, output_tokens=10,
+                               cache_read_tokens=0, cache_write_tokens=0))
+                handler(_event("assistant.turn_end"))
+                if self.error:
+                    handler(_event("session.error", message=self.error))
+                else:
+                    handler(_event("session.idle"))
+
+        asyncio.create_task(reply())
+
+
+@pytest.fixture
+def work_item() -> BeadsWorkItem:
+    return BeadsWorkItem(id="task-1", title="Task", description="", status="open", priority=1, issue_type="task")
+
+
+@pytest.fixture
+def client() -> AsyncMock:
+    client = AsyncMock()
+    client.create_session = AsyncMock(side_effect=[FakeSession("s-1"), FakeSession("s-2")])
+    return client
+
+
+@pytest.mark.asyncio
+class TestInvokeWithConversation:
+    """invoke_copilot_sdk keeps and continues a conversation's session."""
+
+    async def test_first_message_keeps_session_open(self, client: AsyncMock, work_item: BeadsWorkItem) -> None:
+        conversation = CopilotConversation()
+        with patch('pokepoke.copilot_sdk.CopilotClient', return_value=client):
+            result = await invoke_copilot_sdk(work_item, prompt="work", idle_timeout=0.01, conversation=conversation)
+
+        assert result.success
+        assert conversation.is_open
+        assert conversation.client is client
+        conversation.session.destroy.assert_not_called()
+        client.stop.assert_not_called()
+        # The client is out of the pool while the conversation holds it
+        assert get_client_pool().idle_count() == 0
+
+    async def test_follow_up_reuses_session_and_reports_its_own_usage(
+        self, client: AsyncMock, work_item: BeadsWorkItem
+    ) -> None:
+        conversation = CopilotConversation()
+        with patch('pokepoke.copilot_sdk.CopilotClient', return_value=client):
+            await invoke_copilot_sdk(work_item, prompt="work", idle_timeout=0.01, conversation=conversation)
+            session = conversation.session
+            session.input_tokens = 7
+            result = await invoke_copilot_sdk(work_item, prompt="feedback", idle_timeout=0.01, conversation=conversation)
+
+        assert result.success
+        client.create_session.assert_called_once()
+        assert session.prompts == ["work", "feedback"]
+        assert result.stats.input_tokens == 7
+        assert result.stats.premium_requests == 1
+        # The first exchange's handler was unsubscribed
+        assert len(session.handlers) == 0
+        assert conversation.messages_sent == 2
+
+    async def test_close_destroys_session_and_returns_client(self, client: AsyncMock, work_item: BeadsWorkItem) -> None:
+        conversation = CopilotConversation()
+        with patch('pokepoke.copilot_sdk.CopilotClient', return_value=client):
+            await invoke_copilot_sdk(work_item, prompt="work", idle_timeout=0.01, conversation=conversation)
+        session = conversation.session
+
+        await conversation.close()
+
+        session.destroy.assert_awaited_once()
+        assert not conversation.is_open
+        assert get_client_pool().idle_count() == 1
+        client.stop.assert_not_called()
+
+    async def test_failed_follow_up_drops_the_conversation(self, client: AsyncMock, work_item: BeadsWorkItem) -> None:
+        conversation = CopilotConversation()
+        with patch('pokepoke.copilot_sdk.CopilotClient', return_value=client):
+            await invoke_copilot_sdk(work_item, prompt="work", idle_timeout=0.01, conversation=conversation)
+            conversation.session.error = "model exploded"
+            result = await invoke_copilot_sdk(work_item, prompt="feedback", idle_timeout=0.01, conversation=conversation)
+
+        assert not result.success
+        assert "model exploded" in result.error
+        assert not conversation.is_open
+
+    async def test_without_conversation_session_is_destroyed(self, client: AsyncMock, work_item: BeadsWorkItem) -> None:
+        with patch('pokepoke.copilot_sdk.CopilotClient', return_value=client):
+            result = await invoke_copilot_sdk(work_item, prompt="work", idle_timeout=0.01)
+
+        assert result.success
+        assert get_client_pool().idle_count() == 1
+
+
+class TestRetryStats:
+    """Test the rerun counters."""
+
+    @pytest.fixture(autouse=True)
+    def fresh_stats(self):
+        with patch.object(copilot_conversation, '_retry_stats', WorkRetryStats()):
+            yield
+
+    def test_counts_by_kind(self) -> None:
+        record_work_retry(False, AgentStats(input_tokens=5000, premium_requests=20, tool_calls=40))
+        record_work_retry(True, AgentStats(input_tokens=800, premium_requests=3, tool_calls=4))
+        record_work_retry(True, None)
+
+        stats = get_retry_stats()
+        assert stats.fresh_retries == 1
+        assert stats.fresh_input_tokens == 5000
+        assert stats.fresh_turns == 20
+        assert stats.follow_up_retries == 2
+        assert stats.follow_up_input_tokens == 800
+        assert stats.follow_up_tool_calls == 4
+
+    def test_close_sync_without_session_is_noop(self) -> None:
+        with patch('pokepoke.copilot_conversation.run_coroutine') as mock_run:
+            CopilotConversation().close_sync()
+
+        mock_run.assert_not_called()
@@ -0,0 +1,191 @@
+"""Tests for the session event collector and its completion detection."""
+
+import asyncio
+from collections import deque
+from typing import Any
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+import pokepoke.copilot_events as copilot_events
+from pokepoke.copilot_events import SessionEventCollector, adaptive_idle_wait, get_completion_stats
+from pokepoke.types import CompletionStats
+
+
+def _event(event_type: str, **data: Any) -> MagicMock:
+    event = MagicMock()
+    event.type.value = event_type
+    event.data = MagicMock(**data)
+    return event
+
+
+def _final_message(text: str = "All done") -> MagicMock:
+    return _event("assistant.message", content=text, tool_requests=[])
+
+
+@pytest.fixture(autouse=True)
+def fresh_completion_state():
+    with patch.object(copilot_events, '_resume_gaps', deque(maxlen=50)), \
+            patch.object(copilot_events, '_completion_stats', CompletionStats()):
+        yield
+
+
+@pytest.mark.asyncio
+class TestCompletionDetection:
+    """Completion comes from the events, not a fixed idle delay."""
+
+    async def test_final_answer_and_turn_end_completes_immediately(self) -> None:
+        collector = SessionEventCollector("m", idle_timeout=10.0)
+
+        collector(_final_message())
+        collector(_event("assistant.turn_end"))
+
+        assert collector.done.is_set()
+        assert collector.completion == "turn_end"
+        assert collector.idle_wait_saved_seconds == 10.0
+        assert get_completion_stats().deterministic == 1
+
+    async def test_final_answer_then_idle_completes_immediately(self) -> None:
+        collector = SessionEventCollector("m", idle_timeout=10.0)
+
+        collector(_final_message())
+        collector(_event("session.idle"))
+
+        assert collector.done.is_set()
+        assert collector.completion == "idle"
+
+    async def test_tool_requests_are_not_a_final_answer(self) -> None:
+        collector = SessionEventCollector("m", idle_timeout=10.0)
+
+        collector(_event("assistant.message", content="Let me look", tool_requests=[{"tool": "view"}]))
+        collector(_event("assistant.turn_end"))
+
+        assert not collector.done.is_set()
+
+    async def test_running_tool_blocks_completion(self) -> None:
+        collector = SessionEventCollector("m", idle_timeout=0.01)
+
+        collector(_final_message())
+        collector(_event("tool.execution_start", tool_name="bash", arguments={}))
+        collector(_event("session.idle"))
+        await asyncio.sleep(0.05)
+
+        assert not collector.done.is_set()
+
+    async def test_idle_without_answer_falls_back_to_waiting(self) -> None:
+        collector = SessionEventCollector("m", idle_timeout=0.05)
+
+        collector(_event("session.idle"))
+        assert not collector.done.is_set()
+        await asyncio.wait_for(collector.done.wait(), timeout=1.0)
+
+        assert collector.completion == "fallback"
+        assert collector.idle_wait_seconds == pytest.approx(0.05)
+        assert get_completion_stats().fallback == 1
+
+    async def test_activity_after_idle_cancels_wait_and_records_gap(self) -> None:
+        collector = SessionEventCollector("m", idle_timeout=0.05)
+
+        collector(_event("session.idle"))
+        collector(_event("assistant.message_delta", delta_content="more"))
+        await asyncio.sleep(0.1)
+
+        assert not collector.done.is_set()
+        assert len(copilot_events._resume_gaps) == 1
+
+    async def test_events_after_close_are_ignored(self) -> None:
+        collector = SessionEventCollector("m")
+        collector.close()
+
+        collector(_final_message())
+
+        assert collector.output == ""
+
+
+class TestExchangeTiming:
+    """The collector times model turns and tool calls."""
+
+    def test_model_and_tool_time(self) -> None:
+        clock = iter([100.0, 101.0, 103.0, 104.0, 110.0, 111.0, 115.0])
+        with patch('pokepoke.copilot_events.time.monotonic', side_effect=lambda: next(clock)):
+            collector = SessionEventCollector("m")  # Sent at 100
+            collector(_event("assistant.message_delta", delta_content="Let"))  # First token at 101
+            collector(_event("assistant.message", content="Let me look", tool_requests=[{}]))  # 103
+            collector(_event("tool.execution_start", tool_name="bash", tool_call_id="c1", arguments={}))  # 104
+            collector(_event("tool.execution_complete", tool_call_id="c1", result=None))  # 110
+            collector(_event("assistant.message", content="Done", tool_requests=[]))  # 111
+            collector.close()  # 115
+            stats = collector.stats()
+
+        assert collector.first_token_seconds == 1.0
+        assert stats.api_duration == 4.0  # 100 -> 103, then 110 -> 111
+        assert stats.tool_duration == 6.0
+        assert stats.wall_duration == 15.0
+        assert stats.turn_latency.max_seconds == 3.0
+        assert stats.tool_latency["bash"].total_seconds == 6.0
+
+    def test_tool_without_call_id_pairs_with_oldest(self) -> None:
+        collector = SessionEventCollector("m")
+        collector(_event("tool.execution_start", tool_name="view", arguments={}))
+        collector(_event("tool.execution_complete", result=None))
+
+        assert sum(collector.tool_latency["view"].counts) == 1
+        assert not collector._running_tools
+
+
+class TestAdaptiveIdleWait:
+    """The fallback wait follows the idle gaps seen so far."""
+
+    def test_uses_ceiling_until_enough_samples(self) -> None:
+        copilot_events._resume_gaps.extend([0.5, 0.5])
+
+        assert adaptive_idle_wait(10.0) == 10.0
+
+    def test_shrinks_to_margin_over_longest_gap(self) -> None:
+        copilot_events._resume_gaps.extend([1.0, 3.0, 2.0])
+
+        assert adaptive_idle_wait(10.0) == pytest.approx(4.5)
+
+    def test_has_a_floor_and_a_ceiling(self) -> None:
+        copilot_events._resume_gaps.extend([0.1, 0.1, 0.1])
+        assert adaptive_idle_wait(10.0) == 2.0
+
+        copilot_events._resume_gaps.extend([30.0])
+        assert adaptive_idle_wait(10.0) == 10.0
+
+
+class TestOutputStreaming:
+    """Output goes to the item log; only a bounded tail stays in memory."""
+
+    def test_streams_to_item_logger(self) -> None:
+        item_logger = MagicMock()
+        collector = SessionEventCollector("m", item_logger=item_logger)
+
+        collector(_event("assistant.message_delta", delta_content="Hel"))
+        collector(_event("tool.execution_start", tool_name="view", arguments={"path": "a.py"}))
+        collector(_event("tool.execution_complete", result="file contents", success=True))
+
+        streamed = "".join(call.args[0] for call in item_logger.stream.call_args_list)
+        assert streamed == "Hel\n[Tool] view({'path': 'a.py'})\n[Result] file contents\n"
+        item_logger.log_with_timestamp.assert_called_once()
+
+    def test_keeps_bounded_tail_and_last_message(self) -> None:
+        item_logger = MagicMock(log_path="logs/task-1.log")
+        collector = SessionEventCollector("m", item_logger=item_logger)
+
+        with patch.object(copilot_events, 'OUTPUT_TAIL_CHARS', 100):
+            collector(_event("tool.execution_complete", result="x" * 500, success=True))
+            collector(_final_message("verdict " * 5))
+
+        assert collector.output.startswith("[... ")
+        assert "full output in logs/task-1.log" in collector.output
+        assert collector.output.endswith("verdict " * 5)
+        assert collector.dropped_chars + sum(map(len, collector._tail)) == len("[Result] " + "x" * 500 + "\n") + 40
+        assert collector.last_message == "verdict " * 5
+
+    def test_short_output_is_kept_whole(self) -> None:
+        collector = SessionEventCollector("m")
+
+        collector(_final_message("Done"))
+
+        assert collector.output == "Done"
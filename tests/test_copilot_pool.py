@@ -0,0 +1,247 @@
+"""Unit tests for the warm Copilot client pool."""
+
+import asyncio
+from typing import Any, Dict, List, Optional
+from unittest.mock import patch
+
+import pytest
+
+from pokepoke.copilot_pool import CopilotClientPool, close_client_pool, get_client_pool, get_pool_stats
+from pokepoke.async_runtime import run_coroutine
+from pokepoke.stats import print_stats, serialize_session_stats
+from pokepoke.types import AgentStats, SessionStats
+
+
+class FakeClient:
+    """Stands in for CopilotClient: records start/stop/ping calls."""
+
+    def __init__(self, options: Dict[str, Any]) -> None:
+        self.options = options
+        self.starts = 0
+        self.stops = 0
+        self.pings = 0
+        self.healthy = True
+        self.start_error: Optional[Exception] = None
+
+    async def start(self) -> None:
+        self.starts += 1
+        if self.start_error:
+            raise self.start_error
+
+    async def stop(self) -> None:
+        self.stops += 1
+
+    async def ping(self) -> None:
+        self.pings += 1
+        if not self.healthy:
+            raise ConnectionError("client died")
+
+
+class Factory:
+    def __init__(self) -> None:
+        self.created: List[FakeClient] = []
+
+    def __call__(self, options: Dict[str, Any]) -> FakeClient:
+        client = FakeClient(options)
+        self.created.append(client)
+        return client
+
+
+OPTS = {"cli_path": "copilot.cmd", "cwd": "/repo/a"}
+
+
+@pytest.mark.asyncio
+class TestCopilotClientPool:
+    """Test reuse, health checks and eviction."""
+
+    async def test_released_client_is_reused(self) -> None:
+        pool, factory = CopilotClientPool(), Factory()
+
+        first = await pool.acquire(OPTS, factory)
+        await pool.release(first)
+        second = await pool.acquire(dict(OPTS), factory)
+
+        assert second is first
+        assert first.starts == 1
+        assert first.stops == 0
+        assert first.pings == 1
+        assert pool.stats.acquires == 2
+        assert pool.stats.hits == 1
+        assert pool.stats.misses == 1
+
+    async def test_different_options_get_different_clients(self) -> None:
+        pool, factory = CopilotClientPool(), Factory()
+
+        first = await pool.acquire(OPTS, factory)
+        await pool.release(first)
+        other = await pool.acquire({**OPTS, "cwd": "/repo/b"}, factory)
+
+        assert other is not first
+        assert len(factory.created) == 2
+
+    async def test_unhealthy_idle_client_is_replaced(self) -> None:
+        pool, factory = CopilotClientPool(), Factory()
+        first = await pool.acquire(OPTS, factory)
+        await pool.release(first)
+        first.healthy = False
+
+        second = await pool.acquire(OPTS, factory)
+
+        assert second is not first
+        assert first.stops == 1
+        assert pool.stats.health_failures == 1
+        assert pool.stats.hits == 0
+
+    async def test_release_unhealthy_stops_client(self) -> None:
+        pool, factory = CopilotClientPool(), Factory()
+        client = await pool.acquire(OPTS, factory)
+
+        await pool.release(client, healthy=False)
+
+        assert client.stops == 1
+        assert pool.idle_count() == 0
+
+    async def test_surplus_idle_clients_are_stopped(self) -> None:
+        pool, factory = CopilotClientPool(max_idle_per_key=1), Factory()
+        first = await pool.acquire(OPTS, factory)
+        second = await pool.acquire(OPTS, factory)
+
+        await pool.release(first)
+        await pool.release(second)
+
+        assert pool.idle_count() == 1
+        assert first.stops == 1
+        assert second.stops == 0
+        assert pool.stats.evictions == 1
+
+    async def test_idle_timeout_evicts(self) -> None:
+        pool, factory = CopilotClientPool(idle_timeout=60.0), Factory()
+        first = await pool.acquire(OPTS, factory)
+        await pool.release(first)
+
+        with patch('pokepoke.copilot_pool.time.monotonic', return_value=10_000_000.0):
+            second = await pool.acquire(OPTS, factory)
+
+        assert second is not first
+        assert first.stops == 1
+        assert pool.stats.evictions == 1
+        await pool.close()
+
+    async def test_background_sweep_stops_idle_clients(self) -> None:
+        pool, factory = CopilotClientPool(idle_timeout=0.01), Factory()
+        client = await pool.acquire(OPTS, factory)
+        await pool.release(client)
+
+        await asyncio.sleep(0.1)
+
+        assert client.stops == 1
+        assert pool.idle_count() == 0
+
+    async def test_pooling_disabled_stops_on_release(self) -> None:
+        pool, factory = CopilotClientPool(idle_timeout=0), Factory()
+        client = await pool.acquire(OPTS, factory)
+
+        await pool.release(client)
+
+        assert client.stops == 1
+        assert pool.idle_count() == 0
+
+    async def test_failed_start_stops_client_and_raises(self) -> None:
+        pool = CopilotClientPool()
+
+        def failing(options: Dict[str, Any]) -> FakeClient:
+            client = FakeClient(options)
+            client.start_error = RuntimeError("no cli")
+            return client
+
+        with pytest.raises(RuntimeError, match="no cli"):
+            await pool.acquire(OPTS, failing)
+        assert pool.stats.misses == 1
+
+    async def test_startup_time_saved_is_recorded(self) -> None:
+        pool = CopilotClientPool()
+        clock = [100.0]
+
+        class SlowStartClient(FakeClient):
+            async def start(self) -> None:
+                clock[0] += 2.5
+
+        with patch('pokepoke.copilot_pool.time.monotonic', side_effect=lambda: clock[0]):
+            client = await pool.acquire(OPTS, SlowStartClient)
+            await pool.release(client)
+            await pool.acquire(OPTS, SlowStartClient)
+
+        assert pool.stats.startup_seconds == pytest.approx(2.5)
+        assert pool.stats.startup_seconds_saved == pytest.approx(2.5)
+
+    async def test_close_stops_idle_clients_and_disables_reuse(self) -> None:
+        pool, factory = CopilotClientPool(), Factory()
+        idle = await pool.acquire(OPTS, factory)
+        busy = await pool.acquire(OPTS, factory)
+        await pool.release(idle)
+
+        await pool.close()
+        await pool.release(busy)
+
+        assert idle.stops == 1
+        assert busy.stops == 1
+        assert pool.idle_count() == 0
+
+
+class TestPoolAccessors:
+    """Test the process-wide pool helpers."""
+
+    def test_get_client_pool_uses_config(self) -> None:
+        import pokepoke.copilot_pool as copilot_pool
+        from pokepoke.config import ProjectConfig
+
+        config = ProjectConfig.from_dict({"copilot": {"pool_idle_timeout": 30, "pool_max_idle": 4}})
+        copilot_pool._pool = None
+        with patch('pokepoke.copilot_pool.get_config', return_value=config), \
+                patch('pokepoke.copilot_pool.atexit.register'):
+            pool = get_client_pool()
+
+        assert pool.idle_timeout == 30
+        assert pool.max_idle_per_key == 4
+        assert get_pool_stats() is pool.stats
+
+    def test_close_client_pool_stops_clients_on_runtime_loop(self) -> None:
+        pool, factory = get_client_pool(), Factory()
+
+        async def warm_one() -> FakeClient:
+            client = await pool.acquire(OPTS, factory)
+            await pool.release(client)
+            return client
+
+        client = run_coroutine(warm_one())
+        close_client_pool()
+
+        assert client.stops == 1
+        assert pool.idle_count() == 0
+
+
+class TestPoolStatsReporting:
+    """Test the counters reach the session stats."""
+
+    def test_printed_with_hit_rate_and_time_saved(self, capsys) -> None:
+        session = SessionStats(agent_stats=AgentStats())
+        session.copilot_pool.acquires = 4
+        session.copilot_pool.hits = 3
+        session.copilot_pool.misses = 1
+        session.copilot_pool.startup_seconds_saved = 7.5
+
+        print_stats(1, 1, 10.0, session)
+
+        out = capsys.readouterr().out
+        assert "3 reused / 1 started" in out
+        assert "75% hit rate" in out
+        assert "7.5s startup saved" in out
+
+    def test_serialized(self) -> None:
+        session = SessionStats(agent_stats=AgentStats())
+        session.copilot_pool.hits = 2
+
+        data = serialize_session_stats(session, 1.0, 0, 0)
+
+        assert data["copilot_pool"]["hits"] == 2
+        assert data["copilot_pool"]["startup_seconds_saved"] == 0.0
@@ -0,0 +1,159 @@
+"""Tests for retrying transient Copilot SDK failures."""
+
+import asyncio
+from typing import Any, Callable, List, Optional
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from pokepoke.copilot_conversation import CopilotConversation
+from pokepoke.copilot_retry import backoff_sleep, is_retryable_error, retry_delay
+from pokepoke.copilot_sdk import invoke_copilot_sdk
+from pokepoke.types import BeadsWorkItem, RetryConfig
+
+FAST_RETRIES = RetryConfig(max_retries=3, initial_delay=0.01, max_delay=0.05, jitter=False)
+
+
+class FakeSession:
+    """Goes idle after each message, or reports ``error`` instead."""
+
+    def __init__(self, error: Optional[str] = None) -> None:
+        self.session_id = "s"
+        self.error = error
+        self.handlers: List[Callable[[Any], None]] = []
+        self.destroy = AsyncMock()
+        self.abort = AsyncMock()
+
+    def on(self, handler: Callable[[Any], None]) -> None:
+        self.handlers.append(handler)
+
+    async def send(self, message: dict) -> None:
+        async def reply() -> None:
+            await asyncio.sleep(0)
+            event = MagicMock()
+            event.type.value = "session.error" if self.error else "session.idle"
+            event.data = MagicMock(message=self.error)
+            self.handlers[-1](event)
+
+        asyncio.create_task(reply())
+
+
+@pytest.fixture
+def work_item() -> BeadsWorkItem:
+    return BeadsWorkItem(id="task-1", title="Task", description="", status="open", priority=1, issue_type="task")
+
+
+class TestClassification:
+    """Transient failures are retried; ones that would repeat are not."""
+
+    @pytest.mark.parametrize("error", [
+        ConnectionResetError("peer went away"),
+        asyncio.TimeoutError(),
+        RuntimeError("JSON-RPC connection closed"),
+        Exception("503 Service Unavailable"),
+        "Internal server error, please try again",
+        OSError("pipe gone"),
+    ])
+    def test_transient(self, error: Any) -> None:
+        assert is_retryable_error(error)
+
+    @pytest.mark.parametrize("error", [
+        FileNotFoundError("copilot.cmd"),
+        Exception("401 Unauthorized"),
+        RuntimeError("Invalid model: gpt-0"),
+        "Rate limit exceeded",
+        TypeError("bad argument"),
+        "model exploded",
+    ])
+    def test_fatal(self, error: Any) -> None:
+        assert not is_retryable_error(error)
+
+
+class TestRetryDelay:
+    """Exponential backoff capped at max_delay, with optional jitter."""
+
+    def test_exponential_without_jitter(self) -> None:
+        config = RetryConfig(initial_delay=1.0, backoff_factor=2.0, max_delay=5.0, jitter=False)
+
+        assert [retry_delay(config, n) for n in (1, 2, 3, 4)] == [1.0, 2.0, 4.0, 5.0]
+
+    def test_jitter_stays_within_half_to_full_delay(self) -> None:
+        config = RetryConfig(initial_delay=4.0, jitter=True)
+
+        for _ in range(20):
+            assert 2.0 <= retry_delay(config, 1) <= 4.0
+
+
+@pytest.mark.asyncio
+class TestInvokerRetries:
+    """invoke_copilot_sdk retries transient failures from a new session."""
+
+    async def test_transient_start_failure_then_success(self, work_item: BeadsWorkItem) -> None:
+        client = AsyncMock()
+        client.start = AsyncMock(side_effect=[ConnectionError("CLI exited"), None])
+        client.create_session = AsyncMock(return_value=FakeSession())
+        with patch('pokepoke.copilot_sdk.CopilotClient', return_value=client):
+            result = await invoke_copilot_sdk(work_item, prompt="work", idle_timeout=0.01, retry_config=FAST_RETRIES)
+
+        assert result.success
+        assert result.attempt_count == 2
+        assert result.stats.retries == 1
+
+    async def test_transient_session_error_gets_new_session(self, work_item: BeadsWorkItem) -> None:
+        client = AsyncMock()
+        client.create_session = AsyncMock(side_effect=[FakeSession("502 Bad Gateway"), FakeSession()])
+        with patch('pokepoke.copilot_sdk.CopilotClient', return_value=client):
+            result = await invoke_copilot_sdk(work_item, prompt="work", idle_timeout=0.01, retry_config=FAST_RETRIES)
+
+        assert result.success
+        assert client.create_session.await_count == 2
+        assert result.attempt_count == 2
+
+    async def test_fatal_failure_is_not_retried(self, work_item: BeadsWorkItem) -> None:
+        client = AsyncMock()
+        client.start = AsyncMock(side_effect=Exception("401 Unauthorized"))
+        with patch('pokepoke.copilot_sdk.CopilotClient', return_value=client):
+            result = await invoke_copilot_sdk(work_item, prompt="work", idle_timeout=0.01, retry_config=FAST_RETRIES)
+
+        assert not result.success
+        client.start.assert_awaited_once()
+        assert result.attempt_count == 1
+        assert result.stats is None
+
+    async def test_failed_follow_up_is_not_retried(self, work_item: BeadsWorkItem) -> None:
+        session = FakeSession()
+        client = AsyncMock()
+        client.create_session = AsyncMock(return_value=session)
+        conversation = CopilotConversation()
+        with patch('pokepoke.copilot_sdk.CopilotClient', return_value=client):
+            await invoke_copilot_sdk(work_item, prompt="work", idle_timeout=0.01, conversation=conversation)
+            session.error = "connection reset"
+            result = await invoke_copilot_sdk(
+                work_item, prompt="feedback", idle_timeout=0.01, conversation=conversation, retry_config=FAST_RETRIES
+            )
+
+        assert not result.success
+        assert result.attempt_count == 1
+        client.create_session.assert_awaited_once()
+
+    async def test_stops_retrying_when_out_of_time(self, work_item: BeadsWorkItem) -> None:
+        client = AsyncMock()
+        client.start = AsyncMock(side_effect=ConnectionError("CLI exited"))
+        slow = RetryConfig(max_retries=3, initial_delay=30.0, jitter=False)
+        with patch('pokepoke.copilot_sdk.CopilotClient', return_value=client):
+            result = await invoke_copilot_sdk(work_item, prompt="work", timeout=5.0, retry_config=slow)
+
+        assert not result.success
+        client.start.assert_awaited_once()
+
+
+@pytest.mark.asyncio
+class TestBackoffSleep:
+    """Test the shutdown-aware backoff wait."""
+
+    async def test_completes(self) -> None:
+        assert await backoff_sleep(0.01)
+
+    async def test_shutdown_cuts_it_short(self) -> None:
+        with patch('pokepoke.copilot_retry.is_shutting_down', return_value=True):
+            assert not await asyncio.wait_for(backoff_sleep(30.0), timeout=1.0)
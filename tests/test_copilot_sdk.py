@@ -107,24 +107,26 @@ class TestBuildPromptFromWorkItem:
     def test_build_prompt_from_work_item(self, mock_service_class, sample_work_item):
         """Test building prompt from work item."""
         mock_service = MagicMock()
-        mock_service.load_and_render.return_value = "Rendered prompt"
+        mock_service.render_with_item.return_value = "Rendered prompt"
         mock_service_class.return_value = mock_service
         
         result = build_prompt_from_work_item(sample_work_item)
         
         assert result == "Rendered prompt"
-        mock_service.load_and_render.assert_called_once()
-        call_args = mock_service.load_and_render.call_args
+        mock_service.render_with_item.assert_called_once()
+        call_args = mock_service.render_with_item.call_args
         assert call_args[0][0] == "beads-item"
-        variables = call_args[0][1]
-        assert variables["item_id"] == "test-123"
-        assert variables["title"] == "Test work item"
+        # Item fields go after the stable prefix, not into the template
+        assert "item_id" not in call_args[0][1]
+        item_variables = call_args[0][2]
+        assert item_variables["item_id"] == "test-123"
+        assert item_variables["title"] == "Test work item"
     
     @patch('pokepoke.copilot_sdk.PromptService')
     def test_build_prompt_without_labels(self, mock_service_class):
         """Test building prompt for work item without labels."""
         mock_service = MagicMock()
-        mock_service.load_and_render.return_value = "Prompt"
+        mock_service.render_with_item.return_value = "Prompt"
         mock_service_class.return_value = mock_service
         
         work_item = BeadsWorkItem(
@@ -140,23 +142,31 @@ class TestBuildPromptFromWorkItem:
         result = build_prompt_from_work_item(work_item)
         
         assert result == "Prompt"
-        call_args = mock_service.load_and_render.call_args
-        variables = call_args[0][1]
-        assert variables["labels"] is None
+        call_args = mock_service.render_with_item.call_args
+        item_variables = call_args[0][2]
+        assert item_variables["labels"] is None
+
+
+def _close_and_return(result):
+    """Stand-in for run_coroutine that discards the coroutine unawaited."""
+    def run(coro, timeout=None):
+        coro.close()
+        return result
+    return run
 
 
 class TestInvokeCopilotSDKSync:
     """Tests for invoke_copilot_sdk_sync function signature."""
     
-    @patch('pokepoke.copilot_sdk.asyncio.run')
+    @patch('pokepoke.copilot_sdk.run_coroutine')
     def test_invoke_copilot_sdk_sync_with_item_logger(
-        self, mock_asyncio_run, sample_work_item
+        self, mock_run_coroutine, sample_work_item
     ):
         """Test that invoke_copilot_sdk_sync accepts item_logger parameter."""
         mock_result = MagicMock()
         mock_result.success = True
         mock_result.output = "Test output"
-        mock_asyncio_run.return_value = mock_result
+        mock_run_coroutine.side_effect = _close_and_return(mock_result)
         
         # Create a mock logger
         mock_logger = MagicMock()
@@ -169,11 +179,11 @@ class TestInvokeCopilotSDKSync:
         
         # Verify function accepts the parameter and completed
         assert result == mock_result
-        assert mock_asyncio_run.called
+        assert mock_run_coroutine.called
     
-    @patch('pokepoke.copilot_sdk.asyncio.run')
+    @patch('pokepoke.copilot_sdk.run_coroutine')
     def test_invoke_copilot_sdk_sync_with_custom_prompt(
-        self, mock_asyncio_run, sample_work_item
+        self, mock_run_coroutine, sample_work_item
     ):
         """Test invoke_copilot_sdk_sync with custom prompt."""
         from pokepoke.types import CopilotResult
@@ -183,7 +193,7 @@ class TestInvokeCopilotSDKSync:
             success=True,
             output="Custom prompt result"
         )
-        mock_asyncio_run.return_value = mock_result
+        mock_run_coroutine.side_effect = _close_and_return(mock_result)
         
         result = invoke_copilot_sdk_sync(
             work_item=sample_work_item,
@@ -192,7 +202,7 @@ class TestInvokeCopilotSDKSync:
         
         assert result.success
         assert result.work_item_id == sample_work_item.id
-        mock_asyncio_run.assert_called_once()
+        mock_run_coroutine.assert_called_once()
 
 
 @pytest.mark.asyncio
@@ -247,7 +257,62 @@ class TestInvokeCopilotSDKAsync:
         assert result.success
         mock_client.start.assert_called_once()
         mock_client.create_session.assert_called_once()
-        mock_client.stop.assert_called_once()
+        # A clean run leaves the client warm in the pool instead of stopping it
+        mock_client.stop.assert_not_called()
+        
+        from pokepoke.copilot_pool import get_client_pool
+        assert get_client_pool().idle_count() == 1
+        
+        # The next invocation reuses the running client
+        second = await invoke_copilot_sdk(
+            work_item=sample_work_item,
+            prompt="Test prompt",
+            idle_timeout=0.01
+        )
+        assert second.success
+        mock_client.start.assert_called_once()
+        mock_client.ping.assert_awaited_once()
+        assert mock_client_class.call_count == 1
+        assert get_client_pool().stats.hits == 1
+
+    @patch('pokepoke.copilot_sdk.CopilotClient')
+    async def test_worktrees_share_a_client(self, mock_client_class, sample_work_item, tmp_path):
+        """Each worktree is a session working directory, so items reuse one warm client."""
+        from pokepoke.copilot_sdk import invoke_copilot_sdk
+        import asyncio
+        
+        mock_client = AsyncMock()
+        mock_session = AsyncMock()
+        mock_session.session_id = "test-session-cwd"
+        mock_client.create_session = AsyncMock(return_value=mock_session)
+        mock_client_class.return_value = mock_client
+        
+        stored_handler = None
+        def mock_on(handler):
+            nonlocal stored_handler
+            stored_handler = handler
+        mock_session.on = mock_on
+        
+        async def mock_send(message):
+            async def trigger_completion():
+                await asyncio.sleep(0.01)
+                event = MagicMock()
+                event.type.value = "session.idle"
+                stored_handler(event)
+            asyncio.create_task(trigger_completion())
+        mock_session.send = mock_send
+        
+        worktrees = [str(tmp_path / "task-a"), str(tmp_path / "task-b")]
+        for worktree in worktrees:
+            result = await invoke_copilot_sdk(
+                work_item=sample_work_item, prompt="Test prompt", idle_timeout=0.01, cwd=worktree
+            )
+            assert result.success
+        
+        assert mock_client_class.call_count == 1
+        assert "cwd" not in mock_client_class.call_args[0][0]
+        configs = [c[0][0] for c in mock_client.create_session.call_args_list]
+        assert [c["working_directory"] for c in configs] == worktrees
     
     @patch('pokepoke.copilot_sdk.CopilotClient')
     async def test_invoke_copilot_sdk_with_message_delta(self, mock_client_class, sample_work_item):
@@ -481,11 +546,14 @@ class TestInvokeCopilotSDKAsync:
         assert not result.success
         assert "timeout" in result.error.lower()
         mock_session.abort.assert_called_once()
+        # A timed-out client is not trusted for reuse
+        mock_client.stop.assert_called_once()
     
     @patch('pokepoke.copilot_sdk.CopilotClient')
     async def test_invoke_copilot_sdk_exception(self, mock_client_class, sample_work_item):
-        """Test SDK invocation with exception during execution."""
+        """Test SDK invocation with a transient exception on every attempt."""
         from pokepoke.copilot_sdk import invoke_copilot_sdk
+        from pokepoke.types import RetryConfig
         
         mock_client = AsyncMock()
         mock_client.start = AsyncMock(side_effect=Exception("Connection failed"))
@@ -495,12 +563,16 @@ class TestInvokeCopilotSDKAsync:
         
         result = await invoke_copilot_sdk(
             work_item=sample_work_item,
+            retry_config=RetryConfig(max_retries=2, initial_delay=0.01, jitter=False),
             idle_timeout=0.01
         )
         
         assert not result.success
         assert "Connection failed" in result.error
-        mock_client.stop.assert_called_once()
+        # Each failed client is stopped, then the start is retried
+        assert mock_client.stop.call_count == 3
+        assert result.attempt_count == 3
+        assert result.stats.retries == 2
     
     @patch('pokepoke.copilot_sdk.CopilotClient')
     async def test_invoke_copilot_sdk_stop_exception(self, mock_client_class, sample_work_item):
@@ -779,7 +851,7 @@ class TestInvokeCopilotSDKAsync:
     @patch('pokepoke.copilot_sdk.CopilotClient')
     @patch('pokepoke.copilot_sdk.os.environ', new_callable=dict)
     async def test_invoke_copilot_sdk_environment_handling(self, mock_environ, mock_client_class, sample_work_item):
-        """Test SDK invocation handles PYTHONIOENCODING environment variable."""
+        """The CLI gets PYTHONIOENCODING via its own env; os.environ is left alone."""
         from pokepoke.copilot_sdk import invoke_copilot_sdk
         import asyncio
         
@@ -820,8 +892,10 @@ class TestInvokeCopilotSDKAsync:
         )
         
         assert result.success
-        # Environment should be restored to original value
-        assert mock_environ.get('PYTHONIOENCODING') == 'utf-8'
+        client_opts = mock_client_class.call_args[0][0]
+        assert client_opts["env"]["PYTHONIOENCODING"] == 'utf-8:replace'
+        # The process-wide environment is never modified
+        assert mock_environ == {'PYTHONIOENCODING': 'utf-8'}
     
     @patch('pokepoke.copilot_sdk.CopilotClient')
     async def test_invoke_copilot_sdk_with_tool_requests(self, mock_client_class, sample_work_item):
@@ -893,3 +967,51 @@ class TestInvokeCopilotSDKAsync:
         
         assert not result.success
         assert "Interrupted by user" in result.error
+    
+    @patch('pokepoke.copilot_sdk.CopilotClient')
+    async def test_invoke_copilot_sdk_rate_limit_falls_back(self, mock_client_class, sample_work_item):
+        """Test a rate-limit error retries in a new session on the next model in the chain."""
+        from pokepoke.copilot_sdk import invoke_copilot_sdk
+        from pokepoke.model_governor import get_model_governor, get_throttle_states
+        import asyncio
+        
+        def make_session(error_message):
+            session = AsyncMock()
+            session.session_id = "s"
+            handlers = []
+            session.on = lambda handler: handlers.append(handler)
+            
+            async def send(message):
+                async def emit():
+                    await asyncio.sleep(0.01)
+                    event = MagicMock()
+                    if error_message:
+                        event.type.value = "session.error"
+                        event.data = MagicMock(message=error_message)
+                    else:
+                        event.type.value = "session.idle"
+                    handlers[-1](event)
+                asyncio.create_task(emit())
+            session.send = send
+            return session
+        
+        mock_client = AsyncMock()
+        mock_client.create_session = AsyncMock(side_effect=[
+            make_session("Rate limit exceeded"), make_session(None)
+        ])
+        mock_client_class.return_value = mock_client
+        
+        result = await invoke_copilot_sdk(
+            work_item=sample_work_item,
+            prompt="Test prompt",
+            idle_timeout=0.01,
+            model="claude-opus-4.6"
+        )
+        
+        default, fallback = get_model_governor().chain("claude-opus-4.6")[:2]
+        assert result.success
+        assert result.model == fallback
+        models = [c.args[0]["model"] for c in mock_client.create_session.call_args_list]
+        assert models == [default, fallback]
+        assert get_throttle_states()[default].rate_limits == 1
+        assert get_throttle_states()[default].in_flight == 0
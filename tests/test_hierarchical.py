@@ -37,31 +37,32 @@ class TestHierarchicalWorkAssignment:
         
         assert children == []
     
+    @patch('pokepoke.beads_hierarchy.get_issues_bulk')
     @patch('pokepoke.beads_hierarchy.get_issue_dependencies')
-    def test_get_children_with_parent_dependents(self, mock_get_issue: Mock) -> None:
+    def test_get_children_with_parent_dependents(self, mock_get_issue: Mock, mock_bulk: Mock) -> None:
         """Test getting children with parent-type dependents."""
         # Mock parent issue
-        mock_get_issue.side_effect = [
-            IssueWithDependencies(
-                id="epic-1",
-                title="Epic",
-                description="",
-                status="open",
-                priority=1,
-                issue_type="epic",
-                dependents=[
-                    Dependency(
-                        id="task-1",
-                        title="Task 1",
-                        issue_type="task",
-                        dependency_type="parent",
-                        status="open",
-                        priority=1
-                    )
-                ]
-            ),
-            # Mock child issue details
-            IssueWithDependencies(
+        mock_get_issue.return_value = IssueWithDependencies(
+            id="epic-1",
+            title="Epic",
+            description="",
+            status="open",
+            priority=1,
+            issue_type="epic",
+            dependents=[
+                Dependency(
+                    id="task-1",
+                    title="Task 1",
+                    issue_type="task",
+                    dependency_type="parent",
+                    status="open",
+                    priority=1
+                )
+            ]
+        )
+        # Mock child issue details, fetched in one batch
+        mock_bulk.return_value = {
+            "task-1": IssueWithDependencies(
                 id="task-1",
                 title="Task 1",
                 description="Task description",
@@ -69,7 +70,7 @@ class TestHierarchicalWorkAssignment:
                 priority=1,
                 issue_type="task"
             )
-        ]
+        }
         
         children = get_children("epic-1")
         
@@ -77,6 +78,7 @@ class TestHierarchicalWorkAssignment:
         assert children[0].id == "task-1"
         assert children[0].title == "Task 1"
         assert children[0].issue_type == "task"
+        mock_bulk.assert_called_once_with(["task-1"])
     
     @patch('pokepoke.beads_hierarchy.get_children')
     def test_get_next_child_task_no_children(self, mock_get_children: Mock) -> None:
@@ -634,6 +636,27 @@ class TestResolveToLeafTask:
         assert result is not None
         assert result.id == "epic-1"
 
+    @patch('pokepoke.beads_hierarchy.get_children')
+    def test_skipped_child_passed_over(self, mock_get_children: Mock) -> None:
+        """A child in skip_ids (held by another worker) is not returned."""
+        epic = BeadsWorkItem(
+            id="epic-1",
+            title="Epic",
+            description="",
+            status="open",
+            priority=1,
+            issue_type="epic"
+        )
+        mock_get_children.return_value = [
+            BeadsWorkItem(id="task-1", title="First", description="", status="open", priority=1, issue_type="task"),
+            BeadsWorkItem(id="task-2", title="Second", description="", status="open", priority=2, issue_type="task"),
+        ]
+        
+        result = resolve_to_leaf_task(epic, skip_ids={"task-1"})
+        
+        assert result is not None
+        assert result.id == "task-2"
+
     @patch('pokepoke.beads_hierarchy.get_children')
     def test_epic_with_child_task_returns_child(self, mock_get_children: Mock) -> None:
         """Epic with a child task should return the child task."""
@@ -661,6 +684,41 @@ class TestResolveToLeafTask:
         assert result is not None
         assert result.id == "task-1"
 
+    @patch('pokepoke.beads_hierarchy.get_issues_bulk')
+    @patch('pokepoke.beads_hierarchy.get_children')
+    def test_next_level_fetched_in_one_batch(
+        self, mock_get_children: Mock, mock_bulk: Mock
+    ) -> None:
+        """The children of every child feature are looked up together, not one bd show each."""
+        cached = {}
+        
+        def feature(feature_id: str, priority: int, child_id: str) -> BeadsWorkItem:
+            cached[feature_id] = (IssueWithDependencies(
+                id=feature_id, title=feature_id, status="open", priority=priority, issue_type="feature",
+                dependents=[Dependency(id=child_id, title=child_id, issue_type="task", dependency_type="parent-child")]
+            ))
+            return BeadsWorkItem(
+                id=feature_id, title=feature_id, description="", status="open",
+                priority=priority, issue_type="feature"
+            )
+        
+        epic = BeadsWorkItem(
+            id="epic-1", title="Epic", description="", status="open", priority=1, issue_type="epic"
+        )
+        mock_get_children.side_effect = [
+            [feature("feature-1", 1, "task-1"), feature("feature-2", 2, "task-2")],
+            [BeadsWorkItem(id="task-1", title="Task", description="", status="open", priority=1, issue_type="task")],
+        ]
+        
+        # Issues cached by the bulk lookup that found the features
+        with patch('pokepoke.beads_hierarchy._direct_snapshot', return_value=None), \
+             patch('pokepoke.beads_hierarchy._issue_cache') as mock_cache:
+            mock_cache.get.side_effect = cached.get
+            result = resolve_to_leaf_task(epic)
+        
+        assert result is not None and result.id == "task-1"
+        mock_bulk.assert_called_once_with(["task-1", "task-2"])
+
     @patch('pokepoke.beads_hierarchy.get_children')
     def test_epic_with_child_feature_resolves_recursively(
         self, mock_get_children: Mock
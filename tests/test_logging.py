@@ -65,7 +65,7 @@ def test_run_logger_item_logging():
         item_logger.log_with_timestamp("Test timestamped message")
         
         # End item log
-        logger.end_item_log(success=True, request_count=5)
+        logger.end_item_log("test-item-123", success=True, request_count=5)
         
         # Check that item log file exists
         item_log_path = logger.item_logs_dir / "test-item-123.log"
@@ -147,12 +147,12 @@ def test_multiple_item_logs():
         # Process first item
         item_logger1 = logger.start_item_log("item-1", "First Item")
         item_logger1.log("First item output\n")
-        logger.end_item_log(success=True, request_count=3)
+        logger.end_item_log("item-1", success=True, request_count=3)
         
         # Process second item
         item_logger2 = logger.start_item_log("item-2", "Second Item")
         item_logger2.log("Second item output\n")
-        logger.end_item_log(success=False, request_count=5)
+        logger.end_item_log("item-2", success=False, request_count=5)
         
         # Check that both item logs exist
         assert (logger.item_logs_dir / "item-1.log").exists()
@@ -169,3 +169,29 @@ def test_multiple_item_logs():
             content2 = f.read()
         assert "Second item output" in content2
         assert "FAILURE" in content2
+
+
+def test_item_logger_stream_appends_until_closed(tmp_path):
+    """Streamed output is appended in order and the handle closes cleanly."""
+    item_logger = ItemLogger(tmp_path, "task-1", "Task")
+
+    item_logger.stream("Hello ")
+    item_logger.log_with_timestamp("between chunks")
+    item_logger.stream("world\n")
+    item_logger.close()
+
+    content = item_logger.log_path.read_text(encoding='utf-8')
+    assert "Hello " in content
+    assert content.index("between chunks") < content.index("world")
+    assert item_logger._file_handle is None
+
+
+def test_item_logger_stream_failure_warns_once(tmp_path, capsys):
+    """A failed write is reported once; later chunks are dropped."""
+    item_logger = ItemLogger(tmp_path, "task-1", "Task")
+    item_logger.log_path = tmp_path / "missing" / "task-1.log"
+
+    item_logger.stream("a")
+    item_logger.stream("b")
+
+    assert capsys.readouterr().out.count("Could not write agent output") == 1
@@ -1,10 +1,16 @@
 """Tests for the periodic maintenance module."""
 
+import subprocess
+
 import pytest
 from unittest.mock import Mock, patch
 from pokepoke.types import AgentStats, SessionStats
 from pokepoke.config import MaintenanceConfig, MaintenanceAgentConfig, ProjectConfig
-from pokepoke.maintenance import aggregate_stats, run_periodic_maintenance
+from pokepoke.claim_registry import get_claim_registry
+from pokepoke.maintenance import (
+    _commit_beads_changes, aggregate_stats, record_item_result, run_periodic_maintenance
+)
+from pokepoke.merge_queue import _merge_lock
 
 
 def _make_default_config() -> ProjectConfig:
@@ -86,6 +92,21 @@ class TestAggregateStats:
         assert session_stats.agent_stats.input_tokens == 300
 
 
+class TestRecordItemResult:
+    """Test folding a processed item into the session statistics."""
+
+    def test_sdk_retries_are_not_counted_twice(self) -> None:
+        session_stats = SessionStats(agent_stats=AgentStats())
+
+        # Two work-agent runs, one of which needed a transient retry
+        record_item_result(session_stats, 3, AgentStats(retries=1), cleanup_runs=0, gate_runs=1,
+                           model_completion=None)
+
+        assert session_stats.agent_stats.retries == 2
+        assert session_stats.work_agent_runs == 1
+
+
+@pytest.mark.usefixtures('no_post_agent_commits')
 class TestRunPeriodicMaintenance:
     """Test run_periodic_maintenance function."""
     
@@ -514,3 +535,141 @@ class TestRunPeriodicMaintenance:
         run_periodic_maintenance(10, session_stats, run_logger)
         calls = [c for c in mock_maintenance.call_args_list if c[0][0] == "Tech Debt"]
         assert len(calls) == 1
+
+
+@pytest.mark.usefixtures('no_post_agent_commits')
+class TestMainRepoAgents:
+    """Agents that work in the main repository must not race merges or live worktrees."""
+
+    @patch('pokepoke.maintenance.get_config')
+    @patch('pokepoke.maintenance.run_maintenance_agent')
+    @patch('pokepoke.agent_runner.run_beta_tester')
+    @patch('pokepoke.agent_runner.run_worktree_cleanup')
+    @patch('pokepoke.maintenance.set_terminal_banner')
+    @patch('pokepoke.terminal_ui.ui')
+    @patch('pokepoke.maintenance._commit_beads_changes')
+    def test_agents_never_run_under_the_merge_lock(
+        self,
+        mock_commit: Mock,
+        mock_ui: Mock,
+        mock_banner: Mock,
+        mock_worktree_cleanup: Mock,
+        mock_beta_tester: Mock,
+        mock_maintenance: Mock,
+        mock_config: Mock
+    ) -> None:
+        """No agent session holds the lock; main-repo agents take it only to commit."""
+        mock_config.return_value = _make_default_config()
+        held = {}
+        committed = {}
+        mock_commit.side_effect = lambda repo, name: committed.setdefault(name, _merge_lock._is_owned())
+
+        def record(name: str, *args, **kwargs):
+            held[name] = _merge_lock._is_owned()
+            return None
+
+        mock_maintenance.side_effect = record
+        mock_beta_tester.side_effect = lambda **kwargs: record("Beta Tester")
+        mock_worktree_cleanup.side_effect = lambda **kwargs: record("Worktree Cleanup")
+
+        # 60 is a multiple of every default frequency
+        run_periodic_maintenance(60, SessionStats(agent_stats=AgentStats()), Mock())
+
+        assert set(held.values()) == {False}
+        assert committed == {"Tech Debt": True, "Code Review": True, "Worktree Cleanup": True}
+
+    @patch('pokepoke.maintenance.get_config')
+    @patch('pokepoke.maintenance.run_maintenance_agent')
+    @patch('pokepoke.agent_runner.run_beta_tester')
+    @patch('pokepoke.agent_runner.run_worktree_cleanup')
+    @patch('pokepoke.maintenance.set_terminal_banner')
+    @patch('pokepoke.terminal_ui.ui')
+    def test_worktree_cleanup_leaves_claimed_items_alone(
+        self,
+        mock_ui: Mock,
+        mock_banner: Mock,
+        mock_worktree_cleanup: Mock,
+        mock_beta_tester: Mock,
+        mock_maintenance: Mock,
+        mock_config: Mock
+    ) -> None:
+        """Items other workers hold are passed to the cleanup agent to keep."""
+        mock_config.return_value = _make_default_config()
+        mock_maintenance.return_value = None
+        mock_worktree_cleanup.return_value = None
+        get_claim_registry().try_claim("task-1", "worker-2")
+
+        run_periodic_maintenance(4, SessionStats(agent_stats=AgentStats()), Mock())
+
+        assert mock_worktree_cleanup.call_args[1]["keep_item_ids"] == {"task-1"}
+
+
+    @patch('pokepoke.maintenance.get_config')
+    @patch('pokepoke.maintenance.run_maintenance_agent')
+    @patch('pokepoke.agent_runner.run_beta_tester')
+    @patch('pokepoke.agent_runner.run_worktree_cleanup')
+    @patch('pokepoke.maintenance.set_terminal_banner')
+    @patch('pokepoke.terminal_ui.ui')
+    def test_each_run_logs_full_output(
+        self,
+        mock_ui: Mock,
+        mock_banner: Mock,
+        mock_worktree_cleanup: Mock,
+        mock_beta_tester: Mock,
+        mock_maintenance: Mock,
+        mock_config: Mock
+    ) -> None:
+        """Maintenance agents stream to a log of their own, closed after the run."""
+        mock_config.return_value = _make_default_config()
+        mock_maintenance.return_value = None
+        mock_worktree_cleanup.return_value = None
+        run_logger = Mock()
+
+        run_periodic_maintenance(4, SessionStats(agent_stats=AgentStats()), run_logger)
+
+        agent_logger = run_logger.start_item_log.return_value
+        assert mock_worktree_cleanup.call_args[1]["item_logger"] is agent_logger
+        started = [c[0][0] for c in run_logger.start_item_log.call_args_list]
+        ended = [c[0][0] for c in run_logger.end_item_log.call_args_list]
+        assert any(log_id.startswith("maintenance-worktree_cleanup-") for log_id in started)
+        assert ended == started
+
+
+class TestCommitBeadsChanges:
+    """Test committing what a main-repo agent left in .beads/."""
+
+    @staticmethod
+    def _git(repo, *args: str) -> str:
+        return subprocess.run(["git", *args], cwd=repo, capture_output=True, text=True, check=True).stdout
+
+    def _repo(self, tmp_path):
+        self._git(tmp_path, "init", "-q")
+        self._git(tmp_path, "config", "user.email", "test@example.com")
+        self._git(tmp_path, "config", "user.name", "Test")
+        (tmp_path / "README.md").write_text("readme\n")
+        self._git(tmp_path, "add", ".")
+        self._git(tmp_path, "commit", "-q", "-m", "init")
+        return tmp_path
+
+    def test_commits_only_beads_changes(self, tmp_path) -> None:
+        repo = self._repo(tmp_path)
+        (repo / ".beads").mkdir()
+        (repo / ".beads" / "issues.jsonl").write_text("{}\n")
+        (repo / "notes.txt").write_text("unrelated\n")
+
+        _commit_beads_changes(repo, "Tech Debt")
+
+        assert "chore: sync beads after Tech Debt Agent" in self._git(repo, "log", "-1", "--format=%s")
+        assert self._git(repo, "status", "--porcelain").strip() == "?? notes.txt"
+
+    def test_no_commit_without_beads_changes(self, tmp_path) -> None:
+        repo = self._repo(tmp_path)
+
+        _commit_beads_changes(repo, "Code Review")
+
+        assert self._git(repo, "log", "-1", "--format=%s").strip() == "init"
+
+    def test_git_failure_is_reported_not_raised(self, tmp_path, capsys) -> None:
+        _commit_beads_changes(tmp_path / "missing", "Tech Debt")
+
+        assert "Could not commit beads changes from Tech Debt Agent" in capsys.readouterr().out
@@ -0,0 +1,209 @@
+"""Unit tests for the background maintenance lane."""
+
+import threading
+import time
+from typing import List
+from unittest.mock import Mock, patch
+
+import pytest
+
+from pokepoke import shutdown
+from pokepoke.config import MaintenanceAgentConfig, ProjectConfig
+from pokepoke.maintenance_lane import MaintenanceLane, create_maintenance_lane
+from pokepoke.types import AgentStats, SessionStats
+
+pytestmark = pytest.mark.usefixtures('no_post_agent_commits')
+
+
+@pytest.fixture(autouse=True)
+def reset_shutdown():
+    shutdown.reset()
+    yield
+    shutdown.reset()
+
+
+def _agent(name: str) -> MaintenanceAgentConfig:
+    return MaintenanceAgentConfig(name=name, prompt_file=f"{name.lower()}.md", frequency=1)
+
+
+class _FakeRunner:
+    """Stands in for run_maintenance_agent_config and records concurrency."""
+
+    def __init__(self, duration: float = 0.05) -> None:
+        self.duration = duration
+        self.started: List[str] = []
+        self.running = 0
+        self.max_running = 0
+        self.release = threading.Event()
+        self.release.set()
+        self._lock = threading.Lock()
+
+    def __call__(self, agent_cfg: MaintenanceAgentConfig, stats: SessionStats, run_logger: Mock,
+                 foreground: bool = True) -> None:
+        assert foreground is False
+        with self._lock:
+            self.started.append(agent_cfg.name)
+            self.running += 1
+            self.max_running = max(self.max_running, self.running)
+        self.release.wait()
+        time.sleep(self.duration)
+        stats.janitor_agent_runs += 1
+        stats.agent_stats.input_tokens += 10
+        with self._lock:
+            self.running -= 1
+
+
+@pytest.fixture
+def runner():
+    fake = _FakeRunner()
+    with patch('pokepoke.maintenance_lane.run_maintenance_agent_config', side_effect=fake):
+        yield fake
+
+
+class TestMaintenanceLane:
+    """Test queuing, the concurrency cap, pausing and stats collection."""
+
+    def test_runs_agents_and_collects_stats(self, runner: _FakeRunner) -> None:
+        lane = MaintenanceLane(Mock())
+        session = SessionStats(agent_stats=AgentStats())
+
+        assert lane.submit(_agent("Janitor")) is True
+        assert lane.submit(_agent("Tech Debt")) is True
+        lane.close(session)
+
+        assert runner.started == ["Janitor", "Tech Debt"]
+        assert session.janitor_agent_runs == 2
+        assert session.agent_stats.input_tokens == 20
+
+    def test_concurrency_cap(self, runner: _FakeRunner) -> None:
+        lane = MaintenanceLane(Mock(), max_concurrent=2)
+
+        for name in ("A", "B", "C", "D"):
+            lane.submit(_agent(name))
+        lane.close()
+
+        assert sorted(runner.started) == ["A", "B", "C", "D"]
+        assert runner.max_running == 2
+
+    def test_same_agent_not_queued_twice(self, runner: _FakeRunner) -> None:
+        runner.release.clear()
+        lane = MaintenanceLane(Mock())
+
+        assert lane.submit(_agent("Janitor")) is True
+        assert lane.submit(_agent("Janitor")) is False
+        runner.release.set()
+        lane.close()
+
+        assert runner.started == ["Janitor"]
+        # Once it has finished it can be queued again
+        lane2 = MaintenanceLane(Mock())
+        assert lane2.submit(_agent("Janitor")) is True
+        lane2.close()
+
+    def test_pauses_while_queue_is_hot(self, runner: _FakeRunner) -> None:
+        lane = MaintenanceLane(Mock(), pause_at_ready=3)
+        lane.set_ready_count(5)
+
+        lane.submit(_agent("Janitor"))
+        time.sleep(0.1)
+        assert lane.paused is True
+        assert runner.started == []
+        assert lane.pending_count() == 1
+
+        lane.set_ready_count(1)
+        lane.close()
+        assert runner.started == ["Janitor"]
+
+    def test_close_drains_paused_queue(self, runner: _FakeRunner) -> None:
+        lane = MaintenanceLane(Mock(), pause_at_ready=1)
+        lane.set_ready_count(10)
+
+        lane.submit(_agent("Janitor"))
+        lane.close()
+
+        assert runner.started == ["Janitor"]
+        assert lane.submit(_agent("Tech Debt")) is False
+
+    def test_refusal_while_closing_says_so(self, runner: _FakeRunner, capsys) -> None:
+        lane = MaintenanceLane(Mock())
+        lane.close()
+
+        assert lane.submit(_agent("Janitor")) is False
+
+        out = capsys.readouterr().out
+        assert "shutting down" in out
+        assert "already queued" not in out
+
+    def test_worktree_cleanup_never_runs_on_the_lane(self) -> None:
+        """It runs inline on the scheduling thread; its stats are still collected."""
+        threads: List[str] = []
+
+        def run(agent_cfg: MaintenanceAgentConfig, stats: SessionStats, run_logger: Mock,
+                foreground: bool = True) -> None:
+            threads.append(threading.current_thread().name)
+            assert foreground is True
+            stats.worktree_cleanup_agent_runs += 1
+
+        lane = MaintenanceLane(Mock())
+        session = SessionStats(agent_stats=AgentStats())
+        with patch('pokepoke.maintenance_lane.run_maintenance_agent_config', side_effect=run), \
+             patch('pokepoke.maintenance_lane.due_maintenance_agents', return_value=[_agent("Worktree Cleanup")]):
+            assert lane.submit(_agent("Worktree Cleanup")) is False
+            lane.schedule(4)
+            lane.close(session)
+
+        assert threads == [threading.current_thread().name]
+        assert session.worktree_cleanup_agent_runs == 1
+
+    def test_shutdown_drops_queued_agents(self, runner: _FakeRunner) -> None:
+        lane = MaintenanceLane(Mock(), pause_at_ready=1)
+        lane.set_ready_count(10)
+        lane.submit(_agent("Janitor"))
+
+        shutdown._shutdown_event.set()
+        lane.close()
+
+        assert runner.started == []
+
+    def test_agent_error_does_not_stop_lane(self) -> None:
+        calls: List[str] = []
+
+        def run(agent_cfg: MaintenanceAgentConfig, stats: SessionStats, run_logger: Mock,
+                foreground: bool = True) -> None:
+            calls.append(agent_cfg.name)
+            if agent_cfg.name == "Bad":
+                raise RuntimeError("boom")
+
+        with patch('pokepoke.maintenance_lane.run_maintenance_agent_config', side_effect=run):
+            lane = MaintenanceLane(Mock())
+            lane.submit(_agent("Bad"))
+            lane.submit(_agent("Good"))
+            lane.close()
+
+        assert calls == ["Bad", "Good"]
+
+    def test_schedule_uses_due_agents(self, runner: _FakeRunner) -> None:
+        lane = MaintenanceLane(Mock())
+        with patch('pokepoke.maintenance_lane.due_maintenance_agents', return_value=[_agent("Janitor")]) as due:
+            lane.schedule(4)
+        lane.close()
+
+        due.assert_called_once_with(4)
+        assert runner.started == ["Janitor"]
+
+
+class TestCreateMaintenanceLane:
+    """The lane is opt-in through maintenance.background."""
+
+    def test_disabled_by_default(self) -> None:
+        with patch('pokepoke.maintenance_lane.get_config', return_value=ProjectConfig()):
+            assert create_maintenance_lane(Mock()) is None
+
+    def test_enabled_from_config(self) -> None:
+        config = ProjectConfig.from_dict({"maintenance": {"background": True, "max_concurrent": 2, "pause_at_ready": 4}})
+        with patch('pokepoke.maintenance_lane.get_config', return_value=config):
+            lane = create_maintenance_lane(Mock())
+
+        assert lane is not None
+        assert lane.max_concurrent == 2
+        assert lane.pause_at_ready == 4
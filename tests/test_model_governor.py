@@ -0,0 +1,160 @@
+"""Tests for the process-wide model rate-limit governor."""
+
+import asyncio
+import time
+from unittest.mock import patch
+
+import pytest
+
+from pokepoke.model_governor import ModelGovernor, get_model_governor, is_rate_limit_error
+
+
+class TestRateLimitDetection:
+    """Test recognising rate-limit errors."""
+
+    @pytest.mark.parametrize("message", [
+        "Rate limit exceeded", "HTTP 429", "Too Many Requests", "rate_limit_error: slow down",
+        "Request failed with status code 429", "CAPIError: 429",
+    ])
+    def test_detects_rate_limits(self, message: str) -> None:
+        assert is_rate_limit_error(message)
+
+    @pytest.mark.parametrize("message", [
+        "model exploded", "Failed to close item-4291", "Error in task-429", "timeout after 4290ms",
+        "HTTP 500 after 429 tokens",
+    ])
+    def test_ignores_other_errors(self, message: str) -> None:
+        assert not is_rate_limit_error(message)
+
+
+@pytest.mark.asyncio
+class TestAcquire:
+    """acquire picks the first model in the chain that is not throttled."""
+
+    async def test_returns_requested_model_when_free(self) -> None:
+        governor = ModelGovernor(["b", "c"])
+
+        assert await governor.acquire("a") == "a"
+        assert governor.states["a"].in_flight == 1
+        assert governor.states["a"].invocations == 1
+
+    async def test_falls_back_along_chain_while_cooling_down(self) -> None:
+        governor = ModelGovernor(["b", "c"])
+        governor.report_rate_limit("a")
+        governor.report_rate_limit("b")
+
+        assert await governor.acquire("a") == "c"
+        assert governor.states["a"].fallbacks_from == 1
+
+    async def test_pinned_waits_for_the_requested_model(self) -> None:
+        governor = ModelGovernor(["b"])
+        governor.report_rate_limit("a", "Rate limit - retry after 0.1 seconds")
+
+        started = time.monotonic()
+        assert await governor.acquire("a", pinned=True) == "a"
+
+        assert time.monotonic() - started >= 0.05
+        assert governor.states["a"].deferred_seconds > 0
+        assert "b" not in governor.states
+
+    async def test_waits_when_whole_chain_is_throttled(self) -> None:
+        governor = ModelGovernor(["b"])
+        governor.report_rate_limit("a", "retry after 5 seconds")
+        governor.report_rate_limit("b", "retry after 0.1 seconds")
+
+        assert await governor.acquire("a") == "b"
+
+    async def test_max_wait_gives_up_waiting(self) -> None:
+        governor = ModelGovernor()
+        governor.report_rate_limit("a", "retry after 60 seconds")
+
+        assert await governor.acquire("a", max_wait=0.0) == "a"
+
+    async def test_shutdown_stops_waiting(self) -> None:
+        governor = ModelGovernor()
+        governor.report_rate_limit("a", "retry after 60 seconds")
+
+        with patch('pokepoke.model_governor.is_shutting_down', return_value=True):
+            assert await asyncio.wait_for(governor.acquire("a"), timeout=1.0) == "a"
+
+
+@pytest.mark.asyncio
+class TestConcurrencyLimit:
+    """Rate limits halve a model's concurrency; successes raise it again."""
+
+    async def test_rate_limit_halves_in_flight_limit(self) -> None:
+        governor = ModelGovernor(["b"])
+        for _ in range(4):
+            await governor.acquire("a")
+        governor.report_rate_limit("a", "retry after 0 seconds")
+
+        assert governor.states["a"].concurrency_limit == 2
+        # Two still running on "a" - the next invocation uses the fallback
+        governor.release("a", succeeded=False)
+        assert await governor.acquire("a") == "b"
+
+    async def test_successes_lift_the_limit(self) -> None:
+        governor = ModelGovernor()
+        await governor.acquire("a")
+        governor.report_rate_limit("a", "retry after 0 seconds")
+        assert governor.states["a"].concurrency_limit == 1
+
+        for _ in range(8):
+            governor.release("a")
+            await governor.acquire("a")
+
+        assert governor.states["a"].concurrency_limit == 0
+
+    async def test_configured_cap_is_never_exceeded(self) -> None:
+        governor = ModelGovernor(["b"], max_concurrent=1)
+
+        assert await governor.acquire("a") == "a"
+        assert await governor.acquire("a") == "b"
+        governor.release("a")
+        assert governor.states["a"].concurrency_limit == 1
+
+
+class TestCooldown:
+    """Test cooldown lengths."""
+
+    def test_grows_with_consecutive_limits_until_success(self) -> None:
+        governor = ModelGovernor(base_cooldown=10.0, max_cooldown=25.0)
+
+        assert governor.report_rate_limit("a") == 10.0
+        assert governor.report_rate_limit("a") == 20.0
+        assert governor.report_rate_limit("a") == 25.0
+        governor.release("a")
+        assert governor.report_rate_limit("a") == 10.0
+
+    def test_follows_retry_after_hint(self) -> None:
+        governor = ModelGovernor(base_cooldown=10.0)
+
+        assert governor.report_rate_limit("a", "429: please retry after 42 seconds") == 42.0
+
+
+class TestConfiguredGovernor:
+    """get_model_governor builds the chain from the project config."""
+
+    def test_defaults_to_fallback_then_candidates(self) -> None:
+        with patch('pokepoke.model_governor.get_config') as mock_config:
+            models = mock_config.return_value.models
+            models.fallback_chain = []
+            models.fallback = "sonnet"
+            models.candidate_models = ["opus", "gpt"]
+            models.rate_limit_cooldown = 30.0
+            models.max_concurrent_per_model = 0
+
+            assert get_model_governor().chain("opus") == ["opus", "sonnet", "gpt"]
+
+    def test_uses_configured_chain(self) -> None:
+        with patch('pokepoke.model_governor.get_config') as mock_config:
+            models = mock_config.return_value.models
+            models.fallback_chain = ["gpt", "haiku"]
+            models.rate_limit_cooldown = 5.0
+            models.max_concurrent_per_model = 3
+
+            governor = get_model_governor()
+
+        assert governor.chain("opus") == ["opus", "gpt", "haiku"]
+        assert governor.base_cooldown == 5.0
+        assert governor.max_concurrent == 3
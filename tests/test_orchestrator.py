@@ -2,10 +2,21 @@
 
 from unittest.mock import Mock, patch
 
+import pytest
+
 from pokepoke.orchestrator import run_orchestrator
 from pokepoke.workflow import select_work_item, process_work_item
 from pokepoke.types import BeadsWorkItem, CopilotResult
 
+pytestmark = pytest.mark.usefixtures('run_artifacts_in_tmp_path')
+
+
+@pytest.fixture(autouse=True)
+def no_claim_leases():
+    """process_work_item must not write lease labels through the real bd."""
+    with patch('pokepoke.workflow.LeaseHeartbeat'):
+        yield
+
 
 class TestSelectWorkItem:
     """Test work item selection logic."""
@@ -16,10 +27,12 @@ class TestSelectWorkItem:
         
         assert result is None
     
+    @patch('pokepoke.work_item_selection.load_beads_graph')
     @patch('pokepoke.work_item_selection.select_next_hierarchical_item')
     def test_select_work_item_autonomous_mode(
         self, 
-        mock_select_hierarchical: Mock
+        mock_select_hierarchical: Mock,
+        mock_load_graph: Mock
     ) -> None:
         """Test autonomous mode uses hierarchical selection."""
         items = [
@@ -38,7 +51,9 @@ class TestSelectWorkItem:
         
         assert result is not None
         assert result.id == "task-1"
-        mock_select_hierarchical.assert_called_once_with(items)
+        mock_select_hierarchical.assert_called_once_with(
+            items, graph=mock_load_graph.return_value, skip_ids=None
+        )
     
     @patch('builtins.input')
     def test_select_work_item_interactive_quit(self, mock_input: Mock) -> None:
@@ -442,6 +457,44 @@ class TestRunOrchestrator:
         assert result == 0
         mock_process.assert_not_called()
     
+    @patch('subprocess.run')  # Mock git status check
+    @patch('pokepoke.orchestrator.BeadsWatcher')
+    @patch('pokepoke.orchestrator.process_work_item')
+    @patch('pokepoke.orchestrator.select_work_item')
+    @patch('pokepoke.orchestrator.get_ready_work_items')
+    def test_run_orchestrator_watch_waits_for_work(
+        self,
+        mock_get_items: Mock,
+        mock_select: Mock,
+        mock_process: Mock,
+        mock_watcher_cls: Mock,
+        mock_subprocess_run: Mock
+    ) -> None:
+        """Test watch mode waits for beads changes instead of exiting."""
+        from pokepoke.shutdown import request_shutdown, reset
+        mock_subprocess_run.return_value = Mock(stdout="", returncode=0)
+        mock_get_items.return_value = []
+        mock_select.return_value = None
+        watcher = mock_watcher_cls.return_value
+        
+        def wait(timeout: float) -> bool:
+            # First wake finds nothing new; shutdown arrives during the second wait
+            if watcher.wait.call_count == 2:
+                request_shutdown()
+            return True
+        watcher.wait.side_effect = wait
+        
+        try:
+            result = run_orchestrator(interactive=False, continuous=True, watch=True)
+        finally:
+            reset()
+        
+        assert result == 0
+        assert watcher.arm.call_count == 2
+        assert watcher.wait.call_count == 2
+        watcher.close.assert_called_once()
+        mock_process.assert_not_called()
+    
     @patch('subprocess.run')  # Mock git status check
     @patch('pokepoke.agent_runner.run_worktree_cleanup')
     @patch('pokepoke.agent_runner.run_beta_tester')
@@ -485,6 +538,65 @@ class TestRunOrchestrator:
         assert result == 0
         mock_process.assert_called_once()
     
+    @patch('subprocess.run')  # Mock git status check
+    @patch('pokepoke.orchestrator.discard_worktree')
+    @patch('pokepoke.orchestrator.Prefetcher')
+    @patch('pokepoke.orchestrator.process_work_item')
+    @patch('pokepoke.orchestrator.get_ready_work_items')
+    def test_prefetched_item_that_fails_to_claim_loses_worktree(
+        self,
+        mock_get_items: Mock,
+        mock_process: Mock,
+        mock_prefetcher_cls: Mock,
+        mock_discard: Mock,
+        mock_subprocess_run: Mock
+    ) -> None:
+        """A prefetched worktree is removed when the beads claim fails."""
+        mock_subprocess_run.return_value = Mock(stdout="", returncode=0)
+        item = BeadsWorkItem(
+            id="task-1", title="Task", description="", status="open", priority=1, issue_type="task"
+        )
+        mock_prefetcher_cls.return_value.take.return_value = item
+        mock_process.return_value = (False, 0, None, 0, 0, None)
+
+        run_orchestrator(interactive=False, continuous=False, prefetch=True)
+
+        mock_discard.assert_called_once_with("task-1")
+
+    @patch('subprocess.run')  # Mock git status check
+    @patch('pokepoke.orchestrator.increment_items_completed', return_value=2)
+    @patch('pokepoke.orchestrator.create_maintenance_lane')
+    @patch('pokepoke.orchestrator.run_periodic_maintenance')
+    @patch('pokepoke.orchestrator.process_work_item')
+    @patch('pokepoke.orchestrator.select_work_item')
+    @patch('pokepoke.orchestrator.get_ready_work_items')
+    def test_run_orchestrator_background_maintenance(
+        self,
+        mock_get_items: Mock,
+        mock_select: Mock,
+        mock_process: Mock,
+        mock_maintenance: Mock,
+        mock_create_lane: Mock,
+        _mock_increment: Mock,
+        mock_subprocess_run: Mock
+    ) -> None:
+        """Test maintenance is queued on the lane and awaited before exit."""
+        from pokepoke.types import AgentStats
+        mock_subprocess_run.return_value = Mock(stdout="", returncode=0)
+        item = BeadsWorkItem(id="task-1", title="Task", status="open", priority=1, issue_type="task")
+        mock_get_items.return_value = [item]
+        mock_select.return_value = item
+        mock_process.return_value = (True, 1, AgentStats(), 0, 0, None)
+        lane = mock_create_lane.return_value
+        
+        result = run_orchestrator(interactive=False, continuous=False)
+        
+        assert result == 0
+        mock_maintenance.assert_not_called()
+        lane.set_ready_count.assert_called_once_with(1)
+        lane.schedule.assert_called_once_with(2)
+        lane.close.assert_called_once()
+    
     @patch('subprocess.run')  # Mock git status check
     @patch('pokepoke.agent_runner.run_worktree_cleanup')
     @patch('pokepoke.agent_runner.run_beta_tester')
@@ -943,7 +1055,7 @@ class TestOrchestratorMain:
         result = main()
         
         assert result == 0
-        mock_run.assert_called_once_with(interactive=False, continuous=False, run_beta_first=False)
+        mock_run.assert_called_once_with(interactive=False, continuous=False, run_beta_first=False, workers=1, prefetch=False, watch=False)
     
     @patch('pokepoke.orchestrator._check_beads_available', return_value=True)
     @patch('pokepoke.orchestrator.run_orchestrator')
@@ -959,7 +1071,7 @@ class TestOrchestratorMain:
         result = main()
         
         assert result == 0
-        mock_run.assert_called_once_with(interactive=True, continuous=True, run_beta_first=False)
+        mock_run.assert_called_once_with(interactive=True, continuous=True, run_beta_first=False, workers=1, prefetch=False, watch=False)
     
     @patch('pokepoke.orchestrator._check_beads_available', return_value=True)
     @patch('pokepoke.orchestrator.run_orchestrator')
@@ -975,7 +1087,79 @@ class TestOrchestratorMain:
         result = main()
         
         assert result == 0
-        mock_run.assert_called_once_with(interactive=False, continuous=True, run_beta_first=False)
+        mock_run.assert_called_once_with(interactive=False, continuous=True, run_beta_first=False, workers=1, prefetch=False, watch=False)
+
+    @patch('pokepoke.orchestrator._check_beads_available', return_value=True)
+    @patch('pokepoke.orchestrator.run_orchestrator')
+    @patch('pokepoke.terminal_ui.ui')
+    @patch('sys.argv', ['pokepoke', '--autonomous', '--workers', '3'])
+    def test_main_workers(self, mock_ui: Mock, mock_run: Mock, _mock_beads: Mock) -> None:
+        """Test --workers is passed through to the orchestrator."""
+        from pokepoke.orchestrator import main
+        
+        mock_run.return_value = 0
+        mock_ui.run_with_orchestrator.side_effect = lambda f: f()
+        
+        assert main() == 0
+        mock_run.assert_called_once_with(interactive=False, continuous=False, run_beta_first=False, workers=3, prefetch=False, watch=False)
+    
+    @patch('pokepoke.orchestrator._check_beads_available', return_value=True)
+    @patch('pokepoke.orchestrator.run_orchestrator')
+    @patch('sys.argv', ['pokepoke', '--workers', '2'])
+    def test_main_workers_requires_autonomous(self, mock_run: Mock, _mock_beads: Mock) -> None:
+        """Test --workers is rejected in interactive mode."""
+        from pokepoke.orchestrator import main
+        
+        assert main() == 1
+        mock_run.assert_not_called()
+    
+    @patch('pokepoke.orchestrator._check_beads_available', return_value=True)
+    @patch('pokepoke.orchestrator.run_orchestrator')
+    @patch('pokepoke.terminal_ui.ui')
+    @patch('sys.argv', ['pokepoke', '--autonomous', '--continuous', '--prefetch'])
+    def test_main_prefetch(self, mock_ui: Mock, mock_run: Mock, _mock_beads: Mock) -> None:
+        """Test --prefetch is passed through to the orchestrator."""
+        from pokepoke.orchestrator import main
+        
+        mock_run.return_value = 0
+        mock_ui.run_with_orchestrator.side_effect = lambda f: f()
+        
+        assert main() == 0
+        mock_run.assert_called_once_with(interactive=False, continuous=True, run_beta_first=False, workers=1, prefetch=True, watch=False)
+    
+    @patch('pokepoke.orchestrator._check_beads_available', return_value=True)
+    @patch('pokepoke.orchestrator.run_orchestrator')
+    @patch('pokepoke.terminal_ui.ui')
+    @patch('sys.argv', ['pokepoke', '--autonomous', '--watch'])
+    def test_main_watch_implies_continuous(self, mock_ui: Mock, mock_run: Mock, _mock_beads: Mock) -> None:
+        """Test --watch runs continuously."""
+        from pokepoke.orchestrator import main
+        
+        mock_run.return_value = 0
+        mock_ui.run_with_orchestrator.side_effect = lambda f: f()
+        
+        assert main() == 0
+        mock_run.assert_called_once_with(interactive=False, continuous=True, run_beta_first=False, workers=1, prefetch=False, watch=True)
+    
+    @patch('pokepoke.orchestrator._check_beads_available', return_value=True)
+    @patch('pokepoke.orchestrator.run_orchestrator')
+    @patch('sys.argv', ['pokepoke', '--watch'])
+    def test_main_watch_requires_autonomous(self, mock_run: Mock, _mock_beads: Mock) -> None:
+        """Test --watch is rejected in interactive mode."""
+        from pokepoke.orchestrator import main
+        
+        assert main() == 1
+        mock_run.assert_not_called()
+    
+    @patch('pokepoke.orchestrator._check_beads_available', return_value=True)
+    @patch('pokepoke.orchestrator.run_orchestrator')
+    @patch('sys.argv', ['pokepoke', '--autonomous', '--workers', '2', '--prefetch'])
+    def test_main_prefetch_requires_single_worker(self, mock_run: Mock, _mock_beads: Mock) -> None:
+        """Test --prefetch is rejected together with --workers."""
+        from pokepoke.orchestrator import main
+        
+        assert main() == 1
+        mock_run.assert_not_called()
 
     @patch('pokepoke.orchestrator._check_beads_available', return_value=False)
     @patch('sys.argv', ['pokepoke', '--autonomous'])
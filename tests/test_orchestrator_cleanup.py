@@ -2,9 +2,13 @@
 
 from unittest.mock import Mock, patch
 
+import pytest
+
 from src.pokepoke.orchestrator import run_orchestrator
 from src.pokepoke.types import BeadsStats
 
+pytestmark = pytest.mark.usefixtures('run_artifacts_in_tmp_path')
+
 
 class TestOrchestratorCleanupDetection:
     """Test orchestrator's main repo cleanup detection."""
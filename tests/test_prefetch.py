@@ -0,0 +1,138 @@
+"""Unit tests for prefetching the next work item."""
+
+from pathlib import Path
+from typing import Optional, Set
+from unittest.mock import Mock, patch
+
+import pytest
+
+from pokepoke import shutdown
+from pokepoke.claim_registry import ClaimRegistry
+from pokepoke.prefetch import Prefetcher
+from pokepoke.types import BeadsWorkItem
+
+
+@pytest.fixture(autouse=True)
+def reset_shutdown():
+    shutdown.reset()
+    yield
+    shutdown.reset()
+
+
+def _item(item_id: str) -> BeadsWorkItem:
+    return BeadsWorkItem(id=item_id, title=f"Title {item_id}", status="open", priority=1, issue_type="task")
+
+
+def _select(ready: list[BeadsWorkItem], interactive: bool, skip_ids: Set[str]) -> Optional[BeadsWorkItem]:
+    return next((i for i in ready if i.id not in skip_ids), None)
+
+
+@pytest.fixture
+def git_mocks():
+    with patch('pokepoke.prefetch.get_ready_work_items', return_value=[_item("task-1"), _item("task-2")]), \
+         patch('pokepoke.prefetch.select_work_item', side_effect=_select), \
+         patch('pokepoke.prefetch.create_worktree', return_value=Path("worktrees/task-task-2")) as mock_create, \
+         patch('pokepoke.prefetch.cleanup_worktree') as mock_cleanup, \
+         patch('pokepoke.prefetch.get_default_branch', return_value="master"), \
+         patch('pokepoke.prefetch.subprocess.run') as mock_run:
+        yield mock_create, mock_cleanup, mock_run
+
+
+class TestPrefetcher:
+    """Test staging, handing over and discarding the next item."""
+
+    def test_stages_next_unclaimed_item(self, git_mocks) -> None:
+        mock_create, _, mock_run = git_mocks
+        registry = ClaimRegistry()
+        registry.try_claim("task-1", "me")  # the item currently being worked on
+        prefetcher = Prefetcher(registry, "me")
+
+        prefetcher.start(set())
+        assert prefetcher.has_item() is True
+        item = prefetcher.take()
+
+        assert item is not None and item.id == "task-2"
+        assert registry.holder("task-2") == "me"
+        mock_create.assert_called_once_with("task-2")
+        # The staged worktree is brought up to date before use
+        assert mock_run.call_args[0][0] == ["git", "merge", "--ff-only", "master"]
+        assert prefetcher.has_item() is False
+        assert prefetcher.take() is None
+
+    def test_never_stages_an_item_we_already_hold(self, git_mocks) -> None:
+        """An epic resolving to the current item doesn't stage it a second time."""
+        mock_create, _, _ = git_mocks
+        registry = ClaimRegistry()
+        registry.try_claim("task-1", "me")  # the item currently being worked on
+        prefetcher = Prefetcher(registry, "me")
+
+        with patch('pokepoke.prefetch.select_work_item', return_value=_item("task-1")):
+            prefetcher.start(set())
+            assert prefetcher.take() is None
+
+        mock_create.assert_not_called()
+        assert registry.holder("task-1") == "me"
+
+    def test_skips_given_ids(self, git_mocks) -> None:
+        prefetcher = Prefetcher(ClaimRegistry(), "me")
+
+        prefetcher.start({"task-1", "task-2"})
+
+        assert prefetcher.take() is None
+
+    def test_start_is_noop_while_staged(self, git_mocks) -> None:
+        mock_create, _, _ = git_mocks
+        prefetcher = Prefetcher(ClaimRegistry(), "me")
+
+        prefetcher.start(set())
+        prefetcher._join()
+        prefetcher.start(set())
+
+        item = prefetcher.take()
+        assert item is not None and item.id == "task-1"
+        assert mock_create.call_count == 1
+
+    def test_item_reserved_elsewhere_not_staged(self, git_mocks) -> None:
+        mock_create, _, _ = git_mocks
+        registry = ClaimRegistry()
+        registry.try_claim("task-1", "other")
+        registry.try_claim("task-2", "other")
+        prefetcher = Prefetcher(registry, "me")
+
+        prefetcher.start(set())
+
+        assert prefetcher.take() is None
+        mock_create.assert_not_called()
+
+    def test_discard_releases_worktree_and_reservation(self, git_mocks) -> None:
+        _, mock_cleanup, _ = git_mocks
+        registry = ClaimRegistry()
+        prefetcher = Prefetcher(registry, "me")
+
+        prefetcher.start(set())
+        prefetcher.discard()
+
+        mock_cleanup.assert_called_once_with("task-1", force=True)
+        assert registry.claimed_ids() == set()
+        assert prefetcher.take() is None
+
+    def test_no_staging_during_shutdown(self, git_mocks) -> None:
+        mock_create, _, _ = git_mocks
+        shutdown.request_shutdown()
+        prefetcher = Prefetcher(ClaimRegistry(), "me")
+
+        prefetcher.start(set())
+
+        assert prefetcher.has_item() is False
+        mock_create.assert_not_called()
+
+    def test_worktree_failure_still_stages_item(self, git_mocks) -> None:
+        mock_create, _, mock_run = git_mocks
+        mock_create.side_effect = RuntimeError("boom")
+        prefetcher = Prefetcher(ClaimRegistry(), "me", run_logger=Mock())
+
+        prefetcher.start(set())
+        item = prefetcher.take()
+
+        assert item is not None and item.id == "task-1"
+        mock_run.assert_not_called()
@@ -0,0 +1,69 @@
+"""Tests for prompt-cache hit reporting."""
+
+import json
+
+from pokepoke.agent_timing import merge_agent_stats
+from pokepoke.model_stats_store import _rebuild_summary, print_model_leaderboard
+from pokepoke.prompt_cache import cache_hit_ratio, cache_summary
+from pokepoke.stats import print_stats, serialize_session_stats
+from pokepoke.types import AgentStats, SessionStats
+
+
+class TestCacheHitRatio:
+    """Test the share of input tokens read from the cache."""
+
+    def test_ratio(self) -> None:
+        assert cache_hit_ratio(1000, 750) == 0.75
+
+    def test_no_input(self) -> None:
+        assert cache_hit_ratio(0, 10) == 0.0
+
+    def test_capped_at_one(self) -> None:
+        assert cache_hit_ratio(100, 150) == 1.0
+
+
+class TestSessionReporting:
+    """Cache tokens add up and reach the summary and stats.json."""
+
+    def test_merged_and_summarized(self) -> None:
+        stats = AgentStats(input_tokens=1000, cache_read_tokens=600, cache_write_tokens=100)
+        merge_agent_stats(stats, AgentStats(input_tokens=1000, cache_read_tokens=800))
+
+        assert stats.cache_read_tokens == 1400
+        assert cache_summary(stats) == [
+            "🗄️  Prompt cache:       1,400 read / 100 written (70% of input tokens)"
+        ]
+        assert cache_summary(AgentStats(input_tokens=50)) == []
+
+    def test_serialized(self) -> None:
+        session = SessionStats(agent_stats=AgentStats(input_tokens=400, cache_read_tokens=100))
+
+        data = json.loads(json.dumps(serialize_session_stats(session, 60.0, 1, 1)))
+
+        assert data["agent_stats"]["cache_read_tokens"] == 100
+        assert data["cache_hit_ratio"] == 0.25
+
+    def test_printed(self, capsys) -> None:
+        print_stats(1, 1, 60.0, SessionStats(agent_stats=AgentStats(input_tokens=400, cache_read_tokens=100)))
+
+        assert "Prompt cache" in capsys.readouterr().out
+
+
+class TestModelLeaderboard:
+    """Per-model cache use in model_stats.json."""
+
+    def test_summary_and_leaderboard(self, capsys, tmp_path) -> None:
+        log = [
+            {"model": "m1", "duration_seconds": 10.0, "gate_passed": True, "timestamp": "t",
+             "input_tokens": 1000, "cache_read_tokens": 900, "cache_write_tokens": 50},
+            {"model": "m1", "duration_seconds": 10.0, "gate_passed": True, "timestamp": "t"},
+        ]
+        summary = _rebuild_summary(log)
+
+        assert summary["m1"]["total_cache_read_tokens"] == 900
+        assert summary["m1"]["cache_hit_ratio"] == 0.9
+
+        path = tmp_path / "model_stats.json"
+        path.write_text(json.dumps({"log": log, "summary": summary}))
+        print_model_leaderboard(path)
+        assert "90% of 1,000 input tokens" in capsys.readouterr().out
@@ -218,7 +218,7 @@ def test_render_beads_item_with_labels():
     """Test rendering beads-item template with labels."""
     service = PromptService()
     
-    result = service.load_and_render("beads-item", {
+    result = service.render_with_item("beads-item", {}, {
         "item_id": "PokePoke-123",
         "title": "Fix bug",
         "description": "Fix the authentication bug",
@@ -232,3 +232,40 @@ def test_render_beads_item_with_labels():
     assert "Fix the authentication bug" in result
     assert "security, backend" in result
     assert "All pre-commit validation passes successfully" in result
+
+
+def test_render_with_item_appends_item_last():
+    """Item details follow the agent instructions so the prefix is shared."""
+    service = PromptService()
+    first = service.render_with_item("beads-item", {}, {"item_id": "PokePoke-1", "title": "One"})
+    second = service.render_with_item("beads-item", {}, {"item_id": "PokePoke-2", "title": "Two"})
+
+    prefix = first.split("\n---\n")[0]
+    assert second.startswith(prefix)
+    assert first.index("PokePoke-1") > len(prefix)
+
+
+def test_render_with_item_keeps_templates_that_place_item_fields(tmp_path):
+    """Templates that reference item fields themselves render as written."""
+    (tmp_path / "legacy.md").write_text("Work on {{item_id}}: {{title}}\nDone.")
+    service = PromptService(tmp_path)
+
+    result = service.render_with_item("legacy", {}, {"item_id": "PokePoke-9", "title": "Old"})
+
+    assert result == "Work on PokePoke-9: Old\nDone."
+
+
+def test_item_prompt_variables():
+    """Work items map onto the item-context variables."""
+    from pokepoke.prompts import item_prompt_variables
+    from pokepoke.types import BeadsWorkItem
+
+    item = BeadsWorkItem(
+        id="PokePoke-7", title="T", description="D", status="open",
+        priority=2, issue_type="task", labels=["a", "b"],
+    )
+    variables = item_prompt_variables(item, context="Branch: main")
+
+    assert variables["item_id"] == "PokePoke-7"
+    assert variables["labels"] == "a, b"
+    assert variables["context"] == "Branch: main"
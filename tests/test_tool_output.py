@@ -0,0 +1,85 @@
+"""Tests for capping displayed tool output."""
+
+from unittest.mock import MagicMock, patch
+
+from pokepoke.config import ProjectConfig
+from pokepoke.copilot_events import SessionEventCollector
+from pokepoke.logging_utils import ItemLogger
+from pokepoke.tool_output import cap_tool_output, tool_output_limit
+
+
+def _event(event_type: str, **data: object) -> MagicMock:
+    event = MagicMock()
+    event.type.value = event_type
+    event.data = MagicMock(**data)
+    return event
+
+
+class TestCapToolOutput:
+    """Long output is shown as its head and tail."""
+
+    def test_short_output_unchanged(self) -> None:
+        assert cap_tool_output("short", 10) == "short"
+
+    def test_zero_limit_keeps_everything(self) -> None:
+        assert cap_tool_output("x" * 5000, 0) == "x" * 5000
+
+    def test_head_tail_and_omitted_bytes(self) -> None:
+        text = "HEAD" + "é" * 100 + "TAIL"
+
+        capped = cap_tool_output(text, 8)
+
+        assert capped == "HEAD\n[... 200 bytes omitted - not saved (no item log) ...]\nTAIL"
+
+    def test_full_output_saved_and_referenced(self, tmp_path) -> None:
+        item_logger = ItemLogger(tmp_path, "task-1", "Task")
+        first, second = "a" * 50, "b" * 50
+
+        cap_tool_output(first, 10, item_logger)
+        capped = cap_tool_output(second, 10, item_logger)
+        item_logger.close()
+
+        assert "full output in task-1.tool-results.log at byte 51" in capped
+        saved = item_logger.tool_results_path.read_bytes()
+        assert saved[51:101].decode() == second
+
+
+class TestLimits:
+    """Per-tool limits override the default."""
+
+    def test_per_tool_override(self) -> None:
+        config = ProjectConfig.from_dict({"copilot": {"tool_output_limit": 300, "tool_output_limits": {"view": 50}}})
+        with patch('pokepoke.tool_output.get_config', return_value=config):
+            assert tool_output_limit("view") == 50
+            assert tool_output_limit("bash") == 300
+
+    def test_default(self) -> None:
+        assert ProjectConfig.from_dict({}).copilot.tool_output_limit == 2000
+
+
+class TestCollectorDisplay:
+    """The event handler prints and logs capped tool output."""
+
+    def test_large_result_is_capped(self, capsys) -> None:
+        item_logger = MagicMock()
+        item_logger.save_tool_output.return_value = 0
+        item_logger.tool_results_path.name = "task-1.tool-results.log"
+        collector = SessionEventCollector("m", item_logger=item_logger)
+
+        with patch('pokepoke.copilot_events.tool_output_limit', return_value=100):
+            collector(_event("tool.execution_start", tool_call_id="c1", tool_name="view", arguments={}))
+            collector(_event("tool.execution_complete", tool_call_id="c1", result="y" * 1_000_000, success=True))
+
+        printed = capsys.readouterr().out
+        assert len(printed) < 1000
+        assert "bytes omitted - full output in task-1.tool-results.log" in printed
+        item_logger.save_tool_output.assert_called_once_with("y" * 1_000_000)
+        assert len(collector.output) < 1000
+
+    def test_output_without_item_log_says_discarded(self) -> None:
+        collector = SessionEventCollector("m")
+
+        with patch('pokepoke.copilot_events.OUTPUT_TAIL_CHARS', 10):
+            collector(_event("assistant.message_delta", delta_content="x" * 50))
+
+        assert "earlier characters omitted (not saved - no item log)" in collector.output
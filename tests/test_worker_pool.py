@@ -0,0 +1,279 @@
+"""Unit tests for the parallel worker pool and its shared pieces."""
+
+import itertools
+import threading
+import time
+from pathlib import Path
+from typing import Any, List, Optional, Set
+from unittest.mock import Mock, patch
+
+import pytest
+
+from pokepoke import shutdown
+from pokepoke.beads_graph import BeadsGraph
+from pokepoke.claim_registry import ClaimRegistry
+from pokepoke.logging_utils import RunLogger
+from pokepoke.merge_queue import serialized_merge
+from pokepoke.types import AgentStats, BeadsWorkItem, ModelCompletionRecord, SessionStats
+from pokepoke.worker_pool import WorkerPool
+
+pytestmark = pytest.mark.usefixtures('no_post_agent_commits')
+
+
+@pytest.fixture(autouse=True)
+def reset_shutdown():
+    shutdown.reset()
+    yield
+    shutdown.reset()
+
+
+def _item(item_id: str) -> BeadsWorkItem:
+    return BeadsWorkItem(id=item_id, title=f"Title {item_id}", status="open", priority=1, issue_type="task")
+
+
+class TestClaimRegistry:
+    """Test in-process item reservations."""
+
+    def test_claim_is_exclusive(self) -> None:
+        registry = ClaimRegistry()
+
+        assert registry.try_claim("task-1", "worker-1") is True
+        assert registry.try_claim("task-1", "worker-1") is True
+        assert registry.try_claim("task-1", "worker-2") is False
+        assert registry.holder("task-1") == "worker-1"
+
+    def test_release_only_by_owner(self) -> None:
+        registry = ClaimRegistry()
+        registry.try_claim("task-1", "worker-1")
+
+        registry.release("task-1", "worker-2")
+        assert registry.claimed_ids() == {"task-1"}
+
+        registry.release("task-1", "worker-1")
+        assert registry.claimed_ids() == set()
+
+
+class TestSerializedMerge:
+    """Test the process-wide merge lock."""
+
+    def test_merges_do_not_overlap(self) -> None:
+        active: List[int] = []
+        overlaps: List[int] = []
+
+        def merge() -> None:
+            with serialized_merge("task"):
+                active.append(1)
+                overlaps.append(len(active))
+                time.sleep(0.05)
+                active.pop()
+
+        threads = [threading.Thread(target=merge) for _ in range(4)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+
+        assert overlaps == [1, 1, 1, 1]
+
+    def test_reentrant(self) -> None:
+        with serialized_merge():
+            with serialized_merge():
+                pass
+
+
+class TestRunLoggerThreads:
+    """Workers processing items at once each keep their own item log."""
+
+    def test_item_logs_kept_apart(self, tmp_path: Path) -> None:
+        logger = RunLogger(base_dir=str(tmp_path))
+        started = threading.Barrier(3)
+
+        def work(item_id: str, success: bool) -> None:
+            item_logger = logger.start_item_log(item_id, "Title")
+            started.wait()
+            item_logger.stream(f"output of {item_id}\n")
+            logger.end_item_log(item_id, success, 1)
+
+        threads = [threading.Thread(target=work, args=(f"task-{n}", n % 2 == 0)) for n in range(3)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+
+        for n in range(3):
+            log = (logger.item_logs_dir / f"task-{n}.log").read_text(encoding='utf-8')
+            assert f"output of task-{n}" in log
+            assert log.count("Summary") == 1
+            assert ("SUCCESS" if n % 2 == 0 else "FAILURE") in log
+
+    def test_stream_after_close_is_dropped(self, tmp_path: Path) -> None:
+        """Output arriving after another thread closed the log doesn't raise."""
+        logger = RunLogger(base_dir=str(tmp_path))
+        item_logger = logger.start_item_log("task-1", "Title")
+        item_logger.stream("first\n")
+        handle = item_logger._file_handle
+        assert handle is not None
+        handle.close()  # as if closed underneath the writer
+
+        item_logger.stream("second\n")
+
+        assert item_logger._stream_failed is True
+
+
+class TestWorkerSelection:
+    """Test what each worker picks when they share one agent name."""
+
+    def test_workers_split_the_children_of_one_epic(self) -> None:
+        """A leaf another worker holds is not resolved to again."""
+        graph = BeadsGraph.from_records([
+            {"id": "epic-1", "title": "Epic", "status": "open", "priority": 1, "issue_type": "epic"},
+            *[
+                {
+                    "id": task_id, "title": task_id, "status": "open", "priority": priority,
+                    "issue_type": "task",
+                    "dependencies": [{"depends_on_id": "epic-1", "type": "parent-child"}],
+                }
+                for task_id, priority in (("task-a", 1), ("task-b", 2))
+            ],
+        ])
+        epic = graph.get("epic-1")
+        pool = WorkerPool(2, SessionStats(agent_stats=AgentStats()), Mock(), Path("."), registry=ClaimRegistry())
+        with patch('pokepoke.worker_pool.check_and_commit_main_repo', return_value=True), \
+             patch('pokepoke.worker_pool.get_ready_work_items', return_value=[epic]), \
+             patch('pokepoke.work_item_selection.load_beads_graph', return_value=graph):
+            first = pool._next_item("worker-1")
+            second = pool._next_item("worker-2")
+
+        assert first is not None and first.id == "task-a"
+        assert second is not None and second.id == "task-b"
+
+
+class TestWorkerPool:
+    """Test concurrent processing and stats aggregation."""
+
+    def _run_pool(self, items: List[BeadsWorkItem], workers: int, process: Any, maintenance: Any = None) -> WorkerPool:
+        def select(ready: List[BeadsWorkItem], interactive: bool, skip_ids: Set[str]) -> Optional[BeadsWorkItem]:
+            return next((i for i in ready if i.id not in skip_ids), None)
+
+        session = SessionStats(agent_stats=AgentStats())
+        pool = WorkerPool(workers, session, Mock(), Path("."), continuous=True)
+        with patch('pokepoke.worker_pool.check_and_commit_main_repo', return_value=True), \
+             patch('pokepoke.worker_pool.get_ready_work_items', return_value=items), \
+             patch('pokepoke.worker_pool.select_work_item', side_effect=select), \
+             patch('pokepoke.worker_pool.process_work_item', side_effect=process), \
+             patch('pokepoke.worker_pool.record_completion') as mock_record, \
+             patch('pokepoke.worker_pool.increment_items_completed', return_value=1), \
+             patch('pokepoke.worker_pool.run_periodic_maintenance', side_effect=maintenance), \
+             patch('pokepoke.worker_pool._IDLE_POLL_SECONDS', 0.01):
+            pool.run()
+            self.recorded = mock_record.call_count
+        return pool
+
+    def test_items_run_concurrently_once_each(self) -> None:
+        """Workers overlap, each item is processed exactly once."""
+        items = [_item(f"task-{n}") for n in range(4)]
+        done: List[str] = []
+        running: List[int] = [0, 0]
+        lock = threading.Lock()
+
+        def process(item: BeadsWorkItem, interactive: bool, run_logger: Any) -> Any:
+            with lock:
+                running[0] += 1
+                running[1] = max(running[1], running[0])
+            time.sleep(0.1)
+            with lock:
+                running[0] -= 1
+                done.append(item.id)
+            items.remove(item)  # closed items leave the ready list
+            stats = AgentStats(input_tokens=10)
+            completion = ModelCompletionRecord(item_id=item.id, model="m", duration_seconds=1.0)
+            return True, 2, stats, 0, 1, completion
+
+        pool = self._run_pool(items, 3, process)
+
+        assert sorted(done) == ["task-0", "task-1", "task-2", "task-3"]
+        assert running[1] > 1
+        assert pool.items_completed == 4
+        assert pool.total_requests == 8
+        assert pool.session_stats.agent_stats.input_tokens == 40
+        assert pool.session_stats.gate_agent_runs == 4
+        assert len(pool.session_stats.model_completions) == 4
+        assert self.recorded == 4
+
+    def test_failed_claim_not_retried(self) -> None:
+        """An item that fails to claim is skipped for the rest of the run."""
+        items = [_item("task-1")]
+        calls: List[str] = []
+
+        def process(item: BeadsWorkItem, interactive: bool, run_logger: Any) -> Any:
+            calls.append(item.id)
+            return False, 0, None, 0, 0, None
+
+        pool = self._run_pool(items, 2, process)
+
+        assert calls == ["task-1"]
+        assert pool.items_completed == 0
+
+    def test_other_workers_select_and_merge_during_maintenance(self) -> None:
+        """An inline maintenance agent never stops the other workers selecting and merging."""
+        from pokepoke.config import MaintenanceAgentConfig, MaintenanceConfig, ProjectConfig
+        from pokepoke.maintenance import run_periodic_maintenance
+
+        items = [_item(f"task-{n}") for n in range(4)]
+        merged: List[str] = []
+        others_merged = threading.Event()
+        agent_runs = itertools.count()
+        unblocked: List[bool] = []
+
+        def process(item: BeadsWorkItem, interactive: bool, run_logger: Any) -> Any:
+            with serialized_merge(f"merge {item.id}"):
+                merged.append(item.id)
+            items.remove(item)
+            if len(merged) == 4:
+                others_merged.set()
+            return True, 1, None, 0, 0, None
+
+        def run_agent(agent_cfg: Any, repo_root: Any, item_logger: Any = None) -> None:
+            if next(agent_runs) == 0:
+                # The first agent runs until every other item has been merged
+                unblocked.append(others_merged.wait(timeout=5))
+            return None
+
+        config = ProjectConfig()
+        config.maintenance = MaintenanceConfig(
+            agents=[MaintenanceAgentConfig(name="Tech Debt", prompt_file="tech-debt.md", frequency=1)]
+        )
+        with patch('pokepoke.maintenance.get_config', return_value=config), \
+             patch('pokepoke.maintenance._run_agent', side_effect=run_agent), \
+             patch('pokepoke.maintenance.set_terminal_banner'), \
+             patch('pokepoke.terminal_ui.ui'):
+            pool = self._run_pool(items, 2, process, maintenance=run_periodic_maintenance)
+
+        assert unblocked == [True]
+        assert sorted(merged) == ["task-0", "task-1", "task-2", "task-3"]
+        assert pool.items_completed == 4
+
+    def test_watch_mode_waits_instead_of_exiting(self) -> None:
+        """Idle workers in watch mode wait for beads changes until shutdown."""
+        waits: List[float] = []
+
+        def wait(timeout: float) -> bool:
+            waits.append(timeout)
+            if len(waits) >= 3:
+                shutdown.request_shutdown()
+            return True
+
+        session = SessionStats(agent_stats=AgentStats())
+        pool = WorkerPool(1, session, Mock(), Path("."), continuous=True, watch=True)
+        try:
+            with patch('pokepoke.worker_pool.check_and_commit_main_repo', return_value=True), \
+                 patch('pokepoke.worker_pool.get_ready_work_items', return_value=[]), \
+                 patch('pokepoke.worker_pool.select_work_item', return_value=None), \
+                 patch('pokepoke.worker_pool.BeadsWatcher') as mock_watcher_cls:
+                mock_watcher_cls.return_value.wait.side_effect = wait
+                pool.run()
+        finally:
+            shutdown.reset()
+
+        assert len(waits) == 3
+        mock_watcher_cls.return_value.close.assert_called_once()
@@ -25,6 +25,13 @@ from pokepoke.worktree_finalization import (
 from pokepoke.types import BeadsWorkItem, CopilotResult, AgentStats
 
 
+@pytest.fixture(autouse=True)
+def no_claim_leases():
+    """process_work_item must not write lease labels through the real bd."""
+    with patch('pokepoke.workflow.LeaseHeartbeat'):
+        yield
+
+
 class TestSelectWorkItem:
     """Test select_work_item function."""
     
@@ -939,6 +946,49 @@ class TestProcessWorkItem:
         assert stats is None
         assert cleanup_runs == 0
     
+    @patch('pokepoke.workflow.LeaseHeartbeat')
+    @patch('pokepoke.workflow.run_gate_agent')
+    @patch('pokepoke.workflow.finalize_work_item')
+    @patch('pokepoke.workflow._run_cleanup_with_timeout')
+    @patch('pokepoke.workflow.invoke_copilot')
+    @patch('pokepoke.workflow.has_uncommitted_changes')
+    @patch('pokepoke.workflow._setup_worktree')
+    @patch('pokepoke.workflow.assign_and_sync_item')
+    @patch('time.time')
+    def test_timeout_restarts_under_one_heartbeat(
+        self,
+        mock_time: Mock,
+        mock_assign: Mock,
+        mock_setup: Mock,
+        mock_uncommitted: Mock,
+        mock_invoke: Mock,
+        mock_cleanup_timeout: Mock,
+        mock_finalize: Mock,
+        mock_gate_agent: Mock,
+        mock_heartbeat: Mock
+    ) -> None:
+        """A timed-out item restarts without re-claiming or a second lease heartbeat."""
+        item = BeadsWorkItem(
+            id="task-1", title="Task 1", description="", status="open", priority=1, issue_type="task"
+        )
+        # Started at 0, past the 2h timeout at the first check, then restarted at 8000
+        mock_time.side_effect = [0, 8000] + [8000] * 20
+        mock_assign.return_value = True
+        mock_setup.return_value = Path("/fake/worktree")
+        mock_uncommitted.return_value = True
+        mock_invoke.return_value = CopilotResult(work_item_id="task-1", success=True, attempt_count=1)
+        mock_cleanup_timeout.return_value = (True, 0)
+        mock_gate_agent.return_value = (True, "Gate passed", None)
+        mock_finalize.return_value = True
+
+        success, count, *_ = process_work_item(item, interactive=False)
+
+        assert success is True
+        assert count == 1
+        mock_assign.assert_called_once()
+        mock_heartbeat.assert_called_once()
+        assert mock_setup.call_count == 2
+    
     @patch('pokepoke.workflow.run_gate_agent')  # Mock gate agent
     @patch('pokepoke.workflow.run_beta_tester')  # Mock beta tester
     @patch('pokepoke.workflow.finalize_work_item')
@@ -1196,14 +1246,81 @@ class TestProcessWorkItem:
             CopilotResult(work_item_id="task-1", success=True, output="Try 2", attempt_count=1)
         ]
         
+        on_gate_start = Mock()
         success, count, stats, cleanup_runs, gate_runs, model_completion = process_work_item(
-            item, interactive=True
+            item, interactive=True, on_gate_start=on_gate_start
         )
         
         assert success is True
         assert count == 2  # Two invocations
         mock_add_comment.assert_called_once()  # Comment added for gate rejection
         assert mock_gate_agent.call_count == 2
+        assert on_gate_start.call_count == 2
+    
+    @patch('pokepoke.workflow.record_work_retry')
+    @patch('pokepoke.workflow.CopilotConversation')
+    @patch('pokepoke.workflow.get_config')
+    @patch('pokepoke.workflow.add_comment')
+    @patch('pokepoke.workflow.run_gate_agent')
+    @patch('pokepoke.workflow.finalize_work_item')
+    @patch('pokepoke.workflow._run_cleanup_with_timeout')
+    @patch('pokepoke.workflow.invoke_copilot')
+    @patch('pokepoke.workflow.has_uncommitted_changes')
+    @patch('pokepoke.workflow._setup_worktree')
+    @patch('pokepoke.workflow.assign_and_sync_item')
+    @patch('time.time')
+    def test_gate_retry_follows_up_in_kept_session(
+        self,
+        mock_time: Mock,
+        mock_assign: Mock,
+        mock_setup: Mock,
+        mock_uncommitted: Mock,
+        mock_invoke: Mock,
+        mock_cleanup_timeout: Mock,
+        mock_finalize: Mock,
+        mock_gate_agent: Mock,
+        mock_add_comment: Mock,
+        mock_get_config: Mock,
+        mock_conversation_class: Mock,
+        mock_record_retry: Mock
+    ) -> None:
+        """With reuse_work_session, gate feedback is sent into the open session."""
+        from pokepoke.config import ProjectConfig
+        item = BeadsWorkItem(
+            id="task-1", title="Task 1", description="Original description",
+            status="open", priority=1, issue_type="task"
+        )
+        mock_time.return_value = 0
+        mock_assign.return_value = True
+        mock_setup.return_value = Path("/fake/worktree")
+        mock_uncommitted.return_value = True
+        mock_cleanup_timeout.return_value = (True, 0)
+        mock_finalize.return_value = True
+        mock_get_config.return_value = ProjectConfig.from_dict({"copilot": {"reuse_work_session": True}})
+        mock_gate_agent.side_effect = [(False, "Tests failed", None), (True, "All tests pass", None)]
+        conversation = mock_conversation_class.return_value
+        conversation.is_open = False
+        follow_up_stats = AgentStats(input_tokens=500, premium_requests=2)
+        
+        def invoke(item, **kwargs):
+            if conversation.is_open:
+                return CopilotResult(work_item_id="task-1", success=True, output="Fixed", stats=follow_up_stats)
+            conversation.is_open = True
+            return CopilotResult(work_item_id="task-1", success=True, output="Done")
+        mock_invoke.side_effect = invoke
+        
+        success, count, stats, cleanup_runs, gate_runs, model_completion = process_work_item(
+            item, interactive=False
+        )
+        
+        assert success is True
+        first, second = mock_invoke.call_args_list
+        assert first.kwargs["prompt"] is None
+        assert first.kwargs["conversation"] is conversation
+        assert "Tests failed" in second.kwargs["prompt"]
+        assert second.kwargs["conversation"] is conversation
+        mock_record_retry.assert_called_once_with(True, follow_up_stats)
+        conversation.close_sync.assert_called_once()
     
     @patch('pokepoke.workflow.add_comment')
     @patch('pokepoke.workflow.run_gate_agent')
@@ -1292,6 +1409,51 @@ class TestProcessWorkItem:
         assert stats.input_tokens == 100  # Only work agent tokens
         assert gate_runs == 1  # Gate agent ran once
     
+    @patch('pokepoke.workflow.run_gate_agent')
+    @patch('pokepoke.workflow.run_beta_tester')
+    @patch('pokepoke.workflow.finalize_work_item')
+    @patch('pokepoke.workflow._run_cleanup_with_timeout')
+    @patch('pokepoke.workflow.invoke_copilot')
+    @patch('pokepoke.workflow.has_uncommitted_changes')
+    @patch('pokepoke.workflow._setup_worktree')
+    @patch('pokepoke.workflow.assign_and_sync_item')
+    @patch('time.time')
+    def test_beta_tester_stats_fully_aggregated(
+        self,
+        mock_time: Mock,
+        mock_assign: Mock,
+        mock_setup: Mock,
+        mock_uncommitted: Mock,
+        mock_invoke: Mock,
+        mock_cleanup_timeout: Mock,
+        mock_finalize: Mock,
+        mock_beta: Mock,
+        mock_gate_agent: Mock
+    ) -> None:
+        """Every beta tester counter is added to the item's stats, not just the basic ones."""
+        item = BeadsWorkItem(
+            id="task-1", title="Task 1", description="", status="open", priority=1, issue_type="task"
+        )
+        mock_time.return_value = 0
+        mock_assign.return_value = True
+        mock_setup.return_value = Path("/fake/worktree")
+        mock_uncommitted.return_value = True
+        mock_cleanup_timeout.return_value = (True, 0)
+        mock_finalize.return_value = True
+        mock_gate_agent.return_value = (True, "Pass", None)
+        mock_beta.return_value = AgentStats(input_tokens=10, cache_read_tokens=7, tool_calls=3)
+        mock_invoke.return_value = CopilotResult(
+            work_item_id="task-1", success=True, output="Completed", attempt_count=1,
+            stats=AgentStats(input_tokens=100, cache_read_tokens=1, tool_calls=2)
+        )
+        
+        success, _, stats, _, _, _ = process_work_item(item, interactive=False, run_beta_test=True)
+        
+        assert success is True
+        assert stats.input_tokens == 110
+        assert stats.cache_read_tokens == 8
+        assert stats.tool_calls == 5
+    
     @patch('pokepoke.workflow.run_gate_agent')
     @patch('pokepoke.workflow.run_beta_tester')
     @patch('pokepoke.workflow.cleanup_worktree')
@@ -585,6 +585,27 @@ class TestMergeWorktree:
             assert unmerged_files == []
             assert any('bd sync returned non-zero' in str(call) for call in mock_print.call_args_list)
     
+    def test_merge_worktree_bd_sync_timeout(self):
+        """A timed-out bd sync may still be writing .beads/, so the merge stops."""
+        with patch('pokepoke.worktrees.is_worktree_clean', return_value=True), \
+             patch('subprocess.run') as mock_run, \
+             patch('pokepoke.worktrees.get_default_branch', return_value='ameliapayne/dev'), \
+             patch('builtins.print'):
+
+            def run_side_effect(*args, **kwargs):
+                if 'bd' in args[0] and 'sync' in args[0]:
+                    raise subprocess.TimeoutExpired(args[0], 30)
+                return Mock(stdout='', stderr='', returncode=0)
+
+            mock_run.side_effect = run_side_effect
+
+            success, unmerged_files = merge_worktree('incredible_icm-42')
+
+            assert success is False
+            assert unmerged_files == []
+            calls = [str(call) for call in mock_run.call_args_list]
+            assert not any('checkout' in call or 'merge' in call for call in calls)
+
     def test_merge_worktree_with_beads_changes(self):
         """Test merge with uncommitted beads changes in main repo."""
         with patch('pokepoke.worktrees.is_worktree_clean', return_value=True), \